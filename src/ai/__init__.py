@@ -12,8 +12,11 @@ The LLM is ADVISORY ONLY - it cannot:
 
 Components:
 - LLM Provider: Abstraction over LLM APIs with rate limiting and validation
+- Async LLM Provider: asyncio clients for concurrent narration requests
 - Prompt Schemas: Structured prompts for each use case
 - DM Agent: Central orchestrator for all LLM interactions
+- Response Cache: Bounded, optionally persistent narration cache
+- Narration Prefetch: Background cache warming for likely next turns
 """
 
 from src.ai.llm_provider import (
@@ -27,9 +30,27 @@ from src.ai.llm_provider import (
     AnthropicClient,
     OpenAIClient,
     MockLLMClient,
+    MockLatencyProfile,
+    LLMStream,
+    StreamingAuthorityValidator,
+    CircuitBreaker,
+    CircuitState,
+    ProviderStats,
     get_llm_manager,
 )
 
+from src.ai.async_llm_provider import (
+    AsyncLLMClient,
+    AsyncAnthropicClient,
+    AsyncOpenAIClient,
+    AsyncOllamaClient,
+    ThreadedAsyncClient,
+    LLMRequest,
+    create_async_client,
+    backoff_delay,
+    run_sync,
+)
+
 from src.ai.prompt_schemas import (
     PromptSchemaType,
     PromptSchema,
@@ -52,17 +73,29 @@ from src.ai.prompt_schemas import (
     DowntimeSummaryInputs,
     DowntimeSummaryOutput,
     DowntimeSummarySchema,
+    AssembledPrompt,
+    SystemPrompt,
+    estimate_tokens,
     create_schema,
 )
 
+from src.ai.response_cache import (
+    ResponseCache,
+    SQLiteResponseStore,
+    make_structural_key,
+)
+
 from src.ai.dm_agent import (
     DMAgentConfig,
     DescriptionResult,
+    NarrationChunk,
     DMAgent,
     get_dm_agent,
     reset_dm_agent,
 )
 
+from src.ai.narration_prefetch import NarrationPrefetcher
+
 from src.ai.lore_search import (
     LoreCategory,
     LoreSearchResult,
@@ -86,7 +119,23 @@ __all__ = [
     "AnthropicClient",
     "OpenAIClient",
     "MockLLMClient",
+    "MockLatencyProfile",
+    "LLMStream",
+    "StreamingAuthorityValidator",
+    "CircuitBreaker",
+    "CircuitState",
+    "ProviderStats",
     "get_llm_manager",
+    # Async LLM Provider
+    "AsyncLLMClient",
+    "AsyncAnthropicClient",
+    "AsyncOpenAIClient",
+    "AsyncOllamaClient",
+    "ThreadedAsyncClient",
+    "LLMRequest",
+    "create_async_client",
+    "backoff_delay",
+    "run_sync",
     # Prompt Schemas
     "PromptSchemaType",
     "PromptSchema",
@@ -109,13 +158,23 @@ __all__ = [
     "DowntimeSummaryInputs",
     "DowntimeSummaryOutput",
     "DowntimeSummarySchema",
+    "AssembledPrompt",
+    "SystemPrompt",
+    "estimate_tokens",
     "create_schema",
+    # Response Cache
+    "ResponseCache",
+    "SQLiteResponseStore",
+    "make_structural_key",
     # DM Agent
     "DMAgentConfig",
     "DescriptionResult",
+    "NarrationChunk",
     "DMAgent",
     "get_dm_agent",
     "reset_dm_agent",
+    # Narration Prefetch
+    "NarrationPrefetcher",
     # Lore Search
     "LoreCategory",
     "LoreSearchResult",
@@ -0,0 +1,417 @@
+"""
+Async LLM client layer for Dolmenwood Virtual DM.
+
+Mirrors the blocking clients in llm_provider with asyncio-native
+counterparts so that independent narration requests (a hex description,
+an encounter framing, NPC dialogue) can be in flight at the same time.
+A turn that needs several pieces of narration then waits for the slowest
+call rather than the sum of all of them.
+
+Provides:
+- AsyncLLMClient hierarchy with acomplete()
+- ThreadedAsyncClient, which adapts any blocking BaseLLMClient (including
+  MockLLMClient and test doubles) by running it in a worker thread
+- Non-blocking retries with exponential backoff and full jitter
+- run_sync() for driving coroutines from synchronous game code
+
+Retry jitter uses a private random.Random instance, never DiceRoller:
+network timing must not consume game RNG or appear in replays.
+
+LLMManager.complete_many / acomplete_many are the usual entry points.
+"""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Optional, TypeVar
+import asyncio
+import logging
+import os
+import random
+
+from src.ai.llm_provider import (
+    AnthropicClient,
+    BaseLLMClient,
+    LLMConfig,
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    LLMRole,
+    OllamaClient,
+    OpenAIClient,
+    _anthropic_system,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Jitter source for retry backoff (infrastructure only, not game RNG)
+_jitter_rng = random.Random()
+
+
+@dataclass
+class LLMRequest:
+    """One completion request for LLMManager.complete_many."""
+
+    messages: list[LLMMessage]
+    system_prompt: Optional[str] = None
+    allow_narration_context: bool = False
+
+
+def backoff_delay(
+    base_delay: float,
+    attempt: int,
+    max_delay: float = 30.0,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Concurrent requests that fail together spread their retries out
+    instead of hitting the provider again in lockstep.
+
+    Args:
+        base_delay: LLMConfig.retry_delay
+        attempt: Zero-based attempt number that just failed
+        max_delay: Upper bound on the backoff ceiling
+        rng: Random source (defaults to the module jitter source)
+
+    Returns:
+        Delay in seconds, uniform in [0, min(max_delay, base * 2**attempt)]
+    """
+    ceiling = min(max_delay, base_delay * (2 ** attempt))
+    return (rng or _jitter_rng).uniform(0.0, ceiling)
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run() when no loop is running in this thread; otherwise
+    runs it on a fresh loop in a worker thread so callers inside an event
+    loop (e.g. a web frontend) are not deadlocked.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class AsyncLLMClient(ABC):
+    """Abstract base class for asyncio LLM clients."""
+
+    provider: LLMProvider = LLMProvider.MOCK
+
+    def __init__(self, config: LLMConfig):
+        self.config = config
+        self._client: Any = None  # Native SDK client, if any
+
+    @abstractmethod
+    async def acomplete(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> LLMResponse:
+        """Generate a completion from the LLM without blocking the loop."""
+        pass
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        """Check if the provider is available."""
+        pass
+
+    async def close(self) -> None:
+        """
+        Close the native SDK client and its connection pool.
+
+        Must be awaited on the loop that used the client. The client is
+        unavailable afterwards.
+        """
+        client, self._client = self._client, None
+        if client is None:
+            return
+        close = getattr(client, "close", None) or getattr(client, "aclose", None)
+        if close is None:
+            # ollama.AsyncClient keeps its httpx client one level down
+            close = getattr(getattr(client, "_client", None), "aclose", None)
+        if close is not None:
+            await close()
+
+    def _unavailable(self, content: str = "[LLM unavailable - using fallback]") -> LLMResponse:
+        """Response returned when the SDK client could not be created."""
+        return LLMResponse(
+            content=content,
+            model=self.config.model,
+            provider=self.provider,
+            authority_violations=["client_unavailable"],
+        )
+
+    def _failed(self, content: str = "[LLM request failed after retries]") -> LLMResponse:
+        """Response returned once retries are exhausted."""
+        return LLMResponse(
+            content=content,
+            model=self.config.model,
+            provider=self.provider,
+            authority_violations=["request_failed"],
+        )
+
+    async def _retry_wait(self, attempt: int) -> None:
+        """Sleep before the next attempt (no-op after the last one)."""
+        if attempt < self.config.max_retries - 1:
+            await asyncio.sleep(backoff_delay(self.config.retry_delay, attempt))
+
+
+class AsyncAnthropicClient(AsyncLLMClient):
+    """Async client for Anthropic Claude API."""
+
+    provider = LLMProvider.ANTHROPIC
+
+    def __init__(self, config: LLMConfig):
+        super().__init__(config)
+        try:
+            import anthropic
+
+            api_key = config.api_key or os.getenv("ANTHROPIC_API_KEY")
+            if api_key:
+                self._client = anthropic.AsyncAnthropic(api_key=api_key)
+        except ImportError:
+            logger.warning("anthropic package not installed; async client disabled")
+        except Exception as e:
+            logger.error(f"Failed to initialize async Anthropic client: {e}")
+
+    def is_available(self) -> bool:
+        return self._client is not None
+
+    async def acomplete(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> LLMResponse:
+        """Generate completion using Claude."""
+        if not self._client:
+            return self._unavailable()
+
+        anthropic_messages = [
+            {"role": msg.role.value, "content": msg.content}
+            for msg in messages
+            if msg.role != LLMRole.SYSTEM
+        ]
+
+        for attempt in range(self.config.max_retries):
+            try:
+                response = await self._client.messages.create(
+                    model=self.config.model,
+                    max_tokens=self.config.max_tokens,
+                    system=_anthropic_system(system_prompt, self.config.prompt_caching),
+                    messages=anthropic_messages,
+                )
+                content = response.content[0].text if response.content else ""
+                return LLMResponse(
+                    content=content,
+                    model=self.config.model,
+                    provider=LLMProvider.ANTHROPIC,
+                    usage={
+                        "input_tokens": response.usage.input_tokens,
+                        "output_tokens": response.usage.output_tokens,
+                    },
+                    raw_response=response,
+                )
+            except Exception as e:
+                logger.warning(f"Anthropic API attempt {attempt + 1} failed: {e}")
+                await self._retry_wait(attempt)
+
+        return self._failed()
+
+
+class AsyncOpenAIClient(AsyncLLMClient):
+    """Async client for OpenAI API."""
+
+    provider = LLMProvider.OPENAI
+
+    def __init__(self, config: LLMConfig):
+        super().__init__(config)
+        try:
+            import openai
+
+            api_key = config.api_key or os.getenv("OPENAI_API_KEY")
+            if api_key:
+                self._client = openai.AsyncOpenAI(api_key=api_key)
+        except ImportError:
+            logger.warning("openai package not installed; async client disabled")
+        except Exception as e:
+            logger.error(f"Failed to initialize async OpenAI client: {e}")
+
+    def is_available(self) -> bool:
+        return self._client is not None
+
+    async def acomplete(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> LLMResponse:
+        """Generate completion using OpenAI."""
+        if not self._client:
+            return self._unavailable()
+
+        openai_messages = []
+        if system_prompt:
+            openai_messages.append({"role": "system", "content": system_prompt})
+        openai_messages.extend({"role": m.role.value, "content": m.content} for m in messages)
+
+        for attempt in range(self.config.max_retries):
+            try:
+                response = await self._client.chat.completions.create(
+                    model=self.config.model,
+                    messages=openai_messages,
+                    max_tokens=self.config.max_tokens,
+                    temperature=self.config.temperature,
+                )
+                content = response.choices[0].message.content or ""
+                return LLMResponse(
+                    content=content,
+                    model=self.config.model,
+                    provider=LLMProvider.OPENAI,
+                    usage={
+                        "prompt_tokens": response.usage.prompt_tokens,
+                        "completion_tokens": response.usage.completion_tokens,
+                    },
+                    raw_response=response,
+                )
+            except Exception as e:
+                logger.warning(f"OpenAI API attempt {attempt + 1} failed: {e}")
+                await self._retry_wait(attempt)
+
+        return self._failed()
+
+
+class AsyncOllamaClient(AsyncLLMClient):
+    """
+    Async client for a local Ollama server.
+
+    Availability is taken from the blocking OllamaClient's startup probe so
+    the server is not pinged again on every request.
+    """
+
+    provider = LLMProvider.OLLAMA
+
+    def __init__(self, config: LLMConfig, reachable: bool = True):
+        super().__init__(config)
+        host = config.ollama_host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
+        if not reachable:
+            return
+        try:
+            import ollama
+
+            self._client = ollama.AsyncClient(host=host)
+        except ImportError:
+            logger.warning("ollama package not installed; async client disabled")
+        except Exception as e:
+            logger.error(f"Failed to initialize async Ollama client: {e}")
+
+    def is_available(self) -> bool:
+        return self._client is not None
+
+    async def acomplete(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> LLMResponse:
+        """Generate completion using Ollama."""
+        if not self._client:
+            return self._unavailable(
+                "[Ollama unavailable - server not running or not reachable]"
+            )
+
+        ollama_messages = []
+        if system_prompt:
+            ollama_messages.append({"role": "system", "content": system_prompt})
+        ollama_messages.extend({"role": m.role.value, "content": m.content} for m in messages)
+
+        for attempt in range(self.config.max_retries):
+            try:
+                response = await self._client.chat(
+                    model=self.config.model,
+                    messages=ollama_messages,
+                    options={
+                        "temperature": self.config.temperature,
+                        "num_predict": self.config.max_tokens,
+                    },
+                )
+                usage = {}
+                if "eval_count" in response:
+                    usage["output_tokens"] = response["eval_count"]
+                if "prompt_eval_count" in response:
+                    usage["input_tokens"] = response["prompt_eval_count"]
+                return LLMResponse(
+                    content=response.get("message", {}).get("content", ""),
+                    model=self.config.model,
+                    provider=LLMProvider.OLLAMA,
+                    usage=usage,
+                    raw_response=response,
+                )
+            except Exception as e:
+                error_msg = str(e).lower()
+                logger.warning(f"Ollama API attempt {attempt + 1} failed: {e}")
+                if "model" in error_msg and "not found" in error_msg:
+                    return LLMResponse(
+                        content=f"[Model '{self.config.model}' not found. Run: ollama pull {self.config.model}]",
+                        model=self.config.model,
+                        provider=LLMProvider.OLLAMA,
+                        authority_violations=["model_not_found"],
+                    )
+                await self._retry_wait(attempt)
+
+        return self._failed("[Ollama request failed after retries]")
+
+
+class ThreadedAsyncClient(AsyncLLMClient):
+    """
+    Adapts a blocking BaseLLMClient to the async interface.
+
+    Each call runs in the default executor, so several blocking requests
+    still overlap. Used for MockLLMClient, custom clients and providers
+    without a native async SDK. Exceptions from the wrapped client
+    propagate unchanged.
+    """
+
+    def __init__(self, client: BaseLLMClient):
+        super().__init__(client.config)
+        self.client = client
+        self.provider = client.config.provider
+
+    def is_available(self) -> bool:
+        return self.client.is_available()
+
+    async def acomplete(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> LLMResponse:
+        return await asyncio.to_thread(self.client.complete, messages, system_prompt)
+
+
+def create_async_client(client: BaseLLMClient) -> AsyncLLMClient:
+    """
+    Build the async counterpart of a blocking client.
+
+    Exact instances of the bundled provider clients get a native async
+    client; anything else (mocks, subclasses, custom clients) is wrapped
+    in a ThreadedAsyncClient so its behaviour is preserved.
+
+    Args:
+        client: The blocking client LLMManager is using
+
+    Returns:
+        An AsyncLLMClient
+    """
+    client_type = type(client)
+    if client_type is AnthropicClient:
+        return AsyncAnthropicClient(client.config)
+    if client_type is OpenAIClient:
+        return AsyncOpenAIClient(client.config)
+    if client_type is OllamaClient:
+        return AsyncOllamaClient(client.config, reachable=client._client is not None)
+    return ThreadedAsyncClient(client)
@@ -12,14 +12,20 @@ The DM Agent provides:
 - NPC dialogue with lore integration
 - Failure consequence descriptions
 - Downtime summaries
+- Streaming narration to a sink as validated text arrives
 
 CRITICAL: All mechanical resolution happens in Python.
 The LLM only provides evocative descriptions of what has been determined.
 """
 
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional
+import itertools
 import logging
+import threading
+import time
 
 from src.ai.llm_provider import (
     LLMManager,
@@ -30,7 +36,10 @@ from src.ai.llm_provider import (
     LLMProvider,
     get_llm_manager,
 )
+from src.ai.async_llm_provider import LLMRequest
+from src.ai.response_cache import ResponseCache, make_structural_key
 from src.ai.prompt_schemas import (
+    AssembledPrompt,
     PromptSchemaType,
     PromptSchema,
     ExplorationDescriptionInputs,
@@ -107,6 +116,18 @@ class DMAgentConfig:
     cache_responses: bool = True
     validate_all_responses: bool = True
 
+    # Response cache bounds and persistence
+    cache_max_entries: int = 512
+    cache_ttl_seconds: Optional[float] = 7 * 24 * 3600.0
+    cache_persist_path: Optional[str] = None  # SQLite file; None = memory only
+
+    # Estimated input tokens per request; history/lore inputs are trimmed
+    # to fit (None = no budget)
+    prompt_token_budget: Optional[int] = 4096
+
+    # Lore lookups cached per scene; cleared on location change or content reload
+    lore_cache_max_entries: int = 128
+
 
 @dataclass
 class DescriptionResult:
@@ -119,6 +140,31 @@ class DescriptionResult:
     authority_violations: list[str] = field(default_factory=list)
 
 
+@dataclass
+class NarrationChunk:
+    """
+    A piece of streamed narration delivered to a streaming sink.
+
+    Each narration call gets its own stream_id. The last chunk of a stream
+    has done=True; aborted=True means the narration was withdrawn (LLM
+    error or authority violation) and the final turn will not include it.
+    """
+
+    stream_id: int
+    schema_type: PromptSchemaType
+    text: str
+    done: bool = False
+    aborted: bool = False
+
+
+NarrationSink = Callable[[NarrationChunk], None]
+
+# Schemas whose output is parsed by the engine rather than shown to players
+NON_STREAMING_SCHEMAS = frozenset(
+    {PromptSchemaType.INTENT_PARSE, PromptSchemaType.NARRATIVE_INTENT_PARSE}
+)
+
+
 class DMAgent:
     """
     The Dolmenwood Virtual DM Agent.
@@ -155,13 +201,34 @@ class DMAgent:
         # Initialize lore search (optional enrichment)
         self._lore_search: LoreSearchInterface = lore_search or NullLoreSearch()
 
-        # Response cache (simple dict-based)
-        self._cache: dict[str, str] = {}
+        # Response cache (bounded LRU, optionally persisted to SQLite)
+        self._cache = ResponseCache(
+            max_entries=self.config.cache_max_entries,
+            ttl_seconds=self.config.cache_ttl_seconds,
+            persist_path=self.config.cache_persist_path,
+        )
+
+        # Guards the lore cache, recent descriptions and prompt assembly,
+        # which the narration prefetch thread shares with foreground calls
+        self._state_lock = threading.RLock()
+
+        # Lore retrieval cache keyed on query and scene context
+        self._lore_cache: OrderedDict[tuple, list[LoreSearchResult]] = OrderedDict()
+        self._lore_location: Optional[str] = None
+        self._lore_cache_hits = 0
+        self._lore_cache_misses = 0
 
         # Track recent descriptions for context
         self._recent_descriptions: list[str] = []
         self._max_recent = 5
 
+        # Streaming sink (set via streaming())
+        self._stream_sink: Optional[NarrationSink] = None
+        self._stream_ids = itertools.count(1)
+
+        # Schema capture for prefetching (set via capturing())
+        self._captured: Optional[list[PromptSchema]] = None
+
     def is_available(self) -> bool:
         """Check if the LLM is available."""
         return self._llm.is_available()
@@ -199,6 +266,22 @@ class DMAgent:
         if not self._lore_search.is_available():
             return []
 
+        key = (
+            " ".join(query.lower().split()),
+            current_hex,
+            current_npc,
+            current_faction,
+            category,
+            max_results,
+        )
+        with self._state_lock:
+            cached = self._lore_cache.get(key)
+            if cached is not None:
+                self._lore_cache.move_to_end(key)
+                self._lore_cache_hits += 1
+                return list(cached)
+            self._lore_cache_misses += 1
+
         search_query = LoreSearchQuery(
             query=query,
             categories=[category] if category else [],
@@ -208,13 +291,39 @@ class DMAgent:
             current_faction=current_faction,
         )
 
-        return self._lore_search.search(search_query)
+        results = self._lore_search.search(search_query)
+        if self.config.lore_cache_max_entries > 0:
+            with self._state_lock:
+                self._lore_cache[key] = list(results)
+                while len(self._lore_cache) > self.config.lore_cache_max_entries:
+                    self._lore_cache.popitem(last=False)
+        return results
+
+    def set_lore_location(self, location_id: Optional[str]) -> None:
+        """
+        Record the party's location, dropping cached lore if it changed.
+
+        Args:
+            location_id: Hex, settlement or dungeon identifier
+        """
+        with self._state_lock:
+            if location_id != self._lore_location:
+                self._lore_location = location_id
+                self.invalidate_lore_cache()
+
+    def invalidate_lore_cache(self) -> None:
+        """Drop all cached lore lookups (e.g. after content is reloaded)."""
+        with self._state_lock:
+            self._lore_cache.clear()
 
     def get_lore_enrichment(
         self,
         query: str,
         category: Optional[LoreCategory] = None,
         max_results: int = 2,
+        current_hex: Optional[str] = None,
+        current_npc: Optional[str] = None,
+        current_faction: Optional[str] = None,
     ) -> str:
         """
         Get lore as a formatted string for prompt enrichment.
@@ -223,11 +332,16 @@ class DMAgent:
             query: Search query
             category: Optional category filter
             max_results: Maximum results
+            current_hex: Current hex ID for relevance boosting
+            current_npc: Current NPC name for relevance boosting
+            current_faction: Current faction for relevance boosting
 
         Returns:
             Formatted lore string, or empty string if none found
         """
-        results = self.retrieve_lore(query, category, max_results)
+        results = self.retrieve_lore(
+            query, category, max_results, current_hex, current_npc, current_faction
+        )
         if not results:
             return ""
 
@@ -237,8 +351,26 @@ class DMAgent:
         return "\n".join(lines)
 
     def get_lore_status(self) -> dict[str, Any]:
-        """Get status of the lore search system."""
-        return self._lore_search.get_status()
+        """Get status of the lore search system and the response cache."""
+        status = dict(self._lore_search.get_status())
+        status["response_cache"] = self.get_cache_stats()
+        with self._state_lock:
+            status["lore_cache"] = {
+                "entries": len(self._lore_cache),
+                "hits": self._lore_cache_hits,
+                "misses": self._lore_cache_misses,
+                "location": self._lore_location,
+            }
+        return status
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get response cache hit/miss counters."""
+        return self._cache.get_stats()
+
+    @property
+    def llm_manager(self) -> LLMManager:
+        """The LLM manager that serves this agent's requests."""
+        return self._llm
 
     @property
     def lore_search_available(self) -> bool:
@@ -1514,6 +1646,161 @@ class DMAgent:
     # INTERNAL METHODS
     # =========================================================================
 
+    def execute_schemas(
+        self,
+        schemas: list[PromptSchema],
+        allow_narration_context: bool = False,
+    ) -> list[DescriptionResult]:
+        """
+        Execute several independent schemas concurrently.
+
+        Cache hits and invalid inputs are answered immediately; the rest
+        are sent through LLMManager.complete_many so a turn that needs
+        several pieces of narration waits for the slowest call, not the
+        sum of them. A failing request falls back exactly as in
+        _execute_schema without affecting the others.
+
+        VirtualDM sends a travel turn's hex arrival and encounter framing
+        through here together; the prefetcher uses the same batched path
+        through warm_cache.
+
+        Args:
+            schemas: Prompt schemas to execute (e.g. from create_schema)
+            allow_narration_context: If True, allows combat narration words
+
+        Returns:
+            DescriptionResult per schema, in input order
+        """
+        return self._execute_batch(schemas, allow_narration_context)
+
+    def _execute_batch(
+        self,
+        schemas: list[PromptSchema],
+        allow_narration_context: bool = False,
+        track_recent: bool = True,
+        context: Optional[dict[str, Any]] = None,
+    ) -> list[DescriptionResult]:
+        """Shared implementation of execute_schemas and warm_cache."""
+        results: list[Optional[DescriptionResult]] = [None] * len(schemas)
+        pending: list[tuple[int, PromptSchema, Optional[str], str]] = []
+
+        for index, schema in enumerate(schemas):
+            early, cache_key = self._check_schema(schema)
+            if early is not None:
+                results[index] = early
+            else:
+                pending.append((index, schema, cache_key, self._assemble(schema)))
+
+        if pending:
+            requests = [
+                LLMRequest(
+                    messages=[LLMMessage(role=LLMRole.USER, content=prompt.user_prompt)],
+                    system_prompt=prompt.system_prompt,
+                    allow_narration_context=allow_narration_context,
+                )
+                for _, _, _, prompt in pending
+            ]
+            start_time = time.time()
+            responses = self._llm.complete_many(requests, return_exceptions=True)
+            # Requests overlap, so each is charged the batch wall time
+            elapsed_ms = int((time.time() - start_time) * 1000)
+
+            for (index, schema, cache_key, prompt), response in zip(pending, responses):
+                if isinstance(response, Exception):
+                    results[index] = self._schema_failure(
+                        schema, prompt.user_prompt, str(response), elapsed_ms
+                    )
+                else:
+                    results[index] = self._schema_success(
+                        schema,
+                        prompt.user_prompt,
+                        response,
+                        elapsed_ms,
+                        cache_key,
+                        context=context,
+                        track_recent=track_recent,
+                    )
+
+        return [result for result in results if result is not None]
+
+    @contextmanager
+    def streaming(self, sink: NarrationSink) -> Iterator[None]:
+        """
+        Stream narration produced inside this block to sink.
+
+        Every narration call made while the block is active (by any engine
+        hook) forwards validated text to sink as it arrives, then returns
+        its DescriptionResult as usual. Intent parsing is never streamed.
+
+        Args:
+            sink: Called with each NarrationChunk
+        """
+        previous = self._stream_sink
+        self._stream_sink = sink
+        try:
+            yield
+        finally:
+            self._stream_sink = previous
+
+    @contextmanager
+    def capturing(self) -> Iterator[list[PromptSchema]]:
+        """
+        Record schemas instead of executing them.
+
+        Narration calls made inside the block return an empty successful
+        result without contacting the LLM. Running the real narration
+        hooks this way yields exactly the schemas (and so cache keys) they
+        would execute, which is what the prefetcher warms.
+
+        Yields:
+            The list that captured schemas are appended to
+        """
+        previous = self._captured
+        self._captured = []
+        try:
+            yield self._captured
+        finally:
+            self._captured = previous
+
+    def is_cached(self, schema: PromptSchema) -> bool:
+        """Check whether a schema's response is already in the memory cache."""
+        return self.config.cache_responses and self._make_cache_key(schema) in self._cache
+
+    def estimate_tokens(self, schema: PromptSchema) -> int:
+        """
+        Rough token cost of executing a schema.
+
+        Counts the assembled prompt plus the full completion allowance,
+        so the estimate errs high.
+        """
+        return self._assemble(schema).estimated_tokens + self._llm.config.max_tokens
+
+    def _assemble(self, schema: PromptSchema) -> AssembledPrompt:
+        """Render a schema within the configured prompt token budget."""
+        # Trimming swaps the schema's inputs while rendering
+        with self._state_lock:
+            prompt = schema.assemble(self.config.prompt_token_budget)
+        if prompt.trimmed_inputs and self.config.verbose_logging:
+            logger.info(
+                f"Trimmed {prompt.trimmed_inputs} from {schema.schema_type.value} "
+                f"to fit {self.config.prompt_token_budget} tokens"
+            )
+        return prompt
+
+    def warm_cache(self, schemas: list[PromptSchema]) -> list[DescriptionResult]:
+        """
+        Execute schemas purely to populate the response cache.
+
+        Results are not added to recent descriptions, so speculative
+        narration never leaks into the context of later prompts.
+
+        Returns:
+            DescriptionResult per schema (empty if caching is disabled)
+        """
+        if not self.config.cache_responses:
+            return []
+        return self._execute_batch(schemas, track_recent=False, context={"prefetch": True})
+
     def _execute_schema(
         self,
         schema: PromptSchema,
@@ -1529,38 +1816,31 @@ class DMAgent:
         Returns:
             DescriptionResult with the LLM response
         """
-        # Validate inputs
-        errors = schema.validate_inputs()
-        if errors:
+        if self._captured is not None:
+            self._captured.append(schema)
             return DescriptionResult(
-                content="[Input validation failed]",
+                content="",
                 schema_used=schema.schema_type,
-                success=False,
-                warnings=errors,
+                success=True,
+                warnings=["captured"],
             )
 
-        # Check cache if enabled
-        if self.config.cache_responses:
-            cache_key = self._make_cache_key(schema)
-            if cache_key in self._cache:
-                return DescriptionResult(
-                    content=self._cache[cache_key],
-                    schema_used=schema.schema_type,
-                    success=True,
-                    warnings=["from_cache"],
-                )
+        if self._stream_sink is not None and schema.schema_type not in NON_STREAMING_SCHEMAS:
+            return self._stream_schema(schema, self._stream_sink, allow_narration_context)
+
+        early, cache_key = self._check_schema(schema)
+        if early is not None:
+            return early
 
         # Build messages
-        system_prompt = schema.get_system_prompt()
-        user_prompt = schema.build_prompt()
+        prompt = self._assemble(schema)
+        system_prompt = prompt.system_prompt
+        user_prompt = prompt.user_prompt
 
         messages = [LLMMessage(role=LLMRole.USER, content=user_prompt)]
 
         # Get LLM response with timing for observability
-        import time
         start_time = time.time()
-        error_message = ""
-        response = None
 
         try:
             response = self._llm.complete(
@@ -1570,41 +1850,163 @@ class DMAgent:
             )
         except Exception as e:
             # Phase 8: Handle LLM failures gracefully with fallback
-            error_message = str(e)
             elapsed_ms = int((time.time() - start_time) * 1000)
+            return self._schema_failure(schema, user_prompt, str(e), elapsed_ms)
+
+        elapsed_ms = int((time.time() - start_time) * 1000)
+        return self._schema_success(schema, user_prompt, response, elapsed_ms, cache_key)
+
+    def _stream_schema(
+        self,
+        schema: PromptSchema,
+        sink: NarrationSink,
+        allow_narration_context: bool = False,
+    ) -> DescriptionResult:
+        """
+        Streaming variant of _execute_schema.
+
+        Validated chunks go to sink as the provider produces them; the
+        returned DescriptionResult is identical to the blocking path, and
+        after a violation carries the whole completion, not just the part
+        streamed before it.
+        """
+        stream_id = next(self._stream_ids)
 
-            # Log error to RunLog
+        def emit(text: str, done: bool = False, aborted: bool = False) -> None:
             try:
-                from src.observability.run_log import get_run_log
-                get_run_log().log_llm_call(
-                    call_type=schema.schema_type.value if hasattr(schema, 'schema_type') else "unknown",
-                    schema_name=type(schema).__name__,
-                    success=False,
-                    latency_ms=elapsed_ms,
-                    error_message=error_message,
-                    input_summary=user_prompt[:100] + "..." if len(user_prompt) > 100 else user_prompt,
-                    output_summary="",
-                )
-            except (ImportError, NameError):
-                pass  # RunLog not available
+                sink(NarrationChunk(stream_id, schema.schema_type, text, done, aborted))
+            except Exception as e:
+                logger.warning(f"Narration sink failed: {e}")
+
+        early, cache_key = self._check_schema(schema)
+        if early is not None:
+            if early.success:
+                emit(early.content)
+                emit("", done=True)
+            return early
+
+        prompt = self._assemble(schema)
+        user_prompt = prompt.user_prompt
+        start_time = time.time()
+        stream = self._llm.stream(
+            messages=[LLMMessage(role=LLMRole.USER, content=user_prompt)],
+            system_prompt=prompt.system_prompt,
+            allow_narration_context=allow_narration_context,
+        )
+        try:
+            for chunk in stream:
+                emit(chunk)
+        except Exception as e:
+            emit("", done=True, aborted=True)
+            elapsed_ms = int((time.time() - start_time) * 1000)
+            return self._schema_failure(schema, user_prompt, str(e), elapsed_ms)
 
-            logger.error(f"LLM call failed for {type(schema).__name__}: {error_message}")
+        elapsed_ms = int((time.time() - start_time) * 1000)
+        assert stream.response is not None
+        result = self._schema_success(
+            schema,
+            user_prompt,
+            stream.response,
+            elapsed_ms,
+            cache_key,
+            context={"streamed": True, "first_chunk_ms": stream.first_chunk_ms},
+        )
+        emit("", done=True, aborted=not result.success)
+        return result
 
-            # Return safe fallback message suggesting oracle use
-            fallback_content = (
-                "[The narrative could not be generated at this time. "
-                "Consider using the oracle (Mythic GME fate check) to determine "
-                "what happens next, or describe the scene yourself.]"
-            )
+    def _check_schema(
+        self, schema: PromptSchema
+    ) -> tuple[Optional[DescriptionResult], Optional[str]]:
+        """
+        Validate inputs and consult the cache before calling the LLM.
+
+        Returns:
+            (early_result, cache_key); early_result is set when the schema
+            is invalid or already cached
+        """
+        # Validate inputs
+        errors = schema.validate_inputs()
+        if errors:
             return DescriptionResult(
-                content=fallback_content,
+                content="[Input validation failed]",
                 schema_used=schema.schema_type,
                 success=False,
-                warnings=[f"LLM error: {error_message}", "oracle_suggested"],
+                warnings=errors,
+            ), None
+
+        # Check cache if enabled
+        cache_key = None
+        if self.config.cache_responses:
+            cache_key = self._make_cache_key(schema)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return DescriptionResult(
+                    content=cached,
+                    schema_used=schema.schema_type,
+                    success=True,
+                    warnings=["from_cache"],
+                ), cache_key
+
+        return None, cache_key
+
+    def _schema_failure(
+        self,
+        schema: PromptSchema,
+        user_prompt: str,
+        error_message: str,
+        elapsed_ms: int,
+    ) -> DescriptionResult:
+        """Log a failed LLM call and return the oracle fallback result."""
+        # Log error to RunLog
+        try:
+            from src.observability.run_log import get_run_log
+            get_run_log().log_llm_call(
+                call_type=schema.schema_type.value if hasattr(schema, 'schema_type') else "unknown",
+                schema_name=type(schema).__name__,
+                success=False,
+                latency_ms=elapsed_ms,
+                error_message=error_message,
+                input_summary=user_prompt[:100] + "..." if len(user_prompt) > 100 else user_prompt,
+                output_summary="",
+                context=self._llm.provider_context(),
             )
+        except (ImportError, NameError):
+            pass  # RunLog not available
+
+        logger.error(f"LLM call failed for {type(schema).__name__}: {error_message}")
+
+        # Return safe fallback message suggesting oracle use
+        fallback_content = (
+            "[The narrative could not be generated at this time. "
+            "Consider using the oracle (Mythic GME fate check) to determine "
+            "what happens next, or describe the scene yourself.]"
+        )
+        return DescriptionResult(
+            content=fallback_content,
+            schema_used=schema.schema_type,
+            success=False,
+            warnings=[f"LLM error: {error_message}", "oracle_suggested"],
+        )
+
+    def _schema_success(
+        self,
+        schema: PromptSchema,
+        user_prompt: str,
+        response: LLMResponse,
+        elapsed_ms: int,
+        cache_key: Optional[str],
+        context: Optional[dict[str, Any]] = None,
+        track_recent: bool = True,
+    ) -> DescriptionResult:
+        """Log a completed LLM call, then cache and track its result."""
+        # Provider health (latency, error rate, circuit state) rides along
+        context = {
+            **self._llm.provider_context(response.provider),
+            "coalesced": response.coalesced,
+            **(context or {}),
+        }
 
         # Log successful call
-        elapsed_ms = int((time.time() - start_time) * 1000)
         try:
             from src.observability.run_log import get_run_log
             get_run_log().log_llm_call(
@@ -1615,6 +2017,7 @@ class DMAgent:
                 error_message="",
                 input_summary=user_prompt[:100] + "..." if len(user_prompt) > 100 else user_prompt,
                 output_summary=response.content[:100] + "..." if len(response.content) > 100 else response.content,
+                context=context,
             )
         except (ImportError, NameError):
             pass  # RunLog not available
@@ -1628,12 +2031,12 @@ class DMAgent:
         )
 
         # Cache if enabled and successful
-        if self.config.cache_responses and result.success:
-            cache_key = self._make_cache_key(schema)
-            self._cache[cache_key] = result.content
+        if cache_key is not None and result.success:
+            self._cache.put(cache_key, result.content)
 
         # Track for context
-        self._add_to_recent(result.content)
+        if track_recent:
+            self._add_to_recent(result.content)
 
         if self.config.verbose_logging:
             logger.info(f"DM Agent: {schema.schema_type.value} -> {len(result.content)} chars")
@@ -1644,35 +2047,14 @@ class DMAgent:
 
     def _make_cache_key(self, schema: PromptSchema) -> str:
         """Create a cache key for a schema."""
-        import hashlib
-        import json
-        from dataclasses import asdict, is_dataclass
-
-        def serialize(obj):
-            """Custom serializer for dataclasses and other non-JSON types."""
-            if is_dataclass(obj) and not isinstance(obj, type):
-                return asdict(obj)
-            elif isinstance(obj, list):
-                return [serialize(item) for item in obj]
-            elif isinstance(obj, dict):
-                return {k: serialize(v) for k, v in obj.items()}
-            return obj
-
-        data = json.dumps(
-            {
-                "type": schema.schema_type.value,
-                "inputs": serialize(schema.inputs),
-            },
-            sort_keys=True,
-            default=str,
-        )
-        return hashlib.md5(data.encode()).hexdigest()
+        return make_structural_key(schema.schema_type.value, schema.inputs)
 
     def _add_to_recent(self, content: str) -> None:
         """Add to recent descriptions."""
-        self._recent_descriptions.append(content)
-        if len(self._recent_descriptions) > self._max_recent:
-            self._recent_descriptions.pop(0)
+        with self._state_lock:
+            self._recent_descriptions.append(content)
+            if len(self._recent_descriptions) > self._max_recent:
+                self._recent_descriptions.pop(0)
 
     def _build_location_summary(self, location: LocationState) -> str:
         """Build a text summary of a location."""
@@ -1762,7 +2144,8 @@ class DMAgent:
 
     def get_recent_descriptions(self) -> list[str]:
         """Get recent descriptions for context."""
-        return self._recent_descriptions.copy()
+        with self._state_lock:
+            return self._recent_descriptions.copy()
 
 
 # =============================================================================
@@ -4,6 +4,9 @@ LLM Provider abstraction for Dolmenwood Virtual DM.
 This module provides a clean interface to LLM services with:
 - Support for multiple providers (Anthropic Claude, OpenAI)
 - Rate limiting and retry logic
+- Concurrent completions (complete_many) via the async client layer
+- Per-provider circuit breaker and coalescing of identical in-flight prompts
+- Token streaming with incremental authority validation (stream)
 - Response validation and sanitization
 - Strict authority boundary enforcement
 
@@ -15,13 +18,21 @@ CRITICAL: The LLM is ADVISORY ONLY. It cannot:
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from concurrent.futures import Future
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+import asyncio
 import logging
+import random
+import re
+import threading
 import time
 import os
 
+if TYPE_CHECKING:
+    from src.ai.async_llm_provider import AsyncLLMClient, LLMRequest
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,6 +75,20 @@ class LLMResponse:
     authority_violations: list[str] = field(default_factory=list)
     sanitized: bool = False
 
+    # Shared the result of an identical request already in flight
+    coalesced: bool = False
+
+
+@dataclass
+class MockLatencyProfile:
+    """Simulated provider behaviour for MockLLMClient (benchmarks, resilience tests)."""
+
+    latency_ms: float = 0.0  # Time before a completion, or before the first streamed token
+    jitter_ms: float = 0.0  # Uniform +/- variation added to latency_ms
+    failure_rate: float = 0.0  # Probability that a request fails
+    token_delay_ms: float = 0.0  # Delay between streamed tokens
+    seed: Optional[int] = None  # Seed for jitter and failure sampling
+
 
 @dataclass
 class LLMConfig:
@@ -81,10 +106,62 @@ class LLMConfig:
     # Rate limiting
     max_retries: int = 3
     retry_delay: float = 1.0
+    max_concurrency: int = 4  # In-flight requests for complete_many
+
+    # Circuit breaker: fail fast after repeated provider failures
+    breaker_failure_threshold: int = 3  # Consecutive failures before opening
+    breaker_reset_timeout: float = 30.0  # Seconds open before a half-open probe
 
     # Response constraints
     max_response_length: int = 4000
 
+    # Mark the stable system prefix for provider-side prompt caching
+    prompt_caching: bool = True
+
+    # Simulated latency/failures for the mock provider
+    mock_profile: Optional[MockLatencyProfile] = None
+
+
+def _anthropic_messages(messages: list[LLMMessage]) -> list[dict[str, str]]:
+    """Convert messages to Anthropic format (system prompt is passed separately)."""
+    return [
+        {"role": msg.role.value, "content": msg.content}
+        for msg in messages
+        if msg.role != LLMRole.SYSTEM
+    ]
+
+
+def _anthropic_system(system_prompt: Optional[str], prompt_caching: bool) -> Any:
+    """
+    Anthropic system parameter, with the stable prefix as a cache breakpoint.
+
+    System prompts assembled by PromptSchema carry a cacheable_prefix that
+    is identical for every request of a schema type; marking it lets the
+    API reuse the processed prefix. Plain strings are sent unchanged.
+    """
+    prefix = getattr(system_prompt, "cacheable_prefix", "")
+    if not system_prompt or not prompt_caching or not prefix:
+        return system_prompt or ""
+    blocks: list[dict[str, Any]] = [
+        {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}
+    ]
+    remainder = system_prompt[len(prefix):]
+    if remainder:
+        blocks.append({"type": "text", "text": remainder})
+    return blocks
+
+
+def _chat_messages(
+    messages: list[LLMMessage], system_prompt: Optional[str] = None
+) -> list[dict[str, str]]:
+    """Convert messages to OpenAI/Ollama chat format."""
+    chat_messages = []
+    if system_prompt:
+        chat_messages.append({"role": "system", "content": system_prompt})
+    for msg in messages:
+        chat_messages.append({"role": msg.role.value, "content": msg.content})
+    return chat_messages
+
 
 class BaseLLMClient(ABC):
     """Abstract base class for LLM clients."""
@@ -106,6 +183,17 @@ class BaseLLMClient(ABC):
         """Check if the provider is available."""
         pass
 
+    # Clients that can yield text as it is generated override stream()
+    supports_streaming: bool = False
+
+    def stream(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield completion text chunks as the provider generates them."""
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+
 
 class AnthropicClient(BaseLLMClient):
     """Client for Anthropic Claude API."""
@@ -154,18 +242,14 @@ class AnthropicClient(BaseLLMClient):
             )
 
         # Convert messages to Anthropic format
-        anthropic_messages = [
-            {"role": msg.role.value, "content": msg.content}
-            for msg in messages
-            if msg.role != LLMRole.SYSTEM
-        ]
+        anthropic_messages = _anthropic_messages(messages)
 
         for attempt in range(self.config.max_retries):
             try:
                 response = self._client.messages.create(
                     model=self.config.model,
                     max_tokens=self.config.max_tokens,
-                    system=system_prompt or "",
+                    system=_anthropic_system(system_prompt, self.config.prompt_caching),
                     messages=anthropic_messages,
                 )
 
@@ -193,6 +277,24 @@ class AnthropicClient(BaseLLMClient):
             authority_violations=["request_failed"],
         )
 
+    supports_streaming = True
+
+    def stream(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Stream completion text from Claude."""
+        if not self._client:
+            raise RuntimeError("Anthropic client unavailable")
+        with self._client.messages.stream(
+            model=self.config.model,
+            max_tokens=self.config.max_tokens,
+            system=_anthropic_system(system_prompt, self.config.prompt_caching),
+            messages=_anthropic_messages(messages),
+        ) as stream:
+            yield from stream.text_stream
+
 
 class OpenAIClient(BaseLLMClient):
     """Client for OpenAI API."""
@@ -241,17 +343,7 @@ class OpenAIClient(BaseLLMClient):
             )
 
         # Convert messages to OpenAI format
-        openai_messages = []
-        if system_prompt:
-            openai_messages.append({"role": "system", "content": system_prompt})
-
-        for msg in messages:
-            openai_messages.append(
-                {
-                    "role": msg.role.value,
-                    "content": msg.content,
-                }
-            )
+        openai_messages = _chat_messages(messages, system_prompt)
 
         for attempt in range(self.config.max_retries):
             try:
@@ -286,6 +378,27 @@ class OpenAIClient(BaseLLMClient):
             authority_violations=["request_failed"],
         )
 
+    supports_streaming = True
+
+    def stream(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Stream completion text from OpenAI."""
+        if not self._client:
+            raise RuntimeError("OpenAI client unavailable")
+        response = self._client.chat.completions.create(
+            model=self.config.model,
+            messages=_chat_messages(messages, system_prompt),
+            max_tokens=self.config.max_tokens,
+            temperature=self.config.temperature,
+            stream=True,
+        )
+        for event in response:
+            if event.choices and event.choices[0].delta.content:
+                yield event.choices[0].delta.content
+
 
 class OllamaClient(BaseLLMClient):
     """
@@ -377,17 +490,7 @@ class OllamaClient(BaseLLMClient):
             )
 
         # Convert messages to Ollama format
-        ollama_messages = []
-        if system_prompt:
-            ollama_messages.append({"role": "system", "content": system_prompt})
-
-        for msg in messages:
-            ollama_messages.append(
-                {
-                    "role": msg.role.value,
-                    "content": msg.content,
-                }
-            )
+        ollama_messages = _chat_messages(messages, system_prompt)
 
         for attempt in range(self.config.max_retries):
             try:
@@ -439,6 +542,29 @@ class OllamaClient(BaseLLMClient):
             authority_violations=["request_failed"],
         )
 
+    supports_streaming = True
+
+    def stream(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Stream completion text from Ollama."""
+        if not self._client:
+            raise RuntimeError("Ollama unavailable - server not running or not reachable")
+        for part in self._client.chat(
+            model=self.config.model,
+            messages=_chat_messages(messages, system_prompt),
+            options={
+                "temperature": self.config.temperature,
+                "num_predict": self.config.max_tokens,
+            },
+            stream=True,
+        ):
+            content = part.get("message", {}).get("content", "")
+            if content:
+                yield content
+
     def list_models(self) -> list[str]:
         """List available models on the Ollama server."""
         if not self._client:
@@ -472,33 +598,72 @@ class OllamaClient(BaseLLMClient):
 
 
 class MockLLMClient(BaseLLMClient):
-    """Mock LLM client for testing."""
+    """
+    Mock LLM client for testing.
+
+    A MockLatencyProfile (from config.mock_profile or set_profile) adds
+    simulated latency, jitter, failures and per-token streaming delay so
+    the narration stack can be benchmarked offline.
+    """
 
     def __init__(self, config: LLMConfig):
         super().__init__(config)
         self._responses: list[str] = []
         self._response_index = 0
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.set_profile(config.mock_profile or MockLatencyProfile())
+
+    def set_profile(self, profile: MockLatencyProfile) -> None:
+        """Replace the simulated latency profile (reseeds sampling)."""
+        self.profile = profile
+        self._rng = random.Random(profile.seed)
+
+    def _simulate_request(self) -> bool:
+        """Count the call and sleep for its latency; False if it should fail."""
+        profile = self.profile
+        with self._lock:
+            self.calls += 1
+            jitter = self._rng.uniform(-profile.jitter_ms, profile.jitter_ms)
+            failed = self._rng.random() < profile.failure_rate
+        delay_ms = max(0.0, profile.latency_ms + jitter)
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+        return not failed
 
     def set_responses(self, responses: list[str]) -> None:
         """Set canned responses for testing."""
-        self._responses = responses
-        self._response_index = 0
+        with self._lock:
+            self._responses = responses
+            self._response_index = 0
 
     def is_available(self) -> bool:
         """Mock client is always available."""
         return True
 
+    def _next_content(self) -> str:
+        """Next canned response (cycling), or the default placeholder."""
+        with self._lock:
+            if self._responses:
+                content = self._responses[self._response_index % len(self._responses)]
+                self._response_index += 1
+                return content
+        return "[Mock LLM response]"
+
     def complete(
         self,
         messages: list[LLMMessage],
         system_prompt: Optional[str] = None,
     ) -> LLMResponse:
         """Return mock response."""
-        if self._responses:
-            content = self._responses[self._response_index % len(self._responses)]
-            self._response_index += 1
-        else:
-            content = "[Mock LLM response]"
+        if not self._simulate_request():
+            return LLMResponse(
+                content="[LLM request failed after retries]",
+                model="mock",
+                provider=LLMProvider.MOCK,
+                authority_violations=["request_failed"],
+            )
+        content = self._next_content()
 
         return LLMResponse(
             content=content,
@@ -507,6 +672,142 @@ class MockLLMClient(BaseLLMClient):
             usage={"tokens": 100},
         )
 
+    supports_streaming = True
+
+    def stream(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield the mock response word by word."""
+        if not self._simulate_request():
+            raise RuntimeError("Simulated mock stream failure")
+        delay = self.profile.token_delay_ms / 1000
+        for index, token in enumerate(re.findall(r"\S+\s*|\s+", self._next_content())):
+            if delay and index:
+                time.sleep(delay)
+            yield token
+
+
+# Client results that count as provider failures for the circuit breaker
+PROVIDER_FAILURE_MARKERS = frozenset({"request_failed", "client_unavailable"})
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Requests flow normally
+    OPEN = "open"  # Failing fast
+    HALF_OPEN = "half_open"  # One probe request allowed
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+
+    After failure_threshold consecutive failures the circuit opens and
+    requests fail immediately instead of sitting through every client
+    retry. Once reset_timeout has passed a single probe is let through;
+    its outcome closes or re-opens the circuit. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        """State with the open timeout applied (lock held)."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may proceed (claims the probe if half-open)."""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            # A probe that never reported (e.g. an abandoned stream) expires
+            if state == CircuitState.HALF_OPEN and (
+                not self._probe_in_flight
+                or self._clock() - self._probe_started >= self.reset_timeout
+            ):
+                self._probe_in_flight = True
+                self._probe_started = self._clock()
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or on a failed probe."""
+        with self._lock:
+            self._failures += 1
+            if (
+                self._current_state() == CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                if self._state != CircuitState.OPEN:
+                    logger.warning(f"LLM circuit opened after {self._failures} failure(s)")
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+
+@dataclass
+class ProviderStats:
+    """Rolling call statistics for one provider."""
+
+    calls: int = 0
+    failures: int = 0
+    coalesced: int = 0
+    short_circuited: int = 0
+    total_latency_ms: int = 0
+
+    @property
+    def error_rate(self) -> float:
+        return self.failures / self.calls if self.calls else 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_latency_ms / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "coalesced": self.coalesced,
+            "short_circuited": self.short_circuited,
+            "error_rate": round(self.error_rate, 3),
+            "avg_latency_ms": round(self.avg_latency_ms, 1),
+        }
+
 
 class LLMManager:
     """
@@ -516,6 +817,7 @@ class LLMManager:
     - Client initialization and fallback
     - Response validation and sanitization
     - Authority boundary enforcement
+    - Per-provider circuit breakers and in-flight request coalescing
     - Logging and monitoring
     """
 
@@ -559,6 +861,34 @@ class LLMManager:
         _re.VERBOSE | _re.IGNORECASE,
     )
 
+    # Bounded forms of the patterns above for StreamingAuthorityValidator's
+    # sliding window: no match is longer than MAX_VIOLATION_LENGTH, so the
+    # holdback always sees one whole before any of it is released. Only the
+    # window uses these; full texts are checked with the patterns above.
+    MAX_VIOLATION_LENGTH = 64
+
+    _STREAM_DICE_ROLL_PATTERNS = _re.compile(
+        r"""
+        \brolls?\b | \brolling\b
+        | \brolled\s{1,4}(?:a\s{0,4})?\d
+        | \bd(?:20|12|10|8|6|4|100)\b
+        | \d{1,3}d\d
+        | \bmake\s{1,4}a\s{1,4}.{0,40}?\b(?:check|save|roll)\b
+        | \bsave\s{1,4}vs\b
+        | \bsaving\s{1,4}throw\b
+        """,
+        _re.VERBOSE | _re.IGNORECASE,
+    )
+
+    _STREAM_OUTCOME_PATTERNS = _re.compile(
+        r"""
+        \byou\s{1,4}(?:take|lose|gain)\s{1,4}\d
+        | \byou\s{1,4}(?:succeed|fail)\b
+        | \b(?:deals?|inflicts?)\s{1,4}\d{1,4}\s{1,4}damage\b
+        """,
+        _re.VERBOSE | _re.IGNORECASE,
+    )
+
     # Patterns allowed when narrating already-resolved actions
     NARRATION_CONTEXT_ALLOWED = [
         "damage",  # OK when describing what happened (without numbers)
@@ -578,6 +908,17 @@ class LLMManager:
         self.config = config or LLMConfig()
         self._client: Optional[BaseLLMClient] = None
         self._fallback_client: Optional[BaseLLMClient] = None
+
+        # Resilience state, keyed by provider
+        self._lock = threading.Lock()
+        self._breakers: dict[LLMProvider, CircuitBreaker] = {}
+        self._stats: dict[LLMProvider, ProviderStats] = {}
+        self._inflight: dict[tuple, Future] = {}
+
+        # Time spent in authority validation (benchmark instrumentation)
+        self._validation_calls = 0
+        self._validation_ms = 0.0
+
         self._initialize_clients()
 
     def _initialize_clients(self) -> None:
@@ -592,6 +933,11 @@ class LLMManager:
         elif self.config.provider == LLMProvider.MOCK:
             self._client = MockLLMClient(self.config)
 
+    @property
+    def primary_client(self) -> Optional[BaseLLMClient]:
+        """The configured provider client (None if initialization failed)."""
+        return self._client
+
     def is_available(self) -> bool:
         """Check if any LLM is available."""
         if self._client and self._client.is_available():
@@ -619,9 +965,9 @@ class LLMManager:
         """
         # Try primary client
         if self._client and self._client.is_available():
-            response = self._client.complete(messages, system_prompt)
+            client = self._client
         elif self._fallback_client and self._fallback_client.is_available():
-            response = self._fallback_client.complete(messages, system_prompt)
+            client = self._fallback_client
         else:
             return LLMResponse(
                 content="[No LLM available]",
@@ -630,11 +976,359 @@ class LLMManager:
                 authority_violations=["no_provider_available"],
             )
 
+        response = self._call(client, messages, system_prompt)
+
         # Validate and sanitize response
         response = self._validate_response(response, allow_narration_context)
 
         return response
 
+    def stream(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+        allow_narration_context: bool = False,
+    ) -> "LLMStream":
+        """
+        Stream an LLM completion, releasing only validated text.
+
+        Iterate the returned LLMStream for safe chunks; its response
+        attribute holds the validated LLMResponse once iteration ends.
+        Clients without native streaming yield their whole completion as
+        a single chunk.
+
+        Args:
+            messages: Conversation messages
+            system_prompt: System prompt to prepend
+            allow_narration_context: If True, allows damage/hit narration
+
+        Returns:
+            LLMStream
+        """
+        if self._client and self._client.is_available():
+            client = self._client
+        elif self._fallback_client and self._fallback_client.is_available():
+            client = self._fallback_client
+        else:
+            client = None
+        return LLMStream(self, client, messages, system_prompt, allow_narration_context)
+
+    def _create_async_client(self) -> Optional["AsyncLLMClient"]:
+        """
+        Build an async counterpart of the active blocking client.
+
+        Built per call, so tests and callers that replace _client get the
+        same behaviour on both paths. Native SDK clients hold connections
+        bound to the loop that created them (run_sync starts a fresh loop
+        for every complete_many call), so the caller must close() the
+        client before its loop ends.
+        """
+        from src.ai.async_llm_provider import create_async_client
+
+        if self._client and self._client.is_available():
+            return create_async_client(self._client)
+        if self._fallback_client and self._fallback_client.is_available():
+            return create_async_client(self._fallback_client)
+        return None
+
+    async def acomplete(
+        self,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str] = None,
+        allow_narration_context: bool = False,
+    ) -> LLMResponse:
+        """
+        Async version of complete(); validation is identical.
+
+        Args:
+            messages: Conversation messages
+            system_prompt: System prompt to prepend
+            allow_narration_context: If True, allows damage/hit narration
+
+        Returns:
+            Validated and potentially sanitized LLMResponse
+        """
+        client = self._create_async_client()
+        try:
+            return await self._acomplete_with(
+                client, messages, system_prompt, allow_narration_context
+            )
+        finally:
+            if client is not None:
+                await client.close()
+
+    async def _acomplete_with(
+        self,
+        client: Optional["AsyncLLMClient"],
+        messages: list[LLMMessage],
+        system_prompt: Optional[str],
+        allow_narration_context: bool,
+    ) -> LLMResponse:
+        """acomplete() on a client owned by the caller."""
+        if client is None:
+            return LLMResponse(
+                content="[No LLM available]",
+                model="none",
+                provider=LLMProvider.MOCK,
+                authority_violations=["no_provider_available"],
+            )
+        response = await self._acall(client, messages, system_prompt)
+        return self._validate_response(response, allow_narration_context)
+
+    async def acomplete_many(
+        self,
+        requests: list["LLMRequest"],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Run several completions concurrently.
+
+        At most max_concurrency requests are in flight at once, all sharing
+        one async client that is closed when the batch ends. Results are
+        returned in request order.
+
+        Args:
+            requests: LLMRequest items
+            max_concurrency: Override for LLMConfig.max_concurrency
+            return_exceptions: If True, a failing request yields its
+                exception in place of a response instead of raising
+
+        Returns:
+            List of LLMResponse (or exceptions, see return_exceptions)
+        """
+        limit = max(1, max_concurrency or self.config.max_concurrency)
+        semaphore = asyncio.Semaphore(limit)
+        client = self._create_async_client()
+
+        async def run_one(request: "LLMRequest") -> LLMResponse:
+            async with semaphore:
+                return await self._acomplete_with(
+                    client,
+                    request.messages,
+                    request.system_prompt,
+                    request.allow_narration_context,
+                )
+
+        try:
+            return await asyncio.gather(
+                *(run_one(request) for request in requests),
+                return_exceptions=return_exceptions,
+            )
+        finally:
+            if client is not None:
+                await client.close()
+
+    def complete_many(
+        self,
+        requests: list["LLMRequest"],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Blocking wrapper around acomplete_many for synchronous callers.
+
+        Total latency is that of the slowest request (per concurrency
+        slot), not the sum of all requests.
+        """
+        if not requests:
+            return []
+        from src.ai.async_llm_provider import run_sync
+
+        return run_sync(self.acomplete_many(requests, max_concurrency, return_exceptions))
+
+    # -------------------------------------------------------------------------
+    # Circuit breaker and request coalescing
+    # -------------------------------------------------------------------------
+
+    def get_breaker(self, provider: LLMProvider) -> CircuitBreaker:
+        """Get (creating if needed) the circuit breaker for a provider."""
+        with self._lock:
+            breaker = self._breakers.get(provider)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self.config.breaker_failure_threshold,
+                    self.config.breaker_reset_timeout,
+                )
+                self._breakers[provider] = breaker
+            return breaker
+
+    def get_provider_stats(self) -> dict[str, dict[str, Any]]:
+        """Call statistics and circuit state for each provider used so far."""
+        with self._lock:
+            providers = list(self._stats)
+        return {provider.value: self.provider_context(provider) for provider in providers}
+
+    def provider_context(self, provider: Optional[LLMProvider] = None) -> dict[str, Any]:
+        """
+        Provider health snapshot for RunLog LLMCallEvent context.
+
+        Args:
+            provider: Provider to report (defaults to the configured one)
+        """
+        provider = provider or self.config.provider
+        with self._lock:
+            stats = self._stats.get(provider, ProviderStats()).to_dict()
+        return {
+            "provider": provider.value,
+            "circuit": self.get_breaker(provider).state.value,
+            **stats,
+        }
+
+    def _record(
+        self,
+        provider: LLMProvider,
+        latency_ms: int = 0,
+        failed: bool = False,
+        coalesced: bool = False,
+        short_circuited: bool = False,
+    ) -> None:
+        """Update provider statistics."""
+        with self._lock:
+            stats = self._stats.setdefault(provider, ProviderStats())
+            if coalesced:
+                stats.coalesced += 1
+            elif short_circuited:
+                stats.short_circuited += 1
+            else:
+                stats.calls += 1
+                stats.total_latency_ms += latency_ms
+                if failed:
+                    stats.failures += 1
+
+    @staticmethod
+    def _is_provider_failure(response: LLMResponse) -> bool:
+        return any(v in PROVIDER_FAILURE_MARKERS for v in response.authority_violations)
+
+    def _circuit_open_response(self, provider: LLMProvider, model: str) -> LLMResponse:
+        self._record(provider, short_circuited=True)
+        return LLMResponse(
+            content="[LLM circuit open - using fallback]",
+            model=model,
+            provider=provider,
+            authority_violations=["circuit_open"],
+        )
+
+    @staticmethod
+    def _coalesce_key(
+        provider: LLMProvider,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str],
+    ) -> tuple:
+        return (
+            provider,
+            system_prompt or "",
+            tuple((m.role.value, m.content) for m in messages),
+        )
+
+    def _join(self, key: tuple) -> tuple[Future, bool]:
+        """Return the in-flight future for key and whether the caller leads it."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _finish(
+        self,
+        key: tuple,
+        future: Future,
+        provider: LLMProvider,
+        started: float,
+        response: Optional[LLMResponse],
+        error: Optional[BaseException],
+    ) -> None:
+        """Publish a leader's outcome to followers and update breaker/stats."""
+        with self._lock:
+            self._inflight.pop(key, None)
+        failed = error is not None or (response is not None and self._is_provider_failure(response))
+        breaker = self.get_breaker(provider)
+        if failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        self._record(provider, int((time.time() - started) * 1000), failed=failed)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            # Snapshot before the leader validates (and mutates) its response
+            future.set_result(self._share(response))
+
+    @staticmethod
+    def _share(response: LLMResponse) -> LLMResponse:
+        """Independent copy of a raw response, marked as coalesced."""
+        return replace(
+            response,
+            usage=dict(response.usage),
+            authority_violations=list(response.authority_violations),
+            coalesced=True,
+        )
+
+    def _call(
+        self,
+        client: BaseLLMClient,
+        messages: list[LLMMessage],
+        system_prompt: Optional[str],
+    ) -> LLMResponse:
+        """
+        Call a blocking client behind its breaker, sharing identical
+        in-flight requests. Returns the raw (unvalidated) response.
+        """
+        provider = client.config.provider
+        key = self._coalesce_key(provider, messages, system_prompt)
+        future, leader = self._join(key)
+        if not leader:
+            self._record(provider, coalesced=True)
+            return self._share(future.result())
+
+        if not self.get_breaker(provider).allow_request():
+            response = self._circuit_open_response(provider, client.config.model)
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_result(self._share(response))
+            return response
+
+        started = time.time()
+        try:
+            response = client.complete(messages, system_prompt)
+        except BaseException as e:
+            self._finish(key, future, provider, started, None, e)
+            raise
+        self._finish(key, future, provider, started, response, None)
+        return response
+
+    async def _acall(
+        self,
+        client: "AsyncLLMClient",
+        messages: list[LLMMessage],
+        system_prompt: Optional[str],
+    ) -> LLMResponse:
+        """Async counterpart of _call; shares in-flight requests with it."""
+        provider = client.config.provider
+        key = self._coalesce_key(provider, messages, system_prompt)
+        future, leader = self._join(key)
+        if not leader:
+            self._record(provider, coalesced=True)
+            return self._share(await asyncio.wrap_future(future))
+
+        if not self.get_breaker(provider).allow_request():
+            response = self._circuit_open_response(provider, client.config.model)
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_result(self._share(response))
+            return response
+
+        started = time.time()
+        try:
+            response = await client.acomplete(messages, system_prompt)
+        except BaseException as e:
+            self._finish(key, future, provider, started, None, e)
+            raise
+        self._finish(key, future, provider, started, response, None)
+        return response
+
     def _validate_response(
         self,
         response: LLMResponse,
@@ -652,6 +1346,7 @@ class LLMManager:
         Uses word-boundary regex patterns to avoid false positives
         (e.g., "troll" should not trigger "roll" violation).
         """
+        started = time.perf_counter()
         violations = []
         content = response.content
 
@@ -674,13 +1369,233 @@ class LLMManager:
             response.content = response.content[: self.config.max_response_length] + "..."
             response.sanitized = True
 
+        self._add_validation_time((time.perf_counter() - started) * 1000, calls=1)
         return response
 
+    def _add_validation_time(self, elapsed_ms: float, calls: int = 0) -> None:
+        with self._lock:
+            self._validation_calls += calls
+            self._validation_ms += elapsed_ms
+
+    def get_validation_stats(self) -> dict[str, Any]:
+        """Cumulative time spent validating responses and streamed chunks."""
+        with self._lock:
+            calls, total = self._validation_calls, self._validation_ms
+        return {
+            "calls": calls,
+            "total_ms": total,
+            "mean_ms": total / calls if calls else 0.0,
+        }
+
     def get_mock_client(self) -> MockLLMClient:
         """Get a mock client for testing."""
         return MockLLMClient(self.config)
 
 
+class StreamingAuthorityValidator:
+    """
+    Incremental authority check for streamed text.
+
+    The newest holdback characters are never released: each feed rescans
+    a sliding window (the held-back tail of released text plus everything
+    new) and releases up to the last word boundary before the holdback.
+    Any violation no longer than holdback is therefore caught before a
+    single character of it reaches the player; the default holdback is
+    LLMManager.MAX_VIOLATION_LENGTH, the longest match the bounded stream
+    patterns allow. Before the final flush the whole text is checked again
+    with final_patterns, which may be unbounded. Once a violation is seen
+    nothing further is released.
+    """
+
+    def __init__(
+        self,
+        patterns: list["re.Pattern[str]"],
+        holdback: int = LLMManager.MAX_VIOLATION_LENGTH,
+        max_length: Optional[int] = None,
+        final_patterns: Optional[list["re.Pattern[str]"]] = None,
+    ):
+        """
+        Args:
+            patterns: Bounded violation patterns for the sliding window
+            holdback: Characters withheld behind the newest input
+            max_length: Truncate (with "...") after this many characters
+            final_patterns: Patterns checked against the whole text before
+                the final flush (defaults to patterns)
+        """
+        self._patterns = patterns
+        self._final_patterns = final_patterns or patterns
+        self.holdback = holdback
+        self.max_length = max_length
+        self._text = ""
+        self.released = 0
+        self.blocked = False
+        self.truncated = False
+
+    def feed(self, chunk: str) -> str:
+        """Add streamed text; return the newly safe prefix (may be empty)."""
+        if self.blocked or self.truncated:
+            return ""
+        self._text += chunk
+        return self._release(final=False)
+
+    def finish(self) -> str:
+        """End of stream; return whatever remains safe to release."""
+        if self.blocked or self.truncated:
+            return ""
+        if any(pattern.search(self._text) for pattern in self._final_patterns):
+            self.blocked = True
+            return ""
+        return self._release(final=True)
+
+    def _release(self, final: bool) -> str:
+        window_start = max(0, self.released - self.holdback)
+        window = self._text[window_start:]
+        for pattern in self._patterns:
+            for match in pattern.finditer(window):
+                if window_start + match.end() > self.released:
+                    self.blocked = True
+                    return ""
+
+        end = len(self._text)
+        if not final:
+            limit = end - self.holdback
+            if limit <= self.released:
+                return ""  # Everything unreleased is still inside the holdback
+            cut = max(self._text.rfind(ws, self.released, limit) for ws in " \n\t")
+            if cut < self.released:
+                return ""  # No complete word outside the holdback yet
+            end = cut + 1
+
+        suffix = ""
+        if self.max_length is not None and end > self.max_length:
+            end = self.max_length
+            suffix = "..."
+            self.truncated = True
+
+        safe = self._text[self.released:end] + suffix
+        self.released = end
+        return safe
+
+
+class LLMStream:
+    """
+    An in-progress streamed completion from LLMManager.stream().
+
+    Iterating yields validated text chunks. After iteration, response is
+    the full validated LLMResponse (authority violations included), exactly
+    as complete() would have returned it, and first_chunk_ms records the
+    time to the first released text.
+    """
+
+    def __init__(
+        self,
+        manager: LLMManager,
+        client: Optional[BaseLLMClient],
+        messages: list[LLMMessage],
+        system_prompt: Optional[str],
+        allow_narration_context: bool,
+    ):
+        self._manager = manager
+        self._client = client
+        self._messages = messages
+        self._system_prompt = system_prompt
+        self._allow_narration_context = allow_narration_context
+        self._start = 0.0
+        self.response: Optional[LLMResponse] = None
+        self.first_chunk_ms: Optional[int] = None
+
+    def _elapsed_ms(self) -> int:
+        return int((time.time() - self._start) * 1000)
+
+    def _emit(self, text: str) -> str:
+        if self.first_chunk_ms is None:
+            self.first_chunk_ms = self._elapsed_ms()
+        return text
+
+    def _complete_blocking(self) -> Iterator[str]:
+        """Non-streaming path: validate the whole completion, emit it once."""
+        assert self._client is not None
+        response = self._manager._call(self._client, self._messages, self._system_prompt)
+        self.response = self._manager._validate_response(
+            response, self._allow_narration_context
+        )
+        if not self.response.authority_violations:
+            yield self._emit(self.response.content)
+
+    def __iter__(self) -> Iterator[str]:
+        if self.response is not None:
+            return
+        self._start = time.time()
+        client = self._client
+        if client is None:
+            self.response = LLMResponse(
+                content="[No LLM available]",
+                model="none",
+                provider=LLMProvider.MOCK,
+                authority_violations=["no_provider_available"],
+            )
+            return
+        if not client.supports_streaming:
+            yield from self._complete_blocking()
+            return
+
+        manager = self._manager
+        provider = client.config.provider
+        breaker = manager.get_breaker(provider)
+        if not breaker.allow_request():
+            self.response = manager._circuit_open_response(provider, client.config.model)
+            return
+
+        validator = StreamingAuthorityValidator(
+            [manager._STREAM_DICE_ROLL_PATTERNS, manager._STREAM_OUTCOME_PATTERNS],
+            max_length=manager.config.max_response_length,
+            final_patterns=[manager._DICE_ROLL_PATTERNS, manager._OUTCOME_PATTERNS],
+        )
+        received: list[str] = []
+        validating = 0.0
+        chunks = client.stream(self._messages, self._system_prompt)
+        try:
+            # Read to the end even once the validator stops releasing, so
+            # response holds the whole completion just as complete() would
+            for chunk in chunks:
+                received.append(chunk)
+                started = time.perf_counter()
+                safe = validator.feed(chunk)
+                validating += time.perf_counter() - started
+                if safe:
+                    yield self._emit(safe)
+        except Exception as e:
+            breaker.record_failure()
+            manager._record(provider, self._elapsed_ms(), failed=True)
+            if validator.released:
+                raise
+            # Nothing shown yet: fall back to the blocking path and its retries
+            logger.warning(f"LLM stream failed before first chunk, retrying blocking: {e}")
+            yield from self._complete_blocking()
+            return
+        finally:
+            manager._add_validation_time(validating * 1000)
+            close = getattr(chunks, "close", None)
+            if close:
+                close()
+
+        breaker.record_success()
+        manager._record(provider, self._elapsed_ms())
+
+        tail = validator.finish()
+        if tail:
+            yield self._emit(tail)
+
+        self.response = manager._validate_response(
+            LLMResponse(
+                content="".join(received),
+                model=client.config.model,
+                provider=client.config.provider,
+            ),
+            self._allow_narration_context,
+        )
+
+
 def get_llm_manager(config: Optional[LLMConfig] = None) -> LLMManager:
     """Factory function to get an LLM manager instance."""
     return LLMManager(config)
@@ -6,13 +6,15 @@ game lore, rules, and content to enrich LLM-generated narratives.
 
 Architecture:
 - LoreSearchInterface: Abstract protocol for lore retrieval
-- VectorLoreSearch: Implementation using RulesRetriever (ChromaDB)
+- VectorLoreSearch: Implementation using RulesRetriever (ChromaDB or local store)
 - NullLoreSearch: No-op implementation for when vector DB is disabled
 """
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Optional, Protocol, runtime_checkable
 import logging
 
@@ -168,12 +170,21 @@ class NullLoreSearch:
         }
 
 
+@lru_cache(maxsize=1)
+def _content_category_maps() -> tuple[dict[LoreCategory, Any], dict[Any, LoreCategory]]:
+    """LoreCategory <-> ContentCategory maps, built once on first vector search."""
+    from src.vector_db.rules_retriever import ContentCategory
+
+    to_content = {LoreCategory(c.value): c for c in ContentCategory}
+    return to_content, {c: lore for lore, c in to_content.items()}
+
+
 class VectorLoreSearch:
     """
     Vector database implementation using RulesRetriever.
 
-    Wraps the existing ChromaDB-based RulesRetriever to provide
-    lore search functionality to the DM Agent.
+    Wraps RulesRetriever (backed by ChromaDB, a LocalVectorStore or the
+    keyword fallback) to provide lore search functionality to the DM Agent.
     """
 
     def __init__(self, retriever: Any):
@@ -187,6 +198,11 @@ class VectorLoreSearch:
         self._available = retriever is not None
         logger.info(f"VectorLoreSearch initialized, available: {self._available}")
 
+    @property
+    def retriever(self) -> Any:
+        """The wrapped RulesRetriever (for indexing content into it)."""
+        return self._retriever
+
     def search(self, query: LoreSearchQuery) -> list[LoreSearchResult]:
         """
         Search for lore using the vector database.
@@ -201,63 +217,35 @@ class VectorLoreSearch:
             return []
 
         try:
-            # Build search context for the retriever
-            from src.vector_db.rules_retriever import SearchContext, ContentCategory
-
-            # Map LoreCategory to ContentCategory
-            category_map = {
-                LoreCategory.RULES: ContentCategory.RULES,
-                LoreCategory.LORE: ContentCategory.LORE,
-                LoreCategory.HEX: ContentCategory.HEX,
-                LoreCategory.NPC: ContentCategory.NPC,
-                LoreCategory.MONSTER: ContentCategory.MONSTER,
-                LoreCategory.SPELL: ContentCategory.SPELL,
-                LoreCategory.ITEM: ContentCategory.ITEM,
-                LoreCategory.FACTION: ContentCategory.FACTION,
-                LoreCategory.SETTLEMENT: ContentCategory.SETTLEMENT,
-                LoreCategory.DUNGEON: ContentCategory.DUNGEON,
-                LoreCategory.ENCOUNTER: ContentCategory.ENCOUNTER,
-            }
+            from src.vector_db.rules_retriever import SearchContext
+
+            to_content, from_content = _content_category_maps()
 
             # Build context
             context = SearchContext(
                 current_hex=query.current_hex,
                 current_npc=query.current_npc,
-                current_faction=query.current_faction,
+                active_faction=query.current_faction,
                 tags=query.tags,
             )
 
             # Determine categories to search
             categories = None
             if query.categories:
-                categories = [
-                    category_map.get(cat, ContentCategory.LORE)
-                    for cat in query.categories
-                    if cat in category_map
-                ]
-
-            # Execute search
-            if categories:
-                # Filter by categories
-                results = self._retriever.search(
-                    query=query.query,
-                    n_results=query.max_results,
-                    categories=categories,
-                )
-            else:
-                # Use contextual search
-                results = self._retriever.search_contextual(
-                    query=query.query,
-                    context=context,
-                    n_results=query.max_results,
-                )
+                categories = [to_content[cat] for cat in query.categories if cat in to_content]
+
+            # Execute search (context re-ranks; categories filter)
+            results = self._retriever.search(
+                query=query.query,
+                context=context,
+                n_results=query.max_results,
+                categories=categories or None,
+            )
 
             # Convert to LoreSearchResult
             lore_results = []
             for result in results:
-                # Map ContentCategory back to LoreCategory
-                reverse_map = {v: k for k, v in category_map.items()}
-                category = reverse_map.get(result.category, LoreCategory.LORE)
+                category = from_content.get(result.category, LoreCategory.LORE)
 
                 # Build source citation
                 source = result.metadata.get("source", "unknown")
@@ -322,12 +310,17 @@ class VectorLoreSearch:
         try:
             # Get document count from retriever if available
             doc_count = 0
-            if hasattr(self._retriever, "get_document_count"):
+            backend = "chromadb"
+            if hasattr(self._retriever, "get_statistics"):
+                stats = self._retriever.get_statistics()
+                doc_count = stats.get("total_documents", 0)
+                backend = stats.get("backend", backend)
+            elif hasattr(self._retriever, "get_document_count"):
                 doc_count = self._retriever.get_document_count()
 
             return {
                 "available": True,
-                "backend": "chromadb",
+                "backend": backend,
                 "document_count": doc_count,
                 "embedding_model": getattr(self._retriever, "_embedding_model", "unknown"),
             }
@@ -416,6 +409,8 @@ def create_lore_search(
     use_vector_db: bool = True,
     mock_embeddings: bool = False,
     retriever: Optional[Any] = None,
+    local_embeddings: bool = False,
+    vector_store_path: Optional[Path] = None,
 ) -> LoreSearchInterface:
     """
     Factory function to create the appropriate LoreSearch implementation.
@@ -424,6 +419,8 @@ def create_lore_search(
         use_vector_db: Whether to use vector DB
         mock_embeddings: Whether to use mock embeddings (testing)
         retriever: Optional pre-configured retriever
+        local_embeddings: Use a LocalVectorStore instead of ChromaDB
+        vector_store_path: Directory of a persisted LocalVectorStore
 
     Returns:
         Appropriate LoreSearchInterface implementation
@@ -457,6 +454,12 @@ def create_lore_search(
     try:
         from src.vector_db.rules_retriever import RulesRetriever
 
+        if local_embeddings:
+            from src.vector_db.vector_store import LocalVectorStore
+
+            store = LocalVectorStore(persist_directory=vector_store_path)
+            return VectorLoreSearch(RulesRetriever(vector_store=store))
+
         retriever = RulesRetriever()
         return VectorLoreSearch(retriever)
     except ImportError as e:
@@ -0,0 +1,184 @@
+"""
+Speculative narration prefetch for Dolmenwood Virtual DM.
+
+While the player reads the current turn, the most likely next narration
+requests (arriving in an adjacent hex, approaching a visible POI) are
+sent to the LLM in the background so the answer is already in the
+DMAgent response cache when the player commits to the action.
+
+The prefetcher never touches game state. It only receives PromptSchemas
+that VirtualDM captured from its real narration hooks, so a prefetched
+response is served exactly when the foreground call would have made the
+same request.
+
+Work is bounded three ways:
+- one worker thread, one request at a time (foreground calls never queue
+  behind a prefetch batch)
+- a per-schedule token budget
+- a generation counter: any new player action cancels queued work
+
+The worker shares the foreground DMAgent, so everything it touches is
+guarded: the response cache, LLMManager and MockLLMClient take their own
+locks, and DMAgent serialises prompt assembly, the lore cache and recent
+descriptions behind its state lock.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Any, Optional
+import logging
+import threading
+
+if TYPE_CHECKING:
+    from src.ai.dm_agent import DMAgent
+    from src.ai.prompt_schemas import PromptSchema
+
+logger = logging.getLogger(__name__)
+
+
+class NarrationPrefetcher:
+    """
+    Background cache warmer for likely next-turn narration.
+
+    Usage:
+        prefetcher = NarrationPrefetcher(agent, token_budget=8192)
+        prefetcher.schedule(schemas)   # after rendering a turn
+        prefetcher.cancel()            # when the player acts
+    """
+
+    def __init__(self, agent: "DMAgent", token_budget: int = 8192):
+        """
+        Args:
+            agent: DMAgent whose cache is warmed
+            token_budget: Maximum estimated tokens spent per schedule() call
+        """
+        self.agent = agent
+        self.token_budget = token_budget
+
+        self._queue: deque[tuple[int, "PromptSchema"]] = deque()
+        self._generation = 0
+        self._busy = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+        self.scheduled = 0
+        self.warmed = 0
+        self.skipped = 0
+        self.cancelled = 0
+
+    def schedule(self, schemas: list["PromptSchema"]) -> int:
+        """
+        Replace pending work with a new set of schemas.
+
+        Schemas should be ordered most likely first; once the token
+        budget is exhausted the remainder is skipped. Schemas whose
+        response is already cached are skipped without cost.
+
+        Returns:
+            Number of schemas queued
+        """
+        with self._cond:
+            if self._closed:
+                return 0
+            self._drop_pending()
+            spent = 0
+            seen: set[str] = set()
+            for schema in schemas:
+                key = self.agent._make_cache_key(schema)
+                if key in seen or self.agent.is_cached(schema):
+                    self.skipped += 1
+                    continue
+                cost = self.agent.estimate_tokens(schema)
+                if spent + cost > self.token_budget:
+                    self.skipped += 1
+                    continue
+                seen.add(key)
+                spent += cost
+                self._queue.append((self._generation, schema))
+                self.scheduled += 1
+            queued = len(self._queue)
+            if queued:
+                self._ensure_worker()
+                self._cond.notify()
+            return queued
+
+    def cancel(self) -> None:
+        """
+        Drop all queued prefetches.
+
+        A request already in flight completes (its response is harmless
+        to cache) but nothing further is started for the old state.
+        """
+        with self._cond:
+            self._drop_pending()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the queue is empty and no request is in flight.
+
+        Returns:
+            True if idle, False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def shutdown(self) -> None:
+        """Cancel pending work and stop the worker thread."""
+        with self._cond:
+            self._drop_pending()
+            self._closed = True
+            self._cond.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout=5.0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get prefetch counters."""
+        with self._cond:
+            return {
+                "scheduled": self.scheduled,
+                "warmed": self.warmed,
+                "skipped": self.skipped,
+                "cancelled": self.cancelled,
+                "pending": len(self._queue),
+                "token_budget": self.token_budget,
+            }
+
+    def _drop_pending(self) -> None:
+        """Advance the generation and discard the queue (lock held)."""
+        self._generation += 1
+        self.cancelled += len(self._queue)
+        self._queue.clear()
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use (lock held)."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="narration-prefetch", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Worker loop: warm one schema at a time."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if self._closed:
+                    return
+                generation, schema = self._queue.popleft()
+                if generation != self._generation:
+                    self.cancelled += 1
+                    continue
+                self._busy = True
+
+            try:
+                results = self.agent.warm_cache([schema])
+                warmed = any(r.success for r in results)
+            except Exception as e:
+                logger.warning(f"Narration prefetch failed: {e}")
+                warmed = False
+
+            with self._cond:
+                self._busy = False
+                if warmed:
+                    self.warmed += 1
+                self._cond.notify_all()
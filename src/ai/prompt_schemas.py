@@ -7,13 +7,18 @@ Each schema defines:
 - Output structure
 - Strict instructions for LLM behavior
 
+PromptSchema.assemble() renders a schema for sending: the system prompt
+carries a stable per-schema-type prefix (cached, so providers can reuse
+their prompt cache), and history/lore inputs are trimmed to fit a token
+budget.
+
 CRITICAL: These schemas enforce that the LLM is ADVISORY ONLY.
 The LLM may NOT decide outcomes, roll dice, or alter game state.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, is_dataclass, replace
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 import json
 
 
@@ -40,6 +45,64 @@ class PromptSchemaType(str, Enum):
     NARRATIVE_INTENT_PARSE = "narrative_intent_parse"
 
 
+# =============================================================================
+# PROMPT ASSEMBLY
+# =============================================================================
+
+
+BASE_SYSTEM_PROMPT = """You are the descriptive voice of a Dolmenwood virtual DM assistant.
+
+CRITICAL CONSTRAINTS - You MUST follow these rules:
+1. You may ONLY provide descriptions and narration
+2. You may NEVER decide outcomes, success, or failure
+3. You may NEVER roll dice or generate random numbers
+4. You may NEVER alter game state or apply effects
+5. You may NEVER invent rules or mechanics
+6. You may NEVER reveal hidden information unless explicitly provided
+7. You may NEVER suggest specific actions the player should take
+
+Your role is purely descriptive and atmospheric. The Python game system handles
+all mechanical resolutions. You bring the world to life through evocative prose."""
+
+# Rough characters-per-token ratio for English prose
+CHARS_PER_TOKEN = 4
+
+# Stable system prefix per schema class (see PromptSchema.get_system_prefix)
+_SYSTEM_PREFIX_CACHE: dict[type, str] = {}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text (~4 characters per token, rounded up)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+class SystemPrompt(str):
+    """
+    System prompt text that remembers its stable prefix.
+
+    Behaves exactly like str. Providers with explicit prompt caching mark
+    cacheable_prefix as a cache breakpoint; the prefix is identical for
+    every request of the same schema type.
+    """
+
+    cacheable_prefix: str
+
+    def __new__(cls, text: str, cacheable_prefix: str = "") -> "SystemPrompt":
+        prompt = super().__new__(cls, text)
+        prompt.cacheable_prefix = cacheable_prefix if text.startswith(cacheable_prefix) else ""
+        return prompt
+
+
+@dataclass
+class AssembledPrompt:
+    """A schema rendered for sending to the LLM."""
+
+    system_prompt: SystemPrompt
+    user_prompt: str
+    estimated_tokens: int
+    trimmed_inputs: list[str] = field(default_factory=list)  # Shortened to fit budget
+
+
 # =============================================================================
 # BASE SCHEMA
 # =============================================================================
@@ -53,6 +116,15 @@ class PromptSchema:
     inputs: dict[str, Any]
     instructions: str = ""
 
+    # False when get_system_prompt() varies with the inputs; only the
+    # base prompt is then treated as the stable prefix
+    static_system_prompt: ClassVar[bool] = True
+
+    # History/lore inputs that may be shortened to fit a token budget,
+    # least important first. Lists lose their oldest entries, strings
+    # are dropped. Constraint inputs (e.g. hidden topics) never belong here.
+    trimmable_inputs: ClassVar[tuple[str, ...]] = ()
+
     def validate_inputs(self) -> list[str]:
         """Validate that all required inputs are present."""
         errors = []
@@ -75,19 +147,82 @@ class PromptSchema:
 
     def _get_base_system_prompt(self) -> str:
         """Base system prompt enforcing authority boundaries."""
-        return """You are the descriptive voice of a Dolmenwood virtual DM assistant.
-
-CRITICAL CONSTRAINTS - You MUST follow these rules:
-1. You may ONLY provide descriptions and narration
-2. You may NEVER decide outcomes, success, or failure
-3. You may NEVER roll dice or generate random numbers
-4. You may NEVER alter game state or apply effects
-5. You may NEVER invent rules or mechanics
-6. You may NEVER reveal hidden information unless explicitly provided
-7. You may NEVER suggest specific actions the player should take
+        return BASE_SYSTEM_PROMPT
+
+    def get_system_prefix(self) -> str:
+        """
+        Stable system prompt prefix for this schema type.
+
+        Rendered once per schema class. For static system prompts this is
+        the whole system prompt; otherwise it is the base prompt.
+        """
+        cls = type(self)
+        prefix = _SYSTEM_PREFIX_CACHE.get(cls)
+        if prefix is None:
+            prefix = self.get_system_prompt() if cls.static_system_prompt else BASE_SYSTEM_PROMPT
+            _SYSTEM_PREFIX_CACHE[cls] = prefix
+        return prefix
+
+    def assemble(self, max_tokens: Optional[int] = None) -> AssembledPrompt:
+        """
+        Render the system and user prompts for sending.
+
+        Args:
+            max_tokens: Estimated input token budget (system + user). When
+                exceeded, trimmable_inputs are shortened in order until the
+                prompt fits or nothing is left to trim.
+
+        Returns:
+            AssembledPrompt
+        """
+        prefix = self.get_system_prefix()
+        system = prefix if self.static_system_prompt else self.get_system_prompt()
+        user = self.build_prompt()
+        trimmed: list[str] = []
+
+        if max_tokens is not None:
+            user_budget = max_tokens - estimate_tokens(system)
+            if estimate_tokens(user) > user_budget:
+                user, trimmed = self._trim_to_budget(user, user_budget)
+
+        return AssembledPrompt(
+            system_prompt=SystemPrompt(system, prefix),
+            user_prompt=user,
+            estimated_tokens=estimate_tokens(system) + estimate_tokens(user),
+            trimmed_inputs=trimmed,
+        )
 
-Your role is purely descriptive and atmospheric. The Python game system handles
-all mechanical resolutions. You bring the world to life through evocative prose."""
+    def _trim_to_budget(self, user: str, budget: int) -> tuple[str, list[str]]:
+        """Shorten trimmable inputs until the user prompt fits budget."""
+        # build_prompt() renders from the typed inputs dataclass
+        attr = "typed_inputs" if hasattr(self, "typed_inputs") else "_inputs"
+        original = getattr(self, attr, None)
+        if not is_dataclass(original) or not self.trimmable_inputs:
+            return user, []
+
+        trimmed: list[str] = []
+        # Render from a copy so self.inputs (and cache keys) are unchanged
+        working = replace(original)
+        setattr(self, attr, working)
+        try:
+            for name in self.trimmable_inputs:
+                value = getattr(working, name, None)
+                if not value:
+                    continue
+                trimmed.append(name)
+                if isinstance(value, list):
+                    while value and estimate_tokens(user) > budget:
+                        value = value[1:]
+                        setattr(working, name, value)
+                        user = self.build_prompt()
+                else:
+                    setattr(working, name, type(value)())
+                    user = self.build_prompt()
+                if estimate_tokens(user) <= budget:
+                    break
+        finally:
+            setattr(self, attr, original)
+        return user, trimmed
 
 
 # =============================================================================
@@ -466,6 +601,8 @@ class NPCDialogueSchema(PromptSchema):
     - May hint at secrets but not expose them
     """
 
+    trimmable_inputs = ("previous_interactions", "faction_context")
+
     def __init__(self, inputs: NPCDialogueInputs):
         super().__init__(
             schema_type=PromptSchemaType.NPC_DIALOGUE,
@@ -1341,6 +1478,8 @@ class ResolvedActionInputs:
 class ResolvedActionSchema(PromptSchema):
     """Schema for narrating mechanically resolved actions."""
 
+    trimmable_inputs = ("narrative_hints", "location_context")
+
     def __init__(self, inputs: ResolvedActionInputs):
         super().__init__(schema_type=PromptSchemaType.RESOLVED_ACTION, inputs=vars(inputs))
         self.typed_inputs = inputs
@@ -1491,6 +1630,9 @@ class SpellCastNarrationSchema(PromptSchema):
     - Match the magic type's aesthetic (arcane=scholarly, fairy=whimsical, etc.)
     """
 
+    static_system_prompt = False
+    trimmable_inputs = ("narrative_hints", "location_context")
+
     def __init__(self, inputs: SpellCastNarrationInputs):
         super().__init__(
             schema_type=PromptSchemaType.SPELL_CAST,
@@ -1693,6 +1835,9 @@ class SpellRevelationSchema(PromptSchema):
     The LLM describes the EXPERIENCE of perceiving it.
     """
 
+    static_system_prompt = False
+    trimmable_inputs = ("aesthetic_notes", "location_context")
+
     def __init__(self, inputs: SpellRevelationInputs):
         super().__init__(
             schema_type=PromptSchemaType.SPELL_REVELATION,
@@ -1892,6 +2037,8 @@ class MythicInterpretationSchema(PromptSchema):
                         curse is removed but energy is wasted/drained in the process."
     """
 
+    static_system_prompt = False
+
     def __init__(self, inputs: MythicInterpretationInputs):
         super().__init__(
             schema_type=PromptSchemaType.MYTHIC_INTERPRETATION,
@@ -2079,6 +2226,8 @@ class IntentParseSchema(PromptSchema):
     map it to one of the available action IDs.
     """
 
+    trimmable_inputs = ("recent_context",)
+
     def __init__(self, inputs: IntentParseInputs):
         super().__init__(
             schema_type=PromptSchemaType.INTENT_PARSE,
@@ -2251,6 +2400,8 @@ class NarrativeIntentSchema(PromptSchema):
     5. Identify creative solutions that might warrant advantage
     """
 
+    trimmable_inputs = ("recent_actions",)
+
     def __init__(self, inputs: NarrativeIntentInputs):
         super().__init__(
             schema_type=PromptSchemaType.NARRATIVE_INTENT_PARSE,
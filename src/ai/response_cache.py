@@ -0,0 +1,303 @@
+"""
+Narration response cache for the DM Agent.
+
+Two tiers:
+- An in-memory LRU bounded by entry count and TTL
+- An optional SQLite-backed store that survives restarts
+
+Keys are structural hashes of a schema's type and inputs. They are
+computed by streaming the inputs into a BLAKE2 digest, which avoids the
+asdict() deep copy and json.dumps() of the whole input tree on every
+lookup, and are stable across processes so the disk tier can be shared
+between sessions.
+"""
+
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional, Union
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# STRUCTURAL HASHING
+# =============================================================================
+
+
+def _feed(digest: "hashlib._Hash", obj: Any) -> None:
+    """
+    Feed a type-tagged, order-stable encoding of obj into digest.
+
+    Other objects must declare a stable form through to_dict(); anything
+    else is rejected rather than hashed by str(), whose default repr
+    embeds a memory address and would change the key on every run.
+
+    Raises:
+        TypeError: If obj (or anything nested in it) has no stable encoding
+    """
+    if obj is None:
+        digest.update(b"N")
+    elif isinstance(obj, bool):
+        digest.update(b"T" if obj else b"F")
+    elif isinstance(obj, Enum):
+        digest.update(b"E")
+        _feed(digest, obj.value)
+    elif isinstance(obj, (int, float)):
+        digest.update(b"#" + repr(obj).encode() + b";")
+    elif isinstance(obj, str):
+        data = obj.encode()
+        digest.update(b"S" + str(len(data)).encode() + b":" + data)
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b"[" + str(len(obj)).encode() + b":")
+        for item in obj:
+            _feed(digest, item)
+        digest.update(b"]")
+    elif isinstance(obj, (set, frozenset)):
+        digest.update(b"{" + str(len(obj)).encode() + b":")
+        for item in sorted(obj, key=str):
+            _feed(digest, item)
+        digest.update(b"}")
+    elif isinstance(obj, dict):
+        digest.update(b"D" + str(len(obj)).encode() + b":")
+        for key in sorted(obj, key=str):
+            _feed(digest, str(key))
+            _feed(digest, obj[key])
+        digest.update(b"d")
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        digest.update(b"C" + type(obj).__name__.encode() + b":")
+        for f in fields(obj):
+            _feed(digest, f.name)
+            _feed(digest, getattr(obj, f.name))
+        digest.update(b"c")
+    elif callable(getattr(obj, "to_dict", None)):
+        digest.update(b"O" + type(obj).__name__.encode() + b":")
+        _feed(digest, obj.to_dict())
+        digest.update(b"o")
+    else:
+        raise TypeError(f"Cannot build a cache key from {type(obj).__name__!r}")
+
+
+def make_structural_key(schema_type: str, inputs: Any) -> str:
+    """
+    Compute a stable cache key for a schema type and its inputs.
+
+    Args:
+        schema_type: PromptSchemaType value
+        inputs: Schema inputs (dicts, lists, dataclasses, enums, scalars,
+            or objects with to_dict())
+
+    Returns:
+        Hex digest string
+
+    Raises:
+        TypeError: If inputs contain an object with no stable encoding
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _feed(digest, schema_type)
+    _feed(digest, inputs)
+    return digest.hexdigest()
+
+
+# =============================================================================
+# DISK TIER
+# =============================================================================
+
+
+class SQLiteResponseStore:
+    """
+    Persistent key/value store for cached responses.
+
+    A single table keyed by cache key, with the creation time used for
+    TTL expiry. Safe to share between threads.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file, or ":memory:"
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[tuple[str, float]]:
+        """Return (value, created) or None if missing or older than max_age."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        if max_age is not None and time.time() - row[1] > max_age:
+            return None
+        return row[0], row[1]
+
+    def put(self, key: str, value: str, created: Optional[float] = None) -> None:
+        """Insert or replace a response."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                (key, value, created if created is not None else time.time()),
+            )
+
+    def prune(self, max_age: float) -> int:
+        """Delete entries older than max_age seconds. Returns rows removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created < ?", (time.time() - max_age,)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# =============================================================================
+# TWO-TIER CACHE
+# =============================================================================
+
+
+class ResponseCache:
+    """
+    Size- and TTL-bounded LRU with an optional persistent second tier.
+
+    Memory misses fall through to the disk tier; disk hits are promoted
+    back into memory. Writes go to both tiers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: Optional[float] = None,
+        persist_path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Args:
+            max_entries: Maximum in-memory entries before LRU eviction
+            ttl_seconds: Entry lifetime (None = no expiry)
+            persist_path: SQLite file for the disk tier (None = memory only)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._store: Optional[SQLiteResponseStore] = None
+        if persist_path is not None:
+            try:
+                self._store = SQLiteResponseStore(persist_path)
+                if ttl_seconds is not None:
+                    self._store.prune(ttl_seconds)
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache persistence disabled: {e}")
+                self._store = None
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a response, refreshing its LRU position."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._expired(entry[1]):
+                    del self._entries[key]
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+
+        if self._store is not None:
+            stored = self._store.get(key, self.ttl_seconds)
+            if stored is not None:
+                with self._lock:
+                    self._insert(key, stored[0], stored[1])
+                    self.hits += 1
+                    self.disk_hits += 1
+                return stored[0]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response in both tiers."""
+        created = time.time()
+        with self._lock:
+            self._insert(key, value, created)
+        if self._store is not None:
+            self._store.put(key, value, created)
+
+    def _insert(self, key: str, value: str, created: float) -> None:
+        """Insert into the memory tier and evict (lock held)."""
+        self._entries[key] = (value, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry[1])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Clear both tiers."""
+        with self._lock:
+            self._entries.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit/miss counters and sizes."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "persistent": self._store is not None,
+        }
@@ -41,6 +41,7 @@ from src.content_loader.content_manager import ContentManager, ContentType
 from src.content_loader.pdf_parser import PDFParser, TextParser
 from src.vector_db.rules_retriever import (
     ContentCategory,
+    IndexedDocument,
     RulesRetriever,
     SearchContext,
     SearchResult,
@@ -503,6 +504,19 @@ class ContentPipeline:
         source: SourceReference,
     ) -> bool:
         """Index content in the vector store."""
+        document = self._build_index_document(content_id, content_type, data, source)
+        return self.retriever.index_document(
+            document.doc_id, document.category, document.text, document.metadata
+        )
+
+    def _build_index_document(
+        self,
+        content_id: str,
+        content_type: ContentType,
+        data: dict[str, Any],
+        source: SourceReference,
+    ) -> IndexedDocument:
+        """Build the retriever document for a piece of content."""
         category = self.TYPE_TO_CATEGORY.get(content_type, ContentCategory.RULES)
 
         # Build searchable text based on content type
@@ -531,7 +545,7 @@ class ContentPipeline:
             metadata["habitat"] = data.get("habitat", [])
 
         doc_id = f"{content_type.value}_{content_id}"
-        return self.retriever.index_document(doc_id, category, text, metadata)
+        return IndexedDocument(doc_id, category, text, metadata)
 
     def _build_searchable_text(self, content_type: ContentType, data: dict) -> str:
         """Build searchable text from content data."""
@@ -1037,7 +1051,7 @@ class ContentPipeline:
             Number of documents indexed
         """
         self.retriever.clear_all()
-        count = 0
+        documents = []
 
         for content_type in ContentType:
             all_content = self.content_manager.get_all_content(content_type)
@@ -1051,9 +1065,11 @@ class ContentPipeline:
                 if content_id:
                     source_id = data.get("_source_id", "unknown")
                     source = SourceReference(source_id=source_id, book_code="")
-                    if self._index_content(content_id, content_type, data, source):
-                        count += 1
+                    documents.append(
+                        self._build_index_document(content_id, content_type, data, source)
+                    )
 
+        count = self.retriever.bulk_index(documents).indexed
         logger.info(f"Re-indexed {count} documents")
         return count
 
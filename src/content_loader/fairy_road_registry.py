@@ -3,6 +3,11 @@
 Provides a centralized registry for fairy road lookup by:
 - road id
 - door hex id (which roads can be entered from a given hex)
+- road id -> exit door hexes
+
+Door lookups are served from a compiled index of immutable descriptors,
+built once after roads are registered, since hex travel asks about doors
+on every turn.
 
 This mirrors the patterns used by SpellRegistry and MonsterRegistry.
 """
@@ -12,7 +17,8 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from src.fairy_roads.models import FairyRoadCommon, FairyRoadDefinition, FairyRoadDoor
 
@@ -41,6 +47,11 @@ class DoorRef:
     door: FairyRoadDoor
 
 
+# Door directions that can be entered, and that can be exited through
+ENTRY_DIRECTIONS = ("entry", "endpoint")
+EXIT_DIRECTIONS = ("exit_only", "endpoint")
+
+
 class FairyRoadRegistry:
     def __init__(self):
         self._roads_by_id: dict[str, FairyRoadDefinition] = {}
@@ -48,6 +59,13 @@ class FairyRoadRegistry:
         self._common: Optional[FairyRoadCommon] = None
         self._loaded = False
 
+        # Compiled door index (rebuilt lazily after register())
+        self._index_built = False
+        self._door_index: dict[str, tuple[DoorRef, ...]] = {}
+        self._door_by_key: dict[tuple[str, str], DoorRef] = {}
+        self._enterable_by_hex: dict[str, tuple[Mapping[str, str], ...]] = {}
+        self._exits_by_road: dict[str, tuple[DoorRef, ...]] = {}
+
     @property
     def is_loaded(self) -> bool:
         return self._loaded
@@ -73,6 +91,7 @@ class FairyRoadRegistry:
         for road in result.all_roads:
             self.register(road)
 
+        self._build_door_index()
         self._loaded = True
         logger.info(f"Loaded {self.road_count} fairy roads")
         return self.road_count
@@ -84,6 +103,50 @@ class FairyRoadRegistry:
             hex_id = door.hex_id
             refs = self._doors_by_hex.setdefault(hex_id, [])
             refs.append(DoorRef(road_id=road.road_id, road_name=road.name, door=door))
+        self._index_built = False
+
+    def _build_door_index(self) -> None:
+        """Compile per-hex and per-road door lookups from the registered doors."""
+        self._door_index = {hex_id: tuple(refs) for hex_id, refs in self._doors_by_hex.items()}
+
+        self._door_by_key = {}
+        self._enterable_by_hex = {}
+        exits_by_road: dict[str, list[DoorRef]] = {}
+        for hex_id, refs in self._door_index.items():
+            enterable = []
+            for ref in refs:
+                self._door_by_key.setdefault((hex_id, ref.road_id), ref)
+                if ref.door.direction in ENTRY_DIRECTIONS:
+                    enterable.append(
+                        MappingProxyType(
+                            {
+                                "road_id": ref.road_id,
+                                "road_name": ref.road_name,
+                                "door_name": ref.door.name,
+                                "door_hex": ref.door.hex_id,
+                                "direction": ref.door.direction,
+                            }
+                        )
+                    )
+            if enterable:
+                self._enterable_by_hex[hex_id] = tuple(enterable)
+
+        # Exits in the road's own door order
+        for road in self._roads_by_id.values():
+            for door in road.doors:
+                if door.direction not in EXIT_DIRECTIONS:
+                    continue
+                for ref in self._door_index.get(door.hex_id, ()):
+                    if ref.road_id == road.road_id and ref.door == door:
+                        exits_by_road.setdefault(road.road_id, []).append(ref)
+                        break
+        self._exits_by_road = {road_id: tuple(refs) for road_id, refs in exits_by_road.items()}
+
+        self._index_built = True
+
+    def _ensure_door_index(self) -> None:
+        if not self._index_built:
+            self._build_door_index()
 
     def get_by_id(self, road_id: str) -> FairyRoadLookupResult:
         road = self._roads_by_id.get(road_id)
@@ -96,8 +159,24 @@ class FairyRoadRegistry:
         roads.sort(key=lambda r: r.name)
         return FairyRoadListResult(roads=roads, count=len(roads))
 
-    def get_doors_at_hex(self, hex_id: str) -> list[DoorRef]:
-        return list(self._doors_by_hex.get(hex_id, []))
+    def get_doors_at_hex(self, hex_id: str) -> tuple[DoorRef, ...]:
+        self._ensure_door_index()
+        return self._door_index.get(hex_id, ())
+
+    def get_enterable_doors(self, hex_id: str) -> tuple[Mapping[str, str], ...]:
+        """
+        Get read-only descriptors of the doors that can be entered from a hex.
+
+        Each descriptor has road_id, road_name, door_name, door_hex and
+        direction keys.
+        """
+        self._ensure_door_index()
+        return self._enterable_by_hex.get(hex_id, ())
+
+    def get_exit_doors(self, road_id: str) -> tuple[DoorRef, ...]:
+        """Get the doors a road can be exited through, in the road's door order."""
+        self._ensure_door_index()
+        return self._exits_by_road.get(road_id, ())
 
     def get_door(self, hex_id: str, road_id: str) -> Optional[DoorRef]:
         """
@@ -110,11 +189,8 @@ class FairyRoadRegistry:
         Returns:
             DoorRef if found, None otherwise
         """
-        doors = self._doors_by_hex.get(hex_id, [])
-        for door_ref in doors:
-            if door_ref.road_id == road_id:
-                return door_ref
-        return None
+        self._ensure_door_index()
+        return self._door_by_key.get((hex_id, road_id))
 
     def get_door_by_name(self, door_name: str) -> Optional[DoorRef]:
         """
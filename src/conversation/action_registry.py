@@ -422,8 +422,15 @@ def _create_default_registry() -> ActionRegistry:
         """Approach a point of interest."""
         hex_id = p.get("hex_id") or dm.hex_crawl.current_hex_id
         poi_index = int(p.get("poi_index", 0))
+        # Build narration inputs before approaching, matching any prefetch
+        narration_args = dm.poi_approach_narration_args(hex_id, poi_index)
         result = dm.hex_crawl.approach_poi(hex_id, poi_index)
-        return {"success": True, "message": result.get("message", "You approach the location.")}
+        response = {"success": True, "message": result.get("message", "You approach the location.")}
+        if result.get("success") and narration_args:
+            narration = dm.narrate_poi_approach(**narration_args)
+            if narration:
+                response["narration"] = narration
+        return response
 
     registry.register(ActionSpec(
         id="wilderness:approach_poi",
@@ -2060,7 +2067,8 @@ def _create_default_registry() -> ActionRegistry:
 
         Mirrors the working path in ConversationFacade:
         1. Fetch POI dungeon config via dm.hex_crawl.get_poi_dungeon_config()
-        2. Call dm.dungeon.enter_dungeon() with the config
+        2. Call dm.enter_dungeon() with the config (which also moves the
+           DM agent's lore context into the dungeon)
         """
         hex_id = p.get("hex_id") or dm.controller.party_state.location.location_id
         dungeon_id = p.get("dungeon_id") or "dungeon"
@@ -2073,9 +2081,9 @@ def _create_default_registry() -> ActionRegistry:
         except Exception:
             poi_config = {"hex_id": hex_id}
 
-        # Enter dungeon through the dungeon engine
+        # Enter dungeon through VirtualDM
         try:
-            result = dm.dungeon.enter_dungeon(
+            result = dm.enter_dungeon(
                 dungeon_id=dungeon_id,
                 entry_room=entrance_room,
                 poi_config=poi_config,
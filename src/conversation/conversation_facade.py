@@ -13,16 +13,17 @@ This file wires those action ids to concrete engine calls.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 import re
 import random
 
 if TYPE_CHECKING:
+    from src.ai.dm_agent import NarrationChunk, NarrationSink
     from src.main import VirtualDM
 
 from src.game_state.state_machine import GameState
 
-from src.conversation.types import TurnResponse, ChatMessage
+from src.conversation.types import TurnResponse, ChatMessage, SuggestedAction
 from src.conversation.suggestion_builder import build_suggestions
 from src.conversation.state_export import export_public_state, EventStream
 from src.conversation.action_registry import get_default_registry, ActionRegistry
@@ -45,6 +46,10 @@ class ConversationConfig:
     use_llm_intent_parsing: bool = True  # Try LLM parsing first
     llm_confidence_threshold: float = 0.7  # Minimum confidence to use LLM result
 
+    # Local intent classifier: resolve confident inputs without an LLM call
+    use_local_intent_classifier: bool = True
+    local_intent_confidence_threshold: float = 0.85
+
     # Upgrade D: Enhanced oracle integration
     use_oracle_enhancement: bool = True  # Detect ambiguity and offer oracle
     oracle_auto_suggest: bool = True  # Automatically suggest oracle for questions
@@ -80,7 +85,8 @@ class ConversationFacade:
         """Handle freeform player chat.
 
         Routing priority:
-        1. Try LLM intent parsing if enabled and DM agent available
+        1. Try LLM intent parsing if enabled and DM agent available,
+           resolving high-confidence inputs with the local classifier first
         2. Use pattern matching (hex IDs, keywords) as fallback
         3. Delegate to engine's handle_player_action()
         """
@@ -89,11 +95,17 @@ class ConversationFacade:
         if not text:
             return self._response([])
 
+        self._cancel_prefetch()
         character_id = character_id or self._default_character_id()
 
         # Try LLM intent parsing first (Upgrade A)
         if self.config.use_llm_intent_parsing and self.dm.dm_agent:
-            intent_result = self._try_llm_intent_parse(text, character_id)
+            suggestions = build_suggestions(self.dm, character_id=character_id, limit=20)
+            if self.config.use_local_intent_classifier:
+                local_result = self._try_local_intent(text, suggestions)
+                if local_result:
+                    return local_result
+            intent_result = self._try_llm_intent_parse(text, character_id, suggestions)
             if intent_result:
                 return intent_result
 
@@ -111,7 +123,105 @@ class ConversationFacade:
 
         return self._handle_freeform(text, character_id=character_id)
 
-    def _try_llm_intent_parse(self, text: str, character_id: str) -> Optional[TurnResponse]:
+    def handle_chat_streaming(
+        self,
+        text: str,
+        on_chunk: NarrationSink,
+        *,
+        character_id: Optional[str] = None,
+    ) -> TurnResponse:
+        """Streaming variant of handle_chat.
+
+        Narration generated during the turn is passed to on_chunk as it
+        arrives; the returned TurnResponse lists it in streamed_narration.
+        """
+        return self._streaming(
+            lambda: self.handle_chat(text, character_id=character_id), on_chunk
+        )
+
+    def handle_action_streaming(
+        self,
+        action_id: str,
+        params: Optional[dict[str, Any]] = None,
+        *,
+        on_chunk: NarrationSink,
+    ) -> TurnResponse:
+        """Streaming variant of handle_action."""
+        return self._streaming(lambda: self.handle_action(action_id, params), on_chunk)
+
+    def _streaming(
+        self, run_turn: Callable[[], TurnResponse], on_chunk: NarrationSink
+    ) -> TurnResponse:
+        """Run a turn with the DM agent streaming narration to on_chunk."""
+        agent = self.dm.dm_agent
+        if agent is None:
+            return run_turn()
+
+        streams: dict[int, list[str]] = {}
+        completed: list[str] = []
+
+        def sink(chunk: NarrationChunk) -> None:
+            parts = streams.setdefault(chunk.stream_id, [])
+            parts.append(chunk.text)
+            if chunk.done and not chunk.aborted:
+                completed.append("".join(parts))
+            on_chunk(chunk)
+
+        with agent.streaming(sink):
+            turn = run_turn()
+        turn.streamed_narration = completed
+        return turn
+
+    def _try_local_intent(
+        self, text: str, suggestions: list[SuggestedAction]
+    ) -> Optional[TurnResponse]:
+        """
+        Try to resolve player intent with the offline classifier.
+
+        Only accepts a prediction that is confident, currently suggested,
+        and has all required params; negated or questioning input and
+        anything else goes on to the LLM.
+
+        Returns TurnResponse if resolved locally, None otherwise.
+        """
+        try:
+            from src.conversation.intent_classifier import (
+                default_param_extractors,
+                get_local_intent_classifier,
+                requires_llm,
+            )
+
+            if requires_llm(text):
+                return None
+
+            by_id = {s.id: s for s in suggestions}
+            prediction = get_local_intent_classifier().predict(text, candidates=by_id)
+            if prediction.is_unknown:
+                return None
+            if prediction.confidence < self.config.local_intent_confidence_threshold:
+                return None
+
+            params = dict(by_id[prediction.action_id].params)
+            extractor = default_param_extractors().get(prediction.action_id)
+            if extractor:
+                params.update(extractor(text))
+            if self._registry.validate_params(prediction.action_id, params):
+                return None
+
+            self._add_recent_action(f"{prediction.action_id}: {text[:50]}")
+            return self.handle_action(prediction.action_id, params)
+
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).debug(f"Local intent classification failed: {e}")
+            return None
+
+    def _try_llm_intent_parse(
+        self,
+        text: str,
+        character_id: str,
+        suggestions: Optional[list[SuggestedAction]] = None,
+    ) -> Optional[TurnResponse]:
         """
         Try to parse player intent using LLM.
 
@@ -119,7 +229,8 @@ class ConversationFacade:
         """
         try:
             # Get available actions for current state
-            suggestions = build_suggestions(self.dm, character_id=character_id, limit=20)
+            if suggestions is None:
+                suggestions = build_suggestions(self.dm, character_id=character_id, limit=20)
             available_actions = [s.id for s in suggestions]
 
             # Get location context
@@ -184,6 +295,7 @@ class ConversationFacade:
         """Execute a clicked suggestion (action_id + params)."""
 
         params = params or {}
+        self._cancel_prefetch()
 
         # ------------------------------------------------------------------
         # Try ActionRegistry first (Upgrade B: Unified action routing)
@@ -345,8 +457,17 @@ class ConversationFacade:
 
         resp.requires_clarification = requires_clarification
         resp.clarification_prompt = clarification_prompt
+
+        # Warm narration for the likely next actions while the player reads
+        if self.dm.dm_agent:
+            self.dm.prefetch_narration(resp.suggested_actions)
         return resp
 
+    def _cancel_prefetch(self) -> None:
+        """Drop speculative narration queued for the previous turn."""
+        if self.dm.dm_agent:
+            self.dm.cancel_prefetch()
+
     def _default_character_id(self) -> str:
         chars = self.dm.controller.get_active_characters()
         if chars:
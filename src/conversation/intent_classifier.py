@@ -0,0 +1,275 @@
+"""src.conversation.intent_classifier
+
+Offline intent classifier for common player commands.
+
+Sits in front of LLM intent parsing in ConversationFacade.handle_chat so
+that everyday inputs ("search the room", "make camp") resolve locally and
+only ambiguous text pays for an LLM round trip.
+
+Model:
+- Features are TF-IDF weighted word unigrams, word bigrams and character
+  n-grams (3-4) taken within word boundaries, L2-normalized.
+- Each action is represented by the normalized centroid of its training
+  examples (a linear nearest-centroid classifier).
+- Training examples come from the fallback pattern tables in
+  narrative_resolver and the labels/ids of ActionRegistry specs. An
+  "unknown" class trained on filler phrases absorbs off-domain text.
+- Confidence is a softmax over cosine scores restricted to the candidate
+  actions plus the unknown class.
+- Bag-of-words features cannot see negation or questions ("don't make
+  camp", "should we rest?"), so requires_llm() flags such input and the
+  facade sends it straight to the LLM instead of acting on it.
+
+Stdlib only; training is a single pass and takes a few milliseconds.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
+import math
+import re
+
+
+UNKNOWN_ACTION = "unknown"
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# Filler phrases for the unknown class: text that carries no action signal
+_UNKNOWN_EXAMPLES = (
+    "i", "we", "the", "a", "it", "at the", "to the", "i want to", "let's",
+    "what about", "hmm", "ok", "okay", "yes", "no", "maybe", "please",
+    "and then", "with my", "the enemies", "my sword", "something else",
+    "i think", "tell me more",
+)
+
+
+# Words that negate or redirect a command ("don't search", "leave instead")
+_NEGATION_WORDS = frozenset(
+    {"not", "no", "never", "don't", "dont", "instead", "without", "rather", "nor"}
+)
+
+# Leading words that turn a command into a question ("should we rest here")
+_INTERROGATIVE_WORDS = frozenset(
+    {
+        "should", "shall", "can", "could", "would", "may", "might", "do", "does",
+        "did", "is", "are", "what", "why", "how", "when", "where", "who", "which",
+    }
+)
+
+
+def requires_llm(text: str) -> bool:
+    """
+    Whether text is negated or a question and must not be resolved locally.
+
+    Args:
+        text: Player input
+
+    Returns:
+        True if the text contains a question mark, a negation ("don't",
+        "not", "never", "instead", any "n't" contraction) or opens with an
+        interrogative word ("should we", "can we", "what")
+    """
+    if "?" in text:
+        return True
+    tokens = tokenize(text.replace("\u2019", "'"))
+    if not tokens:
+        return False
+    if tokens[0] in _INTERROGATIVE_WORDS:
+        return True
+    return any(t in _NEGATION_WORDS or t.endswith("n't") for t in tokens)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def extract_features(text: str) -> Counter[str]:
+    """Raw term counts for words, word bigrams and in-word char n-grams."""
+    tokens = tokenize(text)
+    features: Counter[str] = Counter()
+    for token in tokens:
+        features["w:" + token] += 1
+        padded = f" {token} "
+        for n in (3, 4):
+            for i in range(len(padded) - n + 1):
+                features["c:" + padded[i:i + n]] += 1
+    for first, second in zip(tokens, tokens[1:]):
+        features[f"b:{first} {second}"] += 1
+    return features
+
+
+def _normalize(vector: dict[str, float]) -> dict[str, float]:
+    """L2-normalize a sparse vector."""
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    if norm == 0:
+        return {}
+    return {k: v / norm for k, v in vector.items()}
+
+
+@dataclass
+class LocalIntentPrediction:
+    """Result of classifying one input."""
+
+    action_id: str
+    confidence: float
+    scores: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def is_unknown(self) -> bool:
+        return self.action_id == UNKNOWN_ACTION
+
+
+class LocalIntentClassifier:
+    """
+    TF-IDF nearest-centroid classifier over action ids.
+
+    Usage:
+        classifier = get_local_intent_classifier()
+        prediction = classifier.predict("make camp", candidates=["wilderness:end_day", ...])
+    """
+
+    def __init__(self, temperature: float = 12.0):
+        """
+        Args:
+            temperature: Softmax sharpness applied to cosine scores
+        """
+        self.temperature = temperature
+        self._idf: dict[str, float] = {}
+        self._centroids: dict[str, dict[str, float]] = {}
+
+    # ------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------
+    def fit(self, examples: Iterable[tuple[str, str]]) -> "LocalIntentClassifier":
+        """
+        Train from (text, action_id) pairs.
+
+        Returns:
+            self, for chaining
+        """
+        documents = [(extract_features(text), action_id) for text, action_id in examples]
+        documents = [(features, action_id) for features, action_id in documents if features]
+
+        doc_freq: Counter[str] = Counter()
+        for features, _ in documents:
+            doc_freq.update(features.keys())
+        total = len(documents)
+        self._idf = {
+            feature: math.log((1 + total) / (1 + df)) + 1.0 for feature, df in doc_freq.items()
+        }
+
+        sums: dict[str, dict[str, float]] = {}
+        for features, action_id in documents:
+            centroid = sums.setdefault(action_id, {})
+            for feature, weight in self._weigh(features).items():
+                centroid[feature] = centroid.get(feature, 0.0) + weight
+        self._centroids = {action_id: _normalize(vec) for action_id, vec in sums.items()}
+        return self
+
+    def _weigh(self, features: Counter[str]) -> dict[str, float]:
+        """TF-IDF weight and normalize a feature count vector."""
+        idf = self._idf
+        return _normalize(
+            {
+                feature: (1.0 + math.log(count)) * idf[feature]
+                for feature, count in features.items()
+                if feature in idf
+            }
+        )
+
+    @property
+    def actions(self) -> list[str]:
+        """Action ids the classifier knows (excluding unknown)."""
+        return [a for a in self._centroids if a != UNKNOWN_ACTION]
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
+    def predict(
+        self, text: str, candidates: Optional[Iterable[str]] = None
+    ) -> LocalIntentPrediction:
+        """
+        Classify text among candidate actions.
+
+        Args:
+            text: Player input
+            candidates: Action ids to consider (defaults to all known);
+                ids the classifier was not trained on are ignored
+
+        Returns:
+            LocalIntentPrediction; action_id is UNKNOWN_ACTION when the
+            unknown class wins or nothing overlaps the training vocabulary
+        """
+        vector = self._weigh(extract_features(text))
+        if not vector:
+            return LocalIntentPrediction(UNKNOWN_ACTION, 1.0)
+
+        names = list(candidates) if candidates is not None else self.actions
+        names = [a for a in dict.fromkeys(names) if a in self._centroids and a != UNKNOWN_ACTION]
+        names.append(UNKNOWN_ACTION)
+
+        scores: dict[str, float] = {}
+        for action_id in names:
+            centroid = self._centroids.get(action_id, {})
+            scores[action_id] = sum(w * centroid.get(f, 0.0) for f, w in vector.items())
+
+        best = max(scores, key=scores.__getitem__)
+        peak = scores[best]
+        exp_sum = sum(math.exp(self.temperature * (s - peak)) for s in scores.values())
+        return LocalIntentPrediction(best, 1.0 / exp_sum, scores)
+
+
+def default_training_examples() -> list[tuple[str, str]]:
+    """
+    Build training examples from the fallback pattern tables and the
+    default ActionRegistry.
+    """
+    from src.conversation.action_registry import get_default_registry
+    from src.narrative.narrative_resolver import ALL_PATTERN_TABLES
+
+    examples: list[tuple[str, str]] = []
+    for table in ALL_PATTERN_TABLES:
+        for keywords, action_id, _, _ in table:
+            examples.extend((keyword, action_id) for keyword in keywords)
+
+    for spec in get_default_registry().all():
+        examples.append((spec.label, spec.id))
+        examples.append((spec.id.split(":", 1)[-1].replace("_", " "), spec.id))
+
+    examples.extend((text, UNKNOWN_ACTION) for text in _UNKNOWN_EXAMPLES)
+    return examples
+
+
+@lru_cache(maxsize=1)
+def default_param_extractors() -> dict[str, Callable[[str], dict[str, Any]]]:
+    """First parameter extractor declared for each action id in the pattern tables."""
+    from src.narrative.narrative_resolver import ALL_PATTERN_TABLES
+
+    extractors: dict[str, Callable[[str], dict[str, Any]]] = {}
+    for table in ALL_PATTERN_TABLES:
+        for _, action_id, extractor, _ in table:
+            if extractor and action_id not in extractors:
+                extractors[action_id] = extractor
+    return extractors
+
+
+# Global default classifier instance (trained lazily)
+_default_classifier: Optional[LocalIntentClassifier] = None
+
+
+def get_local_intent_classifier() -> LocalIntentClassifier:
+    """Get the default classifier (singleton, trained on first use)."""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = LocalIntentClassifier().fit(default_training_examples())
+    return _default_classifier
+
+
+def reset_local_intent_classifier() -> None:
+    """Reset the default classifier (mainly for testing)."""
+    global _default_classifier
+    _default_classifier = None
@@ -49,6 +49,10 @@ class TurnResponse:
     requires_clarification: bool = False
     clarification_prompt: Optional[str] = None
 
+    # Streaming turns: narration already delivered chunk by chunk, so
+    # renderers can skip "dm" messages with identical content
+    streamed_narration: list[str] = field(default_factory=list)
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "messages": [m.__dict__ for m in self.messages],
@@ -67,4 +71,5 @@ class TurnResponse:
             "events": self.events,
             "requires_clarification": self.requires_clarification,
             "clarification_prompt": self.clarification_prompt,
+            "streamed_narration": self.streamed_narration,
         }
@@ -5,13 +5,17 @@ These structures persist across all states and no state owns data exclusively.
 Follows the specifications in Section 6 of the implementation spec.
 """
 
+from bisect import bisect_right
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any, Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.tables.table_types import GeneratedTreasureItem
+import math
 import random
 import uuid
 
@@ -424,6 +428,30 @@ class ActionType(str, Enum):
 # =============================================================================
 
 
+@lru_cache(maxsize=128)
+def _sum_distribution(num_dice: int, die_size: int) -> tuple[int, ...]:
+    """
+    Cumulative outcome counts for the total of num_dice dice of die_size.
+
+    Entry i is the number of the die_size ** num_dice equally likely
+    outcomes whose total is at most num_dice + i.
+    """
+    counts = [1]
+    for _ in range(num_dice):
+        widened = [0] * (len(counts) + die_size - 1)
+        for total, ways in enumerate(counts):
+            for face in range(die_size):
+                widened[total + face] += ways
+        counts = widened
+
+    cumulative = []
+    running = 0
+    for ways in counts:
+        running += ways
+        cumulative.append(running)
+    return tuple(cumulative)
+
+
 class DiceRoller:
     """
     Centralized randomization interface.
@@ -439,6 +467,7 @@ class DiceRoller:
     _seed: Optional[int] = None
     _roll_log: list = []
     _replay_session: Any = None  # ReplaySession when in replay mode
+    _quiet: bool = False  # Skip roll logging during headless bulk simulation
 
     def __new__(cls):
         if cls._instance is None:
@@ -481,6 +510,24 @@ class DiceRoller:
         """
         cls._replay_session = session
 
+    @classmethod
+    @contextmanager
+    def quiet(cls) -> Iterator[None]:
+        """
+        Suppress the roll log and RunLog roll events inside the block.
+
+        Rolls draw from the same random stream as usual, so results are
+        identical to logged rolls. Used by headless bulk simulation such as
+        faction fast-forward, where per-roll logging dominates the cost.
+        Replayed rolls are still consumed and logged.
+        """
+        previous = cls._quiet
+        cls._quiet = True
+        try:
+            yield
+        finally:
+            cls._quiet = previous
+
     @classmethod
     def get_replay_session(cls) -> Any:
         """Get the current replay session if any."""
@@ -565,12 +612,178 @@ class DiceRoller:
         result = DiceResult(
             notation=dice, rolls=rolls, modifier=modifier, total=total, reason=reason
         )
+        if cls._quiet:
+            return result
 
         cls._roll_log.append(result)
         # Log to RunLog for observability
         cls._log_to_run_log(dice, rolls, modifier, total, reason)
         return result
 
+    @classmethod
+    def roll_sum(cls, num_dice: int, die_size: int, reason: str = "") -> "DiceResult":
+        """
+        Roll many identical dice and keep only the total, in a single draw.
+
+        The total is sampled from the exact distribution of the sum of
+        num_dice independent rolls, so it is statistically identical to
+        rolling each die, but costs one draw and one log entry however
+        many dice are rolled. Used for multi-day spans such as 90 days of
+        1d3 healing. The logged result's rolls holds just the total.
+
+        Args:
+            num_dice: Number of dice (0 gives a total of 0)
+            die_size: Sides per die
+            reason: Why this roll is being made (for logging)
+
+        Returns:
+            DiceResult with notation like "90d3" and the summed total
+        """
+        notation = f"{num_dice}d{die_size}"
+        if num_dice <= 0:
+            return DiceResult(notation=notation, rolls=[], modifier=0, total=0, reason=reason)
+
+        # Check for replay mode
+        if cls.is_replaying() and cls._replay_session.has_next_roll():
+            recorded = cls._replay_session.get_next_roll()
+            if recorded:
+                total = recorded.get("total", sum(recorded.get("rolls", [])))
+                result = DiceResult(
+                    notation=notation, rolls=[total], modifier=0, total=total, reason=reason
+                )
+                cls._roll_log.append(result)
+                cls._log_to_run_log(notation, [total], 0, total, reason)
+                return result
+
+        # Normal roll: pick one of die_size ** num_dice equally likely outcomes
+        cumulative = _sum_distribution(num_dice, die_size)
+        outcome = random.randrange(cumulative[-1])
+        total = num_dice + bisect_right(cumulative, outcome)
+
+        result = DiceResult(
+            notation=notation, rolls=[total], modifier=0, total=total, reason=reason
+        )
+        if cls._quiet:
+            return result
+
+        cls._roll_log.append(result)
+        cls._log_to_run_log(notation, [total], 0, total, reason)
+        return result
+
+    @classmethod
+    def roll_until(
+        cls,
+        die_size: int,
+        stop: Callable[[int], bool],
+        max_rolls: int,
+        reason: str = "",
+    ) -> "DiceResult":
+        """
+        Roll 1d{die_size} repeatedly until stop(roll) is true or max_rolls is hit.
+
+        Each roll draws from the random stream exactly as a separate
+        1d{die_size} roll would, so later rolls see the same stream as a
+        one-at-a-time loop; only the logging is batched into one record.
+        Used to skip runs of uneventful per-segment checks.
+
+        Args:
+            die_size: Sides per die
+            stop: Predicate on a single roll that ends the run
+            max_rolls: Maximum number of rolls (at least 1 roll is made)
+            reason: Why these rolls are being made (for logging)
+
+        Returns:
+            DiceResult whose rolls are the individual results in order and
+            whose total is the final (stopping) roll
+        """
+        # Check for replay mode
+        if cls.is_replaying() and cls._replay_session.has_next_roll():
+            recorded = cls._replay_session.get_next_roll()
+            if recorded and recorded.get("rolls"):
+                rolls = list(recorded["rolls"])
+                notation = f"{len(rolls)}x1d{die_size}"
+                result = DiceResult(
+                    notation=notation, rolls=rolls, modifier=0, total=rolls[-1], reason=reason
+                )
+                cls._roll_log.append(result)
+                cls._log_to_run_log(notation, rolls, 0, rolls[-1], reason)
+                return result
+
+        rolls: list[int] = []
+        while True:
+            value = random.randint(1, die_size)
+            rolls.append(value)
+            if stop(value) or len(rolls) >= max_rolls:
+                break
+
+        notation = f"{len(rolls)}x1d{die_size}"
+        result = DiceResult(
+            notation=notation, rolls=rolls, modifier=0, total=rolls[-1], reason=reason
+        )
+        if cls._quiet:
+            return result
+
+        cls._roll_log.append(result)
+        cls._log_to_run_log(notation, rolls, 0, rolls[-1], reason)
+        return result
+
+    @classmethod
+    def trials_until(
+        cls, successes: int, die_size: int, max_trials: int, reason: str = ""
+    ) -> Optional[int]:
+        """
+        Count repeated rolls until the first success, in a single draw.
+
+        Equivalent to rolling 1d{die_size} up to max_trials times and
+        stopping at the first roll that lands on one of `successes` faces
+        (e.g. successes=6, die_size=20 for "15+ on a d20"). The trial count
+        is drawn from the geometric distribution, so a saving throw made
+        once per day over a long downtime costs one draw and one log entry.
+
+        Args:
+            successes: Number of succeeding faces (0..die_size)
+            die_size: Sides per die
+            max_trials: Maximum number of rolls
+            reason: Why this roll is being made (for logging)
+
+        Returns:
+            1-based index of the first successful roll, or None if every
+            roll failed
+        """
+        notation = f"trials({successes}-in-{die_size}, max {max_trials})"
+
+        # Check for replay mode (a recorded total of 0 means no success)
+        if cls.is_replaying() and cls._replay_session.has_next_roll():
+            recorded = cls._replay_session.get_next_roll()
+            if recorded:
+                count = recorded.get("total", 0)
+                cls._roll_log.append(
+                    DiceResult(
+                        notation=notation, rolls=[count], modifier=0, total=count, reason=reason
+                    )
+                )
+                cls._log_to_run_log(notation, [count], 0, count, reason)
+                return count or None
+
+        if max_trials <= 0 or successes <= 0:
+            count = 0
+        elif successes >= die_size:
+            count = 1
+        else:
+            # Inverse CDF: P(more than k trials) = (failures / die_size) ** k
+            fail_rate = (die_size - successes) / die_size
+            count = int(math.log(1.0 - random.random()) / math.log(fail_rate)) + 1
+            if count > max_trials:
+                count = 0
+        if cls._quiet:
+            return count or None
+
+        cls._roll_log.append(
+            DiceResult(notation=notation, rolls=[count], modifier=0, total=count, reason=reason)
+        )
+        cls._log_to_run_log(notation, [count], 0, count, reason)
+        return count or None
+
     @classmethod
     def roll_d20(cls, reason: str = "") -> "DiceResult":
         """Convenience method for d20 rolls."""
@@ -627,6 +840,8 @@ class DiceRoller:
 
         # Normal roll
         result = random.randint(min_val, max_val)
+        if cls._quiet:
+            return result
         # Log as a pseudo-dice roll for consistency
         log_entry = DiceResult(
             notation=notation,
@@ -681,6 +896,8 @@ class DiceRoller:
         # Normal choice
         index = random.randint(0, len(items) - 1)
         result = items[index]
+        if cls._quiet:
+            return result
         # Log as a pseudo-dice roll
         full_reason = f"{reason}: selected '{result}'" if reason else f"selected '{result}'"
         log_entry = DiceResult(
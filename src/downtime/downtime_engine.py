@@ -1357,10 +1357,11 @@ class DowntimeEngine:
             if not character:
                 continue
 
-            total_healing = 0
-            for _ in range(days):
-                roll = self.dice.roll("1d3", f"recuperation healing for {character.name}")
-                total_healing += roll.total
+            # 1d3 per day, drawn as a single aggregate roll over the whole span
+            roll = self.dice.roll_sum(
+                days, 3, f"recuperation healing for {character.name} ({days} days)"
+            )
+            total_healing = roll.total
 
             heal_result = self.controller.heal_character(character.character_id, total_healing)
             healing_results.append(
@@ -1407,18 +1408,17 @@ class DowntimeEngine:
                         )
 
                 elif condition.condition_type == ConditionType.DISEASED:
-                    # Save vs disease each day
-                    for _ in range(days):
-                        roll = self.dice.roll_d20("disease recovery")
-                        if roll.total >= 15:  # Base save
-                            character.conditions.remove(condition)
-                            healed.append(
-                                {
-                                    "character_id": character.character_id,
-                                    "condition": condition.condition_type.value,
-                                }
-                            )
-                            break
+                    # Save vs disease (15+ on d20) each day, until the first success
+                    recovered_on = self.dice.trials_until(6, 20, days, "disease recovery")
+                    if recovered_on is not None:
+                        character.conditions.remove(condition)
+                        healed.append(
+                            {
+                                "character_id": character.character_id,
+                                "condition": condition.condition_type.value,
+                                "day": recovered_on,
+                            }
+                        )
 
         return healed
 
@@ -1,5 +1,5 @@
 """Dungeon exploration engine module."""
 
-from src.dungeon.dungeon_engine import DungeonEngine
+from src.dungeon.dungeon_engine import DungeonEngine, DungeonRoute, DungeonRouter
 
-__all__ = ["DungeonEngine"]
+__all__ = ["DungeonEngine", "DungeonRoute", "DungeonRouter"]
@@ -11,6 +11,7 @@ Also handles light depletion, movement between rooms, search/listen odds,
 and rest cadence (1 Turn of rest per 5 Turns of activity to avoid exhaustion).
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Optional
@@ -193,6 +194,7 @@ class DungeonState:
     known_exit_path: bool = False  # +4 to escape save if safe path known (p163)
     explored_rooms: set[str] = field(default_factory=set)  # For fast travel (p162)
     safe_path_to_exit: list[str] = field(default_factory=list)  # Room IDs of safe path
+    map_version: int = 0  # Bumped when exits or doors change (invalidates cached routes)
 
     # POI-inherited configuration
     poi_name: Optional[str] = None  # Source POI name
@@ -224,6 +226,139 @@ class DungeonState:
     pre_dungeon_sub_location: Optional[str] = None  # POI or building within location
 
 
+@dataclass
+class DungeonRoute:
+    """A shortest known path between two rooms."""
+
+    rooms: list[str]  # Start room first, destination last
+    turns: int
+
+    def wandering_check_turns(self, turns_since_check: int, interval: int) -> list[int]:
+        """
+        Turns along the route (1-based) on which a wandering monster check falls.
+
+        Args:
+            turns_since_check: Turns already elapsed since the last check
+            interval: Turns between checks
+
+        Returns:
+            Turn numbers, in order
+        """
+        return _wandering_check_turns(self.turns, turns_since_check, interval)
+
+
+def _wandering_check_turns(turns: int, turns_since_check: int, interval: int) -> list[int]:
+    """Turns (1-based) within a span of Turns on which a wandering check falls."""
+    first = max(1, interval - turns_since_check)
+    return list(range(first, turns + 1, interval))
+
+
+class DungeonRouter:
+    """
+    Shortest-path routing over the explored room graph for fast travel (p162).
+
+    Adjacency is built from DungeonRoom.exits, keeping only exits that lead
+    to explored rooms through doors that are not locked, stuck, barred or
+    still secret. Each room transition costs turns_per_room Turns, so a
+    breadth-first search gives the cheapest route. The adjacency and the
+    search tree from each start room are cached until the map changes:
+    DungeonState.map_version is bumped when doors or exits change, and a
+    change in the number of known or explored rooms is also detected.
+    """
+
+    BLOCKING_DOORS = frozenset(
+        {DoorState.LOCKED, DoorState.STUCK, DoorState.BARRED, DoorState.SECRET}
+    )
+
+    def __init__(self, turns_per_room: int = 1):
+        self.turns_per_room = turns_per_room
+        self._key: Optional[tuple[str, int, int, int]] = None
+        self._adjacency: dict[str, tuple[str, ...]] = {}
+        self._trees: dict[str, dict[str, Optional[str]]] = {}
+
+    def invalidate(self) -> None:
+        """Drop cached adjacency and routes."""
+        self._key = None
+
+    def _sync(self, state: DungeonState) -> None:
+        key = (
+            state.dungeon_id,
+            state.map_version,
+            len(state.rooms),
+            len(state.explored_rooms),
+        )
+        if key == self._key:
+            return
+
+        explored = state.explored_rooms
+        adjacency: dict[str, tuple[str, ...]] = {}
+        for room_id, room in state.rooms.items():
+            neighbors = []
+            for direction, target in room.exits.items():
+                if target not in explored or target in neighbors:
+                    continue
+                door = room.doors.get(f"{room_id}_{direction}", room.doors.get(direction))
+                if door in self.BLOCKING_DOORS:
+                    continue
+                neighbors.append(target)
+            adjacency[room_id] = tuple(neighbors)
+
+        self._adjacency = adjacency
+        self._trees = {}
+        self._key = key
+
+    def neighbors(self, state: DungeonState, room_id: str) -> tuple[str, ...]:
+        """Explored rooms reachable in one transition from room_id."""
+        self._sync(state)
+        return self._adjacency.get(room_id, ())
+
+    def is_passable(self, state: DungeonState, from_room: str, to_room: str) -> bool:
+        """Whether to_room is explored and reachable directly from from_room."""
+        return to_room in self.neighbors(state, from_room)
+
+    def find_route(
+        self, state: DungeonState, start: str, destination: str
+    ) -> Optional[DungeonRoute]:
+        """
+        Find the cheapest route from start to an explored destination.
+
+        The start room itself need not be explored (the party is in it).
+
+        Returns:
+            DungeonRoute, or None if no known open route exists
+        """
+        self._sync(state)
+        if start == destination:
+            return DungeonRoute(rooms=[start], turns=0)
+        if destination not in state.explored_rooms:
+            return None
+
+        parents = self._trees.get(start)
+        if parents is None:
+            parents = self._search(start)
+            self._trees[start] = parents
+        if destination not in parents:
+            return None
+
+        rooms = [destination]
+        while rooms[-1] != start:
+            rooms.append(parents[rooms[-1]])
+        rooms.reverse()
+        return DungeonRoute(rooms=rooms, turns=(len(rooms) - 1) * self.turns_per_room)
+
+    def _search(self, start: str) -> dict[str, Optional[str]]:
+        """Breadth-first search tree (room -> previous room) from start."""
+        parents: dict[str, Optional[str]] = {start: None}
+        frontier = deque([start])
+        while frontier:
+            room_id = frontier.popleft()
+            for neighbor in self._adjacency.get(room_id, ()):
+                if neighbor not in parents:
+                    parents[neighbor] = room_id
+                    frontier.append(neighbor)
+        return parents
+
+
 class DungeonEngine:
     """
     Engine for dungeon exploration per Dolmenwood rules (p146-147, p162-163).
@@ -283,6 +418,9 @@ class DungeonEngine:
         # Noise thresholds
         self._noise_alert_threshold: int = 10
 
+        # Fast travel routing over explored rooms (p162)
+        self._router = DungeonRouter()
+
         # Callbacks
         self._description_callback: Optional[Callable] = None
 
@@ -811,6 +949,7 @@ class DungeonEngine:
                 roll = self.dice.roll_d6(1, f"find secret door: {direction}")
                 if roll.total <= 2:  # 2-in-6 chance
                     current_room.doors[direction] = DoorState.CLOSED
+                    self._dungeon_state.map_version += 1
                     results["found_secret_doors"].append({
                         "direction": direction,
                         "type": "simple",
@@ -998,6 +1137,7 @@ class DungeonEngine:
                 # Mark as normal door now that it's open
                 door_key = f"{current_room.room_id}_{target_door.direction}"
                 current_room.doors[door_key] = DoorState.OPEN
+                self._dungeon_state.map_version += 1
 
         # Include info about what's required if failed
         if not interaction.success:
@@ -1056,6 +1196,7 @@ class DungeonEngine:
             roll = self.dice.roll_d6(1, "force door")
             if roll.total <= 2:  # 2-in-6 base chance
                 current_room.doors[door_key] = DoorState.OPEN
+                self._dungeon_state.map_version += 1
                 return {
                     "success": True,
                     "message": "Door forced open!",
@@ -1072,6 +1213,7 @@ class DungeonEngine:
 
         # Normal door
         current_room.doors[door_key] = DoorState.OPEN
+        self._dungeon_state.map_version += 1
         return {
             "success": True,
             "message": "Door opened",
@@ -1100,6 +1242,7 @@ class DungeonEngine:
 
         if roll.total <= threshold:
             current_room.doors[door_key] = DoorState.CLOSED
+            self._dungeon_state.map_version += 1
             return {
                 "success": True,
                 "message": "Lock picked!",
@@ -1433,20 +1576,30 @@ class DungeonEngine:
         if not route and not destination:
             return {"success": False, "message": "Must specify route or destination"}
 
-        # If only destination provided, try to find route through explored rooms
+        # If only destination provided, find the shortest route through explored rooms
         if not route and destination:
             if destination not in self._dungeon_state.explored_rooms:
                 return {"success": False, "message": "Cannot fast travel to unexplored area"}
-            # Simplified: direct travel if destination is explored
-            route = [self._dungeon_state.current_room, destination]
+            found = self.find_route(destination)
+            if not found:
+                return {"success": False, "message": f"No known open route to {destination}"}
+            route = found.rooms
 
         # Verify all rooms in route are explored
         for room_id in route:
             if room_id not in self._dungeon_state.explored_rooms:
                 return {"success": False, "message": f"Route includes unexplored room: {room_id}"}
 
-        # Calculate Turns required (simplified: 1 Turn per room transition)
-        turns_required = len(route) - 1
+        # Verify each leg is an open passage
+        for from_room, to_room in zip(route, route[1:]):
+            if not self._router.is_passable(self._dungeon_state, from_room, to_room):
+                return {
+                    "success": False,
+                    "message": f"No open passage from {from_room} to {to_room}",
+                }
+
+        # Calculate Turns required (1 Turn per room transition)
+        turns_required = (len(route) - 1) * self._router.turns_per_room
         if turns_required <= 0:
             return {"success": False, "message": "Invalid route"}
 
@@ -1458,32 +1611,29 @@ class DungeonEngine:
                 "message": f"Not enough light. Need {turns_required} Turns, have {light_remaining}",
             }
 
-        # Make wandering monster checks for the journey
-        encounters = []
-        for turn in range(turns_required):
-            self._turns_since_check += 1
-            if self._turns_since_check >= self._wandering_check_interval:
-                self._turns_since_check = 0
-                # Check for wandering monster
-                roll = self.dice.roll_d6(1, f"fast travel monster check {turn + 1}")
-                if roll.total <= (1 + self._dungeon_state.alert_level):
-                    encounters.append(
-                        {
-                            "turn": turn + 1,
-                            "room": route[turn + 1] if turn + 1 < len(route) else route[-1],
-                        }
-                    )
-                    break  # Stop at first encounter
-
-        if encounters:
-            # Generate encounter at that point
-            encounter_room = encounters[0]["room"]
+        # Make wandering monster checks for the journey, stopping at the first encounter
+        checks = len(
+            _wandering_check_turns(
+                turns_required, self._turns_since_check, self._wandering_check_interval
+            )
+        )
+        encounter_turn = self._resolve_wandering_checks(turns_required, "fast travel monster check")
+
+        if encounter_turn:
+            # Time advances straight to the encounter, which happens in that room
+            encounter_room = route[min(encounter_turn, len(route) - 1)]
             self._dungeon_state.current_room = encounter_room
-            encounter = self._check_wandering_monster()
+            self._dungeon_state.turns_in_dungeon += encounter_turn
+            self.controller.set_party_location(
+                LocationType.DUNGEON_ROOM,
+                encounter_room,
+                sub_location=self._dungeon_state.dungeon_id,
+            )
+            self._start_wandering_encounter()
             return {
                 "success": False,
                 "message": f"Encountered monsters at {encounter_room}!",
-                "turns_traveled": encounters[0]["turn"],
+                "turns_traveled": encounter_turn,
                 "encounter": True,
                 "noise": 0,
             }
@@ -1502,6 +1652,8 @@ class DungeonEngine:
             "message": f"Traveled safely to {route[-1]} ({turns_required} Turns)",
             "turns_used": turns_required,
             "destination": route[-1],
+            "route": list(route),
+            "wandering_checks": checks,
             "noise": 0,
         }
 
@@ -1636,36 +1788,76 @@ class DungeonEngine:
 
         # Standard Dolmenwood check: 1-in-6 every 2 Turns
         if roll.total <= 1:
-            surprise = self._check_dungeon_surprise()
-            distance = self._roll_dungeon_distance(
-                mutual_surprise=surprise == SurpriseStatus.MUTUAL_SURPRISE
-            )
+            return self._start_wandering_encounter()
 
-            encounter = EncounterState(
-                encounter_type=EncounterType.MONSTER,
-                distance=distance,
-                surprise_status=surprise,
-                context="wandering",
-            )
+        return None
 
-            self.controller.set_encounter(encounter)
-            self.controller.transition(
-                "encounter_triggered",
-                context={
-                    "dungeon_id": self._dungeon_state.dungeon_id,
-                    "room_id": self._dungeon_state.current_room,
-                    "source": "wandering_monster",
-                    # Pass roll tables for EncounterEngine to use
-                    "roll_tables": self._dungeon_state.roll_tables,
-                    "poi_name": self._dungeon_state.poi_name,
-                    "hex_id": self._dungeon_state.hex_id,
-                },
-            )
+    def _resolve_wandering_checks(
+        self, turns: int, reason: str = "wandering monster"
+    ) -> Optional[int]:
+        """
+        Make every wandering monster check falling within a span of Turns (p163).
+
+        Checks fall every _wandering_check_interval Turns, counting on from
+        _turns_since_check, and succeed on 1-in-6 plus the alert level. The
+        checks are drawn as one batch that stops at the first encounter,
+        from the same dice stream as checking Turn by Turn, so the outcome
+        under a given seed is identical. _turns_since_check is left as if
+        each Turn had been checked in turn; time stops at an encounter.
 
-            return encounter
+        Args:
+            turns: Number of Turns in the span
+            reason: Why these checks are being made (for logging)
 
+        Returns:
+            Turn (1-based) of the first encounter, or None if no check triggers
+        """
+        check_turns = _wandering_check_turns(
+            turns, self._turns_since_check, self._wandering_check_interval
+        )
+        if not check_turns:
+            self._turns_since_check += turns
+            return None
+
+        threshold = 1 + self._dungeon_state.alert_level
+        roll = self.dice.roll_until(6, lambda value: value <= threshold, len(check_turns), reason)
+        if roll.total <= threshold:
+            self._turns_since_check = 0
+            return check_turns[len(roll.rolls) - 1]
+
+        self._turns_since_check = turns - check_turns[-1]
         return None
 
+    def _start_wandering_encounter(self) -> EncounterState:
+        """Roll surprise and distance and hand a wandering encounter to the controller."""
+        surprise = self._check_dungeon_surprise()
+        distance = self._roll_dungeon_distance(
+            mutual_surprise=surprise == SurpriseStatus.MUTUAL_SURPRISE
+        )
+
+        encounter = EncounterState(
+            encounter_type=EncounterType.MONSTER,
+            distance=distance,
+            surprise_status=surprise,
+            context="wandering",
+        )
+
+        self.controller.set_encounter(encounter)
+        self.controller.transition(
+            "encounter_triggered",
+            context={
+                "dungeon_id": self._dungeon_state.dungeon_id,
+                "room_id": self._dungeon_state.current_room,
+                "source": "wandering_monster",
+                # Pass roll tables for EncounterEngine to use
+                "roll_tables": self._dungeon_state.roll_tables,
+                "poi_name": self._dungeon_state.poi_name,
+                "hex_id": self._dungeon_state.hex_id,
+            },
+        )
+
+        return encounter
+
     def _roll_dungeon_distance(self, mutual_surprise: bool = False) -> int:
         """Roll encounter distance in dungeon (typically close)."""
         if mutual_surprise:
@@ -2004,6 +2196,46 @@ class DungeonEngine:
             "path": room_ids,
         }
 
+    def find_route(self, destination: str, start: Optional[str] = None) -> Optional[DungeonRoute]:
+        """
+        Find the shortest route through explored rooms (p162).
+
+        Args:
+            destination: Explored room to reach
+            start: Starting room (defaults to the current room)
+
+        Returns:
+            DungeonRoute, or None if there is no active dungeon or known route
+        """
+        if not self._dungeon_state:
+            return None
+        start = start or self._dungeon_state.current_room
+        return self._router.find_route(self._dungeon_state, start, destination)
+
+    def plan_fast_travel(self, destination: str) -> dict[str, Any]:
+        """
+        Preview a fast travel route without moving or rolling.
+
+        Returns:
+            Dict with the route, Turns required, and the route turns on which
+            wandering monster checks will be made
+        """
+        route = self.find_route(destination)
+        if not route:
+            return {"success": False, "message": f"No known open route to {destination}"}
+        return {
+            "success": True,
+            "route": route.rooms,
+            "turns": route.turns,
+            "wandering_check_turns": route.wandering_check_turns(
+                self._turns_since_check, self._wandering_check_interval
+            ),
+        }
+
+    def invalidate_routes(self) -> None:
+        """Drop cached fast travel routes after editing rooms, exits or doors directly."""
+        self._router.invalidate()
+
     # =========================================================================
     # ROOM MANAGEMENT
     # =========================================================================
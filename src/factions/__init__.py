@@ -35,6 +35,7 @@ from src.factions.faction_models import (
     ActionInstance,
     Territory,
     FactionLogEntry,
+    FactionStats,
     FactionTurnState,
     # Party state
     PartyAffiliation,
@@ -71,6 +72,7 @@ from src.factions.faction_adventurers import (
 from src.factions.faction_effects import (
     EffectResult,
     FactionEffectsInterpreter,
+    TerritoryIndex,
 )
 
 from src.factions.faction_engine import (
@@ -78,6 +80,7 @@ from src.factions.faction_engine import (
     CycleResult,
     FactionCycleResult,
     FactionEngine,
+    FastForwardSummary,
 )
 
 from src.factions.faction_wiring import (
@@ -119,6 +122,7 @@ __all__ = [
     "ActionInstance",
     "Territory",
     "FactionLogEntry",
+    "FactionStats",
     "FactionTurnState",
     # Party state models
     "PartyAffiliation",
@@ -144,11 +148,13 @@ __all__ = [
     # Effects
     "EffectResult",
     "FactionEffectsInterpreter",
+    "TerritoryIndex",
     # Engine
     "ActionRollResult",
     "CycleResult",
     "FactionCycleResult",
     "FactionEngine",
+    "FastForwardSummary",
     # Wiring
     "init_faction_engine",
     "save_faction_state",
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import json
 import logging
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -60,6 +61,9 @@ def _parse_quest_template(data: dict[str, Any]) -> QuestTemplate:
         tags=data.get("tags", []),
         summary=data.get("summary", ""),
         default_effects=effects,
+        min_rank=data.get("min_rank", 0),
+        hexes=data.get("hexes", []),
+        settlements=data.get("settlements", []),
     )
 
 
@@ -94,7 +98,8 @@ class FactionAdventurerProfiles:
     Supports:
     - Profile lookup by faction or group ID
     - Profile inheritance resolution
-    - Quest template listing and lookup
+    - Quest template listing and lookup via a job index keyed by
+      faction/group, required rank and target hex or settlement
     """
 
     def __init__(self, profiles: dict[str, AdventurerProfile]):
@@ -107,6 +112,13 @@ class FactionAdventurerProfiles:
         self._profiles = profiles
         self._resolved_cache: dict[str, AdventurerProfile] = {}
 
+        # Job index (see rebuild_job_index)
+        self._templates_by_owner: dict[str, list[QuestTemplate]] = {}
+        self._rank_thresholds: dict[str, list[int]] = {}
+        self._template_lookup: dict[tuple[str, str], QuestTemplate] = {}
+        self._templates_by_location: dict[tuple[str, str], list[tuple[str, QuestTemplate]]] = {}
+        self.rebuild_job_index()
+
     @property
     def profiles(self) -> dict[str, AdventurerProfile]:
         """Get all profiles."""
@@ -170,23 +182,88 @@ class FactionAdventurerProfiles:
         """List all faction/group IDs with profiles."""
         return list(self._profiles.keys())
 
+    # =========================================================================
+    # JOB INDEX
+    # =========================================================================
+
+    def rebuild_job_index(self) -> None:
+        """
+        Rebuild the quest template index from the (resolved) profiles.
+
+        Called on construction; call again after editing profiles in place.
+        Templates are stored per faction/group sorted by min_rank so a rank
+        filter is a slice, and located templates are additionally indexed
+        under each ("hex" | "settlement", id) they target.
+        """
+        self._resolved_cache.clear()
+        self._templates_by_owner.clear()
+        self._rank_thresholds.clear()
+        self._template_lookup.clear()
+        self._templates_by_location.clear()
+
+        for owner_id in self._profiles:
+            profile = self.get_profile(owner_id)
+            templates = sorted(profile.quest_templates, key=lambda t: t.min_rank)
+            self._templates_by_owner[owner_id] = templates
+            self._rank_thresholds[owner_id] = [t.min_rank for t in templates]
+            for template in templates:
+                self._template_lookup.setdefault((owner_id, template.id), template)
+                for hex_id in template.hexes:
+                    self._templates_by_location.setdefault(("hex", hex_id), []).append(
+                        (owner_id, template)
+                    )
+                for settlement_id in template.settlements:
+                    self._templates_by_location.setdefault(
+                        ("settlement", settlement_id), []
+                    ).append((owner_id, template))
+
     def list_quest_templates(
         self,
         faction_or_group_id: str,
+        rank: Optional[int] = None,
     ) -> list[QuestTemplate]:
         """
         List quest templates for a faction or group.
 
         Args:
             faction_or_group_id: The faction or group ID
+            rank: If given, only templates whose min_rank is at most this
 
         Returns:
-            List of QuestTemplate objects
+            List of QuestTemplate objects, lowest required rank first
         """
-        profile = self.get_profile(faction_or_group_id)
-        if not profile:
+        templates = self._templates_by_owner.get(faction_or_group_id)
+        if not templates:
             return []
-        return list(profile.quest_templates)
+        if rank is None:
+            return list(templates)
+        return templates[: bisect_right(self._rank_thresholds[faction_or_group_id], rank)]
+
+    def list_templates_at(
+        self,
+        hex_id: Optional[str] = None,
+        settlement_id: Optional[str] = None,
+    ) -> list[tuple[str, QuestTemplate]]:
+        """
+        List quest templates that target a hex or settlement.
+
+        Args:
+            hex_id: Hex to look up
+            settlement_id: Settlement to look up
+
+        Returns:
+            (faction_or_group_id, QuestTemplate) pairs, settlement jobs first
+        """
+        found: list[tuple[str, QuestTemplate]] = []
+        if settlement_id:
+            found.extend(self._templates_by_location.get(("settlement", settlement_id), ()))
+        if hex_id:
+            found.extend(
+                entry
+                for entry in self._templates_by_location.get(("hex", hex_id), ())
+                if entry not in found
+            )
+        return found
 
     def get_quest_template(
         self,
@@ -203,11 +280,7 @@ class FactionAdventurerProfiles:
         Returns:
             QuestTemplate or None
         """
-        templates = self.list_quest_templates(faction_or_group_id)
-        for t in templates:
-            if t.id == template_id:
-                return t
-        return None
+        return self._template_lookup.get((faction_or_group_id, template_id))
 
     def can_affiliate(
         self,
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
         EffectCommand,
         FactionTurnState,
         PartyFactionState,
+        Territory,
     )
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,106 @@ class EffectResult:
     error: Optional[str] = None
 
 
+# Territory type -> Territory attribute holding IDs of that type
+TERRITORY_TYPES: dict[str, str] = {
+    "hex": "hexes",
+    "settlement": "settlements",
+    "stronghold": "strongholds",
+    "domain": "domains",
+}
+
+
+def territory_holdings(territory: "Territory", territory_type: str) -> set[str]:
+    """Get the set of IDs of one territory type held in a Territory."""
+    return getattr(territory, TERRITORY_TYPES[territory_type])
+
+
+class TerritoryIndex:
+    """
+    Reverse index from (territory type, territory ID) to holding faction.
+
+    Built from faction states once, then kept in sync by the effects that
+    move territory, so "who holds this?" is a dict lookup rather than a
+    scan of every faction's territory sets. Code that edits Territory sets
+    directly must call rebuild() afterwards.
+    """
+
+    def __init__(self):
+        self._holders: dict[tuple[str, str], str] = {}
+        self._source: Optional[dict[str, "FactionTurnState"]] = None
+
+    def __len__(self) -> int:
+        return len(self._holders)
+
+    def is_built_from(self, faction_states: dict[str, "FactionTurnState"]) -> bool:
+        """Check whether the index was built from this faction state dict."""
+        return self._source is faction_states
+
+    def rebuild(self, faction_states: dict[str, "FactionTurnState"]) -> None:
+        """
+        Rebuild the index from faction territory sets.
+
+        If several factions list the same territory, the first in
+        iteration order is recorded as holder (check() reports the overlap).
+        """
+        self._holders.clear()
+        self._source = faction_states
+        for faction_id, state in faction_states.items():
+            for territory_type in TERRITORY_TYPES:
+                for territory_id in territory_holdings(state.territory, territory_type):
+                    self._holders.setdefault((territory_type, territory_id), faction_id)
+
+    def holder(self, territory_type: str, territory_id: str) -> Optional[str]:
+        """Get the faction holding a territory, or None if unclaimed."""
+        return self._holders.get((territory_type, territory_id))
+
+    def assign(self, territory_type: str, territory_id: str, faction_id: str) -> None:
+        """Record a faction as the holder of a territory."""
+        self._holders[(territory_type, territory_id)] = faction_id
+
+    def release(self, territory_type: str, territory_id: str, faction_id: str) -> None:
+        """Drop a territory from the index if this faction holds it."""
+        key = (territory_type, territory_id)
+        if self._holders.get(key) == faction_id:
+            del self._holders[key]
+
+    def check(self, faction_states: dict[str, "FactionTurnState"]) -> list[str]:
+        """
+        Compare the index against faction territory sets.
+
+        Args:
+            faction_states: Authoritative faction states
+
+        Returns:
+            Descriptions of each inconsistency (empty if in sync)
+        """
+        problems = []
+        expected: dict[tuple[str, str], str] = {}
+        for faction_id, state in faction_states.items():
+            for territory_type in TERRITORY_TYPES:
+                for territory_id in sorted(territory_holdings(state.territory, territory_type)):
+                    key = (territory_type, territory_id)
+                    if key in expected:
+                        problems.append(
+                            f"{territory_type} {territory_id} held by both "
+                            f"{expected[key]} and {faction_id}"
+                        )
+                        continue
+                    expected[key] = faction_id
+                    indexed = self._holders.get(key)
+                    if indexed != faction_id:
+                        problems.append(
+                            f"{territory_type} {territory_id} held by {faction_id} "
+                            f"but indexed as {indexed}"
+                        )
+        for (territory_type, territory_id), faction_id in sorted(self._holders.items()):
+            if (territory_type, territory_id) not in expected:
+                problems.append(
+                    f"{territory_type} {territory_id} indexed as {faction_id} but unheld"
+                )
+        return problems
+
+
 class FactionEffectsInterpreter:
     """
     Interprets and applies effect commands to faction state.
@@ -64,6 +165,8 @@ class FactionEffectsInterpreter:
         self._global_flags: dict[str, Any] = {}
         # Pending rumors to be delivered
         self._pending_rumors: list[dict[str, Any]] = []
+        # Territory ID -> holding faction, maintained by territory effects
+        self._territory_index = TerritoryIndex()
 
     @property
     def global_flags(self) -> dict[str, Any]:
@@ -85,6 +188,15 @@ class FactionEffectsInterpreter:
         """Restore global flags from persistence."""
         self._global_flags = flags.copy()
 
+    @property
+    def territory_index(self) -> TerritoryIndex:
+        """Get the territory ownership index."""
+        return self._territory_index
+
+    def rebuild_territory_index(self, faction_states: dict[str, "FactionTurnState"]) -> None:
+        """Rebuild the territory ownership index (after load or direct edits)."""
+        self._territory_index.rebuild(faction_states)
+
     def apply_effect(
         self,
         effect: "EffectCommand",
@@ -193,127 +305,91 @@ class FactionEffectsInterpreter:
             fstate = all_faction_states.get(fid)
             if not fstate:
                 return 1
-            points = fstate.territory.compute_points(rules.territory_point_values)
-            return rules.get_level_for_points(points)
+            return fstate.get_stats(rules).level
 
         def get_relationship(fid1: str, fid2: str) -> int:
             """Get relationship score between factions."""
             if not relations:
                 return 0
-            return relations.get_relation(fid1, fid2)
-
-        def find_current_holder(territory_type: str, territory_id: str) -> Optional[str]:
-            """Find which faction currently holds a territory."""
-            for fid, fstate in all_faction_states.items():
-                if fid == attacker_id:
-                    continue
-                territory = fstate.territory
-                if territory_type == "hex" and territory_id in territory.hexes:
-                    return fid
-                if territory_type == "settlement" and territory_id in territory.settlements:
-                    return fid
-                if territory_type == "stronghold" and territory_id in territory.strongholds:
-                    return fid
-                if territory_type == "domain" and territory_id in territory.domains:
-                    return fid
-            return None
-
-        def resolve_contest(territory_type: str, territory_id: str, defender_id: str) -> bool:
+            return relations.get_score(fid1, fid2)
+
+        # An interpreter used outside its engine indexes the states it is given
+        index = self._territory_index
+        if all_faction_states and not index.is_built_from(all_faction_states):
+            index.rebuild(all_faction_states)
+
+        def resolve_contests(contested: list[tuple[str, str, str]]) -> list[bool]:
             """
-            Resolve a contested territory claim via oracle fate check.
+            Resolve contested territory claims via one batch of oracle fate checks.
 
-            Returns True if attacker wins, False if defender keeps territory.
+            All contests in the effect are judged on faction levels as they
+            stood before the effect, and asked in territory-type order.
+
+            Returns True per claim if attacker wins, False if defender keeps it.
             """
+            if not contested:
+                return []
             if not oracle or not oracle.config.enabled or not oracle.config.contested_territory_enabled:
                 # Without oracle, attacker wins by default
-                return True
-
-            attacker_level = get_faction_level(attacker_id)
-            defender_level = get_faction_level(defender_id)
-            relationship = get_relationship(attacker_id, defender_id)
-
-            likelihood = oracle.determine_contest_likelihood(
-                attacker_level=attacker_level,
-                defender_level=defender_level,
-                relationship_score=relationship,
-            )
-
-            question = f"Does {attacker_id} successfully claim {territory_type} {territory_id} from {defender_id}?"
-
-            fate_event = oracle.fate_check(
-                question=question,
-                likelihood=likelihood,
+                return [True] * len(contested)
+
+            questions = []
+            for territory_type, territory_id, defender_id in contested:
+                likelihood = oracle.determine_contest_likelihood(
+                    attacker_level=get_faction_level(attacker_id),
+                    defender_level=get_faction_level(defender_id),
+                    relationship_score=get_relationship(attacker_id, defender_id),
+                )
+                question = (
+                    f"Does {attacker_id} successfully claim "
+                    f"{territory_type} {territory_id} from {defender_id}?"
+                )
+                questions.append((question, likelihood))
+
+            fate_events = oracle.fate_check_batch(
+                questions,
                 date=date,
                 faction_id=attacker_id,
                 tag="contested_territory",
             )
+            oracle_events.extend(fate_events)
+            return [oracle.is_yes(event) for event in fate_events]
 
-            oracle_events.append(fate_event)
-            return oracle.is_yes(fate_event)
-
-        def claim_territory_item(territory_type: str, territory_id: str) -> bool:
+        def claim_territory_item(territory_type: str, territory_id: str, won: bool) -> bool:
             """Attempt to claim a single territory item. Returns True if successful."""
-            defender_id = find_current_holder(territory_type, territory_id)
-
-            if defender_id:
-                # Contested - resolve via oracle
-                attacker_wins = resolve_contest(territory_type, territory_id, defender_id)
-
-                if attacker_wins:
-                    # Remove from defender
-                    defender_state = all_faction_states.get(defender_id)
-                    if defender_state:
-                        if territory_type == "hex":
-                            defender_state.territory.hexes.discard(territory_id)
-                        elif territory_type == "settlement":
-                            defender_state.territory.settlements.discard(territory_id)
-                        elif territory_type == "stronghold":
-                            defender_state.territory.strongholds.discard(territory_id)
-                        elif territory_type == "domain":
-                            defender_state.territory.domains.discard(territory_id)
-                    return True
-                else:
+            defender_id = index.holder(territory_type, territory_id)
+            if defender_id and defender_id != attacker_id:
+                # Contested - resolved via oracle
+                if not won:
                     return False
-            else:
-                # Uncontested
-                return True
+                defender_state = all_faction_states.get(defender_id)
+                if defender_state:
+                    territory_holdings(defender_state.territory, territory_type).discard(
+                        territory_id
+                    )
+
+            territory_holdings(faction_state.territory, territory_type).add(territory_id)
+            index.assign(territory_type, territory_id, attacker_id)
+            return True
+
+        claims = [(t, effect.data[t]) for t in TERRITORY_TYPES if t in effect.data]
+        contested = []
+        for territory_type, territory_id in claims:
+            defender_id = index.holder(territory_type, territory_id)
+            if defender_id and defender_id != attacker_id:
+                contested.append((territory_type, territory_id, defender_id))
+        outcomes = dict(zip([c[:2] for c in contested], resolve_contests(contested)))
 
         # Process each territory type
-        if "hex" in effect.data:
-            hex_id = effect.data["hex"]
-            if claim_territory_item("hex", hex_id):
-                faction_state.territory.hexes.add(hex_id)
-                changes["hex_added"] = hex_id
-                descriptions.append(f"claimed hex {hex_id}")
-            else:
-                descriptions.append(f"failed to claim hex {hex_id} (contested)")
-
-        if "settlement" in effect.data:
-            settlement_id = effect.data["settlement"]
-            if claim_territory_item("settlement", settlement_id):
-                faction_state.territory.settlements.add(settlement_id)
-                changes["settlement_added"] = settlement_id
-                descriptions.append(f"claimed settlement {settlement_id}")
-            else:
-                descriptions.append(f"failed to claim settlement {settlement_id} (contested)")
-
-        if "stronghold" in effect.data:
-            stronghold_id = effect.data["stronghold"]
-            if claim_territory_item("stronghold", stronghold_id):
-                faction_state.territory.strongholds.add(stronghold_id)
-                changes["stronghold_added"] = stronghold_id
-                descriptions.append(f"claimed stronghold {stronghold_id}")
-            else:
-                descriptions.append(f"failed to claim stronghold {stronghold_id} (contested)")
-
-        if "domain" in effect.data:
-            domain_id = effect.data["domain"]
-            if claim_territory_item("domain", domain_id):
-                faction_state.territory.domains.add(domain_id)
-                changes["domain_added"] = domain_id
-                descriptions.append(f"claimed domain {domain_id}")
+        for territory_type, territory_id in claims:
+            won = outcomes.get((territory_type, territory_id), True)
+            if claim_territory_item(territory_type, territory_id, won):
+                changes[f"{territory_type}_added"] = territory_id
+                descriptions.append(f"claimed {territory_type} {territory_id}")
             else:
-                descriptions.append(f"failed to claim domain {domain_id} (contested)")
+                descriptions.append(
+                    f"failed to claim {territory_type} {territory_id} (contested)"
+                )
 
         if oracle_events:
             changes["oracle_events"] = [e.to_dict() for e in oracle_events]
@@ -344,29 +420,14 @@ class FactionEffectsInterpreter:
         changes = {}
         descriptions = []
 
-        if "hex" in effect.data:
-            hex_id = effect.data["hex"]
-            faction_state.territory.hexes.discard(hex_id)
-            changes["hex_removed"] = hex_id
-            descriptions.append(f"ceded hex {hex_id}")
-
-        if "settlement" in effect.data:
-            settlement_id = effect.data["settlement"]
-            faction_state.territory.settlements.discard(settlement_id)
-            changes["settlement_removed"] = settlement_id
-            descriptions.append(f"ceded settlement {settlement_id}")
-
-        if "stronghold" in effect.data:
-            stronghold_id = effect.data["stronghold"]
-            faction_state.territory.strongholds.discard(stronghold_id)
-            changes["stronghold_removed"] = stronghold_id
-            descriptions.append(f"ceded stronghold {stronghold_id}")
-
-        if "domain" in effect.data:
-            domain_id = effect.data["domain"]
-            faction_state.territory.domains.discard(domain_id)
-            changes["domain_removed"] = domain_id
-            descriptions.append(f"ceded domain {domain_id}")
+        for territory_type in TERRITORY_TYPES:
+            if territory_type not in effect.data:
+                continue
+            territory_id = effect.data[territory_type]
+            territory_holdings(faction_state.territory, territory_type).discard(territory_id)
+            self._territory_index.release(territory_type, territory_id, faction_state.faction_id)
+            changes[f"{territory_type}_removed"] = territory_id
+            descriptions.append(f"ceded {territory_type} {territory_id}")
 
         return EffectResult(
             success=True,
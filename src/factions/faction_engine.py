@@ -29,6 +29,7 @@ from src.factions.faction_models import (
     FactionDefinition,
     FactionLogEntry,
     FactionRules,
+    FactionStats,
     FactionTurnState,
     PartyFactionState,
     Territory,
@@ -78,6 +79,23 @@ class CycleResult:
     oracle_events: list[Any] = field(default_factory=list)  # OracleEvent list
 
 
+@dataclass
+class FastForwardSummary:
+    """Compact result of running many faction cycles headlessly."""
+    start_cycle: int
+    end_cycle: int
+    actions_completed: dict[str, int] = field(default_factory=dict)  # faction_id -> count
+    complications: int = 0
+    oracle_events: int = 0
+    rumors_generated: list[dict[str, Any]] = field(default_factory=list)
+    levels: dict[str, int] = field(default_factory=dict)  # Final level per faction
+
+    @property
+    def cycles_run(self) -> int:
+        """Number of cycles simulated."""
+        return self.end_cycle - self.start_cycle
+
+
 class FactionEngine:
     """
     Core faction simulation engine.
@@ -93,6 +111,7 @@ class FactionEngine:
         definitions: dict[str, FactionDefinition],
         relations: Optional["FactionRelations"] = None,
         oracle: Optional["FactionOracle"] = None,
+        verify_stats: bool = False,
     ):
         """
         Initialize the faction engine.
@@ -102,12 +121,15 @@ class FactionEngine:
             definitions: Dict of faction_id -> FactionDefinition
             relations: Optional faction relations for modifiers
             oracle: Optional FactionOracle for complications and contested actions
+            verify_stats: Debug mode - check every cached FactionStats lookup
+                against a fresh recomputation
         """
         self._rules = rules
         self._definitions = definitions
         self._relations = relations
         self._oracle = oracle
         self._effects = FactionEffectsInterpreter()
+        self.verify_stats = verify_stats
 
         # Dynamic state
         self._faction_states: dict[str, FactionTurnState] = {}
@@ -154,6 +176,8 @@ class FactionEngine:
 
             self._faction_states[faction_id] = state
 
+        self._effects.rebuild_territory_index(self._faction_states)
+
     def reset_state(self) -> None:
         """Reset all dynamic state (for new game)."""
         self._faction_states.clear()
@@ -227,18 +251,68 @@ class FactionEngine:
         """Get state for a specific faction."""
         return self._faction_states.get(faction_id)
 
-    def get_faction_level(self, faction_id: str) -> int:
-        """Get the level of a faction based on territory points."""
+    def set_rules(self, rules: FactionRules) -> None:
+        """Replace the faction rules (cached faction stats recompute on next use)."""
+        self._rules = rules
+
+    def get_faction_stats(self, faction_id: str) -> Optional[FactionStats]:
+        """
+        Get cached territory points, level and actions per turn for a faction.
+
+        Args:
+            faction_id: The faction ID
+
+        Returns:
+            FactionStats or None if faction not found
+
+        Raises:
+            RuntimeError: In verify_stats mode, if the cache is stale
+        """
         state = self._faction_states.get(faction_id)
         if not state:
-            return 1
-        points = state.territory.compute_points(self._rules.territory_point_values)
-        return self._rules.get_level_for_points(points)
+            return None
+        stats = state.get_stats(self._rules)
+        if self.verify_stats:
+            fresh = FactionStats.compute(state.territory, self._rules)
+            if stats != fresh:
+                raise RuntimeError(f"Stale faction stats for {faction_id}: {stats} != {fresh}")
+        return stats
+
+    def get_faction_level(self, faction_id: str) -> int:
+        """Get the level of a faction based on territory points."""
+        stats = self.get_faction_stats(faction_id)
+        return stats.level if stats else 1
+
+    def get_territory_holder(self, territory_type: str, territory_id: str) -> Optional[str]:
+        """
+        Get the faction holding a territory.
+
+        Args:
+            territory_type: "hex", "settlement", "stronghold" or "domain"
+            territory_id: The territory identifier
+
+        Returns:
+            Faction ID or None if unclaimed
+        """
+        return self._effects.territory_index.holder(territory_type, territory_id)
+
+    def rebuild_territory_index(self) -> None:
+        """Rebuild the territory ownership index after editing territory sets directly."""
+        self._effects.rebuild_territory_index(self._faction_states)
+
+    def check_territory_index(self) -> list[str]:
+        """
+        Verify the territory ownership index against faction territory.
+
+        Returns:
+            Descriptions of each inconsistency (empty if in sync)
+        """
+        return self._effects.territory_index.check(self._faction_states)
 
     def get_actions_per_turn(self, faction_id: str) -> int:
         """Get the number of actions a faction can take per turn."""
-        level = self.get_faction_level(faction_id)
-        return self._rules.actions_per_turn_by_level.get(level, 1)
+        stats = self.get_faction_stats(faction_id)
+        return stats.actions_per_turn if stats else self._rules.actions_per_turn_by_level.get(1, 1)
 
     def register_cycle_callback(self, callback: Callable[[CycleResult], None]) -> None:
         """Register a callback for cycle completion."""
@@ -316,6 +390,61 @@ class FactionEngine:
 
         return result
 
+    def fast_forward(
+        self,
+        cycles: Optional[int] = None,
+        days: Optional[int] = None,
+    ) -> FastForwardSummary:
+        """
+        Run many faction cycles in a tight headless loop.
+
+        For jumping a campaign forward a season or several years. Faction
+        state ends up exactly as if run_cycle() had been called once per
+        cycle with the same seed, but no CycleResult is built, cycle
+        callbacks are not called and dice rolls are not logged; outcomes
+        are tallied in the returned summary instead.
+
+        Args:
+            cycles: Number of cycles to run
+            days: Alternatively, days to advance; runs one cycle per full
+                cadence (counting days already accumulated) and keeps the
+                remainder accumulated
+
+        Returns:
+            FastForwardSummary of the simulated cycles
+        """
+        if days is not None:
+            total_days = self._days_accumulated + days
+            cycles = total_days // self._rules.turn_cadence_days
+            self._days_accumulated = total_days % self._rules.turn_cadence_days
+        cycles = max(0, cycles or 0)
+
+        summary = FastForwardSummary(
+            start_cycle=self._cycles_completed,
+            end_cycle=self._cycles_completed + cycles,
+        )
+        faction_ids = sorted(self._faction_states.keys())
+        completed = dict.fromkeys(faction_ids, 0)
+
+        with DiceRoller.quiet():
+            for _ in range(cycles):
+                self._cycles_completed += 1
+                if self._oracle:
+                    self._oracle.reset_cycle_counter()
+
+                for faction_id in faction_ids:
+                    faction_result = self._process_faction_turn(faction_id)
+                    completed[faction_id] += len(faction_result.actions_replaced)
+                    for action_result in faction_result.actions:
+                        summary.complications += action_result.complication
+                        summary.oracle_events += action_result.oracle_event is not None
+
+                summary.rumors_generated.extend(self._effects.clear_pending_rumors())
+
+        summary.actions_completed = completed
+        summary.levels = {fid: self.get_faction_level(fid) for fid in faction_ids}
+        return summary
+
     def _process_faction_turn(self, faction_id: str) -> FactionCycleResult:
         """
         Process a single faction's turn.
@@ -334,14 +463,11 @@ class FactionEngine:
 
         result = FactionCycleResult(faction_id=faction_id)
 
-        # Calculate territory points and level
-        result.territory_points = state.territory.compute_points(
-            self._rules.territory_point_values
-        )
-        result.level = self._rules.get_level_for_points(result.territory_points)
-
-        # Determine how many actions this faction gets
-        actions_this_turn = self._rules.actions_per_turn_by_level.get(result.level, 1)
+        # Territory points, level and how many actions this faction gets
+        stats = self.get_faction_stats(faction_id)
+        result.territory_points = stats.territory_points
+        result.level = stats.level
+        actions_this_turn = stats.actions_per_turn
 
         # Get modifiers for this cycle
         modifiers = self._get_cycle_modifiers(state)
@@ -598,6 +724,7 @@ class FactionEngine:
         self._faction_states.clear()
         for fid, state_data in data.get("faction_states", {}).items():
             self._faction_states[fid] = FactionTurnState.from_dict(state_data)
+        self._effects.rebuild_territory_index(self._faction_states)
 
         # Restore party state
         party_data = data.get("party_state")
@@ -633,14 +760,13 @@ class FactionEngine:
         if not state or not definition:
             return None
 
-        points = state.territory.compute_points(self._rules.territory_point_values)
-        level = self._rules.get_level_for_points(points)
+        stats = self.get_faction_stats(faction_id)
 
         return {
             "faction_id": faction_id,
             "name": definition.name,
-            "level": level,
-            "territory_points": points,
+            "level": stats.level,
+            "territory_points": stats.territory_points,
             "actions": [
                 {
                     "action_id": a.action_id,
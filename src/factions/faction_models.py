@@ -261,6 +261,21 @@ class Territory:
         total += sum(self.custom_points.values())
         return total
 
+    def size_key(self) -> tuple[int, ...]:
+        """
+        Holding counts that territory points are derived from.
+
+        Any add or discard changes this key; edits to custom_points values
+        that keep the same keys do not.
+        """
+        return (
+            len(self.hexes),
+            len(self.settlements),
+            len(self.strongholds),
+            len(self.domains),
+            len(self.custom_points),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for persistence."""
         return {
@@ -351,6 +366,25 @@ class FactionLogEntry:
         )
 
 
+@dataclass(frozen=True)
+class FactionStats:
+    """Territory-derived figures for a faction under a rules configuration."""
+    territory_points: int
+    level: int
+    actions_per_turn: int
+
+    @classmethod
+    def compute(cls, territory: Territory, rules: FactionRules) -> "FactionStats":
+        """Derive points, level and actions per turn from scratch."""
+        points = territory.compute_points(rules.territory_point_values)
+        level = rules.get_level_for_points(points)
+        return cls(
+            territory_points=points,
+            level=level,
+            actions_per_turn=rules.actions_per_turn_by_level.get(level, 1),
+        )
+
+
 @dataclass
 class FactionTurnState:
     """
@@ -365,6 +399,31 @@ class FactionTurnState:
     log: list[FactionLogEntry] = field(default_factory=list)
     news: list[str] = field(default_factory=list)  # Recent news items
 
+    # Cached FactionStats and the (rules, territory size) it was derived from
+    _stats: Optional[FactionStats] = field(default=None, init=False, repr=False, compare=False)
+    _stats_rules: Optional[FactionRules] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _stats_key: tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def get_stats(self, rules: FactionRules) -> FactionStats:
+        """
+        Get territory points, level and actions per turn.
+
+        Cached until the territory's holding counts or the rules object
+        change. Call invalidate_stats() after editing custom_points values.
+        """
+        key = self.territory.size_key()
+        if self._stats is None or self._stats_rules is not rules or self._stats_key != key:
+            self._stats = FactionStats.compute(self.territory, rules)
+            self._stats_rules = rules
+            self._stats_key = key
+        return self._stats
+
+    def invalidate_stats(self) -> None:
+        """Drop cached stats so the next get_stats() recomputes them."""
+        self._stats = None
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for persistence."""
         return {
@@ -473,6 +532,12 @@ class PartyFactionState:
     active_jobs: dict[str, ActiveJob] = field(default_factory=dict)  # job_id -> job
     completed_job_ids: list[str] = field(default_factory=list)
 
+    # Active jobs bucketed by faction_id (derived from active_jobs, not persisted)
+    _jobs_by_faction: dict[str, dict[str, ActiveJob]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _bucketed_count: int = field(default=0, init=False, repr=False, compare=False)
+
     def get_standing(self, faction_or_group: str) -> int:
         """Get party standing with a faction or group (default 0)."""
         return self.standing_by_id.get(faction_or_group, 0)
@@ -502,6 +567,46 @@ class PartyFactionState:
                 return aff
         return None
 
+    def add_job(self, job: ActiveJob) -> None:
+        """Record an active job and file it under its faction."""
+        self._job_buckets()
+        if job.job_id in self.active_jobs:
+            self.remove_job(job.job_id)
+        self.active_jobs[job.job_id] = job
+        self._jobs_by_faction.setdefault(job.faction_id, {})[job.job_id] = job
+        self._bucketed_count += 1
+
+    def remove_job(self, job_id: str) -> Optional[ActiveJob]:
+        """Remove an active job, returning it (None if not active)."""
+        self._job_buckets()
+        job = self.active_jobs.pop(job_id, None)
+        if job is None:
+            return None
+        bucket = self._jobs_by_faction[job.faction_id]
+        del bucket[job_id]
+        if not bucket:
+            del self._jobs_by_faction[job.faction_id]
+        self._bucketed_count -= 1
+        return job
+
+    def get_jobs_for(self, faction_id: str) -> list[ActiveJob]:
+        """Get active jobs from one faction without scanning the others."""
+        return list(self._job_buckets().get(faction_id, {}).values())
+
+    def _job_buckets(self) -> dict[str, dict[str, ActiveJob]]:
+        """
+        Per-faction job buckets, rebuilt if active_jobs was edited directly.
+
+        add_job()/remove_job() keep the buckets in sync; a count mismatch
+        catches jobs loaded from a save or inserted into active_jobs by hand.
+        """
+        if self._bucketed_count != len(self.active_jobs):
+            self._jobs_by_faction = {}
+            for job_id, job in self.active_jobs.items():
+                self._jobs_by_faction.setdefault(job.faction_id, {})[job_id] = job
+            self._bucketed_count = len(self.active_jobs)
+        return self._jobs_by_faction
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for persistence."""
         return {
@@ -590,6 +695,14 @@ class QuestTemplate:
     tags: list[str] = field(default_factory=list)
     summary: str = ""
     default_effects: list[QuestEffect] = field(default_factory=list)
+    min_rank: int = 0  # Affiliation rank required to be offered the job
+    hexes: list[str] = field(default_factory=list)  # Target hexes (empty = anywhere)
+    settlements: list[str] = field(default_factory=list)  # Target settlements
+
+    @property
+    def is_located(self) -> bool:
+        """True if the job is only offered at specific hexes or settlements."""
+        return bool(self.hexes or self.settlements)
 
 
 @dataclass(frozen=True)
@@ -22,6 +22,7 @@ from src.oracle.dice_rng_adapter import DiceRngAdapter
 from src.oracle.mythic_gme import (
     MythicGME,
     Likelihood,
+    FateCheckResult,
     FateResult,
     RandomEventFocus,
 )
@@ -375,15 +376,57 @@ class FactionOracle:
             )
 
         result = self._mythic.fate_check(question, likelihood, check_for_event=False)
+        return self._record_fate_check(result, date, faction_id, tag)
 
+    def fate_check_batch(
+        self,
+        questions: list[tuple[str, Likelihood]],
+        date: str,
+        faction_id: Optional[str] = None,
+        tag: str = "fate_check",
+    ) -> list[OracleEvent]:
+        """
+        Perform several Yes/No fate checks in one call.
+
+        Equivalent to calling fate_check for each question in order (same
+        dice stream, same recorded events), but resolved through
+        MythicGME.fate_check_batch for callers that ask many questions
+        per faction cycle.
+
+        Args:
+            questions: Sequence of (question, likelihood) pairs
+            date: Current game date
+            faction_id: Optional faction context
+            tag: Event category (e.g., "contested_territory")
+
+        Returns:
+            List of OracleEvent, one per question
+        """
+        if not self.config.enabled:
+            return [
+                self.fate_check(question, likelihood, date, faction_id, tag)
+                for question, likelihood in questions
+            ]
+
+        results = self._mythic.fate_check_batch(questions, check_for_event=False)
+        return [self._record_fate_check(result, date, faction_id, tag) for result in results]
+
+    def _record_fate_check(
+        self,
+        result: FateCheckResult,
+        date: str,
+        faction_id: Optional[str],
+        tag: str,
+    ) -> OracleEvent:
+        """Convert a fate check result to a recorded OracleEvent."""
         oracle_event = OracleEvent(
             kind=OracleEventKind.FATE_CHECK,
             date=date,
             tag=tag,
             faction_id=faction_id,
-            question=question,
+            question=result.question,
             result=result.result.value,
-            likelihood=likelihood.name,
+            likelihood=result.likelihood.name,
             roll=result.roll,
             chaos_factor=self.chaos_factor,
         )
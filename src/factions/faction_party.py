@@ -235,15 +235,23 @@ class FactionPartyManager:
     # JOB MANAGEMENT
     # =========================================================================
 
+    def get_affiliation_rank(self, faction_id: str) -> int:
+        """Get the party's affiliation rank with a faction (0 if unaffiliated)."""
+        affiliation = self.get_affiliation(faction_id)
+        return affiliation.rank if affiliation else 0
+
     def list_available_jobs(
         self,
         faction_id: str,
+        rank: Optional[int] = None,
     ) -> list[QuestTemplate]:
         """
         List available jobs from a faction.
 
         Args:
             faction_id: The faction ID
+            rank: Only jobs requiring at most this affiliation rank
+                (None lists every job)
 
         Returns:
             List of available quest templates
@@ -251,7 +259,48 @@ class FactionPartyManager:
         if not self._profiles:
             return []
 
-        return self._profiles.list_quest_templates(faction_id)
+        return self._profiles.list_quest_templates(faction_id, rank=rank)
+
+    def list_jobs_here(
+        self,
+        hex_id: Optional[str] = None,
+        settlement_id: Optional[str] = None,
+    ) -> list[tuple[str, QuestTemplate]]:
+        """
+        List jobs on offer at the party's location.
+
+        Combines jobs that target this settlement or hex with the
+        unlocated jobs of the faction holding it, each filtered by the
+        party's affiliation rank with the offering faction.
+
+        Args:
+            hex_id: The party's current hex
+            settlement_id: The settlement the party is in, if any
+
+        Returns:
+            (faction_or_group_id, QuestTemplate) pairs
+        """
+        if not self._profiles:
+            return []
+
+        jobs = [
+            (owner_id, template)
+            for owner_id, template in self._profiles.list_templates_at(hex_id, settlement_id)
+            if template.min_rank <= self.get_affiliation_rank(owner_id)
+        ]
+
+        holder = None
+        if settlement_id:
+            holder = self._engine.get_territory_holder("settlement", settlement_id)
+        if not holder and hex_id:
+            holder = self._engine.get_territory_holder("hex", hex_id)
+        if holder:
+            rank = self.get_affiliation_rank(holder)
+            for template in self._profiles.list_quest_templates(holder, rank=rank):
+                if not template.is_located:
+                    jobs.append((holder, template))
+
+        return jobs
 
     def accept_job(
         self,
@@ -292,7 +341,7 @@ class FactionPartyManager:
             status="active",
         )
 
-        self.party_state.active_jobs[job_id] = job
+        self.party_state.add_job(job)
         return job
 
     def complete_job(
@@ -360,7 +409,7 @@ class FactionPartyManager:
 
         # Move to completed list
         self.party_state.completed_job_ids.append(job_id)
-        del self.party_state.active_jobs[job_id]
+        self.party_state.remove_job(job_id)
 
         return result
 
@@ -383,7 +432,7 @@ class FactionPartyManager:
         # Small standing penalty for abandonment
         self.adjust_standing(job.faction_id, -1, f"Abandoned job: {job.title}")
 
-        del self.party_state.active_jobs[job_id]
+        self.party_state.remove_job(job_id)
         return True
 
     def get_active_jobs(self, faction_id: Optional[str] = None) -> list[ActiveJob]:
@@ -396,10 +445,9 @@ class FactionPartyManager:
         Returns:
             List of active jobs
         """
-        jobs = list(self.party_state.active_jobs.values())
         if faction_id:
-            jobs = [j for j in jobs if j.faction_id == faction_id]
-        return jobs
+            return self.party_state.get_jobs_for(faction_id)
+        return list(self.party_state.active_jobs.values())
 
     # =========================================================================
     # DOWNTIME FACTION WORK
@@ -59,13 +59,13 @@ class FactionRelations:
             groups: Dict of group_id -> GroupRule
             faction_defs: Optional dict of faction definitions for tag matching
         """
-        self._relations = relations
+        self._relations = list(relations)
         self._groups = groups
         self._faction_defs = faction_defs or {}
 
         # Build lookup indices
         self._pair_index: dict[tuple[str, str], Relation] = {}
-        for rel in relations:
+        for rel in self._relations:
             # Store both directions for symmetric lookup
             self._pair_index[(rel.a, rel.b)] = rel
             self._pair_index[(rel.b, rel.a)] = rel
@@ -78,6 +78,8 @@ class FactionRelations:
                     self._tag_to_groups[tag] = set()
                 self._tag_to_groups[tag].add(group_id)
 
+        self._compile()
+
     @property
     def relations(self) -> list[Relation]:
         """Get all relations."""
@@ -91,19 +93,64 @@ class FactionRelations:
     def set_faction_defs(self, faction_defs: dict[str, FactionDefinition]) -> None:
         """Set faction definitions for tag matching."""
         self._faction_defs = faction_defs
+        self._compile()
 
-    def resolve_ids(self, faction_id: str) -> list[str]:
-        """
-        Resolve a faction ID to a list of applicable IDs.
-
-        Returns [faction_id] + any group_ids matched by the faction's tags.
+    # =========================================================================
+    # COMPILED MATRIX
+    # =========================================================================
 
-        Args:
-            faction_id: The faction ID to resolve
+    def _compile(self) -> None:
+        """
+        Resolve every known ID pair into a dense relation matrix.
 
-        Returns:
-            List starting with the faction_id, followed by matching group_ids
+        Group expansion happens here, once, so get_relation() on known IDs
+        is a single list index. Known IDs are the faction definitions,
+        the groups and every ID named in a relation.
         """
+        ids = list(self._faction_defs)
+        seen = set(ids)
+        for entity_id in [*self._groups, *(i for rel in self._relations for i in (rel.a, rel.b))]:
+            if entity_id not in seen:
+                seen.add(entity_id)
+                ids.append(entity_id)
+
+        self._ids = ids
+        self._id_index = {entity_id: i for i, entity_id in enumerate(ids)}
+        self._expanded = {entity_id: self._expand_ids(entity_id) for entity_id in ids}
+
+        # Expanded ID -> indices of the known IDs whose expansion includes it
+        self._members: dict[str, list[int]] = {}
+        for i, entity_id in enumerate(ids):
+            for expanded_id in self._expanded[entity_id]:
+                self._members.setdefault(expanded_id, []).append(i)
+
+        # Direct relations keyed by the ID on the "a" side of the pair index
+        self._outgoing: dict[str, list[Relation]] = {}
+        for (a, _), rel in self._pair_index.items():
+            self._outgoing.setdefault(a, []).append(rel)
+
+        n = len(ids)
+        self._matrix: list[Optional[Relation]] = [
+            self._resolve_relation(a, b) for a in ids for b in ids
+        ]
+        self._neighbors: dict[str, list[tuple[str, int]]] = {}
+        for i in range(n):
+            self._rank_neighbors(i)
+
+    def _rank_neighbors(self, i: int) -> None:
+        """Rebuild the score-sorted list of factions with a relation to ID i."""
+        n = len(self._ids)
+        row = self._matrix[i * n : (i + 1) * n]
+        neighbors = [
+            (other_id, rel.score)
+            for j, (other_id, rel) in enumerate(zip(self._ids, row))
+            if rel is not None and j != i and other_id not in self._groups
+        ]
+        neighbors.sort(key=lambda item: (-item[1], item[0]))
+        self._neighbors[self._ids[i]] = neighbors
+
+    def _expand_ids(self, faction_id: str) -> list[str]:
+        """Expand an ID to itself plus the groups its tags match."""
         result = [faction_id]
 
         # If it's already a group, just return it
@@ -122,6 +169,114 @@ class FactionRelations:
 
         return result
 
+    def _resolve_relation(self, a_id: str, b_id: str) -> Optional[Relation]:
+        """Resolve a pair through exact and group matches (uncompiled path)."""
+        # 1. Try exact pair lookup
+        if (a_id, b_id) in self._pair_index:
+            return self._pair_index[(a_id, b_id)]
+
+        # 2. Expand both IDs to include group matches
+        a_ids = self.resolve_ids(a_id)
+        b_ids = self.resolve_ids(b_id)
+
+        # 3. Search for any pair among expanded sets
+        # Prioritize: exact faction > faction-group > group-group
+        best_rel: Optional[Relation] = None
+        best_priority = -1
+
+        for i, a in enumerate(a_ids):
+            for j, b in enumerate(b_ids):
+                if (a, b) in self._pair_index:
+                    rel = self._pair_index[(a, b)]
+                    # Priority: lower i and j means more specific match
+                    priority = 100 - i - j
+                    if abs(rel.score) > 0:  # Prefer non-zero scores
+                        priority += 10
+                    if priority > best_priority:
+                        best_priority = priority
+                        best_rel = rel
+
+        return best_rel
+
+    def set_relation(
+        self,
+        a_id: str,
+        b_id: str,
+        score: int,
+        sentiment: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> Relation:
+        """
+        Create or replace the direct relation between two factions or groups.
+
+        Only the matrix cells whose expanded IDs include a_id and b_id are
+        re-resolved, along with the neighbor lists of their rows.
+
+        Args:
+            a_id: First faction or group ID
+            b_id: Second faction or group ID
+            score: New relationship score (-100 to 100)
+            sentiment: New sentiment (keeps the existing one if omitted)
+            notes: New notes (keeps the existing ones if omitted)
+
+        Returns:
+            The stored Relation
+        """
+        old = self._pair_index.get((a_id, b_id))
+        rel = Relation(
+            a=a_id,
+            b=b_id,
+            score=score,
+            sentiment=sentiment if sentiment is not None else (old.sentiment if old else "neutral"),
+            notes=notes if notes is not None else (old.notes if old else ""),
+        )
+
+        if old is not None:
+            self._relations[self._relations.index(old)] = rel
+            for source_id in {a_id, b_id}:
+                outgoing = self._outgoing[source_id]
+                outgoing[outgoing.index(old)] = rel
+        else:
+            self._relations.append(rel)
+            self._outgoing.setdefault(a_id, []).append(rel)
+            if b_id != a_id:
+                self._outgoing.setdefault(b_id, []).append(rel)
+        self._pair_index[(a_id, b_id)] = rel
+        self._pair_index[(b_id, a_id)] = rel
+
+        if a_id not in self._id_index or b_id not in self._id_index:
+            # A new ID changes the matrix shape
+            self._compile()
+            return rel
+
+        n = len(self._ids)
+        rows: set[int] = set()
+        for x_id, y_id in ((a_id, b_id), (b_id, a_id)):
+            for i in self._members.get(x_id, ()):
+                rows.add(i)
+                for j in self._members.get(y_id, ()):
+                    self._matrix[i * n + j] = self._resolve_relation(self._ids[i], self._ids[j])
+        for i in rows:
+            self._rank_neighbors(i)
+        return rel
+
+    def resolve_ids(self, faction_id: str) -> list[str]:
+        """
+        Resolve a faction ID to a list of applicable IDs.
+
+        Returns [faction_id] + any group_ids matched by the faction's tags.
+
+        Args:
+            faction_id: The faction ID to resolve
+
+        Returns:
+            List starting with the faction_id, followed by matching group_ids
+        """
+        expanded = self._expanded.get(faction_id)
+        if expanded is None:
+            return self._expand_ids(faction_id)
+        return list(expanded)
+
     def get_score(self, a_id: str, b_id: str) -> int:
         """
         Get the relationship score between two factions or groups.
@@ -160,7 +315,8 @@ class FactionRelations:
         """
         Get the relationship between two factions or groups.
 
-        Tries exact match first, then expands to group matches.
+        Tries exact match first, then expands to group matches. Pairs of
+        known IDs are answered from the compiled matrix.
 
         Args:
             a_id: First faction or group ID
@@ -169,32 +325,11 @@ class FactionRelations:
         Returns:
             Relation object or None if no relationship found
         """
-        # 1. Try exact pair lookup
-        if (a_id, b_id) in self._pair_index:
-            return self._pair_index[(a_id, b_id)]
-
-        # 2. Expand both IDs to include group matches
-        a_ids = self.resolve_ids(a_id)
-        b_ids = self.resolve_ids(b_id)
-
-        # 3. Search for any pair among expanded sets
-        # Prioritize: exact faction > faction-group > group-group
-        best_rel: Optional[Relation] = None
-        best_priority = -1
-
-        for i, a in enumerate(a_ids):
-            for j, b in enumerate(b_ids):
-                if (a, b) in self._pair_index:
-                    rel = self._pair_index[(a, b)]
-                    # Priority: lower i and j means more specific match
-                    priority = 100 - i - j
-                    if abs(rel.score) > 0:  # Prefer non-zero scores
-                        priority += 10
-                    if priority > best_priority:
-                        best_priority = priority
-                        best_rel = rel
-
-        return best_rel
+        i = self._id_index.get(a_id)
+        j = self._id_index.get(b_id)
+        if i is not None and j is not None:
+            return self._matrix[i * len(self._ids) + j]
+        return self._resolve_relation(a_id, b_id)
 
     def get_all_relations_for(self, faction_id: str) -> list[Relation]:
         """
@@ -206,18 +341,29 @@ class FactionRelations:
         Returns:
             List of Relation objects
         """
-        ids = self.resolve_ids(faction_id)
         result = []
         seen = set()
 
-        for fid in ids:
-            for (a, b), rel in self._pair_index.items():
-                if a == fid and rel not in seen:
+        for fid in self._expanded.get(faction_id) or self._expand_ids(faction_id):
+            for rel in self._outgoing.get(fid, ()):
+                if rel not in seen:
                     result.append(rel)
                     seen.add(rel)
 
         return result
 
+    def get_neighbors(self, faction_id: str) -> list[tuple[str, int]]:
+        """
+        Get the factions a faction has a resolved relationship with.
+
+        Args:
+            faction_id: The faction ID
+
+        Returns:
+            (other_faction_id, score) pairs, friendliest first
+        """
+        return list(self._neighbors.get(faction_id, ()))
+
     def is_hostile(self, a_id: str, b_id: str, threshold: int = -25) -> bool:
         """Check if two factions are hostile (score below threshold)."""
         return self.get_score(a_id, b_id) <= threshold
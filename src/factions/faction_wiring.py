@@ -270,12 +270,18 @@ def get_factions_summary(engine: Optional[FactionEngine]) -> str:
     return "\n".join(lines)
 
 
-def get_party_faction_summary(engine: Optional[FactionEngine]) -> str:
+def get_party_faction_summary(
+    engine: Optional[FactionEngine],
+    hex_id: Optional[str] = None,
+    settlement_id: Optional[str] = None,
+) -> str:
     """
     Get a formatted summary of party faction relationships.
 
     Args:
         engine: The FactionEngine instance (or None)
+        hex_id: Party's current hex, to list jobs on offer there
+        settlement_id: Settlement the party is in, to list jobs on offer there
 
     Returns:
         Formatted string with party faction state
@@ -308,6 +314,15 @@ def get_party_faction_summary(engine: Optional[FactionEngine]) -> str:
         for job_id, job in party_state.active_jobs.items():
             lines.append(f"  - {job.title} (from {job.faction_id}): {job.status}")
 
+    # Jobs on offer at the party's location
+    if hex_id or settlement_id:
+        manager = get_party_manager(engine)
+        jobs_here = manager.list_jobs_here(hex_id=hex_id, settlement_id=settlement_id)
+        if jobs_here:
+            lines.append("\nJobs Here:")
+            for faction_id, template in jobs_here:
+                lines.append(f"  - {template.title} (from {faction_id})")
+
     return "\n".join(lines)
 
 
@@ -16,7 +16,8 @@ Key design:
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Optional
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional
 import logging
 import re
 
@@ -37,6 +38,7 @@ from src.fairy_roads.models import (
     FairyRoadLocationEntry,
     FairyRoadEncounterEntry,
     TimePassedEntry,
+    TimePassedTable,
 )
 from src.content_loader.fairy_road_registry import (
     FairyRoadRegistry,
@@ -47,6 +49,38 @@ from src.content_loader.fairy_road_registry import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _parse_time_spec(time_str: str) -> Optional[tuple[Optional[str], int, int]]:
+    """
+    Parse a time passed string once into (dice, fixed amount, turns per unit).
+
+    A turns-per-unit of 0 means minutes (amount // 10 turns). Returns None
+    if the string has no leading amount.
+    """
+    time_str = time_str.lower().strip()
+
+    # Extract dice notation
+    dice_match = re.match(r"(\d+d\d+|\d+)", time_str)
+    if not dice_match:
+        return None
+
+    dice_part = dice_match.group(1)
+    amount_dice = dice_part if "d" in dice_part else None
+    amount = 0 if amount_dice else int(dice_part)
+
+    # Determine unit
+    if "minute" in time_str:
+        turns_per_unit = 0  # 10 min per turn
+    elif "hour" in time_str:
+        turns_per_unit = 6  # 6 turns per hour
+    elif "week" in time_str:
+        turns_per_unit = 144 * 7  # 144 turns/day * 7 days
+    else:
+        turns_per_unit = 144  # Days, and the default
+
+    return (amount_dice, amount, turns_per_unit)
+
+
 class FairyRoadPhase(str, Enum):
     """Current phase of fairy road travel."""
 
@@ -153,6 +187,7 @@ class FairyRoadTravelResult:
     travel_complete: bool = False
     time_dilation_applied: bool = False
     mortal_days_passed: int = 0
+    segments_traveled: int = 1
 
 
 @dataclass
@@ -219,6 +254,10 @@ class FairyRoadEngine:
         # Track mortal world time that was frozen
         self._frozen_mortal_turns: int = 0
 
+        # Time passed table compiled to roll total -> time string
+        self._time_passed_table: Optional[TimePassedTable] = None
+        self._time_passed_by_roll: dict[int, str] = {}
+
     def register_narration_callback(self, callback: Callable) -> None:
         """Register callback for fairy road narration."""
         self._narration_callback = callback
@@ -234,31 +273,21 @@ class FairyRoadEngine:
     # ENTRY
     # =========================================================================
 
-    def get_doors_in_hex(self, hex_id: str) -> list[DoorRef]:
+    def get_doors_in_hex(self, hex_id: str) -> tuple[DoorRef, ...]:
         """Get fairy doors available in a given hex."""
         self._ensure_registry_loaded()
         return self.registry.get_doors_at_hex(hex_id)
 
-    def can_enter_from_hex(self, hex_id: str) -> list[dict[str, Any]]:
+    def can_enter_from_hex(self, hex_id: str) -> tuple[Mapping[str, str], ...]:
         """
         Check what fairy roads can be entered from a hex.
 
-        Returns a list of available roads with door info.
+        Returns the registry's prebuilt read-only door descriptors
+        (road_id, road_name, door_name, door_hex, direction) for the
+        entry and endpoint doors in the hex.
         """
         self._ensure_registry_loaded()
-        doors = self.registry.get_doors_at_hex(hex_id)
-        result = []
-        for door_ref in doors:
-            # Only entry or endpoint doors can be entered
-            if door_ref.door.direction in ("entry", "endpoint"):
-                result.append({
-                    "road_id": door_ref.road_id,
-                    "road_name": door_ref.road_name,
-                    "door_name": door_ref.door.name,
-                    "door_hex": door_ref.door.hex_id,
-                    "direction": door_ref.door.direction,
-                })
-        return result
+        return self.registry.get_enterable_doors(hex_id)
 
     def enter_fairy_road(
         self,
@@ -389,6 +418,70 @@ class FairyRoadEngine:
                 messages=[f"Cannot travel: current phase is {self._phase.value}"],
             )
 
+        # Roll 1d6 for encounter check
+        check_roll = self.dice.roll_d6(1, "fairy road travel check")
+        return self._resolve_segment(check_roll.total)
+
+    def travel_until_event(self, max_segments: Optional[int] = None) -> FairyRoadTravelResult:
+        """
+        Travel segments until an encounter, a location, or the road's end.
+
+        Segment checks are drawn from the same dice stream as repeated
+        travel_segment() calls and logged as one batched roll; quiet
+        segments only advance the counters. Travel state afterwards is
+        identical to stepping one segment at a time.
+
+        Args:
+            max_segments: Optional cap on segments traveled in this call
+
+        Returns:
+            FairyRoadTravelResult for the final segment, with
+            segments_traveled set to the number of segments covered
+        """
+        if not self._state or not self._current_road:
+            return FairyRoadTravelResult(
+                success=False,
+                phase=FairyRoadPhase.COMPLETE,
+                messages=["Not currently on a fairy road"],
+            )
+
+        if self._phase != FairyRoadPhase.TRAVELING:
+            return FairyRoadTravelResult(
+                success=False,
+                phase=self._phase,
+                messages=[f"Cannot travel: current phase is {self._phase.value}"],
+            )
+
+        limit = max(1, self._state.total_segments - self._state.current_segment)
+        if max_segments is not None:
+            limit = max(1, min(limit, max_segments))
+
+        checks = self.dice.roll_until(
+            6, lambda value: value <= 4, limit, "fairy road travel checks"
+        ).rolls
+
+        # Uneventful segments before the last one only advance time
+        quiet = len(checks) - 1
+        self._state.current_segment += quiet
+        self._state.subjective_turns_elapsed += quiet
+        if self._state.mortal_time_frozen:
+            self._frozen_mortal_turns += quiet
+        if quiet:
+            self._state.last_check_result = FairyRoadCheckResult.NOTHING
+
+        result = self._resolve_segment(checks[-1])
+        result.segments_traveled = len(checks)
+        if quiet:
+            first = self._state.current_segment - quiet
+            result.messages[0] = (
+                f"Traveling segments {first}-{self._state.current_segment} "
+                f"of {self._state.total_segments}..."
+            )
+            result.messages.insert(1, f"{quiet} segment(s) pass uneventfully.")
+        return result
+
+    def _resolve_segment(self, check_value: int) -> FairyRoadTravelResult:
+        """Advance one segment and apply its 1d6 travel check result."""
         # Advance segment
         self._state.current_segment += 1
         self._state.subjective_turns_elapsed += 1
@@ -408,10 +501,6 @@ class FairyRoadEngine:
             f"Traveling segment {self._state.current_segment} of {self._state.total_segments}..."
         )
 
-        # Roll 1d6 for encounter check
-        check_roll = self.dice.roll_d6(1, "fairy road travel check")
-        check_value = check_roll.total
-
         if check_value <= 2:
             # Monster encounter
             check_result = FairyRoadCheckResult.MONSTER_ENCOUNTER
@@ -746,11 +835,10 @@ class FairyRoadEngine:
         # Determine exit door
         target_hex = exit_hex_id or self._state.destination_door_hex
         if not target_hex:
-            # Find any exit door on this road
-            for door in self._current_road.doors:
-                if door.direction in ("exit_only", "endpoint"):
-                    target_hex = door.hex_id
-                    break
+            # Use the road's first exit door
+            exits = self.registry.get_exit_doors(self._state.road_id)
+            if exits:
+                target_hex = exits[0].door.hex_id
 
         if not target_hex:
             return FairyRoadExitResult(
@@ -813,24 +901,31 @@ class FairyRoadEngine:
 
         table = self._common.time_passed_table
         roll = self.dice.roll(table.die, "time dilation")
-        roll_total = roll.total
 
-        # Find matching entry
-        for entry in table.entries:
-            matched = False
-            if entry.roll is not None and entry.roll == roll_total:
-                matched = True
-            elif entry.roll_range is not None:
-                low, high = entry.roll_range
-                if low <= roll_total <= high:
-                    matched = True
+        time_str = self._time_passed_lookup(table).get(roll.total)
+        if time_str is None:
+            return ("1d6 days", 144 * 3)
+        return (time_str, self._parse_time_to_turns(time_str))
 
-            if matched:
-                time_str = entry.time
-                turns = self._parse_time_to_turns(time_str)
-                return (time_str, turns)
+    def _time_passed_lookup(self, table: TimePassedTable) -> dict[int, str]:
+        """
+        Map each time passed roll total to its entry's time string.
 
-        return ("1d6 days", 144 * 3)
+        Built once per table (the first matching entry wins, as in a
+        top-to-bottom scan) so exits and strays are a dict lookup.
+        """
+        if self._time_passed_table is not table:
+            lookup: dict[int, str] = {}
+            for entry in table.entries:
+                if entry.roll is not None:
+                    lookup.setdefault(entry.roll, entry.time)
+                if entry.roll_range is not None:
+                    low, high = entry.roll_range
+                    for total in range(low, high + 1):
+                        lookup.setdefault(total, entry.time)
+            self._time_passed_table = table
+            self._time_passed_by_roll = lookup
+        return self._time_passed_by_roll
 
     def _parse_time_to_turns(self, time_str: str) -> int:
         """
@@ -841,31 +936,18 @@ class FairyRoadEngine:
         1 day = 144 turns
         1 week = 1008 turns
         """
-        time_str = time_str.lower().strip()
-
-        # Extract dice notation
-        dice_match = re.match(r"(\d+d\d+|\d+)", time_str)
-        if not dice_match:
+        spec = _parse_time_spec(time_str)
+        if spec is None:
             return 144  # Default 1 day
 
-        dice_part = dice_match.group(1)
-        if "d" in dice_part:
-            roll = self.dice.roll(dice_part, "time amount")
-            amount = roll.total
-        else:
-            amount = int(dice_part)
+        amount_dice, amount, turns_per_unit = spec
+        if amount_dice:
+            amount = self.dice.roll(amount_dice, "time amount").total
 
-        # Determine unit
-        if "minute" in time_str:
+        if turns_per_unit == 0:
             turns = amount // 10  # 10 min per turn
-        elif "hour" in time_str:
-            turns = amount * 6  # 6 turns per hour
-        elif "week" in time_str:
-            turns = amount * 144 * 7  # 144 turns/day * 7 days
-        elif "day" in time_str:
-            turns = amount * 144  # 144 turns per day
         else:
-            turns = amount * 144  # Default to days
+            turns = amount * turns_per_unit
 
         return max(1, turns)
 
@@ -919,15 +1001,14 @@ class FairyRoadEngine:
         """Get available exit doors from the current road."""
         if not self._current_road:
             return []
-        exits = []
-        for door in self._current_road.doors:
-            if door.direction in ("exit_only", "endpoint"):
-                exits.append({
-                    "hex_id": door.hex_id,
-                    "name": door.name,
-                    "direction": door.direction,
-                })
-        return exits
+        return [
+            {
+                "hex_id": ref.door.hex_id,
+                "name": ref.door.name,
+                "direction": ref.door.direction,
+            }
+            for ref in self.registry.get_exit_doors(self._current_road.road_id)
+        ]
 
     # =========================================================================
     # COMBAT TRIGGER (P2-11)
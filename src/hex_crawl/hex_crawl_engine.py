@@ -390,6 +390,9 @@ class HexCrawlEngine:
     - Hex entry/search costs by terrain
     """
 
+    # Turns the clock advances at the end of a travel day (12 hours)
+    TRAVEL_DAY_TURNS = 144
+
     def __init__(
         self,
         controller: GlobalController,
@@ -596,6 +599,10 @@ class HexCrawlEngine:
         """Get hex data if available."""
         return self._hex_data.get(hex_id)
 
+    def get_all_hex_data(self) -> dict[str, HexLocation]:
+        """Get all loaded hex data, keyed by hex ID."""
+        return dict(self._hex_data)
+
     def _get_hex_data(self, hex_id: str) -> Optional[HexLocation]:
         """Internal alias for get_hex_data (used by internal methods)."""
         return self.get_hex_data(hex_id)
@@ -915,11 +922,12 @@ class HexCrawlEngine:
             if not factions:
                 return 0
 
-            from src.factions.faction_hooks import HexFactionLookup, get_encounter_modifier
+            from src.factions.faction_hooks import get_encounter_modifier
 
-            lookup = HexFactionLookup(factions)
-            standing = lookup.get_standing_for_hex(hex_id)
-            return get_encounter_modifier(standing)
+            faction_id = factions.get_territory_holder("hex", hex_id)
+            if not faction_id or not factions.party_state:
+                return 0
+            return get_encounter_modifier(factions.party_state.get_standing(faction_id))
         except Exception:
             # Fail silently - faction system is optional
             return 0
@@ -1235,7 +1243,7 @@ class HexCrawlEngine:
         """
         End the travel day, advance time by one day, and reset daily flags.
         """
-        time_result = self.controller.advance_time(144)  # 12 hours travel + rest window
+        time_result = self.controller.advance_time(self.TRAVEL_DAY_TURNS)
         summary = {
             "travel_points_spent": self._travel_points_total - self._travel_points_remaining,
             "travel_points_total": self._travel_points_total,
@@ -1341,6 +1349,42 @@ class HexCrawlEngine:
         """Get the total travel points for the current day."""
         return self._travel_points_total
 
+    def get_travel_day_turns_elapsed(
+        self,
+        destination_hex: Optional[str] = None,
+        route_type: RouteType = RouteType.WILD,
+    ) -> int:
+        """
+        Turns of the travel day used up by the Travel Points spent so far.
+
+        The clock only advances at end_travel_day, so this places the party
+        partway through the day in proportion to its spent Travel Points.
+        Nothing is rolled or spent.
+
+        Args:
+            destination_hex: Also count the cost of entering this hex, as
+                travel_to_hex would charge it
+            route_type: Road, track, or wild travel into destination_hex
+
+        Returns:
+            Turns since the start of the travel day (at most TRAVEL_DAY_TURNS)
+        """
+        total = self._travel_points_total
+        spent = total - self._travel_points_remaining
+        if destination_hex is not None:
+            if not total:
+                total = MovementCalculator.get_travel_points(self._get_party_speed())
+            cost = self._pending_entry_cost
+            if not cost:
+                terrain_cost = self.get_terrain_info(
+                    self.get_terrain_for_hex(destination_hex)
+                ).travel_point_cost
+                cost = 2 if route_type in {RouteType.ROAD, RouteType.TRACK} else terrain_cost
+            spent = min(total, spent + cost)
+        if total <= 0:
+            return 0
+        return self.TRAVEL_DAY_TURNS * spent // total
+
     def get_current_hex_id(self) -> str:
         """Get the current hex ID."""
         return self.controller.party_state.location.location_id
@@ -2281,6 +2325,25 @@ class HexCrawlEngine:
     # POI APPROACH AND EXPLORATION
     # =========================================================================
 
+    def get_approachable_poi(
+        self, hex_id: str, poi_index: int
+    ) -> Optional["PointOfInterest"]:
+        """
+        Get the POI that approach_poi(hex_id, poi_index) would approach.
+
+        Read-only; used to prepare approach narration ahead of time.
+
+        Returns:
+            The PointOfInterest, or None if the hex or index is invalid
+        """
+        hex_data = self._hex_data.get(hex_id)
+        if not hex_data:
+            return None
+        visible_pois = [poi for poi in hex_data.points_of_interest if poi.is_visible()]
+        if poi_index < 0 or poi_index >= len(visible_pois):
+            return None
+        return visible_pois[poi_index]
+
     def approach_poi(
         self,
         hex_id: str,
@@ -2303,12 +2366,10 @@ class HexCrawlEngine:
         if not hex_data:
             return {"success": False, "error": "Hex data not found"}
 
-        # Get visible POIs
-        visible_pois = [poi for poi in hex_data.points_of_interest if poi.is_visible()]
-        if poi_index < 0 or poi_index >= len(visible_pois):
+        poi = self.get_approachable_poi(hex_id, poi_index)
+        if poi is None:
             return {"success": False, "error": "Invalid location index"}
 
-        poi = visible_pois[poi_index]
         is_night = self._is_night()
 
         # Update POI exploration state
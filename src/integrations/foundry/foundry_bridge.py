@@ -16,11 +16,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 import json
 import copy
 
 if TYPE_CHECKING:
+    from src.ai.dm_agent import NarrationChunk
     from src.main import VirtualDM
 
 
@@ -42,6 +43,7 @@ class FoundryEventType(str, Enum):
     EFFECT_APPLIED = "effect_applied"
     ITEM_CHANGE = "item_change"
     NARRATION = "narration"
+    NARRATION_CHUNK = "narration_chunk"  # Streamed narration as it arrives
 
 
 @dataclass
@@ -355,6 +357,44 @@ class FoundryBridge:
             }
         ))
 
+    def emit_narration_chunk(
+        self,
+        stream_id: int,
+        content: str,
+        done: bool = False,
+        aborted: bool = False,
+        narrator: str = "DM",
+    ) -> None:
+        """
+        Emit a piece of streamed narration.
+
+        Chunks sharing a stream_id belong to one narration message; the
+        module appends them in order and finalizes on done (or discards
+        the message when aborted).
+        """
+        self._pending_events.append(FoundryEvent(
+            event_type=FoundryEventType.NARRATION_CHUNK,
+            data={
+                "narrator": narrator,
+                "stream_id": stream_id,
+                "content": content,
+                "done": done,
+                "aborted": aborted,
+            }
+        ))
+
+    def narration_sink(self, narrator: str = "DM") -> Callable[[NarrationChunk], None]:
+        """
+        Sink for ConversationFacade.handle_chat_streaming that forwards
+        narration chunks as NARRATION_CHUNK events.
+        """
+        def sink(chunk: NarrationChunk) -> None:
+            self.emit_narration_chunk(
+                chunk.stream_id, chunk.text, chunk.done, chunk.aborted, narrator
+            )
+
+        return sink
+
     def emit_actor_update(self, actor_id: str, changes: dict[str, Any]) -> None:
         """Emit an actor update event."""
         self._pending_events.append(FoundryEvent(
@@ -20,7 +20,7 @@ import argparse
 import logging
 import json
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from src.data_models import (
     GameDate,
@@ -50,6 +50,7 @@ from src.game_state import (
     GameSession,
 )
 from src.hex_crawl import HexCrawlEngine
+from src.hex_crawl.hex_crawl_engine import TravelSegmentResult
 from src.dungeon import DungeonEngine
 from src.combat import CombatEngine
 from src.settlement import SettlementEngine
@@ -60,6 +61,9 @@ from src.ai import (
     DMAgentConfig,
     LLMProvider,
     DescriptionResult,
+    NarrationChunk,
+    NarrationPrefetcher,
+    PromptSchema,
 )
 from src.ai.lore_search import create_lore_search, LoreSearchInterface
 from src.narrative import NarrationContext
@@ -115,12 +119,16 @@ class GameConfig:
 
     # Narration settings
     enable_narration: bool = True  # Enable LLM-generated narrative descriptions
+    narration_cache_path: Optional[Path] = None  # SQLite file for persistent narration cache
+    prefetch_narration: bool = False  # Speculatively narrate suggested travel/POI approaches
+    prefetch_token_budget: int = 8192  # Estimated tokens spent per prefetch round
 
     # Database options
     use_vector_db: bool = True
     mock_embeddings: bool = False
     local_embeddings: bool = False
     skip_indexing: bool = False
+    background_indexing: bool = True  # Index loaded content for lore search off the boot path
 
     # Content options
     content_dir: Optional[Path] = None
@@ -145,6 +153,8 @@ class GameConfig:
             self.content_dir = Path(self.content_dir)
         if isinstance(self.ingest_pdf, str):
             self.ingest_pdf = Path(self.ingest_pdf)
+        if isinstance(self.narration_cache_path, str):
+            self.narration_cache_path = Path(self.narration_cache_path)
 
 
 # =============================================================================
@@ -236,6 +246,8 @@ class VirtualDM:
 
         # Initialize the DM Agent for narrative descriptions
         self._dm_agent: Optional[DMAgent] = None
+        self._prefetcher: Optional[NarrationPrefetcher] = None
+        self._lore_retriever: Any = None
         if self.config.enable_narration:
             self._init_dm_agent()
 
@@ -253,12 +265,17 @@ class VirtualDM:
         dm_config = DMAgentConfig(
             llm_provider=provider,
             llm_model=self.config.llm_model or "claude-sonnet-4-20250514",
+            cache_persist_path=(
+                str(self.config.narration_cache_path) if self.config.narration_cache_path else None
+            ),
         )
 
         # Create lore search based on config
         lore_search = create_lore_search(
             use_vector_db=self.config.use_vector_db,
             mock_embeddings=self.config.mock_embeddings,
+            local_embeddings=self.config.local_embeddings,
+            vector_store_path=self.config.data_dir / "vector_store",
         )
         lore_status = lore_search.get_status()
         logger.info(f"Lore search initialized: {lore_status}")
@@ -266,6 +283,14 @@ class VirtualDM:
         self._dm_agent = DMAgent(dm_config, lore_search=lore_search)
         logger.info(f"DM Agent initialized with provider: {provider.value}")
 
+        self._lore_retriever = getattr(lore_search, "retriever", None)
+        self._index_lore_content()
+
+        if self.config.prefetch_narration:
+            self._prefetcher = NarrationPrefetcher(
+                self._dm_agent, token_budget=self.config.prefetch_token_budget
+            )
+
         # Set up narration callback on NarrativeResolver
         narrative_resolver = self.controller.get_narrative_resolver()
         if narrative_resolver:
@@ -364,6 +389,13 @@ class VirtualDM:
                     raise RuntimeError(f"Content loading failed: {msg}")
 
             self._content_loaded = True
+
+            # Lore cached against the previous content is stale (agent may not exist yet)
+            dm_agent = getattr(self, "_dm_agent", None)
+            if dm_agent:
+                dm_agent.invalidate_lore_cache()
+                self._index_lore_content()
+
             logger.info(
                 f"Base content loaded: {content.stats.hexes_loaded} hexes, "
                 f"{content.stats.spells_loaded} spells, "
@@ -381,6 +413,80 @@ class VirtualDM:
         # P1-6: Store the report for player visibility
         self._content_load_report = report
 
+    def _index_lore_content(self) -> None:
+        """
+        Index loaded hexes into the lore search retriever.
+
+        Runs on a background thread unless config.background_indexing is
+        off, so startup does not wait on embedding; lore searches made in
+        the meantime see the batches written so far. Unchanged documents
+        are skipped by content hash, so re-indexing after a reload is cheap.
+        A local vector store is saved to disk when indexing finishes.
+        """
+        retriever = self._lore_retriever
+        if retriever is None or self.config.skip_indexing or not self._content_loaded:
+            return
+
+        from src.vector_db.rules_retriever import RulesRetriever
+
+        documents = [
+            RulesRetriever.hex_document(hex_id, self._hex_lore_data(hex_loc))
+            for hex_id, hex_loc in self.hex_crawl.get_all_hex_data().items()
+        ]
+        if self.config.background_indexing:
+            retriever.start_background_index(documents, on_complete=self._on_lore_indexed)
+        else:
+            retriever.last_bulk_result = retriever.bulk_index(documents)
+            self._on_lore_indexed(retriever.last_bulk_result)
+
+    def _on_lore_indexed(self, result: Any) -> None:
+        """
+        Finish a lore indexing run.
+
+        Drops lore lookups cached while the index was still filling (they
+        may be empty), then saves the local vector store if indexing changed
+        it. The next boot maps the saved store back in (see
+        create_lore_search) and skips every hex whose content is unchanged.
+        """
+        if self._dm_agent:
+            self._dm_agent.invalidate_lore_cache()
+        if not result.indexed or self._lore_retriever is None:
+            return
+        try:
+            self._lore_retriever.persist()
+        except OSError as e:
+            logger.warning(f"Failed to persist lore index: {e}")
+
+    def wait_for_lore_indexing(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background lore indexing started at boot.
+
+        Returns:
+            True if no indexing is still running
+        """
+        if self._lore_retriever is None:
+            return True
+        return self._lore_retriever.wait_for_indexing(timeout)
+
+    @staticmethod
+    def _hex_lore_data(hex_loc: Any) -> dict[str, Any]:
+        """Fields of a HexLocation that RulesRetriever.hex_document indexes."""
+        return {
+            "name": hex_loc.name or "",
+            "terrain": hex_loc.terrain_type,
+            "description": " ".join(filter(None, [hex_loc.tagline, hex_loc.description])),
+            "features": [
+                {"name": poi.name, "description": poi.description}
+                for poi in hex_loc.points_of_interest
+            ],
+            "landmarks": [
+                {"name": lm.name, "description": lm.description}
+                for lm in hex_loc.landmarks
+            ],
+            "fairy_influence": hex_loc.fairy_influence,
+            "drune_presence": hex_loc.drune_presence,
+        }
+
     def _load_settlements(self, content_dir: Path) -> tuple[int, int, list[str]]:
         """
         Load settlement content from JSON files into SettlementEngine.
@@ -1387,22 +1493,118 @@ class VirtualDM:
             narrate: Generate narrative description (default: use config setting)
 
         Returns:
-            Travel result dictionary with optional 'narration' key
+            Travel result dictionary with optional 'narration' key, plus
+            'encounter_narration' when an encounter interrupts the journey
         """
         if self.current_state != GameState.WILDERNESS_TRAVEL:
             return {"error": f"Cannot travel from state: {self.current_state.value}"}
 
         result = self.hex_crawl.travel_to_hex(hex_id)
+        encounter: Optional[EncounterState] = None
+        if isinstance(result, TravelSegmentResult):
+            encounter = result.encounter
+            result = self._travel_result_to_dict(result)
+
+        if self._dm_agent and "error" not in result:
+            self._dm_agent.set_lore_location(result.get("actual_hex") or hex_id)
 
         # Add narration if enabled and travel succeeded
         should_narrate = narrate if narrate is not None else self.config.enable_narration
         if should_narrate and self._dm_agent and "error" not in result:
-            narration = self._narrate_hex_arrival(hex_id, result)
-            if narration:
-                result["narration"] = narration
+            arrived = result.get("actual_hex") or hex_id
+            hooks = [lambda: self._narrate_hex_arrival(arrived, result)]
+            if encounter is not None:
+                hooks.append(lambda: self._narrate_travel_encounter(encounter, result))
+            narrations = self._narrate_together(hooks)
+            for key, narration in zip(["narration", "encounter_narration"], narrations):
+                if narration:
+                    result[key] = narration
 
         return result
 
+    def _narrate_travel_encounter(
+        self, encounter: EncounterState, travel_result: dict[str, Any]
+    ) -> Optional[str]:
+        """Frame an encounter that interrupted travel into a hex."""
+        enemies = encounter.get_enemy_combatants()
+        if enemies:
+            creature_name = enemies[0].name
+        elif encounter.actors:
+            creature_name = encounter.actors[0]
+        else:
+            creature_name = encounter.encounter_type.value
+        return self.narrate_encounter_start(
+            encounter=encounter,
+            creature_name=creature_name,
+            number_appearing=len(enemies) or len(encounter.actors) or 1,
+            terrain=travel_result.get("terrain", encounter.terrain or "wilderness"),
+        )
+
+    def _narrate_together(self, hooks: list[Callable[[], Optional[str]]]) -> list[Optional[str]]:
+        """
+        Run independent narration hooks with their LLM calls in flight at once.
+
+        The hooks run in capture mode to collect their schemas, which then
+        go to DMAgent.execute_schemas together, so the turn waits for the
+        slowest narration rather than the sum. While a streaming sink is
+        active the hooks simply run in order, so their text still streams.
+
+        Returns:
+            Narration text (or None) per hook, in order
+        """
+        if not self._dm_agent or len(hooks) < 2 or self._dm_agent._stream_sink is not None:
+            return [hook() for hook in hooks]
+
+        spans: list[tuple[int, int]] = []
+        with self._dm_agent.capturing() as captured:
+            for hook in hooks:
+                start = len(captured)
+                hook()
+                spans.append((start, len(captured)))
+
+        results = self._dm_agent.execute_schemas(list(captured))
+        narrations: list[Optional[str]] = []
+        for start, end in spans:
+            texts = [r.content for r in results[start:end] if r.success]
+            narrations.append(" ".join(texts) or None)
+        return narrations
+
+    def _travel_result_to_dict(self, result: TravelSegmentResult) -> dict[str, Any]:
+        """Flatten a TravelSegmentResult into the travel_to_hex result dict."""
+        data: dict[str, Any] = {
+            "success": result.success,
+            "message": " ".join(result.messages) or "You travel onward.",
+            "destination_hex": result.destination_hex,
+            "actual_hex": result.actual_hex,
+            "travel_points_spent": result.travel_points_spent,
+            "remaining_travel_points": result.remaining_travel_points,
+            "encounter_occurred": result.encounter_occurred,
+            "lost_today": result.lost_today,
+            "first_visit": result.first_visit,
+            "warnings": list(result.warnings),
+        }
+        if not result.success:
+            data["error"] = "; ".join(result.warnings) or data["message"]
+            return data
+        data.update(self._hex_arrival_context(result.actual_hex or result.destination_hex))
+        data["time_of_day"] = self._travel_time_of_day(
+            self.hex_crawl.get_travel_day_turns_elapsed()
+        ).value
+        return data
+
+    def _hex_arrival_context(self, hex_id: str) -> dict[str, Any]:
+        """Terrain and visible features used to narrate arriving in a hex."""
+        overview = self.hex_crawl.get_hex_overview(hex_id)
+        return {
+            "terrain": self.hex_crawl.get_terrain_for_hex(hex_id).value,
+            "features": list(overview.visible_features),
+        }
+
+    def _travel_time_of_day(self, turns_elapsed: int) -> TimeOfDay:
+        """Time of day once turns_elapsed of the travel day have passed."""
+        arrival, _ = self.time_tracker.game_time.advance_turns(turns_elapsed)
+        return arrival.get_time_of_day()
+
     def _narrate_hex_arrival(
         self,
         hex_id: str,
@@ -1419,7 +1621,9 @@ class VirtualDM:
 
         # Get current conditions
         time_summary = self.time_tracker.get_time_summary()
-        time_of_day = TimeOfDay(time_summary.get("time_of_day", "day"))
+        time_of_day = TimeOfDay(
+            travel_result.get("time_of_day") or time_summary.get("time_of_day", "day")
+        )
         weather = self.controller.world_state.weather
         season = Season(time_summary.get("season", "summer"))
 
@@ -1442,18 +1646,27 @@ class VirtualDM:
             logger.warning(f"Error generating hex narration: {e}")
             return None
 
-    def enter_dungeon(self, dungeon_id: str, entry_room: str) -> dict[str, Any]:
+    def enter_dungeon(
+        self,
+        dungeon_id: str,
+        entry_room: str,
+        poi_config: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
         """
         Enter a dungeon.
 
         Args:
             dungeon_id: Dungeon identifier
             entry_room: Entry room ID
+            poi_config: Dungeon setup from the hex POI it is entered through
 
         Returns:
             Entry result dictionary
         """
-        return self.dungeon.enter_dungeon(dungeon_id, entry_room)
+        result = self.dungeon.enter_dungeon(dungeon_id, entry_room, poi_config=poi_config)
+        if self._dm_agent and "error" not in result:
+            self._dm_agent.set_lore_location(dungeon_id)
+        return result
 
     def enter_settlement(self, settlement_id: str) -> dict[str, Any]:
         """
@@ -1465,7 +1678,10 @@ class VirtualDM:
         Returns:
             Entry result dictionary
         """
-        return self.settlement.enter_settlement(settlement_id)
+        result = self.settlement.enter_settlement(settlement_id)
+        if self._dm_agent and "error" not in result:
+            self._dm_agent.set_lore_location(settlement_id)
+        return result
 
     def rest(self, rest_type: str = "long") -> dict[str, Any]:
         """
@@ -1802,6 +2018,30 @@ class VirtualDM:
             logger.warning(f"Error generating rest narration: {e}")
             return None
 
+    def poi_approach_narration_args(
+        self, hex_id: str, poi_index: int
+    ) -> Optional[dict[str, Any]]:
+        """
+        Build narrate_poi_approach() arguments for a visible POI.
+
+        Args:
+            hex_id: Hex containing the POI
+            poi_index: Index into the hex's visible POIs
+
+        Returns:
+            Keyword arguments for narrate_poi_approach, or None if no such POI
+        """
+        poi = self.hex_crawl.get_approachable_poi(hex_id, poi_index)
+        if poi is None:
+            return None
+        is_night = self.hex_crawl.get_hex_overview(hex_id).is_night
+        return {
+            "poi_name": poi.name,
+            "poi_type": poi.poi_type,
+            "description": poi.get_description(is_night),
+            "tagline": poi.tagline or "",
+        }
+
     def narrate_poi_approach(
         self,
         *,
@@ -2052,6 +2292,68 @@ class VirtualDM:
         """Get the DM Agent for direct access if needed."""
         return self._dm_agent
 
+    # =========================================================================
+    # NARRATION PREFETCH
+    # =========================================================================
+
+    def prefetch_schemas(self, suggestions: list[SuggestedAction]) -> list[PromptSchema]:
+        """
+        Capture the narration prompts the suggested actions would send.
+
+        Runs the real arrival/approach narration hooks in capture mode, so
+        the schemas (and their cache keys) match what executing the action
+        will request. Only travel and POI approach suggestions are used.
+
+        Args:
+            suggestions: Ranked suggestions, most likely first
+
+        Returns:
+            Captured schemas in suggestion order
+        """
+        if not self._dm_agent:
+            return []
+
+        with self._dm_agent.capturing() as captured:
+            for suggestion in suggestions:
+                params = suggestion.params or {}
+                try:
+                    if suggestion.id == "wilderness:travel" and params.get("hex_id"):
+                        hex_id = params["hex_id"]
+                        # Narrate at the time the party would arrive, not now
+                        context = self._hex_arrival_context(hex_id)
+                        context["time_of_day"] = self._travel_time_of_day(
+                            self.hex_crawl.get_travel_day_turns_elapsed(hex_id)
+                        ).value
+                        self._narrate_hex_arrival(hex_id, context)
+                    elif suggestion.id == "wilderness:approach_poi":
+                        args = self.poi_approach_narration_args(
+                            params.get("hex_id") or self.hex_crawl.get_current_hex_id(),
+                            int(params.get("poi_index", 0)),
+                        )
+                        if args:
+                            self.narrate_poi_approach(**args)
+                except Exception as e:
+                    logger.debug(f"Skipping prefetch for {suggestion.id}: {e}")
+        return list(captured)
+
+    def prefetch_narration(self, suggestions: list[SuggestedAction]) -> int:
+        """
+        Warm the narration cache for the suggested next actions.
+
+        No-op unless GameConfig.prefetch_narration is enabled.
+
+        Returns:
+            Number of prompts queued for background generation
+        """
+        if not self._prefetcher:
+            return 0
+        return self._prefetcher.schedule(self.prefetch_schemas(suggestions))
+
+    def cancel_prefetch(self) -> None:
+        """Drop queued prefetches (the game state is about to change)."""
+        if self._prefetcher:
+            self._prefetcher.cancel()
+
     # =========================================================================
     # SESSION MANAGEMENT
     # =========================================================================
@@ -2210,6 +2512,8 @@ class DolmenwoodCLI:
         # Conversation-first interface
         self.conv = ConversationFacade(dm)
         self.last_suggestions: list[SuggestedAction] = []
+        # Print LLM narration as it arrives instead of after the turn
+        self.stream_narration = True
         self.commands = {
             "status": self.cmd_status,
             "help": self.cmd_help,
@@ -2262,7 +2566,12 @@ class DolmenwoodCLI:
             idx = int(user_input.strip()) - 1
             if 0 <= idx < len(self.last_suggestions):
                 action = self.last_suggestions[idx]
-                turn = self.conv.handle_action(action.id, action.params)
+                if self.stream_narration:
+                    turn = self.conv.handle_action_streaming(
+                        action.id, action.params, on_chunk=self._render_chunk
+                    )
+                else:
+                    turn = self.conv.handle_action(action.id, action.params)
                 self._render_turn(turn)
                 return
             else:
@@ -2277,7 +2586,10 @@ class DolmenwoodCLI:
             self.commands[cmd](args)
         else:
             # Treat unknown commands as natural language chat
-            turn = self.conv.handle_chat(user_input)
+            if self.stream_narration:
+                turn = self.conv.handle_chat_streaming(user_input, self._render_chunk)
+            else:
+                turn = self.conv.handle_chat(user_input)
             self._render_turn(turn)
 
     def cmd_help(self, args: str) -> None:
@@ -2474,10 +2786,20 @@ Available Commands:
         except Exception as e:
             logger.debug(f"Could not show initial suggestions: {e}")
 
+    def _render_chunk(self, chunk: NarrationChunk) -> None:
+        """Print streamed narration as it arrives."""
+        if chunk.text:
+            print(chunk.text, end="", flush=True)
+        if chunk.done:
+            print(" [narration withheld]" if chunk.aborted else "", flush=True)
+
     def _render_turn(self, turn: TurnResponse) -> None:
         """Render a conversation turn response."""
+        streamed = set(turn.streamed_narration)
         # Render messages
         for msg in turn.messages:
+            if msg.role == "dm" and msg.content in streamed:
+                continue  # Already printed while streaming
             if msg.role == "system":
                 print(f"[System] {msg.content}")
             elif msg.role == "dm":
@@ -2980,6 +3302,12 @@ Examples:
         type=str,
         help="URL for local LLM server",
     )
+    llm_group.add_argument(
+        "--prefetch-narration",
+        action="store_true",
+        help="Pre-generate narration for suggested travel and POI approaches "
+        "in the background (spends extra tokens)",
+    )
 
     # Database options
     db_group = parser.add_argument_group("Database Options")
@@ -2996,7 +3324,7 @@ Examples:
     db_group.add_argument(
         "--local-embeddings",
         action="store_true",
-        help="Use local embedding model",
+        help="Use the local vector store (no ChromaDB or sentence-transformers)",
     )
     db_group.add_argument(
         "--skip-indexing",
@@ -3072,6 +3400,7 @@ def create_config_from_args(args: argparse.Namespace) -> GameConfig:
         llm_provider=args.llm_provider,
         llm_model=args.llm_model,
         llm_url=args.llm_url,
+        prefetch_narration=args.prefetch_narration,
         use_vector_db=not args.no_vector_db,
         mock_embeddings=args.mock_embeddings,
         local_embeddings=args.local_embeddings,
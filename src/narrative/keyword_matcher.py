@@ -0,0 +1,183 @@
+"""
+Multi-keyword matcher for fallback intent parsing.
+
+Implements an Aho-Corasick automaton so that every keyword of every
+pattern table is found in a single pass over the player's input,
+instead of running one substring test per keyword per pattern.
+
+The pattern tables in narrative_resolver are compiled once at import
+into CompiledPatternTable instances. Pattern priority is the order of
+the source table (earlier entries are more specific by convention), so
+a compiled table returns exactly the pattern a linear first-match scan
+would return when both see the same keyword hits.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Same shape as the pattern tables in narrative_resolver:
+# (keywords, action_id, param_extractor_or_None, confidence)
+PatternEntry = tuple[tuple[str, ...], str, Optional[Callable], float]
+
+
+def _is_word_char(char: str) -> bool:
+    """Word characters for boundary checks (letters, digits, apostrophes)."""
+    return char.isalnum() or char in "_'"
+
+
+class KeywordAutomaton(Generic[T]):
+    """
+    Aho-Corasick automaton over lowercase keywords.
+
+    Each keyword carries a payload. find_all() reports every occurrence of
+    every keyword in one left-to-right pass, in O(len(text) + hits).
+    """
+
+    def __init__(self, keywords: Iterable[tuple[str, T]]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: (keyword, payload) pairs; keywords are lowercased
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Per state: (keyword_length, payload) for every keyword ending here
+        self._output: list[list[tuple[int, T]]] = [[]]
+
+        for keyword, payload in keywords:
+            self._insert(keyword.lower(), payload)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, payload: T) -> None:
+        """Add a keyword to the trie."""
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append((len(keyword), payload))
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first failure link construction with output merging."""
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    @property
+    def state_count(self) -> int:
+        """Number of trie states (for diagnostics)."""
+        return len(self._goto)
+
+    def find_all(self, text: str, word_start: bool = True) -> Iterator[tuple[int, int, T]]:
+        """
+        Find every keyword occurrence in text.
+
+        Args:
+            text: Lowercased input text
+            word_start: Only report hits that begin at a word boundary, so
+                "run" does not fire inside "brunch" while stems such as
+                "hunt" still match "hunting"
+
+        Yields:
+            (start, end, payload) for each hit, end exclusive
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, payload in output[state]:
+                start = index + 1 - length
+                if word_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                yield start, index + 1, payload
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """A pattern selected by a compiled table."""
+
+    rank: int
+    keyword: str
+    action_id: str
+    param_extractor: Optional[Callable]
+    confidence: float
+
+
+class CompiledPatternTable:
+    """
+    One or more pattern tables compiled into a single automaton.
+
+    Tables are concatenated in the order given; a hit on an earlier entry
+    always beats a hit on a later one. This mirrors the resolver's
+    "state patterns first, then universal patterns" lookup.
+    """
+
+    def __init__(self, *tables: list[PatternEntry]):
+        self._entries: list[PatternEntry] = [entry for table in tables for entry in table]
+        keywords: list[tuple[str, tuple[int, str]]] = []
+        for rank, (entry_keywords, _, _, _) in enumerate(self._entries):
+            for keyword in entry_keywords:
+                keywords.append((keyword, (rank, keyword)))
+        self._automaton: KeywordAutomaton[tuple[int, str]] = KeywordAutomaton(keywords)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def best_match(self, text: str, word_start: bool = True) -> Optional[PatternMatch]:
+        """
+        Find the highest-priority pattern with any keyword in text.
+
+        Args:
+            text: Raw player input (lowercased and stripped here)
+            word_start: See KeywordAutomaton.find_all
+
+        Returns:
+            PatternMatch or None if nothing matched
+        """
+        best: Optional[tuple[int, str]] = None
+        for _, _, hit in self._automaton.find_all(text.lower().strip(), word_start):
+            if best is None or hit[0] < best[0]:
+                best = hit
+                if best[0] == 0:
+                    break
+        if best is None:
+            return None
+        rank, keyword = best
+        _, action_id, param_extractor, confidence = self._entries[rank]
+        return PatternMatch(rank, keyword, action_id, param_extractor, confidence)
+
+    def match(self, text: str) -> Optional[tuple[str, dict[str, Any], float]]:
+        """
+        Match text and run the pattern's parameter extractor.
+
+        Returns:
+            (action_id, params, confidence) or None if no match
+        """
+        found = self.best_match(text)
+        if found is None:
+            return None
+        params = found.param_extractor(text) if found.param_extractor else {}
+        return (found.action_id, params, found.confidence)
@@ -52,6 +52,7 @@ from src.narrative.creative_resolver import (
     CreativeResolutionResult,
     CreativeSolutionCategory,
 )
+from src.narrative.keyword_matcher import CompiledPatternTable
 
 
 logger = logging.getLogger(__name__)
@@ -254,17 +255,60 @@ def _match_patterns(
     """
     Match text against a pattern list.
 
+    Uses the precompiled automaton for the module pattern tables and
+    compiles ad-hoc tables on demand. Earlier patterns take priority.
+
     Returns (action_id, params, confidence) or None if no match.
     """
-    text_lower = text.lower().strip()
-
-    for keywords, action_id, param_extractor, confidence in patterns:
-        for keyword in keywords:
-            if keyword in text_lower:
-                params = param_extractor(text) if param_extractor else {}
-                return (action_id, params, confidence)
+    compiled = _COMPILED_TABLES.get(id(patterns))
+    if compiled is None or compiled[0] is not patterns:
+        return CompiledPatternTable(patterns).match(text)
+    return compiled[1].match(text)
+
+
+# Every fallback pattern table (also used to train the local intent classifier)
+ALL_PATTERN_TABLES: tuple[list[tuple[tuple[str, ...], str, Optional[Callable], float]], ...] = (
+    WILDERNESS_PATTERNS,
+    DUNGEON_PATTERNS,
+    ENCOUNTER_PATTERNS,
+    SETTLEMENT_PATTERNS,
+    SOCIAL_PATTERNS,
+    DOWNTIME_PATTERNS,
+    COMBAT_PATTERNS,
+    UNIVERSAL_PATTERNS,
+)
 
-    return None
+# Pattern tables compiled once at import, keyed by id() of the source list
+_COMPILED_TABLES: dict[int, tuple[list, CompiledPatternTable]] = {
+    id(table): (table, CompiledPatternTable(table)) for table in ALL_PATTERN_TABLES
+}
+
+# Per-state automata: state patterns take priority over universal patterns
+_STATE_PATTERN_TABLES: dict[str, list[tuple[tuple[str, ...], str, Optional[Callable], float]]] = {
+    "wilderness_travel": WILDERNESS_PATTERNS,
+    "dungeon_exploration": DUNGEON_PATTERNS,
+    "encounter": ENCOUNTER_PATTERNS,
+    "settlement_exploration": SETTLEMENT_PATTERNS,
+    "social_interaction": SOCIAL_PATTERNS,
+    "downtime": DOWNTIME_PATTERNS,
+    "combat": COMBAT_PATTERNS,
+    "fairy_road_travel": WILDERNESS_PATTERNS,  # Similar to wilderness
+}
+
+_COMPILED_STATE_PATTERNS: dict[str, CompiledPatternTable] = {
+    state: CompiledPatternTable(table, UNIVERSAL_PATTERNS)
+    for state, table in _STATE_PATTERN_TABLES.items()
+}
+
+# Secondary keyword fallback (spells and physical hazards)
+_SECONDARY_KEYWORDS = CompiledPatternTable(
+    [
+        (("cast", "use spell", "invoke"), "spell:cast", None, 0.6),
+        (("climb",), "hazard:climb", None, 0.6),
+        (("jump", "leap"), "hazard:jump", None, 0.6),
+        (("swim",), "hazard:swim", None, 0.6),
+    ]
+)
 
 
 @dataclass
@@ -492,9 +536,11 @@ class NarrativeResolver:
             return intent
 
         # Original pattern matching as secondary fallback
+        secondary = _SECONDARY_KEYWORDS.best_match(player_input)
+        secondary_id = secondary.action_id if secondary else None
 
         # Spell casting
-        if any(kw in input_lower for kw in ["cast", "use spell", "invoke"]):
+        if secondary_id == "spell:cast":
             return ParsedIntent(
                 action_category=ActionCategory.SPELL,
                 action_type=ActionType.CAST_SPELL,
@@ -502,21 +548,21 @@ class NarrativeResolver:
             )
 
         # Physical actions
-        if "climb" in input_lower:
+        if secondary_id == "hazard:climb":
             return ParsedIntent(
                 action_category=ActionCategory.HAZARD,
                 action_type=ActionType.CLIMB,
                 raw_input=player_input,
             )
 
-        if "jump" in input_lower or "leap" in input_lower:
+        if secondary_id == "hazard:jump":
             return ParsedIntent(
                 action_category=ActionCategory.HAZARD,
                 action_type=ActionType.JUMP,
                 raw_input=player_input,
             )
 
-        if "swim" in input_lower:
+        if secondary_id == "hazard:swim":
             return ParsedIntent(
                 action_category=ActionCategory.HAZARD,
                 action_type=ActionType.SWIM,
@@ -551,23 +597,12 @@ class NarrativeResolver:
         Returns:
             FallbackIntentResult with matched action_id or None
         """
-        # Select patterns based on game state
-        state_patterns = self._get_patterns_for_state(game_state)
-
-        # Try state-specific patterns first
-        match = _match_patterns(player_input, state_patterns)
-        if match:
-            action_id, params, confidence = match
-            intent = self._create_intent_from_action_id(action_id, player_input, params)
-            return FallbackIntentResult(
-                intent=intent,
-                action_id=action_id,
-                action_params=params,
-                confidence=confidence,
-            )
-
-        # Try universal patterns
-        match = _match_patterns(player_input, UNIVERSAL_PATTERNS)
+        # One pass over the input finds state-specific and universal hits;
+        # state patterns take priority over universal ones
+        compiled = _COMPILED_STATE_PATTERNS.get(
+            game_state, _COMPILED_STATE_PATTERNS["wilderness_travel"]
+        )
+        match = compiled.match(player_input)
         if match:
             action_id, params, confidence = match
             intent = self._create_intent_from_action_id(action_id, player_input, params)
@@ -595,17 +630,7 @@ class NarrativeResolver:
         game_state: str,
     ) -> list[tuple[tuple[str, ...], str, Optional[Callable], float]]:
         """Get pattern table for current game state."""
-        state_pattern_map = {
-            "wilderness_travel": WILDERNESS_PATTERNS,
-            "dungeon_exploration": DUNGEON_PATTERNS,
-            "encounter": ENCOUNTER_PATTERNS,
-            "settlement_exploration": SETTLEMENT_PATTERNS,
-            "social_interaction": SOCIAL_PATTERNS,
-            "downtime": DOWNTIME_PATTERNS,
-            "combat": COMBAT_PATTERNS,
-            "fairy_road_travel": WILDERNESS_PATTERNS,  # Similar to wilderness
-        }
-        return state_pattern_map.get(game_state, WILDERNESS_PATTERNS)
+        return _STATE_PATTERN_TABLES.get(game_state, WILDERNESS_PATTERNS)
 
     def _create_intent_from_action_id(
         self,
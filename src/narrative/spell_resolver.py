@@ -8037,8 +8037,9 @@ class SpellNarrator:
             return self._generate_fallback_narration(spell, result, caster_name)
 
         # Build LLM request
-        system_prompt = schema.get_system_prompt()
-        user_prompt = schema.build_prompt()
+        prompt = schema.assemble()
+        system_prompt = prompt.system_prompt
+        user_prompt = prompt.user_prompt
 
         messages = [LLMMessage(role=LLMRole.USER, content=user_prompt)]
 
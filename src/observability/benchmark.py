@@ -0,0 +1,331 @@
+"""
+Offline narration benchmark for Dolmenwood Virtual DM.
+
+Replays recorded ConversationFacade turn sequences against a VirtualDM
+whose LLM is a MockLLMClient with a simulated latency profile (latency,
+jitter, failure rate, per-token streaming delay). Reports turn latency
+percentiles, LLM calls per turn, response cache hit rate and authority
+validator overhead as JSON so narration changes can be compared across
+commits without network access.
+
+Usage:
+    python -m src.observability.benchmark data/benchmarks/wilderness_turns.json \\
+        --latency-ms 300 --jitter-ms 100 --failure-rate 0.05 --output results.json
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+
+from src.ai.llm_provider import MockLatencyProfile, MockLLMClient
+from src.data_models import DiceRoller
+
+if TYPE_CHECKING:
+    from src.conversation.conversation_facade import ConversationFacade
+    from src.conversation.types import TurnResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BenchmarkTurn:
+    """One recorded turn: freeform chat, or a clicked action."""
+
+    text: str = ""
+    action_id: Optional[str] = None
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def label(self) -> str:
+        return self.action_id or "chat"
+
+    def to_dict(self) -> dict[str, Any]:
+        if self.action_id:
+            return {"action_id": self.action_id, "params": self.params}
+        return {"text": self.text}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkTurn":
+        return cls(
+            text=data.get("text", ""),
+            action_id=data.get("action_id"),
+            params=dict(data.get("params", {})),
+        )
+
+
+@dataclass
+class BenchmarkScenario:
+    """A named turn sequence plus the GameConfig overrides it runs under."""
+
+    name: str
+    turns: list[BenchmarkTurn] = field(default_factory=list)
+    seed: int = 1
+    config: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "seed": self.seed,
+            "config": self.config,
+            "turns": [turn.to_dict() for turn in self.turns],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkScenario":
+        return cls(
+            name=data.get("name", "unnamed"),
+            turns=[BenchmarkTurn.from_dict(t) for t in data.get("turns", [])],
+            seed=data.get("seed", 1),
+            config=dict(data.get("config", {})),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchmarkScenario":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+class TurnRecorder:
+    """
+    Wraps a ConversationFacade and records the turns sent through it.
+
+    Use it in place of the facade during a play session, then save the
+    resulting scenario for benchmarking.
+    """
+
+    def __init__(self, facade: "ConversationFacade"):
+        self.facade = facade
+        self.turns: list[BenchmarkTurn] = []
+
+    def handle_chat(self, text: str, **kwargs: Any) -> "TurnResponse":
+        self.turns.append(BenchmarkTurn(text=text))
+        return self.facade.handle_chat(text, **kwargs)
+
+    def handle_action(
+        self, action_id: str, params: Optional[dict[str, Any]] = None
+    ) -> "TurnResponse":
+        self.turns.append(BenchmarkTurn(action_id=action_id, params=dict(params or {})))
+        return self.facade.handle_action(action_id, params)
+
+    def scenario(self, name: str, seed: int = 1) -> BenchmarkScenario:
+        return BenchmarkScenario(name=name, turns=list(self.turns), seed=seed)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linearly interpolated percentile (pct in 0-100); 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "max": max(values, default=0.0),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmark(
+    scenario: BenchmarkScenario,
+    profile: Optional[MockLatencyProfile] = None,
+    streaming: bool = False,
+    repeat: int = 1,
+) -> dict[str, Any]:
+    """
+    Replay a scenario against a mock-LLM VirtualDM and measure it.
+
+    Each repetition starts a fresh VirtualDM (and so cold caches) with
+    dice seeded from scenario.seed, so repetitions replay identically.
+
+    Args:
+        scenario: Turns to replay
+        profile: Simulated provider behaviour (defaults to zero latency)
+        streaming: Use the facade's streaming entry points and record
+            time to first narration chunk
+        repeat: Number of full replays to aggregate
+
+    Returns:
+        JSON-serialisable results
+    """
+    from src.conversation.conversation_facade import ConversationFacade
+    from src.main import GameConfig, VirtualDM
+
+    profile = profile or MockLatencyProfile()
+    per_turn: list[dict[str, Any]] = []
+    cache_hits = cache_misses = llm_failures = validator_calls = 0
+    validator_ms = 0.0
+
+    for iteration in range(repeat):
+        DiceRoller.set_seed(scenario.seed)
+        config = {"use_vector_db": False, **scenario.config}
+        config.update(llm_provider="mock", enable_narration=True)
+        dm = VirtualDM(GameConfig(**config))
+        agent = dm.dm_agent
+        if agent is None or not isinstance(agent.llm_manager.primary_client, MockLLMClient):
+            raise RuntimeError("Benchmark requires a VirtualDM with a mock DM agent")
+        manager = agent.llm_manager
+        client = manager.primary_client
+        client.set_profile(profile)
+        facade = ConversationFacade(dm)
+
+        for index, turn in enumerate(scenario.turns):
+            per_turn.append(_run_turn(facade, client, turn, streaming, iteration, index))
+
+        cache = agent.get_cache_stats()
+        cache_hits += cache["hits"]
+        cache_misses += cache["misses"]
+        validation = manager.get_validation_stats()
+        validator_calls += validation["calls"]
+        validator_ms += validation["total_ms"]
+        llm_failures += sum(s["failures"] for s in manager.get_provider_stats().values())
+        dm.cancel_prefetch()
+
+    latencies = [t["latency_ms"] for t in per_turn]
+    calls = [t["llm_calls"] for t in per_turn]
+    first_chunks = [t["first_chunk_ms"] for t in per_turn if t["first_chunk_ms"] is not None]
+    lookups = cache_hits + cache_misses
+    total_turn_ms = sum(latencies)
+
+    results: dict[str, Any] = {
+        "scenario": scenario.name,
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "profile": asdict(profile),
+        "streaming": streaming,
+        "repeat": repeat,
+        "turns": len(per_turn),
+        "turn_latency_ms": _distribution(latencies),
+        "llm_calls_per_turn": {
+            "mean": sum(calls) / len(calls) if calls else 0.0,
+            "max": max(calls, default=0),
+            "total": sum(calls),
+        },
+        "llm_failures": llm_failures,
+        "response_cache": {
+            "hits": cache_hits,
+            "misses": cache_misses,
+            "hit_rate": cache_hits / lookups if lookups else 0.0,
+        },
+        "validator": {
+            "calls": validator_calls,
+            "total_ms": validator_ms,
+            "share_of_turn_time": validator_ms / total_turn_ms if total_turn_ms else 0.0,
+        },
+        "per_turn": per_turn,
+    }
+    if streaming:
+        results["first_chunk_ms"] = _distribution(first_chunks)
+    return results
+
+
+def _run_turn(
+    facade: "ConversationFacade",
+    client: MockLLMClient,
+    turn: BenchmarkTurn,
+    streaming: bool,
+    iteration: int,
+    index: int,
+) -> dict[str, Any]:
+    calls_before = client.calls
+    first_chunk: list[float] = []
+
+    def on_chunk(chunk: Any) -> None:
+        if not first_chunk and chunk.text:
+            first_chunk.append(time.perf_counter())
+
+    started = time.perf_counter()
+    if streaming and turn.action_id:
+        facade.handle_action_streaming(turn.action_id, turn.params, on_chunk=on_chunk)
+    elif streaming:
+        facade.handle_chat_streaming(turn.text, on_chunk)
+    elif turn.action_id:
+        facade.handle_action(turn.action_id, turn.params)
+    else:
+        facade.handle_chat(turn.text)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "iteration": iteration,
+        "turn": index,
+        "kind": turn.label,
+        "latency_ms": elapsed_ms,
+        "llm_calls": client.calls - calls_before,
+        "first_chunk_ms": (first_chunk[0] - started) * 1000 if first_chunk else None,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Offline narration benchmark (mock LLM)")
+    parser.add_argument("scenario", type=Path, help="Scenario JSON file of recorded turns")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mock request latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform latency jitter")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Request failure rate")
+    parser.add_argument("--token-delay-ms", type=float, default=0.0, help="Delay per token")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for jitter and failures")
+    parser.add_argument("--stream", action="store_true", help="Use streaming turn handlers")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of replays")
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON here")
+    parser.add_argument("--summary", action="store_true", help="Omit per-turn samples")
+    args = parser.parse_args(argv)
+
+    profile = MockLatencyProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        failure_rate=args.failure_rate,
+        token_delay_ms=args.token_delay_ms,
+        seed=args.seed,
+    )
+    results = run_benchmark(
+        BenchmarkScenario.load(args.scenario),
+        profile=profile,
+        streaming=args.stream,
+        repeat=args.repeat,
+    )
+    if args.summary:
+        results.pop("per_turn")
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -48,6 +48,7 @@ from src.oracle.mythic_gme import (
     FATE_CHART,
     ACTION_MEANINGS,
     SUBJECT_MEANINGS,
+    fate_outcome,
 )
 
 from src.oracle.spell_adjudicator import (
@@ -81,6 +82,7 @@ __all__ = [
     "FATE_CHART",
     "ACTION_MEANINGS",
     "SUBJECT_MEANINGS",
+    "fate_outcome",
     # Spell adjudicator
     "MythicSpellAdjudicator",
     "SpellAdjudicationType",
@@ -15,7 +15,7 @@ Reference: Mythic Game Master Emulator 2nd Edition by Tana Pigeon
 
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
-from typing import Any, Optional, Callable, Protocol, runtime_checkable
+from typing import Any, Optional, Callable, Protocol, Sequence, runtime_checkable
 import random
 
 
@@ -271,6 +271,111 @@ RANDOM_EVENT_FOCUS_TABLE = [
 ]
 
 
+# =============================================================================
+# COMPILED LOOKUP TABLES
+# =============================================================================
+
+# FATE_CHART and the doubles rule are compiled once at import into flat
+# tuples so a fate check is a single index instead of a nested dict lookup
+# plus an if/elif ladder. Layout: chaos (1-9) x likelihood (0-9) x roll (1-100).
+
+_CHAOS_LEVELS = 9
+_LIKELIHOOD_COUNT = len(Likelihood)
+_D100 = 100
+
+
+def _classify_fate_roll(roll: int, thresholds: tuple[int, int, int, int]) -> FateResult:
+    """Apply Fate Chart thresholds to a d100 roll."""
+    ex_yes, yes, no, ex_no = thresholds
+    if roll <= ex_yes:
+        return FateResult.EXCEPTIONAL_YES
+    elif roll <= yes:
+        return FateResult.YES
+    elif roll > ex_no:
+        return FateResult.EXCEPTIONAL_NO
+    elif roll > no:
+        return FateResult.NO
+    # Between yes and no thresholds - this is the "gray zone"
+    # In some versions this is a weak yes, we'll call it YES
+    return FateResult.YES
+
+
+def _is_random_event_roll(roll: int, chaos_factor: int) -> bool:
+    """
+    Random events trigger on doubles (11, 22, ... 99) whose digit is
+    <= chaos factor. A roll of 100 is never doubles.
+    """
+    if roll == 100:
+        return False
+    tens, ones = divmod(roll, 10)
+    return tens == ones and tens <= chaos_factor
+
+
+def _compile_fate_outcomes() -> tuple[tuple[FateResult, bool], ...]:
+    """Compile FATE_CHART into a flat (result, random_event) table."""
+    outcomes: list[tuple[FateResult, bool]] = []
+    for chaos_factor in range(1, _CHAOS_LEVELS + 1):
+        for likelihood in Likelihood:
+            thresholds = FATE_CHART[chaos_factor][likelihood]
+            for roll in range(1, _D100 + 1):
+                outcomes.append(
+                    (
+                        _classify_fate_roll(roll, thresholds),
+                        _is_random_event_roll(roll, chaos_factor),
+                    )
+                )
+    return tuple(outcomes)
+
+
+def _compile_focus_lookup() -> tuple[RandomEventFocus, ...]:
+    """Compile RANDOM_EVENT_FOCUS_TABLE into a roll-indexed tuple."""
+    lookup = [RandomEventFocus.AMBIGUOUS_EVENT] * _D100
+    for low, high, focus in reversed(RANDOM_EVENT_FOCUS_TABLE):
+        for roll in range(low, high + 1):
+            lookup[roll - 1] = focus
+    return tuple(lookup)
+
+
+def _compile_fate_thresholds() -> tuple[tuple[int, int, int, int], ...]:
+    """Compile FATE_CHART into a flat thresholds table (chaos x likelihood)."""
+    return tuple(
+        tuple(FATE_CHART[chaos_factor][likelihood])
+        for chaos_factor in range(1, _CHAOS_LEVELS + 1)
+        for likelihood in Likelihood
+    )
+
+
+_FATE_OUTCOMES = _compile_fate_outcomes()
+_FATE_THRESHOLDS = _compile_fate_thresholds()
+_FOCUS_BY_ROLL = _compile_focus_lookup()
+
+
+def fate_outcome(chaos_factor: int, likelihood: Likelihood, roll: int) -> tuple[FateResult, bool]:
+    """
+    Look up a precompiled fate outcome.
+
+    Args:
+        chaos_factor: Chaos factor (1-9)
+        likelihood: Likelihood column
+        roll: d100 roll (1-100)
+
+    Returns:
+        Tuple of (FateResult, random_event_triggered)
+    """
+    return _FATE_OUTCOMES[
+        ((chaos_factor - 1) * _LIKELIHOOD_COUNT + likelihood) * _D100 + roll - 1
+    ]
+
+
+def _get_run_log() -> Any:
+    """Get the RunLog, or None when observability is unavailable."""
+    try:
+        from src.observability.run_log import get_run_log
+    except ImportError:
+        return None  # RunLog not available
+    return get_run_log()
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -443,31 +548,56 @@ class MythicGME:
         Returns:
             FateCheckResult with the outcome
         """
-        # Get thresholds from Fate Chart
-        thresholds = FATE_CHART[self.chaos.value][likelihood]
-        ex_yes, yes, no, ex_no = thresholds
+        return self._resolve_fate_check(question, likelihood, check_for_event, _get_run_log())
+
+    def fate_check_batch(
+        self,
+        questions: Sequence[tuple[str, Likelihood]],
+        check_for_event: bool = True,
+    ) -> list[FateCheckResult]:
+        """
+        Perform several Fate Checks in order.
+
+        Rolls are drawn from the same RNG stream in the same order as
+        calling fate_check once per question (including any random event
+        rolls), so results are identical under the same seed. The RunLog
+        is resolved once for the whole batch.
+
+        Args:
+            questions: Sequence of (question, likelihood) pairs
+            check_for_event: Whether to check for random events
+
+        Returns:
+            List of FateCheckResult, one per question
+        """
+        run_log = _get_run_log()
+        return [
+            self._resolve_fate_check(question, likelihood, check_for_event, run_log)
+            for question, likelihood in questions
+        ]
+
+    def _resolve_fate_check(
+        self,
+        question: str,
+        likelihood: Likelihood,
+        check_for_event: bool,
+        run_log: Any,
+    ) -> FateCheckResult:
+        """Roll and resolve one fate check against the compiled chart."""
+        chaos_factor = self.chaos.value
+        ex_yes, yes, no, ex_no = _FATE_THRESHOLDS[
+            (chaos_factor - 1) * _LIKELIHOOD_COUNT + likelihood
+        ]
 
         # Roll d100 (1-100)
         roll = self._rng.randint(1, 100)
-
-        # Determine result
-        if roll <= ex_yes:
-            result = FateResult.EXCEPTIONAL_YES
-        elif roll <= yes:
-            result = FateResult.YES
-        elif roll > ex_no:
-            result = FateResult.EXCEPTIONAL_NO
-        elif roll > no:
-            result = FateResult.NO
-        else:
-            # Between yes and no thresholds - this is the "gray zone"
-            # In some versions this is a weak yes, we'll call it YES
-            result = FateResult.YES
+        result, event_roll = fate_outcome(chaos_factor, likelihood, roll)
+        event_triggered = check_for_event and event_roll
 
         fate_result = FateCheckResult(
             question=question,
             likelihood=likelihood,
-            chaos_factor=self.chaos.value,
+            chaos_factor=chaos_factor,
             roll=roll,
             result=result,
             exceptional_yes_threshold=ex_yes,
@@ -477,25 +607,20 @@ class MythicGME:
         )
 
         # Log to RunLog for observability (Phase 4.1)
-        try:
-            from src.observability.run_log import get_run_log
-            get_run_log().log_oracle(
+        if run_log is not None:
+            run_log.log_oracle(
                 oracle_type="fate_check",
                 question=question,
                 likelihood=likelihood.name.lower(),
                 roll=roll,
                 result=result.value,
-                chaos_factor=self.chaos.value,
+                chaos_factor=chaos_factor,
+                random_event_triggered=event_triggered,
             )
-        except ImportError:
-            pass  # RunLog not available
 
-        # Check for random event
-        if check_for_event:
-            event = self._check_random_event(roll)
-            if event:
-                fate_result.random_event_triggered = True
-                fate_result.random_event = event
+        if event_triggered:
+            fate_result.random_event_triggered = True
+            fate_result.random_event = self.generate_random_event()
 
         return fate_result
 
@@ -506,24 +631,8 @@ class MythicGME:
         Random events trigger on doubles (11, 22, 33, etc.)
         when the doubles value is <= chaos factor.
         """
-        # Check for doubles
-        tens = roll // 10
-        ones = roll % 10
-
-        # Handle roll of 100 (treat as 10 and 0, not doubles)
-        if roll == 100:
+        if not _is_random_event_roll(roll, self.chaos.value):
             return None
-
-        # Check if doubles
-        if tens != ones:
-            return None
-
-        # Doubles! Check if <= chaos factor
-        # For roll 11, tens = 1; for roll 99, tens = 9
-        if tens > self.chaos.value:
-            return None
-
-        # Random event triggered!
         return self.generate_random_event()
 
     def generate_random_event(self) -> RandomEvent:
@@ -546,9 +655,8 @@ class MythicGME:
 
     def _lookup_focus(self, roll: int) -> RandomEventFocus:
         """Look up random event focus from roll."""
-        for low, high, focus in RANDOM_EVENT_FOCUS_TABLE:
-            if low <= roll <= high:
-                return focus
+        if 1 <= roll <= _D100:
+            return _FOCUS_BY_ROLL[roll - 1]
         return RandomEventFocus.AMBIGUOUS_EVENT
 
     def roll_meaning(self) -> MeaningRoll:
@@ -564,16 +672,14 @@ class MythicGME:
         subject = SUBJECT_MEANINGS[subject_idx]
 
         # Log to RunLog for observability (Phase 4.1)
-        try:
-            from src.observability.run_log import get_run_log
-            get_run_log().log_oracle(
+        run_log = _get_run_log()
+        if run_log is not None:
+            run_log.log_oracle(
                 oracle_type="meaning_roll",
                 meaning_action=action,
                 meaning_subject=subject,
                 chaos_factor=self.chaos.value,
             )
-        except ImportError:
-            pass  # RunLog not available
 
         return MeaningRoll(
             action=action,
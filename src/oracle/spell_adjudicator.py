@@ -1269,20 +1269,16 @@ class MythicSpellAdjudicator:
         predetermined_effects: list[EffectCommand] = []
         secondary_checks: list[FateCheckResult] = []
 
-        # First check: Does the spell succeed?
+        # Does the spell succeed, and does it backlash? (always a risk with reality warps)
         success_likelihood = self._assess_reality_warp_likelihood(context, warp_intensity)
-        primary_check = self._mythic.fate_check(
-            f"Does {context.spell_name} successfully warp reality?",
-            success_likelihood,
-        )
-        success_level = self._fate_to_success(primary_check.result)
-
-        # Check for backlash (always a risk with reality warps)
         backlash_likelihood = self._assess_backlash_likelihood(warp_intensity)
-        backlash_check = self._mythic.fate_check(
-            "Does the reality warp cause a backlash?",
-            backlash_likelihood,
+        primary_check, backlash_check = self._mythic.fate_check_batch(
+            [
+                (f"Does {context.spell_name} successfully warp reality?", success_likelihood),
+                ("Does the reality warp cause a backlash?", backlash_likelihood),
+            ]
         )
+        success_level = self._fate_to_success(primary_check.result)
         secondary_checks.append(backlash_check)
 
         has_backlash = self._mythic.is_yes(backlash_check)
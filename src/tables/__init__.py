@@ -7,6 +7,7 @@ This module provides:
 - Dolmenwood-specific game tables (encounters, treasure, NPCs, etc.)
 - Action resolution with failure-first logic
 - Skill check system (X-in-6)
+- Exact probability distributions for dice, tables and checks
 """
 
 from src.tables.table_types import (
@@ -79,6 +80,17 @@ from src.tables.character_tables import (
     get_character_table_manager,
 )
 
+from src.tables.probability import (
+    TableOutcome,
+    TableDistribution,
+    dice_distribution,
+    expected_value,
+    skill_check_probability,
+    reaction_distribution,
+    entry_distribution,
+    table_distribution,
+)
+
 from src.tables.table_manager import (
     TableManager,
     get_table_manager,
@@ -182,6 +194,15 @@ __all__ = [
     # Treasure tables
     "TreasureTableManager",
     "get_treasure_table_manager",
+    # Probability engine
+    "TableOutcome",
+    "TableDistribution",
+    "dice_distribution",
+    "expected_value",
+    "skill_check_probability",
+    "reaction_distribution",
+    "entry_distribution",
+    "table_distribution",
     # Table manager
     "TableManager",
     "get_table_manager",
@@ -0,0 +1,350 @@
+"""
+Exact probability engine for the Dolmenwood Virtual DM.
+
+Answers "what are the odds" questions analytically instead of by rolling
+thousands of times. Dice distributions are convolved exactly and propagated
+through DolmenwoodTable entries, nested sub-tables, X-in-6 skill checks and
+the 2d6 reaction table.
+
+All functions are pure: they never touch DiceRoller, so asking for odds
+consumes no RNG and leaves no entries in the roll log or RunLog.
+
+Probabilities are returned as fractions.Fraction for exactness; callers that
+want a display value can use float() or format_probability().
+"""
+
+from dataclasses import dataclass, field
+from fractions import Fraction
+from functools import lru_cache
+from typing import Callable, Optional, TypeVar
+
+from src.data_models import ReactionResult, interpret_reaction
+from src.tables.table_types import DolmenwoodTable, TableEntry
+
+# A probability mass function: outcome -> exact probability
+PMF = dict[int, Fraction]
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# DICE DISTRIBUTIONS
+# =============================================================================
+
+
+def parse_dice_notation(notation: str) -> tuple[int, int, int]:
+    """
+    Parse dice notation (e.g., '2d6', '1d20+5', 'd8-1').
+
+    Mirrors the parsing rules of DiceRoller.roll.
+
+    Args:
+        notation: Dice notation string
+
+    Returns:
+        Tuple of (num_dice, die_size, modifier)
+
+    Raises:
+        ValueError: If the notation cannot be parsed
+    """
+    text = notation.strip().lower()
+    modifier = 0
+    if "+" in text:
+        dice_part, mod_part = text.split("+")
+        modifier = int(mod_part)
+    elif "-" in text:
+        dice_part, mod_part = text.split("-")
+        modifier = -int(mod_part)
+    else:
+        dice_part = text
+
+    if "d" not in dice_part:
+        raise ValueError(f"Invalid dice notation: {notation!r}")
+
+    num_part, size_part = dice_part.split("d")
+    num_dice = int(num_part) if num_part else 1
+    die_size = int(size_part)
+    if num_dice < 0 or die_size < 1:
+        raise ValueError(f"Invalid dice notation: {notation!r}")
+    return num_dice, die_size, modifier
+
+
+def convolve(first: PMF, second: PMF) -> PMF:
+    """Return the distribution of the sum of two independent variables."""
+    result: PMF = {}
+    for a, pa in first.items():
+        for b, pb in second.items():
+            result[a + b] = result.get(a + b, Fraction(0)) + pa * pb
+    return result
+
+
+def shift(pmf: PMF, offset: int) -> PMF:
+    """Return a distribution with every outcome shifted by offset."""
+    if offset == 0:
+        return dict(pmf)
+    return {value + offset: p for value, p in pmf.items()}
+
+
+def clamp(pmf: PMF, low: int, high: int) -> PMF:
+    """Return a distribution with outcomes clamped into [low, high]."""
+    result: PMF = {}
+    for value, p in pmf.items():
+        clamped = max(low, min(high, value))
+        result[clamped] = result.get(clamped, Fraction(0)) + p
+    return result
+
+
+@lru_cache(maxsize=256)
+def _dice_sum_items(num_dice: int, die_size: int) -> tuple[tuple[int, Fraction], ...]:
+    """Exact distribution of NdS as a hashable tuple (memoized)."""
+    if num_dice == 0:
+        return ((0, Fraction(1)),)
+    single = {face: Fraction(1, die_size) for face in range(1, die_size + 1)}
+    # Binary exponentiation keeps large dice pools (e.g. 90d3) cheap
+    result: Optional[PMF] = None
+    base = single
+    n = num_dice
+    while n:
+        if n & 1:
+            result = base if result is None else convolve(result, base)
+        n >>= 1
+        if n:
+            base = convolve(base, base)
+    assert result is not None
+    return tuple(sorted(result.items()))
+
+
+def dice_distribution(notation: str) -> PMF:
+    """
+    Exact distribution of a dice expression.
+
+    Args:
+        notation: Dice notation string (e.g., '2d6+1')
+
+    Returns:
+        PMF mapping each possible total to its probability
+    """
+    num_dice, die_size, modifier = parse_dice_notation(notation)
+    return shift(dict(_dice_sum_items(num_dice, die_size)), modifier)
+
+
+def expected_value(pmf: dict[int, Fraction]) -> Fraction:
+    """Expected value of a numeric distribution."""
+    return sum((value * p for value, p in pmf.items()), Fraction(0))
+
+
+def probability_at_most(pmf: PMF, threshold: int) -> Fraction:
+    """P(X <= threshold)."""
+    return sum((p for value, p in pmf.items() if value <= threshold), Fraction(0))
+
+
+def probability_at_least(pmf: PMF, threshold: int) -> Fraction:
+    """P(X >= threshold)."""
+    return sum((p for value, p in pmf.items() if value >= threshold), Fraction(0))
+
+
+def map_distribution(pmf: PMF, func: Callable[[int], T]) -> dict[T, Fraction]:
+    """Push a numeric distribution through a function of the outcome."""
+    result: dict[T, Fraction] = {}
+    for value, p in pmf.items():
+        key = func(value)
+        result[key] = result.get(key, Fraction(0)) + p
+    return result
+
+
+def format_probability(probability: Fraction) -> str:
+    """Format a probability as a percentage string for tooltips."""
+    return f"{float(probability) * 100:.1f}%"
+
+
+# =============================================================================
+# CHECKS
+# =============================================================================
+
+
+def skill_check_probability(target: int, modifier: int = 0) -> Fraction:
+    """
+    Probability of succeeding an X-in-6 check.
+
+    Uses the same clamping as SkillCheck.check (effective target 0-6).
+
+    Args:
+        target: Base X in X-in-6
+        modifier: Situational modifier to target
+
+    Returns:
+        Exact probability of success
+    """
+    effective_target = max(0, min(6, target + modifier))
+    return Fraction(effective_target, 6)
+
+
+def reaction_distribution(modifier: int = 0) -> dict[ReactionResult, Fraction]:
+    """
+    Distribution of 2d6 reaction results via interpret_reaction.
+
+    Args:
+        modifier: CHA or situational modifier added to the 2d6 roll
+
+    Returns:
+        Mapping of ReactionResult to probability
+    """
+    return map_distribution(shift(dice_distribution("2d6"), modifier), interpret_reaction)
+
+
+# =============================================================================
+# TABLES
+# =============================================================================
+
+
+@dataclass
+class TableOutcome:
+    """
+    One leaf outcome of a (possibly nested) table roll.
+
+    path holds the chain of entries from the top-level table down to the
+    entry whose sub-table was not resolved further. An entry of None means
+    the roll matched no entry on that table.
+    """
+
+    table_ids: tuple[str, ...]
+    path: tuple[Optional[TableEntry], ...]
+    probability: Fraction
+
+    @property
+    def entry(self) -> Optional[TableEntry]:
+        """The final entry in the chain."""
+        return self.path[-1] if self.path else None
+
+    @property
+    def result_text(self) -> str:
+        """Result text of the final entry, mirroring TableManager.roll_table."""
+        entry = self.entry
+        return entry.result if entry else "No matching entry"
+
+
+@dataclass
+class TableDistribution:
+    """Exact outcome distribution of a table roll."""
+
+    table_id: str
+    modifier: int
+    roll_distribution: PMF = field(default_factory=dict)
+    outcomes: list[TableOutcome] = field(default_factory=list)
+
+    def probability_of(self, predicate: Callable[[TableOutcome], bool]) -> Fraction:
+        """Total probability of outcomes matching predicate."""
+        return sum((o.probability for o in self.outcomes if predicate(o)), Fraction(0))
+
+    def by_result_text(self) -> dict[str, Fraction]:
+        """Collapse outcomes to leaf result text."""
+        result: dict[str, Fraction] = {}
+        for outcome in self.outcomes:
+            key = outcome.result_text
+            result[key] = result.get(key, Fraction(0)) + outcome.probability
+        return result
+
+    def total_probability(self) -> Fraction:
+        """Sum over all outcomes (1 for a well-formed table)."""
+        return sum((o.probability for o in self.outcomes), Fraction(0))
+
+
+def table_roll_distribution(table: DolmenwoodTable, modifier: int = 0) -> PMF:
+    """
+    Distribution of the clamped roll total for a table.
+
+    Mirrors TableManager.roll_table: dice + base_modifier + modifier,
+    clamped to [get_min_roll(), get_max_roll()].
+    """
+    die_size = int(table.die_type.value[1:])
+    pmf = dice_distribution(f"{table.num_dice}d{die_size}")
+    pmf = shift(pmf, table.base_modifier + modifier)
+    return clamp(pmf, table.get_min_roll(), table.get_max_roll())
+
+
+def entry_distribution(
+    table: DolmenwoodTable, modifier: int = 0
+) -> list[tuple[Optional[TableEntry], Fraction]]:
+    """
+    Probability of landing on each entry of a single table.
+
+    Entries are matched in order, first match wins, as in roll_table.
+    Totals that match no entry are reported against None.
+
+    Returns:
+        List of (entry, probability) in table order, None last if present
+    """
+    totals: list[Fraction] = [Fraction(0)] * len(table.entries)
+    unmatched = Fraction(0)
+    for value, p in table_roll_distribution(table, modifier).items():
+        for index, entry in enumerate(table.entries):
+            if entry.matches_roll(value):
+                totals[index] += p
+                break
+        else:
+            unmatched += p
+
+    result: list[tuple[Optional[TableEntry], Fraction]] = [
+        (entry, p) for entry, p in zip(table.entries, totals) if p
+    ]
+    if unmatched:
+        result.append((None, unmatched))
+    return result
+
+
+def table_distribution(
+    table: DolmenwoodTable,
+    modifier: int = 0,
+    resolve_table: Optional[Callable[[str], Optional[DolmenwoodTable]]] = None,
+    max_depth: int = 8,
+    nested_modifier: int = 0,
+) -> TableDistribution:
+    """
+    Exact outcome distribution of a table roll, following nested sub-tables.
+
+    Nested tables are rolled with nested_modifier only, matching
+    TableManager.roll_table's recursive call, which passes the context
+    (and so its modifier) down but not the explicit modifier. Sub-table
+    references that cannot be resolved (or exceed max_depth) terminate
+    the path.
+
+    Args:
+        table: The top-level table
+        modifier: Total modifier applied to the top-level roll
+        resolve_table: Lookup for sub_table IDs (e.g. TableManager.get_table)
+        max_depth: Guard against cyclic sub-table references
+        nested_modifier: Modifier applied to every nested roll (the
+            context modifier when mirroring roll_table)
+
+    Returns:
+        TableDistribution with leaf outcomes
+    """
+    outcomes: list[TableOutcome] = []
+
+    def walk(
+        current: DolmenwoodTable,
+        mod: int,
+        table_ids: tuple[str, ...],
+        path: tuple[Optional[TableEntry], ...],
+        weight: Fraction,
+        depth: int,
+    ) -> None:
+        ids = table_ids + (current.table_id,)
+        for entry, p in entry_distribution(current, mod):
+            child_weight = weight * p
+            child_path = path + (entry,)
+            sub_table = None
+            if entry and entry.sub_table and resolve_table and depth < max_depth:
+                sub_table = resolve_table(entry.sub_table)
+            if sub_table is not None:
+                walk(sub_table, nested_modifier, ids, child_path, child_weight, depth + 1)
+            else:
+                outcomes.append(TableOutcome(ids, child_path, child_weight))
+
+    walk(table, modifier, (), (), Fraction(1), 0)
+    return TableDistribution(
+        table_id=table.table_id,
+        modifier=modifier,
+        roll_distribution=table_roll_distribution(table, modifier),
+        outcomes=outcomes,
+    )
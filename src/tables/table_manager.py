@@ -20,6 +20,7 @@ from src.tables.table_types import (
     TableContext,
     SkillCheck,
 )
+from src.tables.probability import TableDistribution, table_distribution
 
 
 class TableManager:
@@ -46,6 +47,9 @@ class TableManager:
         # Settlement-specific tables
         self._settlement_tables: dict[str, dict[str, str]] = {}
 
+        # Memoized exact distributions: (table_id, modifier) -> distribution
+        self._distribution_cache: dict[tuple[str, int, int], TableDistribution] = {}
+
         # Register built-in tables
         self._register_builtin_tables()
 
@@ -295,6 +299,9 @@ class TableManager:
         self._tables[table.table_id] = table
         self._by_category[table.category].append(table.table_id)
 
+        # Any cached distribution may reach this table through a sub-table
+        self._distribution_cache.clear()
+
         # Index by location if applicable
         if table.hex_id:
             if table.hex_id not in self._hex_tables:
@@ -411,6 +418,47 @@ class TableManager:
 
         return result
 
+    def get_table_distribution(
+        self,
+        table_id: str,
+        context: Optional[TableContext] = None,
+        modifier: int = 0,
+    ) -> Optional[TableDistribution]:
+        """
+        Get the exact outcome distribution of rolling on a table.
+
+        Uses the same modifier and nesting rules as roll_table, but is
+        computed analytically and consumes no dice: the explicit modifier
+        applies to the top-level roll only, the context modifier to nested
+        rolls as well. Results are memoized per (table, explicit modifier,
+        context modifier) until a table is registered.
+
+        Args:
+            table_id: ID of the table
+            context: Optional context for modifiers
+            modifier: Explicit modifier to apply
+
+        Returns:
+            TableDistribution, or None if the table is not registered
+        """
+        table = self._tables.get(table_id)
+        if not table:
+            return None
+
+        context_modifier = context.get_total_modifier() if context else 0
+
+        key = (table_id, modifier, context_modifier)
+        cached = self._distribution_cache.get(key)
+        if cached is None:
+            cached = table_distribution(
+                table,
+                modifier + context_modifier,
+                resolve_table=self.get_table,
+                nested_modifier=context_modifier,
+            )
+            self._distribution_cache[key] = cached
+        return cached
+
     def _log_table_lookup(
         self,
         table_id: str,
@@ -5,6 +5,26 @@ from src.vector_db.rules_retriever import (
     ContentCategory,
     SearchResult,
     SearchContext,
+    IndexedDocument,
+    BulkIndexResult,
+)
+from src.vector_db.keyword_index import KeywordIndex, tokenize
+from src.vector_db.vector_store import (
+    LocalVectorStore,
+    HashingEmbedder,
+    VectorRecord,
 )
 
-__all__ = ["RulesRetriever", "ContentCategory", "SearchResult", "SearchContext"]
+__all__ = [
+    "RulesRetriever",
+    "ContentCategory",
+    "SearchResult",
+    "SearchContext",
+    "IndexedDocument",
+    "BulkIndexResult",
+    "KeywordIndex",
+    "tokenize",
+    "LocalVectorStore",
+    "HashingEmbedder",
+    "VectorRecord",
+]
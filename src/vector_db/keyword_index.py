@@ -0,0 +1,265 @@
+"""
+Keyword Index for Dolmenwood Virtual DM.
+
+Pure-Python BM25 inverted index used by RulesRetriever when ChromaDB
+is not available. Postings are maintained incrementally as documents
+are added and removed, so a query only touches the documents that
+contain at least one of its terms instead of scanning the corpus.
+"""
+
+from collections import Counter
+from typing import Any, Callable, Optional
+import heapq
+import math
+import re
+
+
+# Bumped whenever tokenization changes so persisted indexes are rebuilt
+TOKENIZER_VERSION = 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "into",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "their",
+        "this",
+        "to",
+        "was",
+        "with",
+    }
+)
+
+# (suffix, replacement, minimum stem length) - first match wins
+_SUFFIX_RULES = (
+    ("ies", "y", 2),
+    ("sses", "ss", 2),
+    ("ing", "", 3),
+    ("edly", "", 3),
+    ("ed", "", 3),
+    ("ly", "", 3),
+    ("es", "", 3),
+    ("s", "", 3),
+)
+
+
+def stem(token: str) -> str:
+    """
+    Reduce a token to a crude stem.
+
+    This is deliberately lighter than a full Porter stemmer: it only
+    folds plurals and the common verb/adverb endings so that "drunes",
+    "hunting" and "cursed" match "drune", "hunt" and "curse".
+
+    Args:
+        token: Lowercase alphanumeric token
+
+    Returns:
+        Stemmed token
+    """
+    if token.isdigit() or token.endswith("ss"):
+        return token
+    for suffix, replacement, min_stem in _SUFFIX_RULES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= min_stem:
+            token = token[: -len(suffix)] + replacement
+            break
+    # Fold a trailing silent e so "curse", "cursed" and "curses" agree
+    if token.endswith("e") and len(token) > 3:
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into stemmed index terms.
+
+    Args:
+        text: Raw document or query text
+
+    Returns:
+        List of terms in document order (stopwords removed)
+    """
+    return [stem(tok) for tok in _TOKEN_RE.findall(text.lower()) if tok not in STOPWORDS]
+
+
+class KeywordIndex:
+    """
+    Incrementally maintained BM25 inverted index.
+
+    Stores term frequencies per document in postings lists keyed by
+    term, plus each document's length for BM25 length normalisation.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalisation
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_lengths: dict[str, int] = {}
+        self._doc_terms: dict[str, tuple[str, ...]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_lengths
+
+    def doc_ids(self) -> set[str]:
+        """Identifiers of all indexed documents."""
+        return set(self._doc_lengths)
+
+    @property
+    def term_count(self) -> int:
+        """Number of distinct terms in the index."""
+        return len(self._postings)
+
+    def add(self, doc_id: str, text: str) -> None:
+        """
+        Index a document, replacing any previous version.
+
+        Args:
+            doc_id: Unique document identifier
+            text: Document text
+        """
+        if doc_id in self._doc_lengths:
+            self.remove(doc_id)
+
+        terms = tokenize(text)
+        counts = Counter(terms)
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        self._doc_terms[doc_id] = tuple(counts)
+        self._doc_lengths[doc_id] = len(terms)
+        self._total_length += len(terms)
+
+    def remove(self, doc_id: str) -> bool:
+        """
+        Remove a document from the index.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            True if the document was indexed
+        """
+        length = self._doc_lengths.pop(doc_id, None)
+        if length is None:
+            return False
+        self._total_length -= length
+
+        for term in self._doc_terms.pop(doc_id, ()):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        return True
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self._postings.clear()
+        self._doc_lengths.clear()
+        self._doc_terms.clear()
+        self._total_length = 0
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Score documents against a query with BM25.
+
+        Args:
+            query: Query text
+            limit: Maximum number of results
+            accept: Optional filter called with each candidate doc_id
+
+        Returns:
+            (doc_id, score) pairs, best first
+        """
+        n_docs = len(self._doc_lengths)
+        if not n_docs or limit <= 0:
+            return []
+
+        avg_length = self._total_length / n_docs or 1.0
+        k1, b = self.k1, self.b
+        scores: dict[str, float] = {}
+        rejected: set[str] = set()
+
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings.items():
+                if doc_id in rejected:
+                    continue
+                if accept and doc_id not in scores and not accept(doc_id):
+                    rejected.add(doc_id)
+                    continue
+                norm = k1 * (1.0 - b + b * self._doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1.0) / (tf + norm)
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the index for persistence."""
+        return {
+            "tokenizer_version": TOKENIZER_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "doc_lengths": dict(self._doc_lengths),
+            "postings": {term: dict(postings) for term, postings in self._postings.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Optional["KeywordIndex"]:
+        """
+        Restore a serialized index.
+
+        Returns:
+            The index, or None if it was built by a different tokenizer
+        """
+        if data.get("tokenizer_version") != TOKENIZER_VERSION:
+            return None
+        index = cls(k1=data.get("k1", 1.5), b=data.get("b", 0.75))
+        index._doc_lengths = {doc_id: int(n) for doc_id, n in data["doc_lengths"].items()}
+        index._postings = {
+            term: {doc_id: int(tf) for doc_id, tf in postings.items()}
+            for term, postings in data["postings"].items()
+        }
+        doc_terms: dict[str, list[str]] = {doc_id: [] for doc_id in index._doc_lengths}
+        for term, postings in index._postings.items():
+            for doc_id in postings:
+                doc_terms[doc_id].append(term)
+        index._doc_terms = {doc_id: tuple(terms) for doc_id, terms in doc_terms.items()}
+        index._total_length = sum(index._doc_lengths.values())
+        return index
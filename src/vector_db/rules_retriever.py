@@ -3,6 +3,7 @@ Rules Retriever for Dolmenwood Virtual DM.
 
 Implements ChromaDB vector storage with context-aware retrieval from Section 7.5.
 Provides semantic search over game content (rules, lore, NPCs, locations).
+A LocalVectorStore can be supplied instead of ChromaDB for offline use.
 
 The retriever searches different content based on game state:
 - In combat -> search combat rules + monster stats
@@ -15,11 +16,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional
+import hashlib
 import json
 import logging
+import threading
 
 from src.game_state.state_machine import GameState
+from src.vector_db.keyword_index import KeywordIndex
+from src.vector_db.vector_store import LocalVectorStore, VectorRecord
 from src.data_models import (
     SourceType,
     SourceReference,
@@ -61,7 +66,7 @@ class SearchResult:
 class SearchContext:
     """Context for search to enable context-aware retrieval."""
 
-    game_state: GameState
+    game_state: Optional[GameState] = None
     current_hex: Optional[str] = None
     current_npc: Optional[str] = None
     current_monster: Optional[str] = None
@@ -81,6 +86,19 @@ class IndexedDocument:
     embedding: Optional[list[float]] = None
 
 
+@dataclass
+class BulkIndexResult:
+    """Outcome of a RulesRetriever.bulk_index() run."""
+
+    indexed: int = 0
+    skipped: int = 0  # Unchanged since last indexed
+    failed: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.indexed + self.skipped + self.failed
+
+
 class RulesRetriever:
     """
     Context-aware retrieval system for game content.
@@ -89,8 +107,9 @@ class RulesRetriever:
     Automatically adjusts search based on current game state
     to return the most relevant content.
 
-    When ChromaDB is not available, falls back to simple
-    keyword-based search.
+    When a LocalVectorStore is supplied it is used instead of ChromaDB.
+    When neither is available, falls back to BM25 keyword search over an
+    in-memory inverted index.
     """
 
     # Category weights by game state (higher = more relevant)
@@ -138,6 +157,7 @@ class RulesRetriever:
         persist_directory: Optional[Path] = None,
         collection_name: str = "dolmenwood_content",
         embedding_model: str = "all-MiniLM-L6-v2",
+        vector_store: Optional[LocalVectorStore] = None,
     ):
         """
         Initialize the rules retriever.
@@ -146,6 +166,7 @@ class RulesRetriever:
             persist_directory: Directory for ChromaDB persistence
             collection_name: Name of the ChromaDB collection
             embedding_model: Sentence transformer model for embeddings
+            vector_store: Local vector store to use instead of ChromaDB
         """
         self.persist_directory = persist_directory
         self.collection_name = collection_name
@@ -158,11 +179,22 @@ class RulesRetriever:
 
         # Fallback storage for when ChromaDB is not available
         self._fallback_documents: dict[str, IndexedDocument] = {}
+        self._keyword_index = KeywordIndex()
+
+        # Guards backend writes against concurrent searches during background indexing
+        self._lock = threading.RLock()
+        self._index_thread: Optional[threading.Thread] = None
+        self.last_bulk_result: Optional[BulkIndexResult] = None
 
-        # Try to initialize ChromaDB
-        self._init_chromadb()
+        # A local store replaces ChromaDB entirely
+        self._vector_store = vector_store
+        if vector_store is None:
+            self._init_chromadb()
 
-        logger.info(f"RulesRetriever initialized (ChromaDB available: {self._chroma_available})")
+        logger.info(
+            f"RulesRetriever initialized (ChromaDB available: {self._chroma_available}, "
+            f"local store: {vector_store is not None})"
+        )
 
     def _init_chromadb(self) -> None:
         """Initialize ChromaDB if available."""
@@ -236,29 +268,234 @@ class RulesRetriever:
         Returns:
             True if indexed successfully
         """
-        metadata = metadata or {}
-        metadata["category"] = category.value
+        document = IndexedDocument(doc_id, category, text, metadata or {})
+        return self._write_batch([self._prepare(document)]) == 1
+
+    def bulk_index(
+        self, documents: Iterable[IndexedDocument], batch_size: int = 64
+    ) -> BulkIndexResult:
+        """
+        Index many documents with one backend write per batch.
+
+        Each batch is embedded and upserted together. Documents whose
+        content hash matches the stored copy are skipped, so re-running
+        this at every boot only pays for content that changed.
+
+        Args:
+            documents: Documents to index (see hex_document() etc.)
+            batch_size: Documents per embedding call and upsert
+
+        Returns:
+            BulkIndexResult with indexed/skipped/failed counts
+        """
+        result = BulkIndexResult()
+        batch: list[IndexedDocument] = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                self._bulk_batch(batch, result)
+                batch = []
+        if batch:
+            self._bulk_batch(batch, result)
+
+        logger.info(
+            f"Bulk indexed {result.indexed} documents "
+            f"({result.skipped} unchanged, {result.failed} failed)"
+        )
+        return result
+
+    def start_background_index(
+        self,
+        documents: Iterable[IndexedDocument],
+        batch_size: int = 64,
+        on_complete: Optional[Callable[[BulkIndexResult], None]] = None,
+    ) -> threading.Thread:
+        """
+        Run bulk_index() on a daemon thread so startup does not wait for it.
+
+        Searches stay available while it runs; each batch holds the
+        retriever lock only while it is written.
+
+        Args:
+            documents: Documents to index (consumed before the thread starts)
+            batch_size: Documents per embedding call and upsert
+            on_complete: Called with the BulkIndexResult when finished
+
+        Returns:
+            The started thread
+        """
+        documents = list(documents)
+
+        def run() -> None:
+            result = self.bulk_index(documents, batch_size)
+            self.last_bulk_result = result
+            if on_complete:
+                on_complete(result)
+
+        thread = threading.Thread(target=run, name="rules-retriever-index", daemon=True)
+        self._index_thread = thread
+        thread.start()
+        return thread
+
+    def wait_for_indexing(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a background index started by start_background_index().
+
+        Returns:
+            True if no background index is running
+        """
+        if self._index_thread is not None:
+            self._index_thread.join(timeout)
+            return not self._index_thread.is_alive()
+        return True
+
+    @staticmethod
+    def content_hash(document: IndexedDocument) -> str:
+        """Hash of a document's category, text and metadata (timestamps excluded)."""
+        metadata = {
+            k: v for k, v in document.metadata.items() if k not in ("indexed_at", "content_hash")
+        }
+        payload = json.dumps(
+            [document.category.value, document.text, metadata], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _prepare(self, document: IndexedDocument) -> IndexedDocument:
+        """Stamp category, hash and index time into a document's metadata."""
+        metadata = document.metadata
+        metadata["category"] = document.category.value
+        metadata["content_hash"] = self.content_hash(document)
         metadata["indexed_at"] = datetime.now().isoformat()
+        return document
+
+    def _bulk_batch(self, batch: list[IndexedDocument], result: BulkIndexResult) -> None:
+        # Later duplicates of an id win, as they would with sequential upserts
+        prepared = {d.doc_id: self._prepare(d) for d in batch}
+        stored = self._stored_hashes(list(prepared))
+        changed = [
+            d for d in prepared.values() if stored.get(d.doc_id) != d.metadata["content_hash"]
+        ]
+        written = self._write_batch(changed)
+        result.skipped += len(batch) - len(changed)
+        result.indexed += written
+        result.failed += len(changed) - written
+
+    def _stored_hashes(self, doc_ids: list[str]) -> dict[str, Optional[str]]:
+        """Content hashes of already-indexed documents, by id."""
+        with self._lock:
+            if self._vector_store is not None:
+                records = (self._vector_store.get(doc_id) for doc_id in doc_ids)
+                return {r.doc_id: r.metadata.get("content_hash") for r in records if r}
+            elif self._chroma_available and self._collection:
+                try:
+                    existing = self._collection.get(ids=doc_ids, include=["metadatas"])
+                except Exception as e:
+                    logger.warning(f"Could not read stored hashes: {e}")
+                    return {}
+                metadatas = existing.get("metadatas") or []
+                return {
+                    doc_id: (metadata or {}).get("content_hash")
+                    for doc_id, metadata in zip(existing.get("ids", []), metadatas)
+                }
+            else:
+                return {
+                    doc_id: self._fallback_documents[doc_id].metadata.get("content_hash")
+                    for doc_id in doc_ids
+                    if doc_id in self._fallback_documents
+                }
 
-        if self._chroma_available and self._collection:
+    def _write_batch(self, documents: list[IndexedDocument]) -> int:
+        """Upsert prepared documents in one backend call; returns the number written."""
+        if not documents:
+            return 0
+
+        # Precomputed embeddings are only usable if every document has one
+        embeddings = [d.embedding for d in documents]
+        if any(e is None for e in embeddings):
             try:
-                self._collection.upsert(ids=[doc_id], documents=[text], metadatas=[metadata])
-                return True
+                embeddings = self._embed([d.text for d in documents])
             except Exception as e:
-                logger.error(f"Error indexing document: {e}")
-                return False
-        else:
-            # Fallback storage
-            self._fallback_documents[doc_id] = IndexedDocument(
-                doc_id=doc_id,
-                category=category,
-                text=text,
-                metadata=metadata,
-            )
-            return True
+                logger.error(f"Error embedding documents: {e}")
+                return 0
+
+        # Embedding is the slow part, so only the store mutation holds the lock
+        with self._lock:
+            if self._vector_store is not None:
+                records = [
+                    VectorRecord(d.doc_id, d.category.value, d.text, d.metadata) for d in documents
+                ]
+                try:
+                    self._vector_store.upsert_many(records, embeddings)
+                    return len(documents)
+                except ValueError as e:
+                    logger.error(f"Error indexing document: {e}")
+                    return 0
+            elif self._chroma_available and self._collection:
+                kwargs: dict[str, Any] = {"embeddings": embeddings} if embeddings else {}
+                try:
+                    self._collection.upsert(
+                        ids=[d.doc_id for d in documents],
+                        documents=[d.text for d in documents],
+                        metadatas=[d.metadata for d in documents],
+                        **kwargs,
+                    )
+                    return len(documents)
+                except Exception as e:
+                    logger.error(f"Error indexing document: {e}")
+                    return 0
+            else:
+                # Fallback storage
+                for document in documents:
+                    self._fallback_documents[document.doc_id] = document
+                    self._keyword_index.add(document.doc_id, document.text)
+                return len(documents)
+
+    def _embed(self, texts: list[str]) -> Optional[list[Any]]:
+        """
+        Embed texts with the active backend's embedding function, outside the lock.
+
+        Returns:
+            One vector per text, or None when the backend embeds on write
+            (ChromaDB's default embedder) or does not use embeddings
+        """
+        if self._vector_store is not None:
+            return self._vector_store.embedding_function(texts)
+        if self._chroma_available and self._embedding_function is not None:
+            return self._embedding_function(texts)
+        return None
 
     def index_hex(self, hex_id: str, hex_data: dict[str, Any]) -> bool:
         """Index hex location data."""
+        return self._index(self.hex_document(hex_id, hex_data))
+
+    def index_npc(self, npc_id: str, npc_data: dict[str, Any]) -> bool:
+        """Index NPC data."""
+        return self._index(self.npc_document(npc_id, npc_data))
+
+    def index_monster(self, monster_id: str, monster_data: dict[str, Any]) -> bool:
+        """Index monster data."""
+        return self._index(self.monster_document(monster_id, monster_data))
+
+    def index_rule(self, rule_id: str, rule_text: str, rule_category: str = "general") -> bool:
+        """Index a game rule."""
+        return self._index(self.rule_document(rule_id, rule_text, rule_category))
+
+    def index_lore(self, lore_id: str, lore_text: str, topic: str = "general") -> bool:
+        """Index lore/background information."""
+        return self._index(self.lore_document(lore_id, lore_text, topic))
+
+    def _index(self, document: IndexedDocument) -> bool:
+        return self.index_document(
+            document.doc_id, document.category, document.text, document.metadata
+        )
+
+    # =========================================================================
+    # DOCUMENT BUILDERS
+    # =========================================================================
+
+    @staticmethod
+    def hex_document(hex_id: str, hex_data: dict[str, Any]) -> IndexedDocument:
+        """Build the indexable document for a hex."""
         text_parts = [
             f"Hex {hex_id}",
             hex_data.get("name", ""),
@@ -286,10 +523,11 @@ class RulesRetriever:
             "has_drune": hex_data.get("drune_presence", False),
         }
 
-        return self.index_document(f"hex_{hex_id}", ContentCategory.HEX, text, metadata)
+        return IndexedDocument(f"hex_{hex_id}", ContentCategory.HEX, text, metadata)
 
-    def index_npc(self, npc_id: str, npc_data: dict[str, Any]) -> bool:
-        """Index NPC data."""
+    @staticmethod
+    def npc_document(npc_id: str, npc_data: dict[str, Any]) -> IndexedDocument:
+        """Build the indexable document for an NPC."""
         text_parts = [
             npc_data.get("name", ""),
             npc_data.get("title", ""),
@@ -315,10 +553,11 @@ class RulesRetriever:
             "faction": npc_data.get("faction", ""),
         }
 
-        return self.index_document(f"npc_{npc_id}", ContentCategory.NPC, text, metadata)
+        return IndexedDocument(f"npc_{npc_id}", ContentCategory.NPC, text, metadata)
 
-    def index_monster(self, monster_id: str, monster_data: dict[str, Any]) -> bool:
-        """Index monster data."""
+    @staticmethod
+    def monster_document(monster_id: str, monster_data: dict[str, Any]) -> IndexedDocument:
+        """Build the indexable document for a monster."""
         text_parts = [
             monster_data.get("name", ""),
             monster_data.get("description", ""),
@@ -342,23 +581,27 @@ class RulesRetriever:
             "habitat": monster_data.get("habitat", []),
         }
 
-        return self.index_document(f"monster_{monster_id}", ContentCategory.MONSTER, text, metadata)
+        return IndexedDocument(f"monster_{monster_id}", ContentCategory.MONSTER, text, metadata)
 
-    def index_rule(self, rule_id: str, rule_text: str, rule_category: str = "general") -> bool:
-        """Index a game rule."""
+    @staticmethod
+    def rule_document(
+        rule_id: str, rule_text: str, rule_category: str = "general"
+    ) -> IndexedDocument:
+        """Build the indexable document for a game rule."""
         metadata = {
             "rule_id": rule_id,
             "rule_category": rule_category,
         }
-        return self.index_document(f"rule_{rule_id}", ContentCategory.RULES, rule_text, metadata)
+        return IndexedDocument(f"rule_{rule_id}", ContentCategory.RULES, rule_text, metadata)
 
-    def index_lore(self, lore_id: str, lore_text: str, topic: str = "general") -> bool:
-        """Index lore/background information."""
+    @staticmethod
+    def lore_document(lore_id: str, lore_text: str, topic: str = "general") -> IndexedDocument:
+        """Build the indexable document for lore/background information."""
         metadata = {
             "lore_id": lore_id,
             "topic": topic,
         }
-        return self.index_document(f"lore_{lore_id}", ContentCategory.LORE, lore_text, metadata)
+        return IndexedDocument(f"lore_{lore_id}", ContentCategory.LORE, lore_text, metadata)
 
     # =========================================================================
     # SEARCH
@@ -383,10 +626,13 @@ class RulesRetriever:
         Returns:
             List of SearchResult ordered by relevance
         """
-        if self._chroma_available and self._collection:
-            return self._search_chromadb(query, context, n_results, categories)
-        else:
-            return self._search_fallback(query, context, n_results, categories)
+        with self._lock:
+            if self._vector_store is not None:
+                return self._search_vector_store(query, context, n_results, categories)
+            elif self._chroma_available and self._collection:
+                return self._search_chromadb(query, context, n_results, categories)
+            else:
+                return self._search_fallback(query, context, n_results, categories)
 
     def _search_chromadb(
         self,
@@ -446,6 +692,43 @@ class RulesRetriever:
             logger.error(f"ChromaDB search error: {e}")
             return []
 
+    def _search_vector_store(
+        self,
+        query: str,
+        context: Optional[SearchContext],
+        n_results: int,
+        categories: Optional[list[ContentCategory]],
+    ) -> list[SearchResult]:
+        """Search using the local vector store."""
+        try:
+            hits = self._vector_store.search(
+                query,
+                n_results * 2,  # Get more results for re-ranking
+                categories=[c.value for c in categories] if categories else None,
+            )
+        except ValueError as e:
+            logger.error(f"Local vector search error: {e}")
+            return []
+
+        search_results = []
+        for record, score in hits:
+            if context:
+                score = self._rerank_by_context(score, record.metadata, context)
+            search_results.append(self._record_to_result(record, score))
+
+        search_results.sort(key=lambda x: x.score, reverse=True)
+        return search_results[:n_results]
+
+    @staticmethod
+    def _record_to_result(record: VectorRecord, score: float) -> SearchResult:
+        return SearchResult(
+            content_id=record.doc_id,
+            category=ContentCategory(record.category),
+            text=record.text,
+            metadata=record.metadata,
+            score=score,
+        )
+
     def _search_fallback(
         self,
         query: str,
@@ -453,41 +736,34 @@ class RulesRetriever:
         n_results: int,
         categories: Optional[list[ContentCategory]],
     ) -> list[SearchResult]:
-        """Simple keyword-based fallback search."""
-        query_lower = query.lower()
-        query_terms = query_lower.split()
+        """BM25 keyword search over the fallback inverted index."""
+        accept = None
+        if categories:
+            wanted = set(categories)
 
-        results = []
+            def accept(doc_id: str) -> bool:
+                return self._fallback_documents[doc_id].category in wanted
 
-        for doc_id, doc in self._fallback_documents.items():
-            # Filter by category
-            if categories and doc.category not in categories:
-                continue
-
-            # Simple keyword matching
-            text_lower = doc.text.lower()
-            score = 0.0
-
-            for term in query_terms:
-                if term in text_lower:
-                    # Count occurrences
-                    count = text_lower.count(term)
-                    score += count * 0.1
-
-            if score > 0:
-                # Apply context-based re-ranking
-                if context:
-                    score = self._rerank_by_context(score, doc.metadata, context)
-
-                results.append(
-                    SearchResult(
-                        content_id=doc_id,
-                        category=doc.category,
-                        text=doc.text,
-                        metadata=doc.metadata,
-                        score=score,
-                    )
+        # Get more candidates than needed for re-ranking, as the ChromaDB path does
+        candidates = self._keyword_index.search(query, n_results * 2, accept)
+
+        results = []
+        for doc_id, score in candidates:
+            doc = self._fallback_documents[doc_id]
+
+            # Apply context-based re-ranking
+            if context:
+                score = self._rerank_by_context(score, doc.metadata, context)
+
+            results.append(
+                SearchResult(
+                    content_id=doc_id,
+                    category=doc.category,
+                    text=doc.text,
+                    metadata=doc.metadata,
+                    score=score,
                 )
+            )
 
         # Sort by score and limit results
         results.sort(key=lambda x: x.score, reverse=True)
@@ -593,35 +869,46 @@ class RulesRetriever:
 
     def delete_document(self, doc_id: str) -> bool:
         """Delete a document from the index."""
-        if self._chroma_available and self._collection:
-            try:
-                self._collection.delete(ids=[doc_id])
-                return True
-            except Exception as e:
-                logger.error(f"Error deleting document: {e}")
+        with self._lock:
+            if self._vector_store is not None:
+                return self._vector_store.delete(doc_id)
+            elif self._chroma_available and self._collection:
+                try:
+                    self._collection.delete(ids=[doc_id])
+                    return True
+                except Exception as e:
+                    logger.error(f"Error deleting document: {e}")
+                    return False
+            else:
+                if doc_id in self._fallback_documents:
+                    del self._fallback_documents[doc_id]
+                    self._keyword_index.remove(doc_id)
+                    return True
                 return False
-        else:
-            if doc_id in self._fallback_documents:
-                del self._fallback_documents[doc_id]
-                return True
-            return False
 
     def clear_all(self) -> bool:
         """Clear all indexed documents."""
-        if self._chroma_available and self._client:
-            try:
-                self._client.delete_collection(self.collection_name)
-                self._init_chromadb()
+        with self._lock:
+            if self._vector_store is not None:
+                self._vector_store.clear()
+                return True
+            elif self._chroma_available and self._client:
+                try:
+                    self._client.delete_collection(self.collection_name)
+                    self._init_chromadb()
+                    return True
+                except Exception as e:
+                    logger.error(f"Error clearing index: {e}")
+                    return False
+            else:
+                self._fallback_documents.clear()
+                self._keyword_index.clear()
                 return True
-            except Exception as e:
-                logger.error(f"Error clearing index: {e}")
-                return False
-        else:
-            self._fallback_documents.clear()
-            return True
 
     def get_statistics(self) -> dict[str, Any]:
         """Get index statistics."""
+        if self._vector_store is not None:
+            return self._vector_store.get_statistics()
         if self._chroma_available and self._collection:
             try:
                 count = self._collection.count()
@@ -636,11 +923,29 @@ class RulesRetriever:
         return {
             "backend": "fallback",
             "total_documents": len(self._fallback_documents),
+            "indexed_terms": self._keyword_index.term_count,
         }
 
+    def persist(self) -> None:
+        """Write the local vector store to its persist directory, if any."""
+        if self._vector_store is not None and self._vector_store.persist_directory:
+            with self._lock:
+                self._vector_store.save()
+
     def export_index(self, file_path: Path) -> None:
         """Export index to JSON file."""
-        if self._chroma_available and self._collection:
+        data: dict[str, Any] = {}
+        if self._vector_store is not None:
+            documents = [
+                {
+                    "doc_id": record.doc_id,
+                    "category": record.category,
+                    "text": record.text,
+                    "metadata": record.metadata,
+                }
+                for record in self._vector_store.records()
+            ]
+        elif self._chroma_available and self._collection:
             # Get all documents from ChromaDB
             try:
                 results = self._collection.get(include=["documents", "metadatas"])
@@ -666,17 +971,31 @@ class RulesRetriever:
                 }
                 for doc in self._fallback_documents.values()
             ]
+            data["keyword_index"] = self._keyword_index.to_dict()
+        data["documents"] = documents
 
         with open(file_path, "w") as f:
-            json.dump({"documents": documents}, f, indent=2)
+            json.dump(data, f, indent=2)
 
         logger.info(f"Exported {len(documents)} documents to {file_path}")
 
     def import_index(self, file_path: Path) -> int:
-        """Import index from JSON file."""
+        """
+        Import index from JSON file.
+
+        In fallback mode a persisted keyword index is loaded directly
+        when it covers exactly the exported documents; otherwise each
+        document is re-indexed.
+        """
         with open(file_path, "r") as f:
             data = json.load(f)
 
+        if self._vector_store is None and not self._chroma_available and "keyword_index" in data:
+            count = self._import_keyword_index(data)
+            if count is not None:
+                logger.info(f"Imported {count} documents from {file_path}")
+                return count
+
         count = 0
         for doc in data.get("documents", []):
             category = ContentCategory(
@@ -687,3 +1006,25 @@ class RulesRetriever:
 
         logger.info(f"Imported {count} documents from {file_path}")
         return count
+
+    def _import_keyword_index(self, data: dict[str, Any]) -> Optional[int]:
+        """Restore fallback documents and their persisted keyword index."""
+        if self._fallback_documents:
+            # Merging postings is not worth it; re-index into the live index
+            return None
+
+        index = KeywordIndex.from_dict(data["keyword_index"])
+        documents = data.get("documents", [])
+        if index is None or {doc["doc_id"] for doc in documents} != index.doc_ids():
+            return None
+
+        for doc in documents:
+            metadata = doc.get("metadata", {})
+            self._fallback_documents[doc["doc_id"]] = IndexedDocument(
+                doc_id=doc["doc_id"],
+                category=ContentCategory(doc.get("category", metadata.get("category", "rules"))),
+                text=doc["text"],
+                metadata=metadata,
+            )
+        self._keyword_index = index
+        return len(documents)
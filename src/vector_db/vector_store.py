@@ -0,0 +1,526 @@
+"""
+Local Vector Store for Dolmenwood Virtual DM.
+
+Self-contained embedding index that needs neither ChromaDB nor
+sentence-transformers. Vectors live in a float32 ``.npy`` file that is
+memory-mapped on load, next to a JSON sidecar holding each row's
+document id, category, text and metadata. Opening a persisted store
+therefore costs one JSON parse and an mmap, not a model load.
+
+Search is exact cosine similarity over the rows that survive the
+category/hex/NPC pre-filter bitmasks. NumPy is used for the matrix
+multiply when installed; otherwise a pure-Python dot product is used,
+which is adequate for small corpora and tests.
+
+Embeddings may come from any provider (any callable mapping a list of
+texts to a list of vectors) or be passed in precomputed. The default
+HashingEmbedder is deterministic and offline.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+import ast
+import hashlib
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+import sys
+
+from src.vector_db.keyword_index import tokenize
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+EmbeddingFunction = Callable[[list[str]], list[list[float]]]
+
+VECTORS_FILE = "vectors.npy"
+METADATA_FILE = "vectors.meta.json"
+
+_NPY_MAGIC = b"\x93NUMPY"
+_NPY_DESCR = "<f4"
+
+
+class HashingEmbedder:
+    """
+    Deterministic feature-hashing embedder.
+
+    Each stemmed token is hashed to a signed bucket, so texts sharing
+    vocabulary land close together. It has no notion of synonyms, but it
+    needs no model download and gives identical vectors on every machine.
+    """
+
+    def __init__(self, dim: int = 256):
+        """
+        Initialize the embedder.
+
+        Args:
+            dim: Embedding dimensionality
+        """
+        self.dim = dim
+
+    @property
+    def name(self) -> str:
+        """Identifier recorded in the store sidecar."""
+        return f"hashing-{self.dim}"
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    def _embed(self, text: str) -> list[float]:
+        vector = [0.0] * self.dim
+        for term in tokenize(text):
+            h = int.from_bytes(hashlib.blake2b(term.encode(), digest_size=8).digest(), "little")
+            vector[h % self.dim] += 1.0 if h >> 63 else -1.0
+        return vector
+
+
+@dataclass
+class VectorRecord:
+    """A document row in the local vector store."""
+
+    doc_id: str
+    category: str
+    text: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class LocalVectorStore:
+    """
+    Brute-force cosine index over memory-mapped float32 vectors.
+
+    Rows are appended on upsert and tombstoned on delete; save() compacts
+    the live rows into a fresh ``.npy`` file and sidecar.
+    """
+
+    # Metadata fields that get a pre-filter bitmask alongside category
+    FILTER_FIELDS = ("hex_id", "npc_id")
+
+    def __init__(
+        self,
+        persist_directory: Optional[Path] = None,
+        embedding_function: Optional[EmbeddingFunction] = None,
+        dim: Optional[int] = None,
+    ):
+        """
+        Initialize the store, loading it if persist_directory holds one.
+
+        Args:
+            persist_directory: Directory for the .npy file and sidecar
+            embedding_function: Callable mapping texts to vectors
+                (defaults to HashingEmbedder)
+            dim: Vector dimensionality (inferred from the embedder or
+                the first vector when omitted)
+
+        Raises:
+            ValueError: If the persisted store was built by a different embedder
+        """
+        self.persist_directory = Path(persist_directory) if persist_directory else None
+        self.embedding_function = embedding_function
+        self.dim = dim or getattr(embedding_function, "dim", None)
+
+        self._records: list[Optional[VectorRecord]] = []
+        self._rows: dict[str, int] = {}
+        self._vectors: Any = array("f")
+        self._mmap: Optional[mmap.mmap] = None
+        self._mmap_view: Optional[memoryview] = None
+        self._alive = 0
+        self._masks: dict[tuple[str, str], int] = {}
+
+        if self.persist_directory and (self.persist_directory / METADATA_FILE).exists():
+            self._load(self.persist_directory)
+
+        if self.embedding_function is None:
+            self.embedding_function = HashingEmbedder(self.dim or 256)
+            self.dim = self.dim or self.embedding_function.dim
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._rows
+
+    @property
+    def embedder_name(self) -> str:
+        """Name of the embedding function, recorded when saving."""
+        return getattr(self.embedding_function, "name", type(self.embedding_function).__name__)
+
+    # =========================================================================
+    # MUTATION
+    # =========================================================================
+
+    def upsert(
+        self,
+        doc_id: str,
+        text: str,
+        category: str,
+        metadata: Optional[dict[str, Any]] = None,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        Add or replace a single document.
+
+        Args:
+            doc_id: Unique document identifier
+            text: Document text
+            category: Content category value
+            metadata: Additional metadata
+            embedding: Precomputed vector (embedded from text if omitted)
+        """
+        record = VectorRecord(doc_id, category, text, metadata or {})
+        self.upsert_many([record], [embedding] if embedding is not None else None)
+
+    def upsert_many(
+        self,
+        records: list[VectorRecord],
+        embeddings: Optional[list[Sequence[float]]] = None,
+    ) -> None:
+        """
+        Add or replace documents, embedding them in a single call.
+
+        Args:
+            records: Documents to store
+            embeddings: Precomputed vectors, one per record
+
+        Raises:
+            ValueError: If the vector count or dimensionality is wrong
+        """
+        if not records:
+            return
+        if embeddings is None:
+            embeddings = self.embedding_function([r.text for r in records])
+        if len(embeddings) != len(records):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(records)} documents")
+
+        vectors = [self._normalize(e) for e in embeddings]
+        self._make_writable()
+        for record, vector in zip(records, vectors):
+            if record.doc_id in self._rows:
+                self._tombstone(self._rows[record.doc_id])
+            row = len(self._records)
+            self._records.append(record)
+            self._rows[record.doc_id] = row
+            self._vectors.extend(vector)
+            self._mark(row, record)
+
+    def delete(self, doc_id: str) -> bool:
+        """
+        Remove a document.
+
+        Returns:
+            True if the document was stored
+        """
+        row = self._rows.get(doc_id)
+        if row is None:
+            return False
+        self._tombstone(row)
+        return True
+
+    def clear(self) -> None:
+        """Remove all documents (persisted files are left until save())."""
+        self._release()
+        self._records = []
+        self._rows = {}
+        self._vectors = array("f")
+        self._alive = 0
+        self._masks = {}
+
+    def get(self, doc_id: str) -> Optional[VectorRecord]:
+        """Get a stored document by id."""
+        row = self._rows.get(doc_id)
+        return self._records[row] if row is not None else None
+
+    def records(self) -> Iterator[VectorRecord]:
+        """Iterate over live documents in row order."""
+        return (record for record in self._records if record is not None)
+
+    # =========================================================================
+    # SEARCH
+    # =========================================================================
+
+    def search(
+        self,
+        query: Union[str, Sequence[float]],
+        n_results: int = 5,
+        categories: Optional[Sequence[str]] = None,
+        hex_id: Optional[str] = None,
+        npc_id: Optional[str] = None,
+    ) -> list[tuple[VectorRecord, float]]:
+        """
+        Find the documents most similar to a query.
+
+        Args:
+            query: Query text, or a precomputed query vector
+            n_results: Maximum number of results
+            categories: Only search these categories
+            hex_id: Only search documents for this hex
+            npc_id: Only search documents for this NPC
+
+        Returns:
+            (record, cosine similarity) pairs, best first
+        """
+        if not self._rows or n_results <= 0:
+            return []
+
+        mask = self._alive
+        if categories:
+            allowed = 0
+            for category in categories:
+                allowed |= self._masks.get(("category", getattr(category, "value", category)), 0)
+            mask &= allowed
+        if hex_id:
+            mask &= self._masks.get(("hex_id", hex_id), 0)
+        if npc_id:
+            mask &= self._masks.get(("npc_id", npc_id), 0)
+        if not mask:
+            return []
+
+        vector = self.embedding_function([query])[0] if isinstance(query, str) else query
+        if len(vector) != self.dim:
+            raise ValueError(f"Query vector has {len(vector)} dimensions, expected {self.dim}")
+        vector = self._normalize(vector)
+
+        if NUMPY_AVAILABLE:
+            ranked = self._top_k_numpy(vector, mask, n_results)
+        else:
+            ranked = self._top_k_python(vector, mask, n_results)
+        return [(self._records[row], score) for row, score in ranked]
+
+    def _top_k_numpy(
+        self, vector: list[float], mask: int, n_results: int
+    ) -> list[tuple[int, float]]:
+        n = len(self._records)
+        matrix = np.frombuffer(self._vectors, dtype=np.float32, count=n * self.dim)
+        matrix = matrix.reshape(n, self.dim)
+        query = np.asarray(vector, dtype=np.float32)
+
+        if mask == (1 << n) - 1:
+            rows = np.arange(n)
+            scores = matrix @ query
+        else:
+            bits = np.unpackbits(
+                np.frombuffer(mask.to_bytes((n + 7) // 8, "little"), dtype=np.uint8),
+                bitorder="little",
+            )[:n]
+            rows = np.flatnonzero(bits)
+            scores = matrix[rows] @ query
+
+        k = min(n_results, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(rows[i]), float(scores[i])) for i in top]
+
+    def _top_k_python(
+        self, vector: list[float], mask: int, n_results: int
+    ) -> list[tuple[int, float]]:
+        dim = self.dim
+        vectors = self._vectors
+        scored = []
+        # bin() gives the mask MSB-first; reverse it to walk rows in order
+        for row, bit in enumerate(bin(mask)[:1:-1]):
+            if bit == "1":
+                start = row * dim
+                score = sum(a * b for a, b in zip(vectors[start : start + dim], vector))
+                scored.append((row, score))
+        return heapq.nlargest(n_results, scored, key=lambda item: item[1])
+
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    def save(self, directory: Optional[Path] = None) -> Path:
+        """
+        Compact live rows and write the .npy file and sidecar.
+
+        Args:
+            directory: Target directory (defaults to persist_directory)
+
+        Returns:
+            The directory written to
+        """
+        directory = Path(directory) if directory else self.persist_directory
+        if directory is None:
+            raise ValueError("No directory given and store has no persist_directory")
+        directory.mkdir(parents=True, exist_ok=True)
+
+        dim = self.dim or 0
+        live = [row for row, record in enumerate(self._records) if record is not None]
+        header = self._npy_header((len(live), dim))
+
+        vectors_path = directory / VECTORS_FILE
+        tmp_path = vectors_path.with_suffix(".npy.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            for row in live:
+                f.write(self._vectors[row * dim : (row + 1) * dim].tobytes())
+
+        sidecar = {
+            "format_version": 1,
+            "embedder": self.embedder_name,
+            "dim": dim,
+            "records": [
+                {
+                    "doc_id": record.doc_id,
+                    "category": record.category,
+                    "text": record.text,
+                    "metadata": record.metadata,
+                }
+                for record in self.records()
+            ],
+        }
+        meta_path = directory / METADATA_FILE
+        with open(meta_path.with_suffix(".json.tmp"), "w") as f:
+            json.dump(sidecar, f)
+
+        self._release()
+        os.replace(tmp_path, vectors_path)
+        os.replace(meta_path.with_suffix(".json.tmp"), meta_path)
+
+        # Reopen the compacted files so row numbers match what is on disk
+        self.clear()
+        self._load(directory)
+        logger.info(f"Saved {len(self)} vectors to {directory}")
+        return directory
+
+    def _load(self, directory: Path) -> None:
+        with open(directory / METADATA_FILE) as f:
+            sidecar = json.load(f)
+
+        stored = sidecar["embedder"]
+        if self.embedding_function is None:
+            if not stored.startswith("hashing-"):
+                raise ValueError(
+                    f"Vector store at {directory} was built with {stored}; "
+                    "pass the same embedding_function to open it"
+                )
+            self.embedding_function = HashingEmbedder(int(sidecar["dim"]))
+        if stored != self.embedder_name:
+            raise ValueError(
+                f"Vector store at {directory} was built with {stored}, not {self.embedder_name}"
+            )
+        self.dim = int(sidecar["dim"])
+
+        records = [VectorRecord(**r) for r in sidecar["records"]]
+        self._vectors = self._map_vectors(directory / VECTORS_FILE, len(records))
+        self._records = list(records)
+        self._rows = {}
+        self._alive = 0
+        self._masks = {}
+        for row, record in enumerate(records):
+            self._rows[record.doc_id] = row
+            self._mark(row, record)
+
+    def _map_vectors(self, path: Path, count: int) -> Any:
+        """Memory-map the vectors file as a flat float32 buffer."""
+        with open(path, "rb") as f:
+            preamble = f.read(12)
+            if preamble[:6] != _NPY_MAGIC:
+                raise ValueError(f"{path} is not a .npy file")
+            if preamble[6] == 1:
+                offset = 10 + int.from_bytes(preamble[8:10], "little")
+            else:
+                offset = 12 + int.from_bytes(preamble[8:12], "little")
+            f.seek(0)
+            header_start = 10 if preamble[6] == 1 else 12
+            header = ast.literal_eval(f.read(offset)[header_start:].decode("latin1").strip())
+
+            if header["descr"] != _NPY_DESCR or header["fortran_order"]:
+                raise ValueError(f"{path} must hold C-ordered little-endian float32")
+            if tuple(header["shape"]) != (count, self.dim):
+                raise ValueError(f"{path} shape {header['shape']} does not match its sidecar")
+            if count == 0:
+                return array("f")
+
+            if sys.byteorder != "little":
+                f.seek(offset)
+                vectors = array("f")
+                vectors.frombytes(f.read(count * self.dim * 4))
+                vectors.byteswap()
+                return vectors
+
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mmap_view = memoryview(self._mmap)
+        return self._mmap_view[offset : offset + count * self.dim * 4].cast("f")
+
+    @staticmethod
+    def _npy_header(shape: tuple[int, int]) -> bytes:
+        """Build a version 1.0 .npy header, padded to 64-byte alignment."""
+        text = f"{{'descr': '{_NPY_DESCR}', 'fortran_order': False, 'shape': {shape}, }}"
+        padding = 64 - (len(_NPY_MAGIC) + 4 + len(text) + 1) % 64
+        text = text + " " * (padding % 64) + "\n"
+        return _NPY_MAGIC + bytes([1, 0]) + len(text).to_bytes(2, "little") + text.encode("latin1")
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _normalize(self, vector: Sequence[float]) -> list[float]:
+        if self.dim is None:
+            self.dim = len(vector)
+        if len(vector) != self.dim:
+            raise ValueError(f"Vector has {len(vector)} dimensions, expected {self.dim}")
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else [0.0] * self.dim
+
+    def _mark(self, row: int, record: VectorRecord) -> None:
+        bit = 1 << row
+        self._alive |= bit
+        keys = [("category", record.category)]
+        keys += [(f, str(record.metadata[f])) for f in self.FILTER_FIELDS if record.metadata.get(f)]
+        for key in keys:
+            self._masks[key] = self._masks.get(key, 0) | bit
+
+    def _tombstone(self, row: int) -> None:
+        record = self._records[row]
+        if record is not None:
+            del self._rows[record.doc_id]
+            self._records[row] = None
+            self._alive &= ~(1 << row)
+
+    def _make_writable(self) -> None:
+        """Copy memory-mapped vectors into a growable buffer."""
+        if isinstance(self._vectors, array):
+            return
+        vectors = array("f")
+        vectors.frombytes(self._vectors.tobytes())
+        self._release()
+        self._vectors = vectors
+
+    def _release(self) -> None:
+        """Drop views onto the memory map and close it."""
+        if isinstance(self._vectors, memoryview):
+            self._vectors.release()
+            self._vectors = array("f")
+        if self._mmap_view is not None:
+            self._mmap_view.release()
+            self._mmap_view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self) -> None:
+        """Release the memory map; the store is empty afterwards."""
+        self.clear()
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get store statistics."""
+        return {
+            "backend": "local",
+            "total_documents": len(self._rows),
+            "dimensions": self.dim,
+            "embedder": self.embedder_name,
+            "numpy": NUMPY_AVAILABLE,
+            "memory_mapped": self._mmap is not None,
+        }
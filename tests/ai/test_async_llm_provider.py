@@ -0,0 +1,305 @@
+"""
+Tests for the async LLM client layer.
+
+Verifies that:
+- complete_many overlaps requests and honours the concurrency limit
+- Async retries back off without blocking and recover from failures
+- DMAgent.execute_schemas isolates per-request failures
+- Travel into an encounter sends both narrations as one batch
+"""
+
+import asyncio
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.ai.async_llm_provider import (
+    AsyncAnthropicClient,
+    LLMRequest,
+    ThreadedAsyncClient,
+    backoff_delay,
+    run_sync,
+)
+from src.ai.dm_agent import DMAgent, DMAgentConfig
+from src.ai.llm_provider import (
+    LLMConfig,
+    LLMManager,
+    LLMMessage,
+    LLMProvider,
+    LLMRole,
+    MockLLMClient,
+)
+from src.ai.prompt_schemas import PromptSchemaType, create_schema
+
+
+class SlowMockLLMClient(MockLLMClient):
+    """Stub provider that takes a fixed time per request and tracks overlap."""
+
+    def __init__(self, config: LLMConfig, latency: float = 0.2):
+        super().__init__(config)
+        self.latency = latency
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def complete(self, messages, system_prompt=None):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            return super().complete(messages, system_prompt)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _request(text: str) -> LLMRequest:
+    return LLMRequest(messages=[LLMMessage(role=LLMRole.USER, content=text)])
+
+
+@pytest.fixture
+def mock_config():
+    return LLMConfig(provider=LLMProvider.MOCK, model="mock-model", max_concurrency=4)
+
+
+class TestCompleteMany:
+    """Tests for LLMManager.complete_many."""
+
+    def test_latency_is_slowest_call_not_sum(self, mock_config):
+        manager = LLMManager(mock_config)
+        manager._client = SlowMockLLMClient(mock_config, latency=0.2)
+
+        start = time.perf_counter()
+        responses = manager.complete_many([_request(f"r{i}") for i in range(3)])
+        elapsed = time.perf_counter() - start
+
+        assert len(responses) == 3
+        assert elapsed < 0.45
+        assert manager._client.peak_in_flight == 3
+
+    def test_concurrency_limit(self, mock_config):
+        manager = LLMManager(mock_config)
+        manager._client = SlowMockLLMClient(mock_config, latency=0.02)
+
+        manager.complete_many([_request(f"r{i}") for i in range(5)], max_concurrency=2)
+
+        assert manager._client.peak_in_flight <= 2
+
+    def test_results_in_request_order_and_validated(self, mock_config):
+        manager = LLMManager(mock_config)
+        manager._client.set_responses(["calm mist", "roll a d20"])
+
+        responses = manager.complete_many([_request("a"), _request("b")], max_concurrency=1)
+
+        assert responses[0].content == "calm mist"
+        assert responses[1].authority_violations
+
+    def test_return_exceptions(self, mock_config):
+        class FlakyClient(MockLLMClient):
+            def complete(self, messages, system_prompt=None):
+                if messages[0].content == "bad":
+                    raise ConnectionError("Network unreachable")
+                return super().complete(messages, system_prompt)
+
+        manager = LLMManager(mock_config)
+        manager._client = FlakyClient(mock_config)
+
+        responses = manager.complete_many(
+            [_request("ok"), _request("bad")], return_exceptions=True
+        )
+        assert responses[0].content == "[Mock LLM response]"
+        assert isinstance(responses[1], ConnectionError)
+
+        with pytest.raises(ConnectionError):
+            manager.complete_many([_request("bad")])
+
+    def test_swapped_client_is_picked_up(self, mock_config):
+        manager = LLMManager(mock_config)
+        manager._client = MockLLMClient(mock_config)
+        client = manager._create_async_client()
+
+        assert isinstance(client, ThreadedAsyncClient)
+        assert client.client is manager._client
+
+    def test_batch_client_closed_when_batch_ends(self, mock_config, monkeypatch):
+        manager = LLMManager(mock_config)
+        created: list = []
+        closed: list = []
+
+        class ClosingClient(ThreadedAsyncClient):
+            async def close(self):
+                closed.append(self)
+
+        def create():
+            created.append(ClosingClient(manager._client))
+            return created[-1]
+
+        monkeypatch.setattr(manager, "_create_async_client", create)
+        for _ in range(3):
+            manager.complete_many([_request("a"), _request("b")])
+
+        # One client per batch, shared by its requests, always closed
+        assert len(created) == 3
+        assert closed == created
+
+    def test_close_releases_sdk_client(self, mock_config):
+        released: list = []
+
+        class FakeSDK:
+            async def close(self):
+                released.append(True)
+
+        client = ThreadedAsyncClient(MockLLMClient(mock_config))
+        client._client = FakeSDK()
+        asyncio.run(client.close())
+        asyncio.run(client.close())  # Idempotent
+
+        assert released == [True]
+        assert client._client is None
+
+    def test_complete_many_across_loops(self, mock_config):
+        manager = LLMManager(mock_config)
+        for _ in range(3):
+            responses = manager.complete_many([_request("a"), _request("b")])
+            assert [r.content for r in responses] == ["[Mock LLM response]"] * 2
+
+    def test_usable_inside_running_loop(self, mock_config):
+        manager = LLMManager(mock_config)
+
+        async def caller():
+            return manager.complete_many([_request("a")])
+
+        assert len(asyncio.run(caller())) == 1
+
+
+class TestAsyncRetries:
+    """Tests for jittered, non-blocking retries."""
+
+    def test_backoff_delay_bounds(self):
+        rng = random.Random(7)
+        for attempt in range(6):
+            delay = backoff_delay(0.5, attempt, max_delay=4.0, rng=rng)
+            assert 0.0 <= delay <= min(4.0, 0.5 * 2 ** attempt)
+
+    def test_backoff_does_not_touch_dice_roller(self):
+        from src.data_models import DiceRoller
+
+        DiceRoller.set_seed(42)
+        expected = DiceRoller.randint(1, 100, "probe")
+        DiceRoller.set_seed(42)
+        backoff_delay(1.0, 3)
+        assert DiceRoller.randint(1, 100, "probe") == expected
+
+    def test_retry_recovers_on_local_stub(self):
+        calls = []
+
+        class StubMessages:
+            async def create(self, **kwargs):
+                calls.append(kwargs)
+                if len(calls) < 2:
+                    raise ConnectionError("stub server warming up")
+                return SimpleNamespace(
+                    content=[SimpleNamespace(text="The fog parts.")],
+                    usage=SimpleNamespace(input_tokens=10, output_tokens=4),
+                )
+
+        config = LLMConfig(provider=LLMProvider.ANTHROPIC, retry_delay=0.01)
+        client = AsyncAnthropicClient(config)
+        client._client = SimpleNamespace(messages=StubMessages())
+
+        response = run_sync(client.acomplete([LLMMessage(LLMRole.USER, "describe")], "sys"))
+
+        assert response.content == "The fog parts."
+        assert len(calls) == 2
+        assert calls[0]["system"] == "sys"
+
+    def test_retries_exhausted(self):
+        class DownMessages:
+            async def create(self, **kwargs):
+                raise TimeoutError("stub server down")
+
+        config = LLMConfig(provider=LLMProvider.ANTHROPIC, retry_delay=0.001, max_retries=2)
+        client = AsyncAnthropicClient(config)
+        client._client = SimpleNamespace(messages=DownMessages())
+
+        response = run_sync(client.acomplete([LLMMessage(LLMRole.USER, "describe")]))
+
+        assert response.authority_violations == ["request_failed"]
+
+
+class TestDMAgentExecuteSchemas:
+    """Tests for concurrent schema execution in DMAgent."""
+
+    @staticmethod
+    def _schema(location: str):
+        return create_schema(
+            PromptSchemaType.EXPLORATION_DESCRIPTION,
+            {
+                "current_state": "wilderness_travel",
+                "location_summary": location,
+                "sensory_tags": ["damp"],
+            },
+        )
+
+    def test_failure_is_isolated(self):
+        class FlakyClient(MockLLMClient):
+            def complete(self, messages, system_prompt=None):
+                if "Hag's Hollow" in messages[0].content:
+                    raise RuntimeError("LLM service unavailable")
+                return super().complete(messages, system_prompt)
+
+        agent = DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK))
+        agent._llm._client = FlakyClient(agent._llm.config)
+
+        results = agent.execute_schemas(
+            [self._schema("Fogmire Edge"), self._schema("Hag's Hollow")]
+        )
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert "oracle_suggested" in results[1].warnings
+
+    def test_cache_hits_skip_llm(self):
+        agent = DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK))
+        agent.execute_schemas([self._schema("Fogmire Edge")])
+
+        results = agent.execute_schemas(
+            [self._schema("Fogmire Edge"), self._schema("Lankshorn")]
+        )
+
+        assert "from_cache" in results[0].warnings
+        assert "from_cache" not in results[1].warnings
+
+
+class TestTravelNarrationBatch:
+    """Tests for VirtualDM sending a travel turn's narration in one batch."""
+
+    def test_arrival_and_encounter_narrated_together(self, monkeypatch):
+        from src.data_models import EncounterState
+        from src.main import GameConfig, VirtualDM
+
+        dm = VirtualDM(GameConfig(use_vector_db=False))
+        monkeypatch.setattr(dm.hex_crawl, "_check_encounter", lambda *a, **k: True)
+        monkeypatch.setattr(dm.hex_crawl, "_get_random_adjacent_hex", lambda hex_id: hex_id)
+        monkeypatch.setattr(
+            dm.hex_crawl,
+            "_generate_encounter",
+            lambda *a, **k: EncounterState(actors=["goblin"], terrain="forest"),
+        )
+        batches: list[int] = []
+        complete_many = dm.dm_agent._llm.complete_many
+
+        def recording(requests, *args, **kwargs):
+            batches.append(len(requests))
+            return complete_many(requests, *args, **kwargs)
+
+        monkeypatch.setattr(dm.dm_agent._llm, "complete_many", recording)
+        result = dm.travel_to_hex("0710")
+
+        assert result["encounter_occurred"]
+        assert batches == [2]
+        assert result["narration"] and result["encounter_narration"]
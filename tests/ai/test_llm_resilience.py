@@ -0,0 +1,217 @@
+"""
+Tests for LLMManager circuit breakers and request coalescing.
+
+Verifies that:
+- The breaker opens after repeated failures and fails fast
+- A half-open probe closes or re-opens the circuit
+- Identical concurrent prompts share one provider call
+- Provider stats reach RunLog LLMCallEvent context
+"""
+
+import threading
+
+import pytest
+
+from src.ai.async_llm_provider import LLMRequest
+from src.ai.dm_agent import DMAgent, DMAgentConfig
+from src.ai.llm_provider import (
+    CircuitBreaker,
+    CircuitState,
+    LLMConfig,
+    LLMManager,
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    LLMRole,
+    MockLLMClient,
+)
+from src.data_models import LocationState, LocationType
+from src.observability.run_log import EventType, get_run_log, reset_run_log
+
+
+class FlakyClient(MockLLMClient):
+    """Mock client that reports failures until told to recover."""
+
+    def __init__(self, config: LLMConfig):
+        super().__init__(config)
+        self.failing = True
+        self.calls = 0
+
+    def complete(self, messages, system_prompt=None) -> LLMResponse:
+        self.calls += 1
+        if self.failing:
+            return LLMResponse(
+                content="[LLM request failed after retries]",
+                model="mock",
+                provider=LLMProvider.MOCK,
+                authority_violations=["request_failed"],
+            )
+        return super().complete(messages, system_prompt)
+
+
+class GatedClient(MockLLMClient):
+    """Mock client that blocks until released."""
+
+    def __init__(self, config: LLMConfig):
+        super().__init__(config)
+        self.gate = threading.Event()
+
+    def complete(self, messages, system_prompt=None) -> LLMResponse:
+        self.gate.wait(5)
+        return super().complete(messages, system_prompt)
+
+
+def _messages(text: str = "Describe the glade") -> list[LLMMessage]:
+    return [LLMMessage(role=LLMRole.USER, content=text)]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Tests for the breaker state machine."""
+
+    def test_opens_at_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=_Clock())
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_half_open_allows_one_probe(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+
+class TestManagerBreaker:
+    """Tests for fail-fast behaviour in LLMManager."""
+
+    @pytest.fixture
+    def manager(self):
+        config = LLMConfig(provider=LLMProvider.MOCK, breaker_failure_threshold=2)
+        manager = LLMManager(config)
+        manager._client = FlakyClient(config)
+        return manager
+
+    def test_fails_fast_once_open(self, manager):
+        manager.complete(_messages("a"))
+        manager.complete(_messages("b"))
+        response = manager.complete(_messages("c"))
+
+        assert response.authority_violations == ["circuit_open"]
+        assert manager._client.calls == 2
+        stats = manager.get_provider_stats()["mock"]
+        assert stats["circuit"] == "open"
+        assert (stats["failures"], stats["short_circuited"]) == (2, 1)
+        assert stats["error_rate"] == 1.0
+
+    def test_probe_success_closes(self, manager):
+        breaker = manager.get_breaker(LLMProvider.MOCK)
+        breaker._clock = clock = _Clock()
+        manager.complete(_messages("a"))
+        manager.complete(_messages("b"))
+
+        manager._client.failing = False
+        clock.now = manager.config.breaker_reset_timeout
+        response = manager.complete(_messages("c"))
+
+        assert not response.authority_violations
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_stream_respects_open_circuit(self, manager):
+        manager.complete(_messages("a"))
+        manager.complete(_messages("b"))
+        stream = manager.stream(_messages("c"))
+
+        assert list(stream) == []
+        assert stream.response.authority_violations == ["circuit_open"]
+
+
+class TestCoalescing:
+    """Tests for sharing identical in-flight prompts."""
+
+    @pytest.fixture
+    def manager(self):
+        config = LLMConfig(provider=LLMProvider.MOCK)
+        manager = LLMManager(config)
+        manager._client = GatedClient(config)
+        return manager
+
+    def test_identical_concurrent_requests_share_a_call(self, manager):
+        manager._client.set_responses(["Fog rolls over the glade."])
+        results: list[LLMResponse] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(manager.complete(_messages())))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        while manager.get_provider_stats().get("mock", {}).get("coalesced", 0) < 2:
+            threading.Event().wait(0.01)
+        manager._client.gate.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert manager._client.calls == 1
+        assert len(results) == 3
+        assert sum(r.coalesced for r in results) == 2
+        assert len({r.content for r in results}) == 1
+        # Each caller validates its own copy, so violations are not doubled
+        assert all(len(r.authority_violations) == 1 for r in results)
+
+    def test_complete_many_coalesces_duplicates(self, manager):
+        manager._client.gate.set()
+        requests = [LLMRequest(messages=_messages()) for _ in range(3)]
+        requests.append(LLMRequest(messages=_messages("Describe the bog")))
+
+        responses = manager.complete_many(requests)
+
+        assert len(responses) == 4
+        assert manager._client.calls + manager.get_provider_stats()["mock"]["coalesced"] == 4
+
+
+class TestRunLogContext:
+    """Tests for provider stats in LLMCallEvent logging."""
+
+    def test_llm_call_event_carries_provider_health(self):
+        reset_run_log()
+        agent = DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK))
+        agent.describe_location(
+            location=LocationState(
+                location_type=LocationType.HEX,
+                location_id="0705",
+                name="Fogmire Edge",
+                terrain="swamp",
+            )
+        )
+
+        [event] = get_run_log().get_events(EventType.LLM_CALL)
+        assert event.context["provider"] == "mock"
+        assert event.context["circuit"] == "closed"
+        assert event.context["calls"] == 1
+        assert event.context["coalesced"] is False
+        reset_run_log()
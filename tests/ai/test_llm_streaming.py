@@ -0,0 +1,239 @@
+"""
+Tests for streaming narration.
+
+Verifies that:
+- The incremental validator never releases any part of a violation
+- LLMManager.stream yields validated chunks and a final response
+  matching the blocking path
+- DMAgent.streaming forwards narration (not intent parsing) to a sink
+"""
+
+import pytest
+
+from src.ai.dm_agent import DMAgent, DMAgentConfig, NarrationChunk
+from src.ai.llm_provider import (
+    LLMConfig,
+    LLMManager,
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    LLMRole,
+    MockLLMClient,
+    StreamingAuthorityValidator,
+)
+from src.data_models import LocationState, LocationType
+
+
+def _validator(**kwargs) -> StreamingAuthorityValidator:
+    return StreamingAuthorityValidator(
+        [LLMManager._STREAM_DICE_ROLL_PATTERNS, LLMManager._STREAM_OUTCOME_PATTERNS],
+        final_patterns=[LLMManager._DICE_ROLL_PATTERNS, LLMManager._OUTCOME_PATTERNS],
+        **kwargs,
+    )
+
+
+def _messages() -> list[LLMMessage]:
+    return [LLMMessage(role=LLMRole.USER, content="describe")]
+
+
+class TestStreamingAuthorityValidator:
+    """Tests for the sliding-window validator."""
+
+    def test_clean_text_released_in_full(self):
+        validator = _validator(holdback=8)
+        text = "The mist curls around ancient oaks while an owl calls."
+        released = "".join(validator.feed(text[i:i + 5]) for i in range(0, len(text), 5))
+        released += validator.finish()
+        assert released == text
+        assert not validator.blocked
+
+    def test_violation_split_across_chunks_never_leaks(self):
+        validator = _validator(holdback=16)
+        chunks = ["The goblin lunges. You ", "ta", "ke 5 da", "mage and stagger back."]
+        released = "".join(validator.feed(chunk) for chunk in chunks) + validator.finish()
+
+        assert validator.blocked
+        assert "take" not in released
+        assert "5" not in released
+
+    def test_long_make_a_check_never_leaks(self):
+        validator = _validator()
+        text = (
+            "The bridge sways underfoot. You must make a very careful and deliberate "
+            "Dexterity check before crossing the chasm below."
+        )
+        released = "".join(validator.feed(text[i:i + 3]) for i in range(0, len(text), 3))
+        released += validator.finish()
+
+        assert validator.blocked
+        assert "make" not in released
+
+    def test_text_shorter_than_holdback_is_withheld(self):
+        validator = _validator(holdback=32)
+        assert validator.feed("Mist rises from the bog. ") == ""
+        assert validator.finish() == "Mist rises from the bog. "
+
+    def test_patterns_are_bounded_by_max_violation_length(self):
+        longest = "make" + " " * 4 + "a" + " " * 4 + "x" * 39 + " check"
+        match = LLMManager._STREAM_DICE_ROLL_PATTERNS.search(longest)
+        assert match is not None
+        assert len(match.group(0)) <= LLMManager.MAX_VIOLATION_LENGTH
+
+    def test_final_flush_checks_unbounded_patterns(self):
+        validator = _validator(holdback=8)
+        text = "Make a very careful and deliberately slow Dexterity-based check now."
+        released = validator.feed(text) + validator.finish()
+
+        assert validator.blocked
+        assert "check" not in released
+
+    def test_troll_is_not_a_roll(self):
+        validator = _validator(holdback=8)
+        released = validator.feed("A troll lurks beneath the bridge. ") + validator.finish()
+        assert released == "A troll lurks beneath the bridge. "
+
+    def test_truncates_to_max_length(self):
+        validator = _validator(holdback=4, max_length=10)
+        released = validator.feed("word " * 10) + validator.finish()
+        assert released == ("word " * 10)[:10] + "..."
+        assert validator.truncated
+
+
+class TestLLMManagerStream:
+    """Tests for LLMManager.stream."""
+
+    @pytest.fixture
+    def manager(self):
+        return LLMManager(LLMConfig(provider=LLMProvider.MOCK))
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Make a very careful and deliberately slow Dexterity-based check.",
+            "You must make  a      Wisdom check.",
+            "You take   12 damage from the fall.",
+        ],
+    )
+    def test_blocking_validation_keeps_unbounded_patterns(self, manager, text):
+        manager._client.set_responses([text])
+        assert manager.complete(_messages()).authority_violations
+
+    def test_chunks_match_blocking_response(self, manager):
+        text = "Rain drums on the thatch of the Lankshorn inn as evening falls softly."
+        manager._client.set_responses([text])
+        stream = manager.stream(_messages())
+        chunks = list(stream)
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == text
+        assert stream.response.content == text
+        assert stream.response.authority_violations == []
+        assert stream.first_chunk_ms is not None
+
+    def test_violation_halts_stream_and_is_reported(self, manager):
+        manager._client.set_responses(
+            ["The knight swings wide. Roll a d20 to see if the blow lands on the beast."]
+        )
+        stream = manager.stream(_messages())
+        released = "".join(stream)
+
+        assert "d20" not in released
+        assert any("dice_mechanic_violation" in v for v in stream.response.authority_violations)
+
+    def test_violation_response_matches_blocking_path(self, manager):
+        text = "The knight swings wide. Roll a d20 to see if the blow lands on the beast."
+        manager._client.set_responses([text])
+        stream = manager.stream(_messages())
+        list(stream)
+
+        manager._client.set_responses([text])
+        blocking = manager.complete(_messages())
+
+        assert stream.response.content == blocking.content == text
+        assert stream.response.authority_violations == blocking.authority_violations
+
+    def test_non_streaming_client_yields_single_chunk(self, manager):
+        class BlockingClient(MockLLMClient):
+            supports_streaming = False
+
+        manager._client = BlockingClient(manager.config)
+        manager._client.set_responses(["A single block of narration."])
+        stream = manager.stream(_messages())
+
+        assert list(stream) == ["A single block of narration."]
+
+    def test_stream_error_before_first_chunk_falls_back(self, manager):
+        class BrokenStreamClient(MockLLMClient):
+            def stream(self, messages, system_prompt=None):
+                raise ConnectionError("stream refused")
+                yield  # pragma: no cover
+
+        manager._client = BrokenStreamClient(manager.config)
+        stream = manager.stream(_messages())
+
+        assert list(stream) == ["[Mock LLM response]"]
+        assert isinstance(stream.response, LLMResponse)
+
+
+class TestDMAgentStreaming:
+    """Tests for DMAgent.streaming."""
+
+    @pytest.fixture
+    def location(self):
+        return LocationState(
+            location_type=LocationType.HEX,
+            location_id="0705",
+            name="Fogmire Edge",
+            terrain="swamp",
+        )
+
+    def test_sink_receives_chunks_then_done(self, location):
+        agent = DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK))
+        agent._llm._client.set_responses(
+            ["Reeds whisper in the black water as fog drifts in off the mire and night comes."]
+        )
+        chunks: list[NarrationChunk] = []
+
+        with agent.streaming(chunks.append):
+            result = agent.describe_location(location=location)
+
+        assert result.success
+        assert chunks[-1].done and not chunks[-1].aborted
+        assert "".join(c.text for c in chunks) == result.content
+        assert len({c.stream_id for c in chunks}) == 1
+
+    def test_cache_hit_is_streamed_whole(self, location):
+        agent = DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK))
+        first = agent.describe_location(location=location)
+        chunks: list[NarrationChunk] = []
+
+        with agent.streaming(chunks.append):
+            agent.describe_location(location=location)
+
+        assert [c.text for c in chunks] == [first.content, ""]
+
+    def test_violation_marks_stream_aborted(self, location):
+        agent = DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK))
+        agent._llm._client.set_responses(["The bog hag shrieks and you take 4 damage."])
+        chunks: list[NarrationChunk] = []
+
+        with agent.streaming(chunks.append):
+            result = agent.describe_location(location=location)
+
+        assert not result.success
+        assert chunks[-1].aborted
+        assert result.content == "The bog hag shrieks and you take 4 damage."
+
+    def test_intent_parsing_is_not_streamed(self):
+        agent = DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK))
+        chunks: list[NarrationChunk] = []
+
+        with agent.streaming(chunks.append):
+            agent.parse_intent(
+                player_input="search the room",
+                current_state="dungeon_exploration",
+                available_actions=["dungeon:search"],
+            )
+
+        assert chunks == []
+        assert agent._stream_sink is None
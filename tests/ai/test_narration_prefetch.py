@@ -0,0 +1,219 @@
+"""
+Tests for speculative narration prefetch.
+
+Verifies that:
+- DMAgent.capturing records schemas without calling the LLM
+- NarrationPrefetcher warms the cache within its token budget
+- Cancelling drops queued work for a stale game state
+- State shared with the worker thread stays consistent under concurrency
+- VirtualDM prefetches travel narration that the real action then hits,
+  narrated at the projected arrival time
+"""
+
+import threading
+
+import pytest
+
+from src.ai.dm_agent import DMAgent, DMAgentConfig
+from src.ai.llm_provider import LLMProvider
+from src.data_models import GameTime, TimeOfDay
+from src.ai.narration_prefetch import NarrationPrefetcher
+from src.conversation.types import SuggestedAction
+from src.main import GameConfig, VirtualDM
+
+
+@pytest.fixture
+def agent():
+    return DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK))
+
+
+def _count_calls(agent: DMAgent) -> list:
+    """Record prompts reaching the mock client."""
+    calls: list = []
+    client = agent._llm._client
+    complete = client.complete
+
+    def counting(messages, system_prompt=None):
+        calls.append(messages)
+        return complete(messages, system_prompt)
+
+    client.complete = counting
+    return calls
+
+
+def _capture_hexes(agent: DMAgent, hex_ids: list[str]) -> list:
+    with agent.capturing() as captured:
+        for hex_id in hex_ids:
+            agent.describe_hex(hex_id=hex_id, terrain="bog")
+    return list(captured)
+
+
+class TestCapture:
+    """Tests for DMAgent.capturing."""
+
+    def test_records_schema_without_llm_call(self, agent):
+        calls = _count_calls(agent)
+        with agent.capturing() as captured:
+            result = agent.describe_hex(hex_id="0710", terrain="bog")
+
+        assert result.success and result.content == ""
+        assert "captured" in result.warnings
+        assert len(captured) == 1
+        assert not agent.is_cached(captured[0])
+        assert calls == []
+
+    def test_warm_cache_feeds_later_request(self, agent):
+        [schema] = _capture_hexes(agent, ["0710"])
+        agent.warm_cache([schema])
+
+        result = agent.describe_hex(hex_id="0710", terrain="bog")
+        assert "from_cache" in result.warnings
+        # Prefetched text was never shown, so it is not prompt context
+        assert agent._recent_descriptions == []
+
+
+class TestNarrationPrefetcher:
+    """Tests for the background worker."""
+
+    def test_schedule_warms_cache(self, agent):
+        prefetcher = NarrationPrefetcher(agent)
+        schemas = _capture_hexes(agent, ["0710", "0711"])
+
+        assert prefetcher.schedule(schemas) == 2
+        assert prefetcher.wait_idle(timeout=5)
+        assert all(agent.is_cached(s) for s in schemas)
+        assert prefetcher.get_stats()["warmed"] == 2
+        prefetcher.shutdown()
+
+    def test_token_budget_limits_work(self, agent):
+        schemas = _capture_hexes(agent, ["0710", "0711"])
+        budget = agent.estimate_tokens(schemas[0])
+        prefetcher = NarrationPrefetcher(agent, token_budget=budget)
+
+        assert prefetcher.schedule(schemas) == 1
+        assert prefetcher.get_stats()["skipped"] == 1
+        prefetcher.shutdown()
+
+    def test_cached_schemas_are_skipped(self, agent):
+        schemas = _capture_hexes(agent, ["0710"])
+        agent.warm_cache(schemas)
+
+        prefetcher = NarrationPrefetcher(agent)
+        assert prefetcher.schedule(schemas) == 0
+        prefetcher.shutdown()
+
+    def test_cancel_drops_queued_work(self, agent):
+        gate = threading.Event()
+        started = threading.Event()
+        warm = agent.warm_cache
+
+        def slow_warm(schemas):
+            started.set()
+            gate.wait(5)
+            return warm(schemas)
+
+        agent.warm_cache = slow_warm
+        prefetcher = NarrationPrefetcher(agent)
+        prefetcher.schedule(_capture_hexes(agent, ["0710", "0711", "0712"]))
+        assert started.wait(5)
+
+        prefetcher.cancel()
+        gate.set()
+        assert prefetcher.wait_idle(timeout=5)
+
+        stats = prefetcher.get_stats()
+        assert stats["warmed"] == 1
+        assert stats["cancelled"] == 2
+        prefetcher.shutdown()
+
+
+class TestSharedAgentState:
+    """Tests for state the prefetch worker shares with foreground calls."""
+
+    def test_mock_responses_dealt_once_each_across_threads(self, agent):
+        client = agent._llm._client
+        client.set_responses([f"response {i}" for i in range(8)])
+        seen: list[str] = []
+        lock = threading.Lock()
+
+        def draw():
+            for _ in range(200):
+                content = client._next_content()
+                with lock:
+                    seen.append(content)
+
+        threads = [threading.Thread(target=draw) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(set(seen)) == [f"response {i}" for i in range(8)]
+        assert all(seen.count(f"response {i}") == 200 for i in range(8))
+
+    def test_prefetch_alongside_foreground_narration(self, agent):
+        prefetcher = NarrationPrefetcher(agent, token_budget=1_000_000)
+        prefetcher.schedule(_capture_hexes(agent, [f"07{n:02d}" for n in range(10, 20)]))
+        for n in range(20, 30):
+            agent.describe_hex(hex_id=f"07{n}", terrain="bog")
+        assert prefetcher.wait_idle(timeout=5)
+
+        assert prefetcher.get_stats()["warmed"] == 10
+        assert len(agent.get_recent_descriptions()) == agent._max_recent
+        prefetcher.shutdown()
+
+
+class TestVirtualDMPrefetch:
+    """Tests for VirtualDM capture of suggested actions."""
+
+    @pytest.fixture
+    def dm(self):
+        dm = VirtualDM(GameConfig(prefetch_narration=True, use_vector_db=False))
+        yield dm
+        dm._prefetcher.shutdown()
+
+    def test_travel_prefetch_is_hit_by_travel(self, dm, monkeypatch):
+        # Keep the party on course and encounter-free
+        monkeypatch.setattr(dm.hex_crawl, "_check_encounter", lambda *a, **k: False)
+        monkeypatch.setattr(dm.hex_crawl, "_get_random_adjacent_hex", lambda hex_id: hex_id)
+        suggestions = [
+            SuggestedAction(id="wilderness:travel", label="Travel", params={"hex_id": "0710"}),
+            SuggestedAction(id="meta:status", label="Status"),
+        ]
+        assert len(dm.prefetch_schemas(suggestions)) == 1
+
+        assert dm.prefetch_narration(suggestions) == 1
+        assert dm._prefetcher.wait_idle(timeout=5)
+        calls = _count_calls(dm.dm_agent)
+
+        result = dm.travel_to_hex("0710")
+        assert result["success"]
+        assert "narration" in result
+        assert calls == []
+
+    def test_travel_prefetch_keyed_on_arrival_time(self, dm, monkeypatch):
+        monkeypatch.setattr(dm.hex_crawl, "_check_encounter", lambda *a, **k: False)
+        monkeypatch.setattr(dm.hex_crawl, "_get_random_adjacent_hex", lambda hex_id: hex_id)
+        dm.time_tracker.game_time = GameTime(hour=10)
+        suggestions = [
+            SuggestedAction(id="wilderness:travel", label="Travel", params={"hex_id": "0710"})
+        ]
+        [schema] = dm.prefetch_schemas(suggestions)
+
+        # Entering the hex uses part of the travel day, so the party arrives later
+        assert dm.hex_crawl.get_travel_day_turns_elapsed("0710") > 0
+        assert schema.inputs["time_of_day"] != TimeOfDay.MORNING.value
+
+        dm.prefetch_narration(suggestions)
+        assert dm._prefetcher.wait_idle(timeout=5)
+        calls = _count_calls(dm.dm_agent)
+        result = dm.travel_to_hex("0710")
+        assert result["time_of_day"] == schema.inputs["time_of_day"]
+        assert calls == []
+
+    def test_disabled_by_default(self):
+        dm = VirtualDM(GameConfig(use_vector_db=False))
+        suggestions = [
+            SuggestedAction(id="wilderness:travel", label="Travel", params={"hex_id": "0710"})
+        ]
+        assert dm.prefetch_narration(suggestions) == 0
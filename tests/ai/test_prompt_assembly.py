@@ -0,0 +1,145 @@
+"""
+Tests for prompt assembly: cached system prefixes and token budgets.
+
+Verifies that:
+- Each schema type has one stable, cacheable system prefix
+- Anthropic requests mark that prefix as a cache breakpoint
+- History/lore inputs are trimmed oldest-first to fit a budget
+- Trimming never touches constraint inputs or cache keys
+"""
+
+from src.ai.dm_agent import DMAgent, DMAgentConfig
+from src.ai.llm_provider import LLMProvider, _anthropic_system
+from src.ai.prompt_schemas import (
+    BASE_SYSTEM_PROMPT,
+    ExplorationDescriptionInputs,
+    ExplorationDescriptionSchema,
+    NPCDialogueInputs,
+    NPCDialogueSchema,
+    SpellRevelationInputs,
+    SpellRevelationSchema,
+    SystemPrompt,
+    estimate_tokens,
+)
+
+
+def _exploration(summary: str = "Hex 0705: bog") -> ExplorationDescriptionSchema:
+    return ExplorationDescriptionSchema(
+        ExplorationDescriptionInputs(
+            current_state="wilderness_travel",
+            location_summary=summary,
+            sensory_tags=["damp"],
+        )
+    )
+
+
+def _dialogue(previous: list[str]) -> NPCDialogueSchema:
+    return NPCDialogueSchema(
+        NPCDialogueInputs(
+            npc_name="Mother Gorse",
+            npc_personality="wary hedge-witch",
+            npc_voice="clipped",
+            reaction_result="neutral",
+            conversation_topic="the standing stones",
+            known_to_npc=["the stones hum at dusk"],
+            hidden_from_player=["she buried the bishop"],
+            previous_interactions=previous,
+        )
+    )
+
+
+class TestSystemPrefix:
+    """Tests for the per-schema-type prefix."""
+
+    def test_prefix_is_shared_across_instances(self):
+        first = _exploration("Hex 0705: bog").assemble()
+        second = _exploration("Hex 0912: heath").assemble()
+
+        assert first.system_prompt == second.system_prompt
+        assert first.system_prompt.cacheable_prefix == str(first.system_prompt)
+        assert first.user_prompt != second.user_prompt
+
+    def test_dynamic_system_prompt_uses_base_prefix(self):
+        schema = SpellRevelationSchema(
+            SpellRevelationInputs(
+                spell_name="Detect Magic",
+                caster_name="Merlin",
+                sensory_mode="sight",
+                revelations=["a glowing ring"],
+            )
+        )
+        prompt = schema.assemble()
+
+        assert prompt.system_prompt.cacheable_prefix == BASE_SYSTEM_PROMPT
+        assert "SENSORY MODE: SIGHT" in prompt.system_prompt
+
+    def test_anthropic_marks_prefix_for_caching(self):
+        system = SystemPrompt(BASE_SYSTEM_PROMPT + "\n\nTASK", BASE_SYSTEM_PROMPT)
+        blocks = _anthropic_system(system, prompt_caching=True)
+
+        assert blocks[0]["text"] == BASE_SYSTEM_PROMPT
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+        assert blocks[1]["text"] == "\n\nTASK"
+        assert _anthropic_system(system, prompt_caching=False) == system
+        assert _anthropic_system("plain", prompt_caching=True) == "plain"
+
+
+class TestBudget:
+    """Tests for priority trimming."""
+
+    def test_within_budget_is_untouched(self):
+        schema = _dialogue(["asked about wolves"])
+        prompt = schema.assemble(max_tokens=10_000)
+
+        assert prompt.trimmed_inputs == []
+        assert prompt.user_prompt == schema.build_prompt()
+
+    def test_history_trimmed_oldest_first(self):
+        previous = [f"topic {n:03d} " + "x" * 40 for n in range(200)]
+        schema = _dialogue(previous)
+        full = schema.assemble()
+        budget = estimate_tokens(full.system_prompt) + 400
+
+        prompt = schema.assemble(max_tokens=budget)
+
+        assert prompt.estimated_tokens <= budget
+        assert prompt.trimmed_inputs == ["previous_interactions"]
+        assert "topic 199" in prompt.user_prompt
+        assert "topic 000" not in prompt.user_prompt
+        # Constraints survive and the schema's own inputs are unchanged
+        assert "she buried the bishop" in prompt.user_prompt
+        assert len(schema.inputs["previous_interactions"]) == 200
+
+    def test_agent_requests_respect_budget(self):
+        agent = DMAgent(
+            DMAgentConfig(llm_provider=LLMProvider.MOCK, prompt_token_budget=900)
+        )
+        sent: list[str] = []
+        client = agent._llm._client
+        complete = client.complete
+
+        def recording(messages, system_prompt=None):
+            sent.append(system_prompt + messages[0].content)
+            return complete(messages, system_prompt)
+
+        client.complete = recording
+        agent.execute_schemas([_dialogue([f"topic {n} " + "x" * 60 for n in range(200)])])
+
+        assert estimate_tokens(sent[0]) <= 900
+
+    def test_intent_recent_context_dropped_when_over_budget(self):
+        from src.ai.prompt_schemas import IntentParseInputs, IntentParseSchema
+
+        schema = IntentParseSchema(
+            IntentParseInputs(
+                player_input="search the room",
+                current_state="dungeon_exploration",
+                available_actions=["dungeon:search"],
+                recent_context="y" * 8000,
+            )
+        )
+        full = schema.assemble()
+        prompt = schema.assemble(max_tokens=full.estimated_tokens - 1000)
+
+        assert prompt.trimmed_inputs == ["recent_context"]
+        assert "y" * 100 not in prompt.user_prompt
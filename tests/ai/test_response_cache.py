@@ -0,0 +1,141 @@
+"""
+Tests for the bounded, persistent DMAgent response cache.
+
+Verifies that:
+- Structural keys are stable and input-sensitive, and reject objects
+  without a stable encoding
+- The memory tier is LRU- and TTL-bounded
+- The SQLite tier survives a new cache instance
+- DMAgent serves repeat requests from cache and reports counters
+"""
+
+from dataclasses import dataclass
+
+import pytest
+
+from src.ai.dm_agent import DMAgent, DMAgentConfig
+from src.ai.llm_provider import LLMProvider
+from src.ai.response_cache import ResponseCache, make_structural_key
+from src.data_models import LocationState, LocationType
+
+
+@dataclass
+class _Inputs:
+    name: str
+    tags: list
+
+
+class TestStructuralKey:
+    """Tests for make_structural_key."""
+
+    def test_stable_for_equal_inputs(self):
+        a = make_structural_key("x", {"b": 1, "a": _Inputs("n", ["t"])})
+        b = make_structural_key("x", {"a": _Inputs("n", ["t"]), "b": 1})
+        assert a == b
+
+    def test_sensitive_to_values_and_types(self):
+        base = make_structural_key("x", {"a": 1})
+        assert make_structural_key("x", {"a": 2}) != base
+        assert make_structural_key("x", {"a": "1"}) != base
+        assert make_structural_key("y", {"a": 1}) != base
+        assert make_structural_key("x", {"a": ["ab", "c"]}) != make_structural_key(
+            "x", {"a": ["a", "bc"]}
+        )
+
+    def test_unsupported_object_rejected(self):
+        class Opaque:
+            pass
+
+        with pytest.raises(TypeError, match="Opaque"):
+            make_structural_key("x", {"a": [Opaque()]})
+
+    def test_to_dict_is_the_stable_form(self):
+        class Weather:
+            def __init__(self, kind):
+                self.kind = kind
+
+            def to_dict(self):
+                return {"kind": self.kind}
+
+        key = make_structural_key("x", {"w": Weather("fog")})
+        assert key == make_structural_key("x", {"w": Weather("fog")})
+        assert key != make_structural_key("x", {"w": Weather("rain")})
+
+
+class TestResponseCache:
+    """Tests for the two-tier cache."""
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        assert cache.get("a") == "1"  # refresh a
+        cache.put("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        import src.ai.response_cache as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "time", lambda: now[0])
+        cache = ResponseCache(ttl_seconds=10)
+        cache.put("a", "1")
+        now[0] += 11
+        assert cache.get("a") is None
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_hit_miss_counters(self):
+        cache = ResponseCache()
+        cache.get("missing")
+        cache.put("k", "v")
+        cache.get("k")
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        path = tmp_path / "narration.sqlite"
+        ResponseCache(persist_path=path).put("k", "a misty glade")
+
+        fresh = ResponseCache(persist_path=path)
+        assert fresh.get("k") == "a misty glade"
+        assert fresh.get_stats()["disk_hits"] == 1
+
+    def test_clear_clears_both_tiers(self, tmp_path):
+        path = tmp_path / "narration.sqlite"
+        cache = ResponseCache(persist_path=path)
+        cache.put("k", "v")
+        cache.clear()
+        assert ResponseCache(persist_path=path).get("k") is None
+
+
+class TestDMAgentCache:
+    """Tests for DMAgent integration."""
+
+    @pytest.fixture
+    def location(self):
+        return LocationState(
+            location_type=LocationType.HEX,
+            location_id="0705",
+            name="Fogmire Edge",
+            terrain="swamp",
+        )
+
+    def test_repeat_request_served_from_cache(self, location):
+        agent = DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK))
+        first = agent.describe_location(location=location)
+        second = agent.describe_location(location=location)
+
+        assert second.content == first.content
+        assert "from_cache" in second.warnings
+        assert agent.get_lore_status()["response_cache"]["hits"] == 1
+
+    def test_persisted_across_agents(self, location, tmp_path):
+        path = str(tmp_path / "narration.sqlite")
+        config = DMAgentConfig(llm_provider=LLMProvider.MOCK, cache_persist_path=path)
+        DMAgent(config).describe_location(location=location)
+
+        result = DMAgent(config).describe_location(location=location)
+        assert "from_cache" in result.warnings
@@ -0,0 +1,175 @@
+"""
+Tests for the offline intent classifier in front of LLM intent parsing.
+
+Verifies that:
+- Common commands classify confidently among candidate actions
+- Off-domain text falls to the unknown class
+- ConversationFacade resolves confident inputs without calling the LLM
+- Ambiguous inputs still go to the LLM
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.main import VirtualDM, GameConfig
+from src.data_models import DiceRoller, GameDate, GameTime
+from src.game_state.state_machine import GameState
+from src.conversation.conversation_facade import ConversationFacade, ConversationConfig
+from src.conversation.types import SuggestedAction
+from src.conversation.intent_classifier import (
+    UNKNOWN_ACTION,
+    LocalIntentClassifier,
+    get_local_intent_classifier,
+    requires_llm,
+)
+from src.ai.prompt_schemas import IntentParseOutput
+
+
+WILDERNESS_CANDIDATES = [
+    "wilderness:look_around",
+    "wilderness:forage",
+    "wilderness:hunt",
+    "oracle:fate_check",
+    "meta:status",
+]
+
+
+@pytest.fixture
+def dm():
+    DiceRoller.clear_roll_log()
+    DiceRoller.set_seed(42)
+    dm = VirtualDM(
+        config=GameConfig(llm_provider="mock", enable_narration=True, load_content=False),
+        initial_state=GameState.WILDERNESS_TRAVEL,
+        game_date=GameDate(year=1, month=6, day=15),
+        game_time=GameTime(hour=10, minute=0),
+    )
+    dm._dm_agent.parse_intent = MagicMock(
+        return_value=IntentParseOutput(
+            action_id="unknown",
+            params={},
+            confidence=0.1,
+            requires_clarification=False,
+            clarification_prompt="",
+            reasoning="",
+        )
+    )
+    yield dm
+    DiceRoller.clear_roll_log()
+
+
+class TestLocalIntentClassifier:
+    """Tests for the classifier itself."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("forage for food", "wilderness:forage"),
+            ("let's go hunting", "wilderness:hunt"),
+            ("look around", "wilderness:look_around"),
+        ],
+    )
+    def test_common_commands(self, text, expected):
+        prediction = get_local_intent_classifier().predict(text, WILDERNESS_CANDIDATES)
+        assert prediction.action_id == expected
+        assert prediction.confidence >= 0.85
+
+    def test_off_domain_is_unknown(self):
+        prediction = get_local_intent_classifier().predict(
+            "I cast fireball at the enemies", WILDERNESS_CANDIDATES
+        )
+        assert prediction.is_unknown or prediction.confidence < 0.85
+
+    def test_empty_text_is_unknown(self):
+        assert get_local_intent_classifier().predict("!!!").action_id == UNKNOWN_ACTION
+
+    def test_candidates_restrict_prediction(self):
+        classifier = LocalIntentClassifier().fit(
+            [("search", "a:search"), ("search room", "b:search"), ("hmm", UNKNOWN_ACTION)]
+        )
+        assert classifier.predict("search", candidates=["b:search"]).action_id == "b:search"
+
+
+class TestFacadeLocalRouting:
+    """Tests for ConversationFacade local-first routing."""
+
+    def test_confident_input_skips_llm(self, dm):
+        facade = ConversationFacade(
+            dm, config=ConversationConfig(use_oracle_enhancement=False)
+        )
+        response = facade.handle_chat("forage for food")
+
+        dm._dm_agent.parse_intent.assert_not_called()
+        assert response.messages
+
+    def test_ambiguous_input_uses_llm(self, dm):
+        facade = ConversationFacade(
+            dm, config=ConversationConfig(use_oracle_enhancement=False)
+        )
+        facade.handle_chat("I cast fireball at the enemies")
+
+        dm._dm_agent.parse_intent.assert_called_once()
+
+    def test_disabled_classifier_uses_llm(self, dm):
+        facade = ConversationFacade(
+            dm,
+            config=ConversationConfig(
+                use_oracle_enhancement=False, use_local_intent_classifier=False
+            ),
+        )
+        facade.handle_chat("forage for food")
+
+        dm._dm_agent.parse_intent.assert_called_once()
+
+
+class TestNegationAndQuestionGuard:
+    """Negated or questioning input must never trigger a local action."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "don't make camp yet",
+            "don't search the room, just leave",
+            "should we rest here?",
+            "can we rest here",
+            "never mind the door",
+            "leave the room instead",
+        ],
+    )
+    def test_guarded_phrasings_require_llm(self, text):
+        assert requires_llm(text)
+
+    @pytest.mark.parametrize("text", ["make camp", "search the room", "forage for food"])
+    def test_plain_commands_stay_local(self, text):
+        assert not requires_llm(text)
+
+    @pytest.mark.parametrize(
+        "text,action_id",
+        [
+            ("don't make camp yet", "wilderness:end_day"),
+            ("don't search the room, just leave", "dungeon:search"),
+            ("should we rest here?", "dungeon:rest"),
+        ],
+    )
+    def test_facade_does_not_resolve_guarded_phrasings(self, dm, text, action_id):
+        facade = ConversationFacade(
+            dm, config=ConversationConfig(use_oracle_enhancement=False)
+        )
+        facade.handle_action = MagicMock()
+        suggestions = [SuggestedAction(id=action_id, label=action_id)]
+
+        # The classifier alone is confident enough to act on these
+        prediction = get_local_intent_classifier().predict(text, [action_id])
+        assert prediction.action_id == action_id
+        assert prediction.confidence >= facade.config.local_intent_confidence_threshold
+
+        assert facade._try_local_intent(text, suggestions) is None
+        facade.handle_action.assert_not_called()
+
+    def test_facade_sends_negated_command_to_llm(self, dm):
+        facade = ConversationFacade(
+            dm, config=ConversationConfig(use_oracle_enhancement=False)
+        )
+        facade.handle_chat("don't forage for food")
+
+        dm._dm_agent.parse_intent.assert_called_once()
@@ -0,0 +1,63 @@
+"""
+Tests for streaming conversation turns.
+
+ConversationFacade.handle_chat_streaming / handle_action_streaming pass
+DM narration to a callback as it is generated and record it in
+TurnResponse.streamed_narration so renderers do not print it twice.
+"""
+
+import pytest
+
+from src.conversation.conversation_facade import ConversationFacade
+from src.conversation.types import ChatMessage
+from src.data_models import DiceRoller, GameDate, GameTime, LocationState, LocationType
+from src.game_state.state_machine import GameState
+from src.integrations.foundry import FoundryBridge
+from src.main import GameConfig, VirtualDM
+
+
+@pytest.fixture
+def facade():
+    DiceRoller.set_seed(42)
+    dm = VirtualDM(
+        config=GameConfig(llm_provider="mock", enable_narration=True, load_content=False),
+        initial_state=GameState.WILDERNESS_TRAVEL,
+        game_date=GameDate(year=1, month=6, day=15),
+        game_time=GameTime(hour=10, minute=0),
+    )
+    dm.dm_agent._llm._client.set_responses(["Mist drifts between the standing stones."])
+    facade = ConversationFacade(dm)
+
+    def narrating_action(action_id, params=None):
+        result = dm.dm_agent.describe_location(
+            location=LocationState(
+                location_type=LocationType.HEX,
+                location_id="0705",
+                name="Fogmire Edge",
+                terrain="swamp",
+            )
+        )
+        return facade._response([ChatMessage("dm", result.content)])
+
+    facade.handle_action = narrating_action
+    yield facade
+    DiceRoller.clear_roll_log()
+
+
+def test_action_streaming_delivers_chunks(facade):
+    chunks = []
+    turn = facade.handle_action_streaming("test:narrate", on_chunk=chunks.append)
+
+    assert "".join(c.text for c in chunks) == "Mist drifts between the standing stones."
+    assert turn.streamed_narration == [turn.messages[0].content]
+    assert turn.to_dict()["streamed_narration"] == turn.streamed_narration
+    assert facade.dm.dm_agent._stream_sink is None
+
+
+def test_foundry_sink_emits_chunk_events(facade):
+    bridge = FoundryBridge(facade.dm)
+    facade.handle_action_streaming("test:narrate", on_chunk=bridge.narration_sink())
+
+    events = bridge.clear_pending_events()
+    assert events and all(e.event_type.value == "narration_chunk" for e in events)
+    assert events[-1].data["done"] is True
@@ -229,6 +229,22 @@ class TestActionRegistryExecution:
         if result.get("success"):
             assert offline_dm.current_state == GameState.DUNGEON_EXPLORATION
 
+    def test_registry_moves_lore_context_into_dungeon(self, seeded_dice):
+        """Entering via the registry should drop hex lore cached by the DM agent."""
+        reset_registry()
+        dm = VirtualDM(
+            config=GameConfig(llm_provider="mock", load_content=False, use_vector_db=False),
+            initial_state=GameState.WILDERNESS_TRAVEL,
+        )
+        dm.dm_agent.set_lore_location("0709")
+
+        result = get_default_registry().execute(
+            dm, "wilderness:enter_dungeon", {"dungeon_id": "test_dungeon"}
+        )
+
+        assert result.get("success")
+        assert dm.dm_agent.get_lore_status()["lore_cache"]["location"] == "test_dungeon"
+
     def test_registry_validates_state(self, offline_dm):
         """Registry should reject action if not in required state."""
         reset_registry()
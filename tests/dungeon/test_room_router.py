@@ -0,0 +1,138 @@
+"""
+Tests for fast travel routing over explored dungeon rooms (p162).
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.dungeon.dungeon_engine import (
+    DoorState,
+    DungeonActionType,
+    DungeonEngine,
+    DungeonRoom,
+    DungeonRoute,
+    DungeonRouter,
+    DungeonState,
+)
+from src.game_state.global_controller import GlobalController
+from src.game_state.state_machine import GameState
+from src.data_models import (
+    DiceRoller,
+    LightSourceType,
+    Location,
+    LocationType,
+    PartyResources,
+    PartyState,
+)
+
+
+def _dungeon() -> DungeonState:
+    """
+    A ring of rooms with a locked shortcut:
+
+        entrance -- hall -- gallery
+            |                  |
+          (locked) -------- vault
+    """
+    state = DungeonState(dungeon_id="ring", current_room="entrance")
+    state.rooms = {
+        "entrance": DungeonRoom(
+            room_id="entrance",
+            exits={"east": "hall", "south": "vault"},
+            doors={"entrance_south": DoorState.LOCKED},
+        ),
+        "hall": DungeonRoom(room_id="hall", exits={"west": "entrance", "east": "gallery"}),
+        "gallery": DungeonRoom(room_id="gallery", exits={"west": "hall", "south": "vault"}),
+        "vault": DungeonRoom(room_id="vault", exits={"north": "gallery", "west": "entrance"}),
+    }
+    state.explored_rooms = set(state.rooms)
+    return state
+
+
+@pytest.fixture
+def mock_controller():
+    controller = MagicMock(spec=GlobalController)
+    controller.party_state = PartyState(
+        location=Location(
+            location_type=LocationType.DUNGEON_ROOM,
+            location_id="entrance",
+            sub_location="ring",
+        ),
+        resources=PartyResources(),
+        active_light_source=LightSourceType.LANTERN,
+        light_remaining_turns=10,
+    )
+    controller.current_state = GameState.DUNGEON_EXPLORATION
+    controller.get_party_speed.return_value = 30
+    controller.advance_time.return_value = {}
+    return controller
+
+
+@pytest.fixture
+def engine(mock_controller):
+    DiceRoller.set_seed(42)
+    engine = DungeonEngine(controller=mock_controller)
+    engine._dungeon_state = _dungeon()
+    return engine
+
+
+class TestDungeonRouter:
+    def test_routes_around_locked_door(self):
+        state = _dungeon()
+        route = DungeonRouter().find_route(state, "entrance", "vault")
+        assert route.rooms == ["entrance", "hall", "gallery", "vault"]
+        assert route.turns == 3
+
+    def test_unexplored_and_secret_exits_are_not_used(self):
+        state = _dungeon()
+        router = DungeonRouter()
+        state.explored_rooms.discard("gallery")
+        assert router.find_route(state, "entrance", "vault") is None
+
+        state.explored_rooms.add("gallery")
+        state.rooms["hall"].doors["east"] = DoorState.SECRET
+        state.map_version += 1
+        assert router.find_route(state, "entrance", "vault") is None
+
+    def test_cache_invalidated_when_door_opens(self):
+        state = _dungeon()
+        router = DungeonRouter()
+        assert router.find_route(state, "entrance", "vault").turns == 3
+
+        state.rooms["entrance"].doors["entrance_south"] = DoorState.OPEN
+        assert router.find_route(state, "entrance", "vault").turns == 3  # Stale until bumped
+        state.map_version += 1
+        assert router.find_route(state, "entrance", "vault").rooms == ["entrance", "vault"]
+
+    def test_wandering_check_turns(self):
+        route = DungeonRoute(rooms=["a", "b", "c", "d", "e", "f"], turns=5)
+        assert route.wandering_check_turns(0, 2) == [2, 4]
+        assert route.wandering_check_turns(1, 2) == [1, 3, 5]
+        assert DungeonRoute(rooms=["a", "b"], turns=1).wandering_check_turns(0, 2) == []
+
+
+class TestFastTravelRouting:
+    def test_destination_only_uses_shortest_route(self, engine):
+        plan = engine.plan_fast_travel("vault")
+        assert plan["route"] == ["entrance", "hall", "gallery", "vault"]
+        assert plan["wandering_check_turns"] == [2]
+
+        engine._dungeon_state.alert_level = -10  # Checks cannot trigger
+        result = engine.execute_turn(DungeonActionType.FAST_TRAVEL, {"destination": "vault"})
+        assert result.action_result["success"]
+        assert result.action_result["route"] == plan["route"]
+        assert result.action_result["wandering_checks"] == 1
+        assert engine._dungeon_state.current_room == "vault"
+
+    def test_invalidate_routes_after_direct_edit(self, engine):
+        engine.find_route("vault")  # Prime the cache
+        engine._dungeon_state.rooms["entrance"].doors["entrance_south"] = DoorState.CLOSED
+        engine.invalidate_routes()
+        assert engine.find_route("vault").rooms == ["entrance", "vault"]
+
+    def test_explicit_route_through_locked_door_rejected(self, engine):
+        result = engine.execute_turn(
+            DungeonActionType.FAST_TRAVEL, {"route": ["entrance", "vault"]}
+        )
+        assert not result.action_result["success"]
+        assert "No open passage" in result.action_result["message"]
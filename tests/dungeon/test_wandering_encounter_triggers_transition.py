@@ -336,3 +336,57 @@ class TestDungeonSurpriseRules:
 
         # Verify 1d4 was used (mutual surprise distance)
         mock_distance.assert_called_with("1d4", "dungeon distance (mutual surprise)")
+
+
+class TestBatchedWanderingChecks:
+    """Test that a span of Turns resolves like checking Turn by Turn."""
+
+    @staticmethod
+    def _turn_by_turn(engine, turns):
+        """Reference: one check roll per interval, stopping at the first encounter."""
+        threshold = 1 + engine._dungeon_state.alert_level
+        for turn in range(1, turns + 1):
+            engine._turns_since_check += 1
+            if engine._turns_since_check >= engine._wandering_check_interval:
+                engine._turns_since_check = 0
+                if DiceRoller.roll_d6(1, "check").total <= threshold:
+                    return turn
+        return None
+
+    @pytest.mark.parametrize("seed", range(12))
+    @pytest.mark.parametrize("since_check", [0, 1])
+    def test_matches_turn_by_turn(self, dungeon_engine, seed, since_check):
+        dungeon_engine._turns_since_check = since_check
+        DiceRoller.set_seed(seed)
+        expected = self._turn_by_turn(dungeon_engine, 15)
+        expected_since = dungeon_engine._turns_since_check
+        expected_next = DiceRoller.roll_d6(1, "next").total
+
+        dungeon_engine._turns_since_check = since_check
+        DiceRoller.set_seed(seed)
+        assert dungeon_engine._resolve_wandering_checks(15) == expected
+        assert dungeon_engine._turns_since_check == expected_since
+        assert DiceRoller.roll_d6(1, "next").total == expected_next
+
+    def test_span_without_check_draws_nothing(self, dungeon_engine):
+        dungeon_engine._turns_since_check = 0
+        with patch.object(dungeon_engine.dice, "roll_until") as mock_roll:
+            assert dungeon_engine._resolve_wandering_checks(1) is None
+        mock_roll.assert_not_called()
+        assert dungeon_engine._turns_since_check == 1
+
+    def test_fast_travel_stops_at_encounter(self, dungeon_engine, mock_controller):
+        state = dungeon_engine._dungeon_state
+        for room_id, next_id in [("entrance", "a"), ("a", "b"), ("b", "c"), ("c", "d")]:
+            state.rooms.setdefault(room_id, DungeonRoom(room_id=room_id)).exits["on"] = next_id
+        state.rooms["d"] = DungeonRoom(room_id="d")
+        state.explored_rooms = set(state.rooms)
+        state.alert_level = 5  # Every check triggers
+
+        result = dungeon_engine._handle_fast_travel({"destination": "d"})
+
+        assert result["encounter"] is True
+        assert result["turns_traveled"] == 2
+        assert state.current_room == "b"
+        assert state.turns_in_dungeon == 2
+        mock_controller.set_encounter.assert_called_once()
@@ -0,0 +1,63 @@
+"""
+Tests for indexing loaded content into lore search at boot.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.main import VirtualDM, GameConfig
+
+
+CONTENT_DIR = Path(__file__).parents[2] / "data" / "content"
+
+
+def _config(tmp_path: Path, **overrides) -> GameConfig:
+    return GameConfig(
+        data_dir=tmp_path,
+        content_dir=CONTENT_DIR,
+        load_content=True,
+        llm_provider="mock",
+        local_embeddings=True,
+        **overrides,
+    )
+
+
+@pytest.mark.skipif(not CONTENT_DIR.exists(), reason="Content directory not available")
+class TestBootLoreIndexing:
+    def test_loaded_hexes_indexed_in_background(self, tmp_path):
+        dm = VirtualDM(_config(tmp_path))
+
+        assert dm.wait_for_lore_indexing(timeout=30)
+        hex_count = len(dm.hex_crawl.get_all_hex_data())
+        assert dm._lore_retriever.last_bulk_result.indexed == hex_count > 0
+        assert dm._lore_retriever.get_statistics()["total_documents"] == hex_count
+
+    def test_lore_cached_during_indexing_is_dropped(self, tmp_path):
+        dm = VirtualDM(_config(tmp_path))
+        assert dm.wait_for_lore_indexing(timeout=30)
+        dm.dm_agent._lore_cache[("stale",)] = []  # Looked up mid-index
+
+        dm._index_lore_content()
+        assert dm.wait_for_lore_indexing(timeout=30)
+        assert dm.dm_agent.get_lore_status()["lore_cache"]["entries"] == 0
+
+    def test_index_persisted_and_reloaded_at_next_boot(self, tmp_path):
+        dm = VirtualDM(_config(tmp_path))
+        assert dm.wait_for_lore_indexing(timeout=30)
+        hex_count = len(dm.hex_crawl.get_all_hex_data())
+        assert (tmp_path / "vector_store").is_dir()
+
+        # The saved store is loaded, so nothing needs embedding again
+        dm = VirtualDM(_config(tmp_path, background_indexing=False))
+        assert dm._lore_retriever.last_bulk_result.indexed == 0
+        assert dm._lore_retriever.last_bulk_result.skipped == hex_count
+
+    def test_foreground_indexing(self, tmp_path):
+        dm = VirtualDM(_config(tmp_path, background_indexing=False))
+        assert dm._lore_retriever._index_thread is None
+        assert dm._lore_retriever.last_bulk_result.indexed > 0
+
+    def test_skip_indexing(self, tmp_path):
+        dm = VirtualDM(_config(tmp_path, skip_indexing=True))
+        assert dm._lore_retriever.last_bulk_result is None
@@ -0,0 +1,100 @@
+"""
+Tests for the compiled keyword matcher used by fallback intent parsing.
+
+Verifies that:
+- The Aho-Corasick automaton finds every (overlapping) keyword hit
+- Hits are word-start aware
+- Compiled pattern tables keep table-order priority
+- Compiled state tables agree with a linear first-match scan
+"""
+
+import pytest
+
+from src.narrative.keyword_matcher import CompiledPatternTable, KeywordAutomaton
+from src.narrative.narrative_resolver import (
+    _COMPILED_STATE_PATTERNS,
+    _STATE_PATTERN_TABLES,
+    UNIVERSAL_PATTERNS,
+)
+
+
+def _linear_first_match(text, *tables):
+    """Reference implementation: first pattern with a word-start keyword hit."""
+    text_lower = text.lower().strip()
+    for table in tables:
+        for keywords, action_id, _, _ in table:
+            for keyword in keywords:
+                start = text_lower.find(keyword)
+                while start != -1:
+                    if start == 0 or not (text_lower[start - 1].isalnum() or text_lower[start - 1] in "_'"):
+                        return action_id
+                    start = text_lower.find(keyword, start + 1)
+    return None
+
+
+class TestKeywordAutomaton:
+    """Tests for the raw automaton."""
+
+    def test_finds_overlapping_keywords(self):
+        automaton = KeywordAutomaton([(k, k) for k in ("he", "she", "his", "hers")])
+        hits = sorted((s, e, p) for s, e, p in automaton.find_all("ushers", word_start=False))
+        assert hits == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+    def test_word_start_filter(self):
+        automaton = KeywordAutomaton([("run", "run"), ("hunt", "hunt")])
+        assert list(automaton.find_all("a late brunch")) == []
+        assert [p for _, _, p in automaton.find_all("go hunting")] == ["hunt"]
+        assert [p for _, _, p in automaton.find_all("run!")] == ["run"]
+
+    def test_multiword_keywords(self):
+        automaton = KeywordAutomaton([("make camp", 1), ("camp", 2)])
+        assert sorted(p for _, _, p in automaton.find_all("we make camp")) == [1, 2]
+
+
+class TestCompiledPatternTable:
+    """Tests for table-order priority."""
+
+    def test_earlier_pattern_wins(self):
+        table = CompiledPatternTable(
+            [
+                (("ask fate",), "social:oracle_question", None, 0.85),
+                (("ask", "say"), "social:say", None, 0.95),
+            ]
+        )
+        assert table.match("I ask fate about it")[0] == "social:oracle_question"
+        assert table.match("I ask the miller")[0] == "social:say"
+
+    def test_extractor_runs_on_original_text(self):
+        table = CompiledPatternTable([(("say",), "social:say", lambda t: {"text": t}, 0.9)])
+        assert table.match("Say Hello") == ("social:say", {"text": "Say Hello"}, 0.9)
+
+    def test_no_match(self):
+        assert CompiledPatternTable(UNIVERSAL_PATTERNS).match("xyzzy") is None
+
+
+class TestStateTables:
+    """Compiled state tables must agree with a linear scan."""
+
+    INPUTS = [
+        "search the room",
+        "make camp for the night",
+        "talk to the woodcutter",
+        "ask the oracle if it rains",
+        "I want to forage for berries",
+        "listen at the door",
+        "flee!",
+        "what time is it",
+        "let's go hunting",
+        "study lore about the drune",
+        "pick the lock",
+        "light torch",
+        "nothing relevant here",
+    ]
+
+    @pytest.mark.parametrize("state", sorted(_STATE_PATTERN_TABLES))
+    def test_matches_linear_scan(self, state):
+        compiled = _COMPILED_STATE_PATTERNS[state]
+        for text in self.INPUTS:
+            found = compiled.best_match(text)
+            expected = _linear_first_match(text, _STATE_PATTERN_TABLES[state], UNIVERSAL_PATTERNS)
+            assert (found.action_id if found else None) == expected, (state, text)
@@ -0,0 +1,124 @@
+"""
+Tests for the offline narration benchmark and simulated mock latency.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from src.ai.llm_provider import (
+    LLMConfig,
+    LLMMessage,
+    LLMProvider,
+    LLMRole,
+    MockLatencyProfile,
+    MockLLMClient,
+)
+from src.observability.benchmark import (
+    BenchmarkScenario,
+    BenchmarkTurn,
+    TurnRecorder,
+    main,
+    percentile,
+    run_benchmark,
+)
+
+SAMPLE_SCENARIO = Path(__file__).parents[2] / "data" / "benchmarks" / "wilderness_turns.json"
+
+
+def _client(profile: MockLatencyProfile) -> MockLLMClient:
+    return MockLLMClient(LLMConfig(provider=LLMProvider.MOCK, mock_profile=profile))
+
+
+def _ask(client: MockLLMClient):
+    return client.complete([LLMMessage(role=LLMRole.USER, content="Describe the hex")], "system")
+
+
+class TestMockLatencyProfile:
+    def test_latency_is_applied(self):
+        client = _client(MockLatencyProfile(latency_ms=30))
+        started = time.perf_counter()
+        response = _ask(client)
+        assert (time.perf_counter() - started) >= 0.025
+        assert response.authority_violations == []
+        assert client.calls == 1
+
+    def test_failure_rate_is_seeded(self):
+        def failures(seed: int) -> list[bool]:
+            client = _client(MockLatencyProfile(failure_rate=0.5, seed=seed))
+            return [bool(_ask(client).authority_violations) for _ in range(40)]
+
+        first = failures(7)
+        assert first == failures(7)
+        assert 0 < sum(first) < 40
+
+    def test_certain_failure_breaks_stream(self):
+        client = _client(MockLatencyProfile(failure_rate=1.0))
+        with pytest.raises(RuntimeError):
+            list(client.stream([LLMMessage(role=LLMRole.USER, content="hi")], "system"))
+
+
+class TestScenarioRecording:
+    def test_recorder_round_trip(self, tmp_path):
+        class FakeFacade:
+            def handle_chat(self, text, **kwargs):
+                return text
+
+            def handle_action(self, action_id, params=None):
+                return action_id
+
+        recorder = TurnRecorder(FakeFacade())
+        recorder.handle_action("wilderness:travel", {"hex_id": "0102"})
+        recorder.handle_chat("search the area")
+
+        path = tmp_path / "scenario.json"
+        recorder.scenario("recorded", seed=5).save(path)
+        loaded = BenchmarkScenario.load(path)
+
+        assert loaded.seed == 5
+        assert loaded.turns == [
+            BenchmarkTurn(action_id="wilderness:travel", params={"hex_id": "0102"}),
+            BenchmarkTurn(text="search the area"),
+        ]
+
+    def test_percentile_interpolates(self):
+        assert percentile([], 95) == 0.0
+        assert percentile([5.0], 99) == 5.0
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+        assert percentile([10.0, 0.0, 20.0], 100) == 20.0
+
+
+class TestRunBenchmark:
+    def test_sample_scenario_reports_metrics(self):
+        scenario = BenchmarkScenario.load(SAMPLE_SCENARIO)
+        results = run_benchmark(scenario, repeat=2)
+
+        assert results["turns"] == 2 * len(scenario.turns)
+        assert set(results["turn_latency_ms"]) >= {"p50", "p95", "p99"}
+        assert results["llm_calls_per_turn"]["total"] > 0
+        assert results["response_cache"]["hits"] + results["response_cache"]["misses"] > 0
+        assert results["validator"]["calls"] > 0
+        assert results["llm_failures"] == 0
+
+        # Each repetition replays the same turns with the same dice
+        n = len(scenario.turns)
+        first, second = results["per_turn"][:n], results["per_turn"][n:]
+        assert [t["llm_calls"] for t in first] == [t["llm_calls"] for t in second]
+
+    def test_streaming_records_first_chunk(self):
+        scenario = BenchmarkScenario(
+            name="travel",
+            turns=[BenchmarkTurn(action_id="wilderness:travel", params={"hex_id": "0102"})],
+        )
+        results = run_benchmark(scenario, streaming=True)
+        assert results["first_chunk_ms"]["max"] > 0
+
+    def test_cli_writes_json(self, tmp_path):
+        output = tmp_path / "results.json"
+        assert main([str(SAMPLE_SCENARIO), "--summary", "--output", str(output)]) == 0
+
+        results = json.loads(output.read_text())
+        assert results["scenario"] == "wilderness_turns"
+        assert "per_turn" not in results
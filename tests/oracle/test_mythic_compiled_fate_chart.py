@@ -0,0 +1,96 @@
+"""
+Tests for the compiled Mythic Fate Chart and fate_check_batch.
+
+Verifies that:
+- The flat outcome table agrees with FATE_CHART thresholds and the doubles rule
+- fate_check_batch matches sequential fate_check calls under the same seed
+- FactionOracle.fate_check_batch records the same events as fate_check
+"""
+
+import random
+
+from src.factions.faction_oracle import FactionOracle
+from src.oracle.mythic_gme import (
+    FATE_CHART,
+    FateResult,
+    Likelihood,
+    MythicGME,
+    fate_outcome,
+)
+
+
+def _reference_result(roll, thresholds):
+    ex_yes, yes, no, ex_no = thresholds
+    if roll <= ex_yes:
+        return FateResult.EXCEPTIONAL_YES
+    if roll <= yes:
+        return FateResult.YES
+    if roll > ex_no:
+        return FateResult.EXCEPTIONAL_NO
+    if roll > no:
+        return FateResult.NO
+    return FateResult.YES
+
+
+class TestCompiledFateChart:
+    """The compiled table must agree with the source chart everywhere."""
+
+    def test_every_cell_matches_chart(self):
+        for chaos in range(1, 10):
+            for likelihood in Likelihood:
+                thresholds = FATE_CHART[chaos][likelihood]
+                for roll in range(1, 101):
+                    result, _ = fate_outcome(chaos, likelihood, roll)
+                    assert result == _reference_result(roll, thresholds)
+
+    def test_event_flag_is_doubles_within_chaos(self):
+        assert fate_outcome(5, Likelihood.FIFTY_FIFTY, 55)[1] is True
+        assert fate_outcome(5, Likelihood.FIFTY_FIFTY, 66)[1] is False
+        assert fate_outcome(9, Likelihood.FIFTY_FIFTY, 99)[1] is True
+        assert fate_outcome(9, Likelihood.FIFTY_FIFTY, 100)[1] is False
+        assert fate_outcome(9, Likelihood.FIFTY_FIFTY, 12)[1] is False
+
+
+class TestFateCheckBatch:
+    """Batch checks must be identical to stepping one check at a time."""
+
+    QUESTIONS = [
+        ("Is the bridge guarded?", Likelihood.LIKELY),
+        ("Does the witch notice?", Likelihood.UNLIKELY),
+        ("Is it raining?", Likelihood.FIFTY_FIFTY),
+    ] * 20
+
+    def test_batch_matches_sequential(self):
+        single = MythicGME(chaos_factor=9, rng=random.Random(7))
+        expected = [single.fate_check(q, lk) for q, lk in self.QUESTIONS]
+
+        batched = MythicGME(chaos_factor=9, rng=random.Random(7))
+        actual = batched.fate_check_batch(self.QUESTIONS)
+
+        assert [(r.roll, r.result, r.random_event_triggered) for r in actual] == [
+            (r.roll, r.result, r.random_event_triggered) for r in expected
+        ]
+        assert [str(r.random_event) for r in actual] == [str(r.random_event) for r in expected]
+
+    def test_batch_without_events(self):
+        mythic = MythicGME(chaos_factor=9, rng=random.Random(3))
+        results = mythic.fate_check_batch(self.QUESTIONS, check_for_event=False)
+        assert not any(r.random_event_triggered for r in results)
+
+    def test_faction_oracle_batch_matches_sequential(self, seeded_dice):
+        questions = self.QUESTIONS[:6]
+        oracle = FactionOracle()
+        expected = [
+            oracle.fate_check(q, lk, date="1-1-1", faction_id="f", tag="t").to_dict()
+            for q, lk in questions
+        ]
+
+        seeded_dice.set_seed(42)
+        batch_oracle = FactionOracle()
+        actual = [
+            e.to_dict()
+            for e in batch_oracle.fate_check_batch(questions, date="1-1-1", faction_id="f", tag="t")
+        ]
+
+        assert actual == expected
+        assert batch_oracle.state.total_events == len(questions)
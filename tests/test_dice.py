@@ -204,3 +204,65 @@ class TestDiceStatistics:
             result = clean_dice.roll("1d6", "range check")
             assert isinstance(result.total, int), "roll().total should be an int"
             assert 1 <= result.total <= 6, f"1d6 total should be 1-6, got {result.total}"
+
+
+class TestAggregateRolls:
+    """Tests for single-draw multi-day rolls (roll_sum, trials_until)."""
+
+    def test_roll_sum_single_log_entry(self, seeded_dice):
+        """A 90-die sum is one draw and one summarizing log entry."""
+        seeded_dice.clear_roll_log()
+        result = seeded_dice.roll_sum(90, 3, "recuperation")
+        assert result.notation == "90d3"
+        assert 90 <= result.total <= 270
+        assert result.rolls == [result.total]
+        assert len(seeded_dice.get_roll_log()) == 1
+
+    def test_roll_sum_zero_dice(self, seeded_dice):
+        assert seeded_dice.roll_sum(0, 3).total == 0
+
+    def test_roll_sum_matches_per_die_distribution(self, clean_dice):
+        """Exact 2d6 probabilities hold for the aggregate draw."""
+        DiceRoller.set_seed(7)
+        with DiceRoller.quiet():
+            results = [DiceRoller.roll_sum(2, 6).total for _ in range(6000)]
+        assert set(results) == set(range(2, 13))
+        # 6/36 of rolls are 7, 1/36 are 2
+        assert 850 <= results.count(7) <= 1150
+        assert 100 <= results.count(2) <= 240
+
+        with DiceRoller.quiet():
+            totals = [DiceRoller.roll_sum(30, 3).total for _ in range(2000)]
+        mean = sum(totals) / len(totals)
+        variance = sum((t - mean) ** 2 for t in totals) / len(totals)
+        assert 59.5 <= mean <= 60.5  # 30 * 2
+        assert 17 <= variance <= 23  # 30 * 2/3
+
+    def test_trials_until_edge_cases(self, seeded_dice):
+        assert seeded_dice.trials_until(20, 20, 5) == 1
+        assert seeded_dice.trials_until(0, 20, 5) is None
+        assert seeded_dice.trials_until(6, 20, 0) is None
+
+    def test_trials_until_is_geometric(self, clean_dice):
+        """First success on 15+ (d20) matches the per-day loop odds."""
+        DiceRoller.set_seed(11)
+        with DiceRoller.quiet():
+            results = [DiceRoller.trials_until(6, 20, 3) for _ in range(4000)]
+        # P(day 1) = 0.3, P(day 2) = 0.21, P(no success in 3 days) = 0.343
+        assert 1080 <= results.count(1) <= 1320
+        assert 720 <= results.count(2) <= 960
+        assert 1250 <= results.count(None) <= 1500
+        assert all(r is None or 1 <= r <= 3 for r in results)
+
+    def test_roll_until_uses_same_stream(self, clean_dice):
+        """Batched rolls match separate 1d6 rolls and log once."""
+        DiceRoller.set_seed(3)
+        separate = [DiceRoller.roll_d6(1).total for _ in range(20)]
+
+        DiceRoller.set_seed(3)
+        DiceRoller.clear_roll_log()
+        batched = DiceRoller.roll_until(6, lambda value: value == 6, 20, "segments")
+        assert batched.rolls == separate[: len(batched.rolls)]
+        assert batched.total == batched.rolls[-1]
+        assert batched.total == 6 or len(batched.rolls) == 20
+        assert len(DiceRoller.get_roll_log()) == 1
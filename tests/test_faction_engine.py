@@ -10,6 +10,7 @@ Step 2 acceptance criteria:
 """
 
 import pytest
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
@@ -411,6 +412,56 @@ class TestWeeklyCadence:
         assert engine.cycles_completed == 3
 
 
+class TestFastForward:
+    """Tests for headless multi-cycle fast-forward."""
+
+    def _content_engine(self) -> FactionEngine:
+        content_root = Path(__file__).parent.parent / "data" / "content"
+        loader = FactionLoader(content_root)
+        loader.load_all()
+        return FactionEngine(rules=loader.rules, definitions=loader.definitions)
+
+    def test_matches_stepping_one_cycle_at_a_time(self):
+        stepped = self._content_engine()
+        DiceRoller.set_seed(7)
+        for _ in range(104):
+            stepped.run_cycle()
+
+        fast = self._content_engine()
+        DiceRoller.set_seed(7)
+        summary = fast.fast_forward(cycles=104)
+
+        assert summary.cycles_run == 104
+        assert fast.cycles_completed == stepped.cycles_completed
+        assert fast.to_dict()["faction_states"] == stepped.to_dict()["faction_states"]
+        assert sum(summary.actions_completed.values()) > 0
+        assert summary.levels == {
+            fid: stepped.get_faction_level(fid) for fid in stepped.faction_states
+        }
+
+    def test_defers_callbacks_and_roll_logging(self, engine: FactionEngine):
+        calls = []
+        engine.register_cycle_callback(calls.append)
+        DiceRoller.clear_roll_log()
+        DiceRoller.set_seed(42)
+
+        summary = engine.fast_forward(cycles=20)
+
+        assert calls == []
+        assert DiceRoller.get_roll_log() == []
+        assert summary.start_cycle == 0
+        assert summary.end_cycle == engine.cycles_completed == 20
+
+    def test_days_keep_remainder(self, engine: FactionEngine):
+        engine.on_days_advanced(3)
+        DiceRoller.set_seed(42)
+
+        summary = engine.fast_forward(days=365)
+
+        assert summary.cycles_run == 52
+        assert engine.days_accumulated == (3 + 365) % 7
+
+
 # =============================================================================
 # PROGRESS RULES TESTS
 # =============================================================================
@@ -590,6 +641,40 @@ class TestTerritoryAndLevels:
         # Level 2 => 1 action per turn
         assert actions == 1
 
+    def test_stats_cached_until_territory_changes(self, engine: FactionEngine):
+        """Test cached stats are reused, then refreshed by a territory edit."""
+        engine.verify_stats = True
+        first = engine.get_faction_stats("test_faction")
+        assert first.territory_points == 4
+        assert engine.get_faction_stats("test_faction") is first
+
+        engine.faction_states["test_faction"].territory.domains.add("marsh")
+        updated = engine.get_faction_stats("test_faction")
+        assert updated.territory_points == 8
+        assert updated.level == 3
+        assert engine.get_actions_per_turn("test_faction") == 2
+
+    def test_stats_refresh_on_rules_change(self, engine: FactionEngine, sample_rules):
+        """Test that replacing the rules invalidates cached stats."""
+        assert engine.get_faction_level("test_faction") == 2
+
+        engine.set_rules(replace(sample_rules, territory_points_to_level={1: 0, 2: 10}))
+        assert engine.get_faction_level("test_faction") == 1
+
+    def test_verify_stats_detects_stale_cache(self, engine: FactionEngine):
+        """Test debug mode catches edits the cache cannot see."""
+        engine.verify_stats = True
+        state = engine.faction_states["test_faction"]
+        state.territory.custom_points["town_a"] = 1
+        engine.get_faction_stats("test_faction")
+
+        state.territory.custom_points["town_a"] = 5
+        with pytest.raises(RuntimeError, match="Stale faction stats"):
+            engine.get_faction_stats("test_faction")
+
+        state.invalidate_stats()
+        assert engine.get_faction_stats("test_faction").territory_points == 9
+
     def test_level_4_gets_2_actions(self, sample_rules: FactionRules):
         """Test that level 4 faction gets 2 actions per turn."""
         definition = FactionDefinition(
@@ -619,6 +704,97 @@ class TestTerritoryAndLevels:
         assert actions == 2
 
 
+# =============================================================================
+# TERRITORY INDEX TESTS
+# =============================================================================
+
+
+class TestTerritoryIndex:
+    """Tests for the territory ownership reverse index."""
+
+    @pytest.fixture
+    def rival_engine(
+        self, sample_rules: FactionRules, sample_definition: FactionDefinition
+    ) -> FactionEngine:
+        """Engine with a second faction holding its own hex and stronghold."""
+        rival = FactionDefinition(
+            faction_id="rival",
+            name="Rival",
+            home_territory=HomeTerritory(hexes=["2001"], strongholds=["keep"]),
+        )
+        definitions = {sample_definition.faction_id: sample_definition, "rival": rival}
+        return FactionEngine(rules=sample_rules, definitions=definitions)
+
+    def _claim(self, engine: FactionEngine, faction_id: str, **data: str) -> EffectResult:
+        context = {
+            "all_faction_states": engine.faction_states,
+            "rules": engine.rules,
+        }
+        return engine.effects_interpreter.apply_effect(
+            EffectCommand(type="claim_territory", data=data),
+            engine.faction_states[faction_id],
+            None,
+            context,
+        )
+
+    def test_index_built_from_home_territory(self, rival_engine: FactionEngine):
+        assert rival_engine.get_territory_holder("hex", "1001") == "test_faction"
+        assert rival_engine.get_territory_holder("settlement", "town_a") == "test_faction"
+        assert rival_engine.get_territory_holder("stronghold", "keep") == "rival"
+        assert rival_engine.get_territory_holder("hex", "9999") is None
+        assert rival_engine.check_territory_index() == []
+
+    def test_contested_claim_moves_holder(self, rival_engine: FactionEngine):
+        # No oracle configured, so the attacker wins the contest
+        self._claim(rival_engine, "test_faction", hex="2001", stronghold="keep")
+
+        assert rival_engine.get_territory_holder("hex", "2001") == "test_faction"
+        assert rival_engine.get_territory_holder("stronghold", "keep") == "test_faction"
+        assert "2001" not in rival_engine.faction_states["rival"].territory.hexes
+        assert rival_engine.check_territory_index() == []
+
+    def test_cede_releases_territory(self, rival_engine: FactionEngine):
+        rival_engine.effects_interpreter.apply_effect(
+            EffectCommand(type="cede_territory", data={"hex": "2001"}),
+            rival_engine.faction_states["rival"],
+        )
+
+        assert rival_engine.get_territory_holder("hex", "2001") is None
+        assert rival_engine.check_territory_index() == []
+
+    def test_cede_by_non_holder_keeps_holder(self, rival_engine: FactionEngine):
+        rival_engine.effects_interpreter.apply_effect(
+            EffectCommand(type="cede_territory", data={"hex": "2001"}),
+            rival_engine.faction_states["test_faction"],
+        )
+
+        assert rival_engine.get_territory_holder("hex", "2001") == "rival"
+
+    def test_direct_edits_detected_until_rebuild(self, rival_engine: FactionEngine):
+        rival_engine.faction_states["rival"].territory.domains.add("marsh")
+        rival_engine.faction_states["rival"].territory.hexes.add("1001")
+
+        problems = rival_engine.check_territory_index()
+        assert any("marsh" in p for p in problems)
+        assert any("held by both" in p for p in problems)
+
+        rival_engine.faction_states["rival"].territory.hexes.discard("1001")
+        rival_engine.rebuild_territory_index()
+        assert rival_engine.get_territory_holder("domain", "marsh") == "rival"
+        assert rival_engine.check_territory_index() == []
+
+    def test_from_dict_rebuilds_index(self, rival_engine: FactionEngine):
+        self._claim(rival_engine, "rival", settlement="town_a")
+        data = rival_engine.to_dict()
+
+        restored = FactionEngine(rules=rival_engine.rules, definitions=rival_engine.definitions)
+        assert restored.get_territory_holder("settlement", "town_a") == "test_faction"
+
+        restored.from_dict(data)
+        assert restored.get_territory_holder("settlement", "town_a") == "rival"
+        assert restored.check_territory_index() == []
+
+
 # =============================================================================
 # PERSISTENCE TESTS
 # =============================================================================
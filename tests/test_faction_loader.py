@@ -26,6 +26,7 @@ from src.factions import (
     QuestTemplate,
     # Loaders
     FactionLoader,
+    FactionRelations,
     FactionRelationsLoader,
     FactionAdventurerProfilesLoader,
 )
@@ -301,6 +302,55 @@ class TestFactionRelationshipsLoad:
         assert sentiment == "neutral"
 
 
+class TestCompiledRelationMatrix:
+    """Tests for the precompiled relation matrix and neighbor lists."""
+
+    @pytest.fixture
+    def relations(self, faction_loader: FactionLoader, relations_loader: FactionRelationsLoader):
+        faction_loader.load_all()
+        return relations_loader.load(faction_loader.definitions)
+
+    def test_matrix_matches_uncompiled_resolution(self, relations):
+        ids = list(relations._id_index)
+        assert ids
+        for a in ids:
+            for b in ids:
+                assert relations.get_relation(a, b) == relations._resolve_relation(a, b)
+
+    def test_neighbors_sorted_by_score(self, relations):
+        neighbors = relations.get_neighbors("drune")
+        assert ("pluritine_church", relations.get_score("drune", "pluritine_church")) in neighbors
+        scores = [score for _, score in neighbors]
+        assert scores == sorted(scores, reverse=True)
+        assert all(other not in relations.groups for other, _ in neighbors)
+
+    def test_set_relation_updates_incrementally(
+        self, relations, faction_loader: FactionLoader, relations_loader: FactionRelationsLoader
+    ):
+        relations.set_relation("drune", "pluritine_church", 40, sentiment="wary")
+        relations.set_relation("human_nobility", "drune", -60)
+
+        assert relations.get_score("pluritine_church", "drune") == 40
+        assert relations.get_sentiment("drune", "pluritine_church") == "wary"
+        assert ("pluritine_church", 40) in relations.get_neighbors("drune")
+
+        # Incremental updates agree with compiling the changed relations from scratch
+        rebuilt = FactionRelations(
+            relations.relations, relations.groups, faction_loader.definitions
+        )
+        for a in rebuilt._id_index:
+            for b in rebuilt._id_index:
+                assert relations.get_relation(a, b) == rebuilt.get_relation(a, b)
+            assert relations.get_neighbors(a) == rebuilt.get_neighbors(a)
+
+    def test_set_relation_with_new_id(self, relations):
+        relations.set_relation("drune", "wandering_pedlars", -10, sentiment="suspicious")
+
+        assert relations.get_score("wandering_pedlars", "drune") == -10
+        assert ("wandering_pedlars", -10) in relations.get_neighbors("drune")
+        assert relations.get_all_relations_for("wandering_pedlars")[0].score == -10
+
+
 # =============================================================================
 # ADVENTURER PROFILES TESTS
 # =============================================================================
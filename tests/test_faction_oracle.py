@@ -29,9 +29,11 @@ from src.factions.faction_models import (
     FactionTurnState,
     PartyFactionState,
     ActionTemplate,
+    Relation,
     Territory,
 )
 from src.factions.faction_engine import FactionEngine
+from src.factions.faction_relations import FactionRelations
 
 
 # =============================================================================
@@ -654,6 +656,36 @@ class TestContestedTerritoryOracle:
         assert oracle_event["kind"] == "fate_check"
         assert oracle_event["tag"] == "contested_territory"
 
+    def test_contested_claim_uses_relationship_score(self, two_faction_engine):
+        """Test that the relationship score (not the Relation) feeds the contest."""
+        engine = two_faction_engine
+        attacker_state = engine.faction_states["attacker"]
+
+        from src.factions.faction_effects import FactionEffectsInterpreter
+        from src.factions.faction_models import EffectCommand
+
+        relations = FactionRelations([Relation("attacker", "defender", -100, "hate")], {})
+        effects = FactionEffectsInterpreter()
+        effect = EffectCommand(type="claim_territory", data={"hex": "0604"})
+
+        context = {
+            "date": "1420-05-15",
+            "faction_id": "attacker",
+            "oracle": engine.oracle,
+            "all_faction_states": engine.faction_states,
+            "relations": relations,
+            "rules": engine.rules,
+        }
+
+        oracle = engine.oracle
+        with patch.object(
+            oracle, "determine_contest_likelihood", wraps=oracle.determine_contest_likelihood
+        ) as likelihood:
+            result = effects.apply_effect(effect, attacker_state, None, context)
+
+        assert result.success is True
+        assert likelihood.call_args.kwargs["relationship_score"] == -100
+
     def test_contested_claim_winner_gets_territory(self, two_faction_engine):
         """Test that contest winner gets territory."""
         engine = two_faction_engine
@@ -667,14 +699,14 @@ class TestContestedTerritoryOracle:
         effect = EffectCommand(type="claim_territory", data={"hex": "0604"})
 
         # Force oracle to return yes (attacker wins)
-        with patch.object(engine.oracle, 'fate_check') as mock_fate:
+        with patch.object(engine.oracle, 'fate_check_batch') as mock_fate:
             mock_event = OracleEvent(
                 kind=OracleEventKind.FATE_CHECK,
                 date="1420-05-15",
                 tag="contested_territory",
                 result="yes",
             )
-            mock_fate.return_value = mock_event
+            mock_fate.return_value = [mock_event]
 
             context = {
                 "date": "1420-05-15",
@@ -704,14 +736,14 @@ class TestContestedTerritoryOracle:
         effect = EffectCommand(type="claim_territory", data={"hex": "0604"})
 
         # Force oracle to return no (defender wins)
-        with patch.object(engine.oracle, 'fate_check') as mock_fate:
+        with patch.object(engine.oracle, 'fate_check_batch') as mock_fate:
             mock_event = OracleEvent(
                 kind=OracleEventKind.FATE_CHECK,
                 date="1420-05-15",
                 tag="contested_territory",
                 result="no",
             )
-            mock_fate.return_value = mock_event
+            mock_fate.return_value = [mock_event]
 
             context = {
                 "date": "1420-05-15",
@@ -730,6 +762,43 @@ class TestContestedTerritoryOracle:
         # Description mentions failure
         assert "failed to claim" in result.description
 
+    def test_multiple_contests_resolved_in_one_batch(self, two_faction_engine):
+        """Test that every contested item in one effect goes through one batch call."""
+        engine = two_faction_engine
+        attacker_state = engine.faction_states["attacker"]
+
+        from src.factions.faction_effects import FactionEffectsInterpreter
+        from src.factions.faction_models import EffectCommand
+
+        effects = FactionEffectsInterpreter()
+        effect = EffectCommand(
+            type="claim_territory",
+            data={"hex": "0604", "settlement": "prigwort", "stronghold": "keep"},
+        )
+        context = {
+            "date": "1420-05-15",
+            "faction_id": "attacker",
+            "oracle": engine.oracle,
+            "all_faction_states": engine.faction_states,
+            "rules": engine.rules,
+        }
+
+        oracle = engine.oracle
+        with patch.object(oracle, "fate_check", wraps=oracle.fate_check) as single, patch.object(
+            oracle, "fate_check_batch", wraps=oracle.fate_check_batch
+        ) as batch:
+            result = effects.apply_effect(effect, attacker_state, None, context)
+
+        single.assert_not_called()
+        batch.assert_called_once()
+        questions = batch.call_args.args[0]
+        assert [q for q, _ in questions] == [
+            "Does attacker successfully claim hex 0604 from defender?",
+            "Does attacker successfully claim settlement prigwort from defender?",
+        ]
+        assert len(result.changes["oracle_events"]) == 2
+        assert "keep" in attacker_state.territory.strongholds
+
 
 # =============================================================================
 # Party Work Oracle Twist Tests
@@ -746,3 +746,111 @@ class TestQuestEffects:
         # Standing should not be adjusted for quest effects
         assert manager.get_standing("allied_faction") == 0
         assert manager.get_standing("enemy_faction") == 0
+
+
+# =============================================================================
+# Job Board Index Tests
+# =============================================================================
+
+
+class TestJobBoardIndex:
+    """Tests for the quest template index and per-faction job buckets."""
+
+    @pytest.fixture
+    def profiles(self):
+        """Create real profiles with ranked and located templates."""
+        from src.factions.faction_adventurers import FactionAdventurerProfiles
+
+        return FactionAdventurerProfiles({
+            "nag_lord": AdventurerProfile(
+                faction_or_group_id="nag_lord",
+                quest_templates=[
+                    QuestTemplate(id="inner_circle", title="Inner Circle", min_rank=2),
+                    QuestTemplate(id="errand", title="Errand"),
+                    QuestTemplate(id="trusted", title="Trusted Work", min_rank=1),
+                    QuestTemplate(
+                        id="prigwort_drop", title="Prigwort Drop", settlements=["prigwort"]
+                    ),
+                ],
+            ),
+            "fey_courts": AdventurerProfile(
+                faction_or_group_id="fey_courts",
+                quest_templates=[
+                    QuestTemplate(id="hex_watch", title="Watch the Ring", hexes=["0604"]),
+                    QuestTemplate(
+                        id="hex_secret", title="Secret Rite", hexes=["0604"], min_rank=3
+                    ),
+                ],
+            ),
+            "nag_kin": AdventurerProfile(faction_or_group_id="nag_kin", inherits_from="nag_lord"),
+        })
+
+    @pytest.fixture
+    def manager(self, faction_engine, profiles):
+        return FactionPartyManager(faction_engine, profiles=profiles)
+
+    def test_rank_filter_and_lookup(self, profiles):
+        all_ids = [t.id for t in profiles.list_quest_templates("nag_lord")]
+        assert all_ids == ["errand", "prigwort_drop", "trusted", "inner_circle"]
+        assert [t.id for t in profiles.list_quest_templates("nag_lord", rank=0)] == [
+            "errand",
+            "prigwort_drop",
+        ]
+        assert len(profiles.list_quest_templates("nag_lord", rank=5)) == 4
+        assert profiles.list_quest_templates("unknown", rank=5) == []
+
+        # Inherited templates are indexed under the child profile too
+        assert profiles.get_quest_template("nag_kin", "trusted").title == "Trusted Work"
+        assert profiles.get_quest_template("nag_lord", "missing") is None
+
+    def test_location_index(self, profiles):
+        at_hex = profiles.list_templates_at(hex_id="0604")
+        assert [(owner, t.id) for owner, t in at_hex] == [
+            ("fey_courts", "hex_watch"),
+            ("fey_courts", "hex_secret"),
+        ]
+        at_town = profiles.list_templates_at(settlement_id="prigwort")
+        assert {owner for owner, _ in at_town} == {"nag_lord", "nag_kin"}
+        assert profiles.list_templates_at() == []
+
+    def test_jobs_here_uses_holder_and_rank(self, manager, faction_engine):
+        faction_engine.faction_states["nag_lord"].territory.hexes.add("0604")
+        faction_engine.rebuild_territory_index()
+
+        jobs = manager.list_jobs_here(hex_id="0604")
+        assert [(owner, t.id) for owner, t in jobs] == [
+            ("fey_courts", "hex_watch"),
+            ("nag_lord", "errand"),
+        ]
+
+        manager.create_affiliation("nag_lord")
+        manager.advance_affiliation_rank("nag_lord")
+        ids = [t.id for _, t in manager.list_jobs_here(hex_id="0604")]
+        assert "trusted" in ids and "inner_circle" not in ids
+        assert "prigwort_drop" not in ids
+
+    def test_active_jobs_bucketed_by_faction(self, manager):
+        first = manager.accept_job("nag_lord", "errand")
+        manager.accept_job("fey_courts", "hex_watch")
+
+        assert [j.job_id for j in manager.get_active_jobs("nag_lord")] == [first.job_id]
+        assert len(manager.get_active_jobs()) == 2
+
+        manager.complete_job(first.job_id)
+        assert manager.get_active_jobs("nag_lord") == []
+        assert len(manager.get_active_jobs("fey_courts")) == 1
+
+    def test_buckets_rebuilt_after_load(self):
+        job = ActiveJob(
+            job_id="j1", faction_id="nag_lord", template_id="errand",
+            title="Errand", accepted_on="",
+        )
+        state = PartyFactionState.from_dict({"active_jobs": {"j1": job.to_dict()}})
+        assert state.get_jobs_for("nag_lord") == [job]
+
+        state.active_jobs["j2"] = ActiveJob(
+            job_id="j2", faction_id="fey_courts", template_id="x", title="X", accepted_on=""
+        )
+        assert [j.job_id for j in state.get_jobs_for("fey_courts")] == ["j2"]
+        assert state.remove_job("j1") == job
+        assert state.get_jobs_for("nag_lord") == []
@@ -333,6 +333,42 @@ class TestFairyRoadRegistry:
         assert len(result.roads) == 1
         assert result.roads[0].name == "The Test Road"
 
+    def test_door_index_prebuilt_descriptors(self, registry):
+        """Enterable door descriptors are built once and read-only."""
+        doors = registry.get_enterable_doors("0704")
+        assert doors is registry.get_enterable_doors("0704")
+        assert dict(doors[0]) == {
+            "road_id": "test_road",
+            "road_name": "The Test Road",
+            "door_name": "Entry Door",
+            "door_hex": "0704",
+            "direction": "entry",
+        }
+        with pytest.raises(TypeError):
+            doors[0]["road_id"] = "other"
+
+    def test_exit_doors_by_road(self, registry):
+        exits = registry.get_exit_doors("test_road")
+        assert [ref.door.hex_id for ref in exits] == ["1203"]
+        assert registry.get_exit_doors("nonexistent") == ()
+
+    def test_register_rebuilds_index(self, registry):
+        road = FairyRoadDefinition(
+            road_id="second_road",
+            name="Second Road",
+            length_miles=8,
+            doors=[FairyRoadDoor(hex_id="0704", name="Side Door", direction="endpoint")],
+        )
+        registry.get_door("0704", "test_road")
+        registry.register(road)
+
+        assert [d["road_id"] for d in registry.get_enterable_doors("0704")] == [
+            "test_road",
+            "second_road",
+        ]
+        assert registry.get_door("0704", "second_road").door.name == "Side Door"
+        assert registry.get_exit_doors("second_road")[0].door.hex_id == "0704"
+
 
 # =============================================================================
 # ENGINE TESTS
@@ -423,6 +459,76 @@ class TestFairyRoadEngineTravel:
         assert result.check_outcome.roll >= 1 and result.check_outcome.roll <= 6
 
 
+class TestFairyRoadBatchedTravel:
+    """Tests for travel_until_event and the compiled time passed table."""
+
+    @staticmethod
+    def _snapshot(engine):
+        state = engine.get_travel_state()
+        return (
+            engine.get_current_phase(),
+            state.current_segment,
+            state.subjective_turns_elapsed,
+            state.encounters_triggered,
+            state.last_check_result,
+            state.last_encounter_entry,
+            state.last_location_entry,
+            engine._frozen_mortal_turns,
+        )
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_matches_stepping_one_segment_at_a_time(self, engine, seed):
+        """Batched travel stops where stepping would, with the same dice stream."""
+        engine.enter_fairy_road("test_road", "0704")
+        engine.get_travel_state().total_segments = 12
+        DiceRoller.set_seed(seed)
+        while True:
+            stepped = engine.travel_segment()
+            if engine.get_current_phase() != FairyRoadPhase.TRAVELING:
+                break
+        expected = self._snapshot(engine)
+        expected_next = DiceRoller.randint(1, 1000)
+
+        engine.enter_fairy_road("test_road", "0704")
+        engine.get_travel_state().total_segments = 12
+        DiceRoller.set_seed(seed)
+        batched = engine.travel_until_event()
+
+        assert self._snapshot(engine) == expected
+        assert DiceRoller.randint(1, 1000) == expected_next
+        assert batched.segment == stepped.segment
+        assert batched.segments_traveled == batched.segment
+        assert batched.check_outcome.roll == stepped.check_outcome.roll
+
+    def test_quiet_segments_logged_as_one_roll(self, engine):
+        engine.enter_fairy_road("test_road", "0704")
+        engine.get_travel_state().total_segments = 50
+        DiceRoller.clear_roll_log()
+
+        result = engine.travel_until_event(max_segments=10)
+
+        checks = [r for r in DiceRoller.get_roll_log() if "travel check" in r.reason]
+        assert len(checks) == 1
+        assert len(checks[0].rolls) == result.segments_traveled <= 10
+
+    def test_not_traveling(self, engine):
+        assert engine.travel_until_event().success is False
+
+    def test_time_passed_lookup_first_match_wins(self, engine, fairy_common):
+        lookup = engine._time_passed_lookup(fairy_common.time_passed_table)
+        assert lookup[2] == "1d6 minutes"
+        assert lookup[7] == "1d6 days"
+        assert lookup[12] == "1d6 weeks"
+        assert engine._time_passed_lookup(fairy_common.time_passed_table) is lookup
+
+    def test_parse_time_to_turns_units(self, engine):
+        assert engine._parse_time_to_turns("3 hours") == 18
+        assert engine._parse_time_to_turns("2 weeks") == 2016
+        assert engine._parse_time_to_turns("5 minutes") == 1
+        assert engine._parse_time_to_turns("a while") == 144
+        assert 144 <= engine._parse_time_to_turns("1d6 days") <= 864
+
+
 class TestFairyRoadEngineEncounters:
     """Tests for encounter handling on fairy roads."""
 
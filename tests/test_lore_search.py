@@ -374,3 +374,52 @@ class TestGracefulDegradation:
 
             # Check runtime_checkable protocol
             assert isinstance(impl, LoreSearchInterface)
+
+
+class TestLoreRetrievalCache:
+    """Test DMAgent caching of lore lookups within a scene."""
+
+    @pytest.fixture
+    def agent_and_calls(self):
+        mock_search = MockLoreSearch()
+        mock_search.add_mock_result("drune", "The Drune are ancient sorcerers.", "CB p.12")
+        calls = []
+        search = mock_search.search
+
+        def counting(query):
+            calls.append(query)
+            return search(query)
+
+        mock_search.search = counting
+        agent = DMAgent(DMAgentConfig(llm_provider=LLMProvider.MOCK), lore_search=mock_search)
+        return agent, calls
+
+    def test_repeated_lookup_is_cached(self, agent_and_calls):
+        agent, calls = agent_and_calls
+        first = agent.retrieve_lore("Drune ", current_hex="0710")
+        second = agent.retrieve_lore("  drune", current_hex="0710")
+
+        assert first == second and len(first) == 1
+        assert len(calls) == 1
+        assert agent.get_lore_status()["lore_cache"]["hits"] == 1
+
+    def test_context_is_part_of_key(self, agent_and_calls):
+        agent, calls = agent_and_calls
+        agent.retrieve_lore("drune", current_hex="0710")
+        agent.retrieve_lore("drune", current_hex="0711")
+        agent.retrieve_lore("drune", current_hex="0710", category=LoreCategory.FACTION)
+        assert len(calls) == 3
+
+    def test_location_change_and_reload_invalidate(self, agent_and_calls):
+        agent, calls = agent_and_calls
+        agent.set_lore_location("0710")
+        agent.get_lore_enrichment("drune")
+        agent.set_lore_location("0710")
+        agent.get_lore_enrichment("drune")
+        assert len(calls) == 1
+
+        agent.set_lore_location("0711")
+        agent.get_lore_enrichment("drune")
+        agent.invalidate_lore_cache()
+        agent.get_lore_enrichment("drune")
+        assert len(calls) == 3
@@ -0,0 +1,204 @@
+"""
+Tests for the exact probability engine.
+
+Tests src/tables/probability.py and TableManager.get_table_distribution.
+"""
+
+from fractions import Fraction
+
+import pytest
+
+from src.data_models import DiceRoller, ReactionResult
+from src.observability.run_log import reset_run_log
+from src.tables.probability import (
+    dice_distribution,
+    entry_distribution,
+    expected_value,
+    parse_dice_notation,
+    reaction_distribution,
+    skill_check_probability,
+    table_distribution,
+)
+from src.tables.table_manager import TableManager
+from src.tables.table_types import (
+    DieType,
+    DolmenwoodTable,
+    TableCategory,
+    TableContext,
+    TableEntry,
+)
+
+
+class TestDiceDistribution:
+    """Tests for dice convolution."""
+
+    def test_parse_notation(self):
+        assert parse_dice_notation("2d6") == (2, 6, 0)
+        assert parse_dice_notation("d20+5") == (1, 20, 5)
+        assert parse_dice_notation("3d6-2") == (3, 6, -2)
+
+    def test_invalid_notation(self):
+        with pytest.raises(ValueError):
+            parse_dice_notation("six")
+
+    def test_2d6_exact(self):
+        pmf = dice_distribution("2d6")
+        assert pmf[7] == Fraction(6, 36)
+        assert pmf[2] == Fraction(1, 36)
+        assert sum(pmf.values()) == 1
+        assert expected_value(pmf) == 7
+
+    def test_modifier_shifts(self):
+        pmf = dice_distribution("1d6+2")
+        assert min(pmf) == 3
+        assert max(pmf) == 8
+
+    def test_large_pool(self):
+        pmf = dice_distribution("90d3")
+        assert sum(pmf.values()) == 1
+        assert expected_value(pmf) == 180
+
+
+class TestChecks:
+    """Tests for skill checks and reactions."""
+
+    def test_skill_check_probability(self):
+        assert skill_check_probability(2) == Fraction(1, 3)
+        assert skill_check_probability(5, 3) == 1
+        assert skill_check_probability(1, -3) == 0
+
+    def test_reaction_distribution(self):
+        dist = reaction_distribution()
+        assert dist[ReactionResult.ATTACKS] == Fraction(1, 36)
+        assert dist[ReactionResult.UNCERTAIN] == Fraction(16, 36)
+        assert sum(dist.values()) == 1
+
+    def test_reaction_with_modifier(self):
+        dist = reaction_distribution(modifier=3)
+        assert ReactionResult.ATTACKS not in dist
+        assert dist[ReactionResult.FRIENDLY] == Fraction(10, 36)
+
+
+def _make_table(table_id, entries, num_dice=1, base_modifier=0):
+    return DolmenwoodTable(
+        table_id=table_id,
+        name=table_id,
+        category=TableCategory.FLAVOR,
+        die_type=DieType.D6,
+        num_dice=num_dice,
+        base_modifier=base_modifier,
+        entries=entries,
+    )
+
+
+class TestTableDistribution:
+    """Tests for table and nested table distributions."""
+
+    def test_entry_distribution(self):
+        table = _make_table(
+            "t",
+            [TableEntry(1, 2, "low"), TableEntry(3, 6, "high")],
+        )
+        dist = entry_distribution(table)
+        assert [(e.result, p) for e, p in dist] == [
+            ("low", Fraction(1, 3)),
+            ("high", Fraction(2, 3)),
+        ]
+
+    def test_modifier_clamps_to_table_range(self):
+        table = _make_table("t", [TableEntry(1, 5, "low"), TableEntry(6, 6, "top")])
+        dist = table_distribution(table, modifier=10)
+        assert dist.by_result_text() == {"top": Fraction(1)}
+
+    def test_unmatched_rolls_reported(self):
+        table = _make_table("t", [TableEntry(1, 3, "low")])
+        dist = table_distribution(table)
+        assert dist.by_result_text()["No matching entry"] == Fraction(1, 2)
+
+    def test_nested_tables(self):
+        sub = _make_table("sub", [TableEntry(1, 3, "goblin"), TableEntry(4, 6, "wolf")])
+        top = _make_table(
+            "top",
+            [TableEntry(1, 2, "monster", sub_table="sub"), TableEntry(3, 6, "nothing")],
+        )
+        dist = table_distribution(top, resolve_table={"sub": sub}.get)
+        texts = dist.by_result_text()
+        assert texts["goblin"] == Fraction(1, 6)
+        assert texts["wolf"] == Fraction(1, 6)
+        assert texts["nothing"] == Fraction(2, 3)
+        assert dist.total_probability() == 1
+
+    def test_cyclic_sub_tables_terminate(self):
+        loop = _make_table("loop", [TableEntry(1, 6, "again", sub_table="loop")])
+        dist = table_distribution(loop, resolve_table={"loop": loop}.get, max_depth=3)
+        assert dist.total_probability() == 1
+
+
+class TestTableManagerDistribution:
+    """Tests for the memoized manager entry point."""
+
+    def test_reaction_table_matches_interpret_reaction(self):
+        manager = TableManager()
+        dist = manager.get_table_distribution("reaction_2d6")
+        assert dist is not None
+        assert dist.total_probability() == 1
+
+    def test_memoized_per_modifier(self):
+        manager = TableManager()
+        first = manager.get_table_distribution("reaction_2d6", modifier=1)
+        assert manager.get_table_distribution("reaction_2d6", modifier=1) is first
+        assert manager.get_table_distribution("reaction_2d6", modifier=2) is not first
+
+    def test_register_invalidates_cache(self):
+        manager = TableManager()
+        first = manager.get_table_distribution("reaction_2d6")
+        manager.register_table(_make_table("extra", [TableEntry(1, 6, "x")]))
+        assert manager.get_table_distribution("reaction_2d6") is not first
+
+    def test_unknown_table(self):
+        assert TableManager().get_table_distribution("missing") is None
+
+    def test_context_modifier_reaches_nested_tables(self):
+        manager = TableManager()
+        manager.register_table(
+            _make_table("sub", [TableEntry(1, 3, "goblin"), TableEntry(4, 6, "wolf")])
+        )
+        manager.register_table(
+            _make_table(
+                "top",
+                [TableEntry(1, 4, "monster", sub_table="sub"), TableEntry(5, 6, "nothing")],
+            )
+        )
+        context = TableContext(situational_modifiers={"lair": 2})
+
+        dist = manager.get_table_distribution("top", context=context, modifier=-3)
+        expected = {
+            "goblin": Fraction(5, 36),
+            "wolf": Fraction(25, 36),
+            "nothing": Fraction(1, 6),
+        }
+        assert dist.by_result_text() == expected
+
+        reset_run_log()
+        DiceRoller.set_seed(7)
+        trials = 1500
+        tally: dict[str, int] = {}
+        for _ in range(trials):
+            result = manager.roll_table("top", context=context, modifier=-3)
+            leaf = result.sub_results[0] if result.sub_results else result
+            tally[leaf.result_text] = tally.get(leaf.result_text, 0) + 1
+        for text, p in expected.items():
+            assert abs(tally[text] / trials - float(p)) < 0.04
+
+    def test_memoized_separately_per_context(self):
+        manager = TableManager()
+        context = TableContext(situational_modifiers={"lair": 1})
+        explicit = manager.get_table_distribution("reaction_2d6", modifier=1)
+        from_context = manager.get_table_distribution("reaction_2d6", context=context)
+        assert explicit is not from_context
+
+    def test_consumes_no_dice(self):
+        DiceRoller.clear_roll_log()
+        TableManager().get_table_distribution("encounter_type")
+        reaction_distribution(2)
+        assert DiceRoller.get_roll_log() == []
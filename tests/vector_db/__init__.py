@@ -0,0 +1 @@
+"""Tests for vector_db module."""
@@ -0,0 +1,107 @@
+"""
+Tests for RulesRetriever bulk indexing.
+
+Verifies that:
+- bulk_index writes each batch with a single embedding call
+- Unchanged documents are skipped by content hash
+- Background indexing completes and reports its result
+- Searches are not blocked while a batch is being embedded
+"""
+
+import threading
+
+from src.vector_db import HashingEmbedder, LocalVectorStore, RulesRetriever
+
+
+class CountingEmbedder(HashingEmbedder):
+    """HashingEmbedder that records each batch it embeds."""
+
+    def __init__(self):
+        super().__init__(dim=32)
+        self.batches: list[int] = []
+
+    def __call__(self, texts):
+        self.batches.append(len(texts))
+        return super().__call__(texts)
+
+
+def _hex_documents(count: int, terrain: str = "bog"):
+    return [
+        RulesRetriever.hex_document(f"{i:04d}", {"name": f"Hex {i}", "terrain": terrain})
+        for i in range(count)
+    ]
+
+
+class TestBulkIndex:
+    """Tests for bulk_index."""
+
+    def test_batches_embedding_calls(self):
+        embedder = CountingEmbedder()
+        retriever = RulesRetriever(vector_store=LocalVectorStore(embedding_function=embedder))
+
+        result = retriever.bulk_index(_hex_documents(10), batch_size=4)
+        assert (result.indexed, result.skipped, result.failed) == (10, 0, 0)
+        assert embedder.batches == [4, 4, 2]
+        assert retriever.get_statistics()["total_documents"] == 10
+
+    def test_skips_unchanged_documents(self):
+        embedder = CountingEmbedder()
+        retriever = RulesRetriever(vector_store=LocalVectorStore(embedding_function=embedder))
+        retriever.bulk_index(_hex_documents(5))
+        embedder.batches.clear()
+
+        documents = _hex_documents(5)
+        documents[2] = RulesRetriever.hex_document("0002", {"name": "Hex 2", "terrain": "moor"})
+        result = retriever.bulk_index(documents)
+
+        assert (result.indexed, result.skipped) == (1, 4)
+        assert embedder.batches == [1]
+
+    def test_single_index_is_hashed_too(self):
+        retriever = RulesRetriever()
+        assert retriever.index_rule("morale", "Monsters check morale.")
+
+        document = RulesRetriever.rule_document("morale", "Monsters check morale.")
+        result = retriever.bulk_index([document])
+        assert result.skipped == 1
+        assert retriever.search("morale")[0].content_id == "rule_morale"
+
+    def test_background_index(self):
+        retriever = RulesRetriever()
+        finished = []
+        retriever.start_background_index(
+            _hex_documents(20), batch_size=8, on_complete=finished.append
+        )
+
+        assert retriever.wait_for_indexing(timeout=5)
+        assert finished and finished[0].indexed == 20
+        assert retriever.last_bulk_result is finished[0]
+        assert retriever.get_hex_info("0007")[0].content_id == "hex_0007"
+
+    def test_search_not_blocked_while_batch_embeds(self):
+        entered, release = threading.Event(), threading.Event()
+
+        class SlowBatchEmbedder(HashingEmbedder):
+            def __call__(self, texts):
+                if len(texts) > 1:  # Index batches block; single queries do not
+                    entered.set()
+                    release.wait(5)
+                return super().__call__(texts)
+
+        retriever = RulesRetriever(
+            vector_store=LocalVectorStore(embedding_function=SlowBatchEmbedder(dim=32))
+        )
+        retriever.index_rule("morale", "Monsters check morale.")
+        retriever.start_background_index(_hex_documents(4))
+        assert entered.wait(5)
+
+        searched = []
+        searcher = threading.Thread(target=lambda: searched.extend(retriever.search("morale")))
+        searcher.start()
+        searcher.join(2)
+        try:
+            assert not searcher.is_alive()
+            assert searched[0].content_id == "rule_morale"
+        finally:
+            release.set()
+        assert retriever.wait_for_indexing(timeout=5)
@@ -0,0 +1,108 @@
+"""
+Tests for the BM25 keyword index behind the RulesRetriever fallback.
+
+Verifies that:
+- Tokenization folds plurals and common suffixes
+- Postings are maintained incrementally on add, replace and remove
+- RulesRetriever fallback search ranks by BM25 and honours categories
+- Export/import round-trips the persisted index
+"""
+
+import pytest
+
+from src.game_state.state_machine import GameState
+from src.vector_db import ContentCategory, KeywordIndex, RulesRetriever, SearchContext, tokenize
+
+
+class TestTokenize:
+    """Tests for tokenize/stem."""
+
+    def test_folds_suffixes_and_drops_stopwords(self):
+        assert tokenize("The Drunes") == tokenize("drune")
+        assert tokenize("cursed curses") == tokenize("curse curse")
+        assert tokenize("fairies") == tokenize("fairy")
+        assert tokenize("hunting") == tokenize("hunt")
+        assert tokenize("Hex 0710") == ["hex", "0710"]
+
+
+class TestKeywordIndex:
+    """Tests for KeywordIndex."""
+
+    def test_ranks_rarer_and_denser_matches_first(self):
+        index = KeywordIndex()
+        index.add("a", "drune drune stones in the forest")
+        index.add("b", "a forest path with one drune")
+        index.add("c", "a forest clearing")
+
+        ranked = index.search("drune forest", limit=5)
+        assert [doc_id for doc_id, _ in ranked] == ["a", "b", "c"]
+        assert index.search("witch", limit=5) == []
+
+    def test_replace_and_remove_update_postings(self):
+        index = KeywordIndex()
+        index.add("a", "goblin market")
+        index.add("a", "fairy road")
+        assert index.search("goblin", limit=5) == []
+        assert [d for d, _ in index.search("road", limit=5)] == ["a"]
+
+        assert index.remove("a")
+        assert not index.remove("a")
+        assert len(index) == 0 and index.term_count == 0
+
+    def test_accept_filter_and_limit(self):
+        index = KeywordIndex()
+        for i in range(10):
+            index.add(f"doc{i}", "wyrm " * (i + 1))
+
+        ranked = index.search("wyrm", limit=3, accept=lambda d: d != "doc9")
+        assert len(ranked) == 3
+        assert "doc9" not in [d for d, _ in ranked]
+
+    def test_round_trip(self):
+        index = KeywordIndex()
+        index.add("a", "the nag lord")
+        restored = KeywordIndex.from_dict(index.to_dict())
+        assert restored.search("nag", limit=1) == index.search("nag", limit=1)
+        restored.remove("a")
+        assert restored.term_count == 0
+
+        stale = dict(index.to_dict(), tokenizer_version=-1)
+        assert KeywordIndex.from_dict(stale) is None
+
+
+class TestRulesRetrieverFallback:
+    """Tests for RulesRetriever using the keyword index."""
+
+    @pytest.fixture
+    def retriever(self):
+        retriever = RulesRetriever()
+        if retriever._chroma_available:
+            pytest.skip("ChromaDB installed; fallback not in use")
+        retriever.index_lore("drune", "The Drunes are secretive cult sorcerers.", "factions")
+        retriever.index_rule("morale", "Monsters check morale when half are slain.")
+        retriever.index_hex("0710", {"name": "Drune Stones", "terrain": "bog"})
+        return retriever
+
+    def test_search_filters_categories(self, retriever):
+        results = retriever.search("drune", categories=[ContentCategory.LORE])
+        assert [r.content_id for r in results] == ["lore_drune"]
+
+    def test_context_rerank_applies_to_candidates(self, retriever):
+        context = SearchContext(game_state=GameState.WILDERNESS_TRAVEL, current_hex="0710")
+        results = retriever.search("drune", context=context)
+        assert results[0].content_id == "hex_0710"
+
+    def test_delete_removes_from_index(self, retriever):
+        assert retriever.delete_document("rule_morale")
+        assert retriever.search("morale") == []
+
+    def test_export_import_restores_index(self, retriever, tmp_path):
+        path = tmp_path / "index.json"
+        retriever.export_index(path)
+
+        restored = RulesRetriever()
+        assert restored.import_index(path) == 3
+        assert restored.get_statistics()["indexed_terms"] == retriever.get_statistics()[
+            "indexed_terms"
+        ]
+        assert [r.content_id for r in restored.search("slain morale")] == ["rule_morale"]
@@ -0,0 +1,114 @@
+"""
+Tests for the local memory-mapped vector store.
+
+Verifies that:
+- HashingEmbedder is deterministic and places shared vocabulary together
+- Upsert, delete and category/hex/NPC pre-filters behave
+- save() writes a valid .npy file that reloads memory-mapped
+- RulesRetriever and VectorLoreSearch can use the store instead of ChromaDB
+"""
+
+import pytest
+
+from src.ai.lore_search import LoreCategory, LoreSearchQuery, create_lore_search
+from src.vector_db import HashingEmbedder, LocalVectorStore, RulesRetriever
+from src.vector_db.vector_store import VECTORS_FILE
+
+
+@pytest.fixture
+def store():
+    store = LocalVectorStore(embedding_function=HashingEmbedder(dim=64))
+    store.upsert("hex_0710", "Drune standing stones in the bog", "hex", {"hex_id": "0710"})
+    store.upsert("npc_ygraine", "Ygraine the witch sells fairy wine", "npc", {"npc_id": "ygraine"})
+    store.upsert("lore_drune", "The Drunes are a secretive cult of sorcerers", "lore")
+    return store
+
+
+class TestHashingEmbedder:
+    """Tests for HashingEmbedder."""
+
+    def test_is_deterministic(self):
+        assert HashingEmbedder(32)(["fairy road"]) == HashingEmbedder(32)(["fairy road"])
+        assert HashingEmbedder(32).name == "hashing-32"
+
+
+class TestLocalVectorStore:
+    """Tests for LocalVectorStore."""
+
+    def test_search_ranks_shared_vocabulary_first(self, store):
+        hits = store.search("drune sorcerers", n_results=2)
+        assert [r.doc_id for r, _ in hits] == ["lore_drune", "hex_0710"]
+        assert hits[0][1] > hits[1][1]
+
+    def test_prefilters(self, store):
+        assert [r.doc_id for r, _ in store.search("drune", categories=["hex"])] == ["hex_0710"]
+        assert [r.doc_id for r, _ in store.search("drune", hex_id="0710")] == ["hex_0710"]
+        assert [r.doc_id for r, _ in store.search("drune", npc_id="ygraine")] == ["npc_ygraine"]
+        assert store.search("drune", hex_id="9999") == []
+
+    def test_upsert_replaces_and_delete_removes(self, store):
+        store.upsert("lore_drune", "Goblin market", "lore")
+        assert len(store) == 3
+        assert store.get("lore_drune").text == "Goblin market"
+        assert store.search("goblin market", n_results=1)[0][0].doc_id == "lore_drune"
+
+        assert store.delete("lore_drune")
+        assert not store.delete("lore_drune")
+        assert "lore_drune" not in [r.doc_id for r, _ in store.search("goblin")]
+
+    def test_precomputed_embeddings(self):
+        store = LocalVectorStore(embedding_function=lambda texts: [[0.0, 1.0]] * len(texts))
+        store.upsert("a", "anything", "lore", embedding=[1.0, 0.0])
+        store.upsert("b", "anything", "lore", embedding=[0.0, 1.0])
+        assert store.search([1.0, 0.1], n_results=1)[0][0].doc_id == "a"
+        with pytest.raises(ValueError):
+            store.upsert("c", "bad", "lore", embedding=[1.0, 0.0, 0.0])
+
+    def test_save_and_reload_memory_mapped(self, store, tmp_path):
+        store.delete("npc_ygraine")
+        store.save(tmp_path)
+        assert (tmp_path / VECTORS_FILE).read_bytes()[:6] == b"\x93NUMPY"
+
+        loaded = LocalVectorStore(persist_directory=tmp_path)
+        assert loaded.get_statistics()["memory_mapped"]
+        assert loaded.dim == 64 and len(loaded) == 2
+        assert loaded.search("drune sorcerers", 1) == store.search("drune sorcerers", 1)
+
+        # Writes after loading copy the mapped vectors first
+        loaded.upsert("lore_wine", "fairy wine", "lore")
+        assert loaded.search("wine", 1)[0][0].doc_id == "lore_wine"
+        loaded.close()
+
+    def test_reload_rejects_other_embedder(self, store, tmp_path):
+        store.save(tmp_path)
+        with pytest.raises(ValueError):
+            LocalVectorStore(tmp_path, embedding_function=HashingEmbedder(dim=32))
+
+
+class TestRetrieverIntegration:
+    """Tests for RulesRetriever and VectorLoreSearch over the local store."""
+
+    def test_rules_retriever_uses_store(self):
+        retriever = RulesRetriever(vector_store=LocalVectorStore())
+        retriever.index_lore("drune", "The Drunes are a secretive cult of sorcerers")
+        retriever.index_rule("morale", "Monsters check morale when half are slain")
+
+        results = retriever.search("drune cult")
+        assert results[0].content_id == "lore_drune"
+        assert retriever.get_statistics()["backend"] == "local"
+        assert retriever.delete_document("lore_drune")
+        assert retriever.get_statistics()["total_documents"] == 1
+
+    def test_create_lore_search_local(self, tmp_path):
+        seed = RulesRetriever(vector_store=LocalVectorStore(tmp_path))
+        seed.index_lore("drune", "The Drunes are a secretive cult of sorcerers")
+        seed.persist()
+
+        lore = create_lore_search(local_embeddings=True, vector_store_path=tmp_path)
+        assert lore.get_status()["document_count"] == 1
+
+        results = lore.search(
+            LoreSearchQuery(query="drune cult", categories=[LoreCategory.LORE], min_relevance=0.1)
+        )
+        assert len(results) == 1
+        assert "sorcerers" in results[0].content